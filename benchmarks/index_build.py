@@ -0,0 +1,83 @@
+"""
+Time the indexing phase on a synthetic library.
+
+The library is written to a temporary folder once: creators with projects, metadata files, and
+empty audio, document, and text files. Indexing then runs several times against a warm scan
+cache, so the reported time is dominated by metadata loading and model construction rather
+than by the folder walk.
+
+    python benchmarks/index_build.py --creators 200 --projects-per-creator 10 --files-per-project 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.config_manager import apply_cli_overrides, load_config
+from cr4te.constants import CR4TE_JSON_FILE_NAME
+from cr4te.enums.domain import Domain
+from cr4te.library_builder import build_library_index
+
+MEDIA_SUFFIXES = (".mp3", ".mp3", ".mp3", ".pdf", ".md")
+
+
+def write_library(root: Path, creator_count: int, projects_per_creator: int, files_per_project: int) -> None:
+    for creator_number in range(creator_count):
+        creator_dir = root / f"Creator {creator_number:05d}"
+        creator_dir.mkdir(parents=True)
+        (creator_dir / CR4TE_JSON_FILE_NAME).write_text(
+            json.dumps({"person": {"active_since": "2001", "nationalities": ["Germany"]}, "tags": {"Genre": ["Jazz"]}}),
+            encoding="utf-8",
+        )
+        for project_number in range(projects_per_creator):
+            project_dir = creator_dir / f"Project {project_number:03d}"
+            project_dir.mkdir()
+            (project_dir / CR4TE_JSON_FILE_NAME).write_text(
+                json.dumps({"release_date": "2020-05", "tags": {"Mood": ["Calm"]}}),
+                encoding="utf-8",
+            )
+            for file_number in range(files_per_project):
+                (project_dir / f"{file_number:03d}{MEDIA_SUFFIXES[file_number % len(MEDIA_SUFFIXES)]}").touch()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--creators", type=int, default=200)
+    parser.add_argument("--projects-per-creator", type=int, default=10)
+    parser.add_argument("--files-per-project", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    media_rules = apply_cli_overrides(load_config(), domain=Domain.MUSIC).media_rules
+    with tempfile.TemporaryDirectory() as tmp:
+        library_dir = Path(tmp) / "library"
+        scan_cache_dir = Path(tmp) / "cache" / "scan"
+        write_library(library_dir, args.creators, args.projects_per_creator, args.files_per_project)
+        build_library_index(library_dir, media_rules, scan_cache_dir=scan_cache_dir)
+
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            index = build_library_index(library_dir, media_rules, scan_cache_dir=scan_cache_dir)
+            timings.append(time.perf_counter() - started)
+
+    media_files = args.creators * args.projects_per_creator * args.files_per_project
+    median = statistics.median(timings)
+    print(f"creators:      {index.creator_count}")
+    print(f"projects:      {index.project_count}")
+    print(f"media files:   {media_files}")
+    print(f"index median:  {median:.3f} s over {args.repeat} runs")
+    print(f"per creator:   {median / max(index.creator_count, 1) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
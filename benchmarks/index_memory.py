@@ -0,0 +1,112 @@
+"""
+Measure how much memory library index summaries keep per creator and per project.
+
+Creators are synthesized in memory from JSON, the way ``cr4te.json`` files are parsed, so every
+project starts with its own copies of tag, facet, and date strings. Only the summaries retained
+by the index are measured; the loaded models are dropped before the snapshot is taken.
+
+    python benchmarks/index_memory.py --creators 2000 --projects-per-creator 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.library_index import summarize_creator
+from cr4te.schemas.library_schema import Creator
+
+GENRES = ("Ambient", "Jazz", "Folk", "Electronic", "Classical", "Rock")
+LANGUAGES = ("English", "German", "French", "Japanese")
+COUNTRIES = ("Germany", "France", "Japan", "Canada")
+
+
+def creator_json(creator_number: int, project_count: int) -> str:
+    name = f"Creator {creator_number:06d}"
+    projects = [
+        {
+            "title": f"Project {project_number:03d}",
+            "display_title": f"Project {project_number:03d}",
+            "release_date": f"20{project_number % 25:02d}-0{project_number % 9 + 1}-01",
+            "cover": f"{name}/Project {project_number:03d}/cover.jpg",
+            "tags": {
+                "Genre": [GENRES[(creator_number + project_number) % len(GENRES)]],
+                "Mood": ["Calm", "Bright"][: project_number % 3],
+            },
+            "facets": {
+                "languages": [LANGUAGES[project_number % len(LANGUAGES)]],
+                "genres": [GENRES[project_number % len(GENRES)]],
+                "periods": [],
+                "mediums": [],
+            },
+            "media_groups": [
+                {
+                    "is_root": True,
+                    "videos": [],
+                    "tracks": [f"{name}/Project {project_number:03d}/{track:02d}.mp3" for track in range(10)],
+                    "images": [f"{name}/Project {project_number:03d}/cover.jpg"],
+                    "documents": [],
+                    "texts": [],
+                    "rel_dir_path": f"{name}/Project {project_number:03d}",
+                }
+            ],
+        }
+        for project_number in range(project_count)
+    ]
+    return json.dumps(
+        {
+            "name": name,
+            "display_name": name,
+            "type": "person",
+            "portrait": f"{name}/portrait.jpg",
+            "aliases": [],
+            "collaborations": [],
+            "tags": {"Genre": [GENRES[creator_number % len(GENRES)]]},
+            "active_since": "2001",
+            "nationalities": [COUNTRIES[creator_number % len(COUNTRIES)]],
+            "place_of_birth": "Berlin",
+            "media_groups": [],
+            "projects": projects,
+        }
+    )
+
+
+def measure(creator_count: int, projects_per_creator: int) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    summaries = []
+    for creator_number in range(creator_count):
+        creator = Creator.model_validate(json.loads(creator_json(creator_number, projects_per_creator)))
+        summaries.append(summarize_creator(Path("/library") / creator.name, creator))
+        del creator
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained - baseline, len(summaries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--creators", type=int, default=2000)
+    parser.add_argument("--projects-per-creator", type=int, default=20)
+    args = parser.parse_args()
+
+    retained_bytes, creator_count = measure(args.creators, args.projects_per_creator)
+    project_count = creator_count * args.projects_per_creator
+    print(f"creators:            {creator_count}")
+    print(f"projects:            {project_count}")
+    print(f"retained:            {retained_bytes / 1024 / 1024:.1f} MiB")
+    print(f"bytes per creator:   {retained_bytes / creator_count:,.0f} (including its projects)")
+    print(f"bytes per project:   {retained_bytes / max(project_count, 1):,.0f}")
+
+
+if __name__ == "__main__":
+    main()
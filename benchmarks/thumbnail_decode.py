@@ -0,0 +1,109 @@
+"""
+Compare thumbnail generation against a full-resolution decode and a single Lanczos resize.
+
+A camera-sized JPEG with photographic-like detail is written to a temporary folder once. Each
+path then turns it into thumbnails of the heights cr4te generates; the reported time is the median
+per thumbnail. Quality is the PSNR of cr4te's thumbnail against the full-decode reference. The
+last line times the three cover sizes cut from one decode against one decode per size, and reports
+the lowest PSNR among those shared-decode sizes.
+
+    python benchmarks/thumbnail_decode.py --width 8192 --height 5464 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from PIL import Image, ImageChops, ImageFilter, ImageStat
+
+from cr4te.constants import (
+    COVER_THUMB_HEIGHT,
+    CREATOR_PAGE_PROJECT_THUMB_HEIGHT,
+    GALLERY_THUMB_HEIGHT,
+    PROJECT_OVERVIEW_THUMB_HEIGHT,
+)
+from cr4te.utils.image_utils import generate_thumbnails
+
+
+def write_source(path: Path, width: int, height: int) -> None:
+    # Noise blurred at a few scales gives edges and texture at every thumbnail size.
+    detail = Image.effect_noise((width // 8, height // 8), 64).resize((width, height), Image.BICUBIC)
+    grain = Image.effect_noise((width, height), 24).filter(ImageFilter.GaussianBlur(1))
+    gradient = Image.linear_gradient("L").resize((width, height))
+    Image.merge("RGB", (detail, grain, gradient)).save(path, format="JPEG", quality=92)
+
+
+def full_decode_thumbnail(source_path: Path, target_height: int) -> Image.Image:
+    with Image.open(source_path) as img:
+        target_width = int(target_height * img.width / img.height)
+        return img.resize((target_width, target_height), Image.LANCZOS)
+
+
+def median_seconds(action, repeat: int) -> tuple[float, Image.Image]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = action()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), result
+
+
+def psnr(image: Image.Image, reference: Image.Image) -> float:
+    difference = ImageChops.difference(image.convert("RGB"), reference.convert("RGB"))
+    mean_square = sum(ImageStat.Stat(difference).sum2) / (3 * image.width * image.height)
+    return math.inf if mean_square == 0 else 10 * math.log10(255**2 / mean_square)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--width", type=int, default=8192)
+    parser.add_argument("--height", type=int, default=5464)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = Path(tmp) / "camera.jpg"
+        write_source(source_path, args.width, args.height)
+        print(f"source:        {args.width}x{args.height} ({args.width * args.height / 1e6:.1f} MP), "
+              f"{source_path.stat().st_size / 1e6:.1f} MB")
+
+        cover_heights = sorted({COVER_THUMB_HEIGHT, CREATOR_PAGE_PROJECT_THUMB_HEIGHT, PROJECT_OVERVIEW_THUMB_HEIGHT}, reverse=True)
+        for target_height in sorted({GALLERY_THUMB_HEIGHT, PROJECT_OVERVIEW_THUMB_HEIGHT, COVER_THUMB_HEIGHT}):
+            reference_seconds, reference = median_seconds(
+                lambda: full_decode_thumbnail(source_path, target_height), args.repeat
+            )
+            seconds, (thumbnail,) = median_seconds(
+                lambda: generate_thumbnails(source_path, [target_height]), args.repeat
+            )
+            print(
+                f"height {target_height:4d}:  full decode {reference_seconds * 1000:7.1f} ms, "
+                f"cr4te {seconds * 1000:7.1f} ms, "
+                f"{reference_seconds / seconds:4.1f}x faster, PSNR {psnr(thumbnail, reference):.1f} dB"
+            )
+
+        separate_seconds, _ = median_seconds(
+            lambda: [generate_thumbnails(source_path, [height]) for height in cover_heights], args.repeat
+        )
+        shared_seconds, shared = median_seconds(lambda: generate_thumbnails(source_path, cover_heights), args.repeat)
+        shared_psnr = min(
+            psnr(thumbnail, full_decode_thumbnail(source_path, height))
+            for height, thumbnail in zip(cover_heights, shared)
+        )
+        print(
+            f"cover sizes {'/'.join(map(str, cover_heights))}:  one decode each {separate_seconds * 1000:7.1f} ms, "
+            f"one decode {shared_seconds * 1000:7.1f} ms, {separate_seconds / shared_seconds:4.1f}x faster, "
+            f"min PSNR {shared_psnr:.1f} dB"
+        )
+
+
+if __name__ == "__main__":
+    main()
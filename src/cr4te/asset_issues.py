@@ -9,6 +9,7 @@ __all__ = [
     "media_read_failure_issue",
     "media_staging_failure_issue",
     "missing_media_issue",
+    "text_truncated_issue",
     "thumbnail_failure_issue",
 ]
 
@@ -57,3 +58,13 @@ def media_staging_failure_issue(path: Path, message: str) -> BuildIssue:
         code=IssueCode.MEDIA_STAGING_FAILURE,
         message=message,
     )
+
+
+def text_truncated_issue(path: Path, max_bytes: int) -> BuildIssue:
+    return BuildIssue(
+        path=path,
+        scope=IssueScope.ASSET,
+        code=IssueCode.TEXT_TRUNCATED,
+        severity=IssueSeverity.WARNING,
+        message=f"Text file exceeds {max_bytes} bytes; only the beginning is shown",
+    )
@@ -40,6 +40,7 @@ class IssueCode(str, Enum):
     MEDIA_STAGING_FAILURE = "media_staging_failure"
     MISSING_MEDIA = "missing_media"
     MISSING_REFERENCE = "missing_reference"
+    TEXT_TRUNCATED = "text_truncated"
     THUMBNAIL_FAILURE = "thumbnail_failure"
 
 
@@ -57,6 +58,10 @@ class BuildIssueError(ValueError):
         self.issue = issue
         super().__init__(f"{issue.scope.value} {issue.path} [{issue.code.value}]: {issue.message}")
 
+    def __reduce__(self):
+        # Rebuild from the structured issue when crossing process boundaries.
+        return type(self), (self.issue,)
+
 
 @dataclass
 class BuildIssuePolicy:
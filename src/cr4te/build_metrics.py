@@ -5,6 +5,8 @@ from dataclasses import dataclass
 __all__ = [
     "AssetStatistics",
     "BuildTimings",
+    "IndexStatistics",
+    "RenderStatistics",
 ]
 
 
@@ -17,13 +19,45 @@ class AssetStatistics:
     source_thumbnails_reused: int = 0
     default_thumbnail_uses: int = 0
     source_freshness_checks: int = 0
+    source_fingerprints_computed: int = 0
+    stale_thumbnails_removed: int = 0
+    filesystem_stat_calls: int = 0
+    path_resolve_calls: int = 0
+    filesystem_cache_hits: int = 0
+    thumbnail_workers: int = 1
+    thumbnail_seconds: float = 0
+    thumbnail_busy_seconds: float = 0
+
+    @property
+    def thumbnails_per_second(self) -> float:
+        return self.source_thumbnails_generated / self.thumbnail_seconds if self.thumbnail_seconds > 0 else 0
+
+    @property
+    def thumbnail_worker_utilization(self) -> float:
+        capacity = self.thumbnail_seconds * self.thumbnail_workers
+        return min(1.0, self.thumbnail_busy_seconds / capacity) if capacity > 0 else 0
+
+
+@dataclass(frozen=True)
+class RenderStatistics:
+    creator_cache_hits: int = 0
+    creator_cache_misses: int = 0
+    media_probe_hits: int = 0
+    media_probe_misses: int = 0
+
+
+@dataclass(frozen=True)
+class IndexStatistics:
+    scan_cache_hits: int = 0
+    scan_cache_misses: int = 0
+    media_probe_hits: int = 0
+    media_probe_misses: int = 0
 
 
 @dataclass(frozen=True)
 class BuildTimings:
     theme_discovery_seconds: float = 0
     output_preparation_seconds: float = 0
-    metadata_reconciliation_seconds: float = 0
     library_indexing_seconds: float = 0
     html_rendering_seconds: float = 0
 
@@ -32,7 +66,6 @@ class BuildTimings:
         return (
             self.theme_discovery_seconds
             + self.output_preparation_seconds
-            + self.metadata_reconciliation_seconds
             + self.library_indexing_seconds
             + self.html_rendering_seconds
         )
@@ -10,19 +10,42 @@ from typing import Callable, TypeVar
 from .build_issues import BuildIssueError
 from .build_metrics import BuildTimings
 from .build_summary import BuildSummary
-from .html_builder import build_html_pages_streaming
+from .constants import (
+    CREATOR_SPILL_DIRNAME,
+    LIBRARY_INDEX_DB_FILE_NAME,
+    LIBRARY_LOOKUP_DB_FILE_NAME,
+    MEDIA_PROBE_DB_FILE_NAME,
+    METADATA_STATE_DIRNAME,
+    OUTPUT_CACHE_DIRNAME,
+    SCAN_CACHE_DIRNAME,
+)
+from .creator_store import DEFAULT_CREATOR_MEMORY_BUDGET_BYTES, CreatorStore
+from .enums.index_backend import IndexBackend
+from .enums.thumbnail_store import ThumbnailStore
+from .html_builder import HtmlBuildResult, build_html_pages_streaming
+from .library_artifact import open_library_artifact, write_library_artifact
 from .library_builder import build_library_index, load_indexed_creator
-from .metadata_manager import MetadataWriteResult, reconcile_metadata_files
+from .library_index import CreatorSummary, LibraryIndex
+from .library_index_store import SqliteLibraryIndex, write_library_lookup
+from .media_cache import MediaInfoCache
+from .media_probe_store import MediaProbeStore
+from .metadata_results import MetadataWriteResult
 from .output_preparation import clear_output_folder
 from .schemas.config_schema import AppConfig
-from .themes import discover_themes
+from .schemas.library_schema import Creator
+from .themes import ThemeRegistry, discover_themes
 
 __all__ = [
     "BuildPhase",
     "BuildPhaseError",
     "BuildRequest",
     "BuildRunResult",
+    "IndexRequest",
+    "IndexRunResult",
+    "RenderRequest",
     "run_build",
+    "run_index",
+    "run_render",
 ]
 
 logger = logging.getLogger(__name__)
@@ -32,7 +55,6 @@ PhaseResult = TypeVar("PhaseResult")
 class BuildPhase(str, Enum):
     THEME_DISCOVERY = "theme discovery"
     OUTPUT_PREPARATION = "output preparation"
-    METADATA_RECONCILIATION = "metadata reconciliation"
     LIBRARY_INDEXING = "library indexing"
     HTML_RENDERING = "HTML rendering"
 
@@ -51,6 +73,12 @@ class BuildRequest:
     custom_themes_dir: Path | None = None
     clear_thumbnail_cache: bool = False
     strict: bool = False
+    creator_memory_budget_bytes: int = DEFAULT_CREATOR_MEMORY_BUDGET_BYTES
+    jobs: int = 1
+    io_concurrency: int = 1
+    thumbnail_workers: int = 1
+    thumbnail_store: ThumbnailStore = ThumbnailStore.PATH
+    index_backend: IndexBackend = IndexBackend.MEMORY
 
 
 @dataclass(frozen=True)
@@ -60,6 +88,40 @@ class BuildRunResult:
     metadata_result: MetadataWriteResult
 
 
+@dataclass(frozen=True)
+class IndexRequest:
+    input_dir: Path
+    artifact_path: Path
+    cache_dir: Path
+    config: AppConfig
+    strict: bool = False
+    creator_memory_budget_bytes: int = DEFAULT_CREATOR_MEMORY_BUDGET_BYTES
+    jobs: int = 1
+    io_concurrency: int = 1
+    index_backend: IndexBackend = IndexBackend.MEMORY
+
+
+@dataclass(frozen=True)
+class IndexRunResult:
+    summary: BuildSummary
+    artifact_path: Path
+    metadata_result: MetadataWriteResult
+
+
+@dataclass(frozen=True)
+class RenderRequest:
+    artifact_path: Path
+    output_dir: Path
+    config: AppConfig
+    input_dir: Path | None = None
+    custom_themes_dir: Path | None = None
+    clear_thumbnail_cache: bool = False
+    strict: bool = False
+    thumbnail_workers: int = 1
+    thumbnail_store: ThumbnailStore = ThumbnailStore.PATH
+    index_backend: IndexBackend = IndexBackend.MEMORY
+
+
 def _run_phase(phase: BuildPhase, action: Callable[[], PhaseResult]) -> tuple[PhaseResult, float]:
     started = perf_counter()
     try:
@@ -71,14 +133,78 @@ def _run_phase(phase: BuildPhase, action: Callable[[], PhaseResult]) -> tuple[Ph
     return result, perf_counter() - started
 
 
-def _prepare_output(request: BuildRequest) -> None:
+def _prepare_output(request: BuildRequest | RenderRequest) -> None:
     if request.output_dir.exists():
         clear_output_folder(request.output_dir, request.clear_thumbnail_cache)
     else:
         request.output_dir.mkdir(parents=True, exist_ok=True)
 
 
-def run_build(request: BuildRequest) -> BuildRunResult:
+def _index_library(
+    request: BuildRequest | IndexRequest,
+    cache_dir: Path,
+    creator_store: CreatorStore,
+    index_store: SqliteLibraryIndex | None,
+) -> LibraryIndex | SqliteLibraryIndex:
+    return build_library_index(
+        request.input_dir,
+        request.config.media_rules,
+        strict=request.strict,
+        scan_cache_dir=cache_dir / SCAN_CACHE_DIRNAME,
+        creator_store=creator_store,
+        jobs=request.jobs,
+        media_probe_path=cache_dir / MEDIA_PROBE_DB_FILE_NAME,
+        project_facet_fields=request.config.site_rendering.project_metadata.configured_fields(),
+        metadata_state_dir=cache_dir / METADATA_STATE_DIRNAME,
+        index_store=index_store,
+        io_concurrency=request.io_concurrency,
+    )
+
+
+def _write_lookup(library_index: LibraryIndex | SqliteLibraryIndex, cache_dir: Path) -> None:
+    # The lookup outlives the build so ``cr4te query`` can answer from it without re-indexing.
+    lookup_path = cache_dir / LIBRARY_LOOKUP_DB_FILE_NAME
+    if isinstance(library_index, SqliteLibraryIndex):
+        library_index.write_lookup(lookup_path)
+    else:
+        write_library_lookup(library_index.creators, lookup_path)
+
+
+def _open_index_store(backend: IndexBackend, cache_dir: Path) -> SqliteLibraryIndex | None:
+    return SqliteLibraryIndex(cache_dir / LIBRARY_INDEX_DB_FILE_NAME) if backend == IndexBackend.SQLITE else None
+
+
+def _render_site(
+    request: BuildRequest | RenderRequest,
+    theme_registry: ThemeRegistry,
+    library_index: LibraryIndex | SqliteLibraryIndex,
+    load_creator: Callable[[CreatorSummary], Creator],
+    index_store: SqliteLibraryIndex | None,
+) -> tuple[HtmlBuildResult, float]:
+    media_probe_store = MediaProbeStore(request.output_dir / OUTPUT_CACHE_DIRNAME / MEDIA_PROBE_DB_FILE_NAME)
+    try:
+        logger.info("Building HTML site...")
+        return _run_phase(
+            BuildPhase.HTML_RENDERING,
+            lambda: build_html_pages_streaming(
+                library_index,
+                theme_registry,
+                request.output_dir,
+                request.config.site_labels,
+                request.config.site_rendering,
+                load_creator,
+                strict=request.strict,
+                media_cache=MediaInfoCache(probe_store=media_probe_store),
+                overview=index_store.overview_collector() if index_store is not None else None,
+                thumbnail_workers=request.thumbnail_workers,
+                thumbnail_store=request.thumbnail_store,
+            ),
+        )
+    finally:
+        media_probe_store.close()
+
+
+def _discover_themes_and_prepare_output(request: BuildRequest | RenderRequest) -> tuple[ThemeRegistry, float, float]:
     logger.info("Discovering themes...")
     theme_registry, theme_discovery_seconds = _run_phase(
         BuildPhase.THEME_DISCOVERY,
@@ -89,46 +215,43 @@ def run_build(request: BuildRequest) -> BuildRunResult:
         BuildPhase.OUTPUT_PREPARATION,
         lambda: _prepare_output(request),
     )
+    return theme_registry, theme_discovery_seconds, output_preparation_seconds
 
-    logger.info("Reconciling metadata...")
-    project_facet_fields = request.config.site_rendering.project_metadata.configured_fields()
-    metadata_result, metadata_reconciliation_seconds = _run_phase(
-        BuildPhase.METADATA_RECONCILIATION,
-        lambda: reconcile_metadata_files(
-            request.input_dir,
-            request.config.media_rules,
-            project_facet_fields=project_facet_fields,
-        ),
-    )
-    logger.info(metadata_result.summary_line())
 
-    logger.info("Indexing media library...")
-    library_index, library_indexing_seconds = _run_phase(
-        BuildPhase.LIBRARY_INDEXING,
-        lambda: build_library_index(
-            request.input_dir,
-            request.config.media_rules,
-            strict=request.strict,
-        ),
-    )
+def run_build(request: BuildRequest) -> BuildRunResult:
+    theme_registry, theme_discovery_seconds, output_preparation_seconds = _discover_themes_and_prepare_output(request)
 
-    logger.info("Building HTML site...")
-    html_result, html_rendering_seconds = _run_phase(
-        BuildPhase.HTML_RENDERING,
-        lambda: build_html_pages_streaming(
-            library_index,
+    cache_dir = request.output_dir / OUTPUT_CACHE_DIRNAME
+    creator_store = CreatorStore(cache_dir / CREATOR_SPILL_DIRNAME, request.creator_memory_budget_bytes)
+    index_store = _open_index_store(request.index_backend, cache_dir)
+    try:
+        logger.info("Reconciling metadata and indexing media library...")
+
+        def index_library() -> LibraryIndex | SqliteLibraryIndex:
+            library_index = _index_library(request, cache_dir, creator_store, index_store)
+            _write_lookup(library_index, cache_dir)
+            return library_index
+
+        library_index, library_indexing_seconds = _run_phase(BuildPhase.LIBRARY_INDEXING, index_library)
+        metadata_result = library_index.metadata_result
+        logger.info(metadata_result.summary_line())
+
+        html_result, html_rendering_seconds = _render_site(
+            request,
             theme_registry,
-            request.output_dir,
-            request.config.site_labels,
-            request.config.site_rendering,
+            library_index,
             lambda summary: load_indexed_creator(
                 library_index,
                 summary,
                 request.config.media_rules,
+                creator_store,
             ),
-            strict=request.strict,
-        ),
-    )
+            index_store,
+        )
+    finally:
+        creator_store.close()
+        if index_store is not None:
+            index_store.close()
 
     summary = BuildSummary.from_library_index(
         library_index,
@@ -136,10 +259,92 @@ def run_build(request: BuildRequest) -> BuildRunResult:
         timings=BuildTimings(
             theme_discovery_seconds=theme_discovery_seconds,
             output_preparation_seconds=output_preparation_seconds,
-            metadata_reconciliation_seconds=metadata_reconciliation_seconds,
             library_indexing_seconds=library_indexing_seconds,
             html_rendering_seconds=html_rendering_seconds,
         ),
         asset_statistics=html_result.asset_statistics,
+        render_statistics=html_result.render_statistics,
     )
     return BuildRunResult(summary, html_result.index_html_path, metadata_result)
+
+
+def run_index(request: IndexRequest) -> IndexRunResult:
+    """
+    Reconcile metadata, index the library, and write the result to a standalone artifact for ``run_render``.
+
+    Scan, media probe, and metadata caches are kept in ``request.cache_dir`` between runs.
+    """
+    creator_store = CreatorStore(request.cache_dir / CREATOR_SPILL_DIRNAME, request.creator_memory_budget_bytes)
+    index_store = _open_index_store(request.index_backend, request.cache_dir)
+    try:
+        logger.info("Reconciling metadata and indexing media library...")
+
+        def index_library() -> LibraryIndex | SqliteLibraryIndex:
+            library_index = _index_library(request, request.cache_dir, creator_store, index_store)
+            write_library_artifact(
+                library_index,
+                lambda summary: load_indexed_creator(library_index, summary, request.config.media_rules, creator_store),
+                request.artifact_path,
+            )
+            return library_index
+
+        library_index, library_indexing_seconds = _run_phase(BuildPhase.LIBRARY_INDEXING, index_library)
+    finally:
+        creator_store.close()
+        if index_store is not None:
+            index_store.close()
+
+    metadata_result = library_index.metadata_result
+    logger.info(metadata_result.summary_line())
+    summary = BuildSummary.from_library_index(
+        library_index,
+        additional_issues=tuple(metadata_result.issues),
+        timings=BuildTimings(library_indexing_seconds=library_indexing_seconds),
+    )
+    return IndexRunResult(summary, request.artifact_path, metadata_result)
+
+
+def run_render(request: RenderRequest) -> BuildRunResult:
+    """
+    Render the site from an artifact written by ``run_index`` without walking the library again.
+
+    Media files are still read from the library folder to link them and generate thumbnails.
+    """
+    with open_library_artifact(request.artifact_path, request.input_dir) as artifact:
+        theme_registry, theme_discovery_seconds, output_preparation_seconds = _discover_themes_and_prepare_output(request)
+
+        cache_dir = request.output_dir / OUTPUT_CACHE_DIRNAME
+        index_store = _open_index_store(request.index_backend, cache_dir)
+        try:
+            logger.info(f"Loading library index from {request.artifact_path}...")
+
+            def load_index() -> LibraryIndex | SqliteLibraryIndex:
+                library_index = artifact.load_index(index_store)
+                _write_lookup(library_index, cache_dir)
+                return library_index
+
+            library_index, library_indexing_seconds = _run_phase(BuildPhase.LIBRARY_INDEXING, load_index)
+            html_result, html_rendering_seconds = _render_site(
+                request,
+                theme_registry,
+                library_index,
+                artifact.load_creator,
+                index_store,
+            )
+        finally:
+            if index_store is not None:
+                index_store.close()
+
+    summary = BuildSummary.from_library_index(
+        library_index,
+        additional_issues=(*theme_registry.issues, *html_result.issues),
+        timings=BuildTimings(
+            theme_discovery_seconds=theme_discovery_seconds,
+            output_preparation_seconds=output_preparation_seconds,
+            library_indexing_seconds=library_indexing_seconds,
+            html_rendering_seconds=html_rendering_seconds,
+        ),
+        asset_statistics=html_result.asset_statistics,
+        render_statistics=html_result.render_statistics,
+    )
+    return BuildRunResult(summary, html_result.index_html_path, library_index.metadata_result)
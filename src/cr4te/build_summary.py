@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from .build_issues import BuildIssue, IssueSeverity, deduplicate_issues
-from .build_metrics import AssetStatistics, BuildTimings
+from .build_metrics import AssetStatistics, BuildTimings, IndexStatistics, RenderStatistics
 from .library_index import LibraryIndex
 
 __all__ = [
@@ -21,6 +21,8 @@ class BuildSummary:
     project_count: int
     issues: tuple[BuildIssue, ...] = ()
     timings: BuildTimings = field(default_factory=BuildTimings)
+    index_statistics: IndexStatistics = field(default_factory=IndexStatistics)
+    render_statistics: RenderStatistics = field(default_factory=RenderStatistics)
     asset_statistics: AssetStatistics = field(default_factory=AssetStatistics)
 
     @classmethod
@@ -30,13 +32,16 @@ class BuildSummary:
         additional_issues: tuple[BuildIssue, ...] = (),
         timings: BuildTimings | None = None,
         asset_statistics: AssetStatistics | None = None,
+        render_statistics: RenderStatistics | None = None,
     ) -> "BuildSummary":
         return cls(
             input_dir=index.input_dir,
-            creator_count=len(index.creators),
+            creator_count=index.creator_count,
             project_count=index.project_count,
             issues=deduplicate_issues((*index.issues, *additional_issues)),
             timings=timings or BuildTimings(),
+            index_statistics=index.statistics,
+            render_statistics=render_statistics or RenderStatistics(),
             asset_statistics=asset_statistics or AssetStatistics(),
         )
 
@@ -73,13 +78,37 @@ class BuildSummary:
             "Build timings: "
             f"themes={timings.theme_discovery_seconds:.3f}s, "
             f"output={timings.output_preparation_seconds:.3f}s, "
-            f"metadata={timings.metadata_reconciliation_seconds:.3f}s, "
             f"indexing={timings.library_indexing_seconds:.3f}s, "
             f"rendering={timings.html_rendering_seconds:.3f}s, "
             f"total={timings.total_seconds:.3f}s"
         )
 
-    def asset_statistic_lines(self) -> tuple[str, str]:
+    def index_statistic_line(self) -> str:
+        stats = self.index_statistics
+        return (
+            "Scan cache: "
+            f"reused={stats.scan_cache_hits}, "
+            f"rescanned={stats.scan_cache_misses}"
+        )
+
+    def render_statistic_line(self) -> str:
+        stats = self.render_statistics
+        return (
+            "Creator cache: "
+            f"hits={stats.creator_cache_hits}, "
+            f"misses={stats.creator_cache_misses}"
+        )
+
+    def media_probe_statistic_line(self) -> str:
+        index_stats = self.index_statistics
+        render_stats = self.render_statistics
+        return (
+            "Media probes: "
+            f"reused={index_stats.media_probe_hits + render_stats.media_probe_hits}, "
+            f"measured={index_stats.media_probe_misses + render_stats.media_probe_misses}"
+        )
+
+    def asset_statistic_lines(self) -> tuple[str, str, str, str]:
         stats = self.asset_statistics
         return (
             (
@@ -93,12 +122,34 @@ class BuildSummary:
                 f"generated={stats.source_thumbnails_generated}, "
                 f"reused={stats.source_thumbnails_reused}, "
                 f"default_uses={stats.default_thumbnail_uses}, "
-                f"freshness_checks={stats.source_freshness_checks}"
+                f"freshness_checks={stats.source_freshness_checks}, "
+                f"fingerprints={stats.source_fingerprints_computed}, "
+                f"removed={stats.stale_thumbnails_removed}"
+            ),
+            (
+                "Thumbnail engine: "
+                f"workers={stats.thumbnail_workers}, "
+                f"images_per_second={stats.thumbnails_per_second:.1f}, "
+                f"utilization={stats.thumbnail_worker_utilization:.0%}"
+            ),
+            (
+                "Filesystem calls: "
+                f"stat={stats.filesystem_stat_calls}, "
+                f"resolve={stats.path_resolve_calls}, "
+                f"cached={stats.filesystem_cache_hits}"
             ),
         )
 
     def lines(self) -> tuple[str, ...]:
-        return (self.headline(), self.timing_line(), *self.asset_statistic_lines(), *self.issue_lines())
+        return (
+            self.headline(),
+            self.timing_line(),
+            self.index_statistic_line(),
+            self.render_statistic_line(),
+            self.media_probe_statistic_line(),
+            *self.asset_statistic_lines(),
+            *self.issue_lines(),
+        )
 
     def _display_path(self, path: Path) -> str:
         resolved_input_dir = self.input_dir.resolve()
@@ -113,6 +164,9 @@ def log_build_summary(summary: BuildSummary, logger: logging.Logger | None = Non
     if summary.issue_count:
         logger.warning(summary.headline())
         logger.info(summary.timing_line())
+        logger.info(summary.index_statistic_line())
+        logger.info(summary.render_statistic_line())
+        logger.info(summary.media_probe_statistic_line())
         for line in summary.asset_statistic_lines():
             logger.info(line)
         for line in summary.issue_lines():
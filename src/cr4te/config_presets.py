@@ -178,6 +178,7 @@ DEFAULT_CONFIG = {
                 MediaType.TEXT,
                 MediaType.DOCUMENT,
             ],
+            "text_max_bytes": 1024 * 1024,
         },
         "galleries": {
             "creator_cards": {
@@ -185,16 +186,20 @@ DEFAULT_CONFIG = {
                 "aspect_ratio": "2/3",
                 "page_rows": 5,
                 "image_max_height": 300,
+                "srcset_heights": [175],
             },
             "project_cards": {
                 "building_strategy": ImageGalleryBuildingStrategy.ASPECT,
                 "aspect_ratio": "3/2",
                 "page_rows": 5,
                 "image_max_height": 300,
+                "srcset_heights": [175],
                 "creator_page_image_max_height": 300,
+                "creator_page_srcset_heights": [150, 300],
             },
             "media_groups": {
                 "image_max_height": 300,
+                "srcset_heights": [150, 300],
             },
         },
         "creator_page": {
@@ -16,6 +16,7 @@ CR4TE_TEMPLATES_DIR = CR4TE_PACKAGE_DIR / "templates"
 # === Shared filenames ===
 CR4TE_JSON_FILE_NAME = "cr4te.json"
 README_FILE_NAME = "README.md"
+IGNORE_FILE_NAME = ".cr4teignore"
 INDEX_HTML_FILE_NAME = "index.html"
 PROJECTS_HTML_FILE_NAME = "projects.html"
 TAGS_HTML_FILE_NAME = "tags.html"
@@ -31,6 +32,14 @@ OUTPUT_HTML_DIRNAME = "html"
 OUTPUT_SYMLINKS_DIRNAME = "symlinks"
 OUTPUT_THUMBNAILS_DIRNAME = "thumbnails"
 OUTPUT_THEMES_DIRNAME = "themes"
+OUTPUT_CACHE_DIRNAME = "cache"
+SCAN_CACHE_DIRNAME = "scan"
+METADATA_STATE_DIRNAME = "metadata"
+CREATOR_SPILL_DIRNAME = "creators"
+MEDIA_PROBE_DB_FILE_NAME = "media_probes.sqlite3"
+LIBRARY_INDEX_DB_FILE_NAME = "library_index.sqlite3"
+LIBRARY_LOOKUP_DB_FILE_NAME = "library_lookup.sqlite3"
+THUMBNAIL_MANIFEST_DB_FILE_NAME = "manifest.sqlite3"
 
 # === Thumbnail dimensions ===
 CREATOR_OVERVIEW_THUMB_HEIGHT = 350
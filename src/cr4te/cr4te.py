@@ -8,7 +8,7 @@ from pathlib import Path
 from importlib.metadata import version, PackageNotFoundError
 
 from .build_issues import BuildIssueError
-from .build_runner import BuildPhaseError, BuildRequest, run_build
+from .build_runner import BuildPhaseError, BuildRequest, IndexRequest, RenderRequest, run_build, run_index, run_render
 from .build_summary import log_build_summary
 from .config_manager import load_config, apply_cli_overrides
 from .schemas.config_schema import AppConfig
@@ -16,7 +16,14 @@ from .enums.image_sample_strategy import ImageSampleStrategy
 from .enums.portrait_discovery import PortraitDiscovery
 from .enums.portrait_visibility import PortraitVisibility
 from .enums.domain import Domain
+from .enums.index_backend import IndexBackend
+from .enums.thumbnail_store import ThumbnailStore
+from .enums.visible_fields import ProjectField
+from .constants import LIBRARY_LOOKUP_DB_FILE_NAME, OUTPUT_CACHE_DIRNAME
+from .library_artifact import LibraryArtifactError, open_library_artifact
+from .library_index_store import LibraryLookupError, open_library_lookup
 from .metadata_manager import delete_metadata_files
+from .creator_store import DEFAULT_CREATOR_MEMORY_BUDGET_BYTES
 
 # Short flags
 FLAG_INPUT_SHORT = "-i"
@@ -25,10 +32,21 @@ FLAG_OUTPUT_SHORT = "-o"
 # Long Flags
 FLAG_INPUT = "--input"
 FLAG_OUTPUT = "--output"
+FLAG_OUT = "--out"
+FLAG_INDEX = "--index"
+FLAG_CACHE_DIR = "--cache-dir"
 FLAG_OPEN = "--open"
 FLAG_FORCE = "--force"
 FLAG_CLEAR_THUMBNAIL_CACHE = "--clear-thumbnail-cache"
 FLAG_THEMES_DIR = "--themes-dir"
+FLAG_INDEX_MEMORY_MB = "--index-memory-mb"
+FLAG_JOBS = "--jobs"
+FLAG_IO_CONCURRENCY = "--io-concurrency"
+FLAG_THUMBNAIL_WORKERS = "--thumbnail-workers"
+FLAG_INDEX_BACKEND = "--index-backend"
+FLAG_THUMBNAIL_STORE = "--thumbnail-store"
+FLAG_TAG = "--tag"
+FLAG_FACET = "--facet"
 
 
 class ExitCode(IntEnum):
@@ -148,6 +166,63 @@ def _create_parser() -> argparse.ArgumentParser:
             help="Override portrait rendering: disabled hides portraits, details limits them to detail pages, and all includes overview cards",
         )
 
+    def _add_rendering_arguments(p: argparse.ArgumentParser):
+        p.add_argument(FLAG_OPEN, action="store_true", help="Open index.html after a successful build")
+        p.add_argument(FLAG_FORCE, action="store_true", help="Skip confirmation before replacing existing output")
+        p.add_argument(
+            FLAG_CLEAR_THUMBNAIL_CACHE,
+            action="store_true",
+            help="Remove cached thumbnails before building",
+        )
+        p.add_argument(FLAG_THEMES_DIR, help="Folder containing custom theme CSS files", metavar="DIR")
+        p.add_argument("--strict", action="store_true", help="Fail immediately on invalid metadata instead of skipping entries")
+        p.add_argument(
+            FLAG_THUMBNAIL_WORKERS,
+            type=int,
+            default=1,
+            help="Generate thumbnails in N worker processes while pages are built (default: 1)",
+            metavar="N",
+        )
+        p.add_argument(
+            FLAG_THUMBNAIL_STORE,
+            choices=[store.value for store in ThumbnailStore],
+            default=ThumbnailStore.PATH.value,
+            help="Name cached thumbnails after the source path, or after the source contents so moved and duplicate images reuse them",
+        )
+
+    def _add_index_backend_argument(p: argparse.ArgumentParser):
+        p.add_argument(
+            FLAG_INDEX_BACKEND,
+            choices=[backend.value for backend in IndexBackend],
+            default=IndexBackend.MEMORY.value,
+            help="Keep creator summaries and overview entries in memory, or in an SQLite file in the output cache for very large libraries",
+        )
+
+    def _add_indexing_arguments(p: argparse.ArgumentParser):
+        p.add_argument(
+            FLAG_INDEX_MEMORY_MB,
+            type=int,
+            default=DEFAULT_CREATOR_MEMORY_BUDGET_BYTES // (1024 * 1024),
+            help="Keep up to MB of indexed creator data in memory for rendering and spill the rest to the output cache",
+            metavar="MB",
+        )
+        p.add_argument(
+            "-j",
+            FLAG_JOBS,
+            type=int,
+            default=1,
+            help="Index creators in N worker processes (default: 1)",
+            metavar="N",
+        )
+        p.add_argument(
+            FLAG_IO_CONCURRENCY,
+            type=int,
+            default=1,
+            help="Overlap the file system round trips of N upcoming creators on threads, for network mounts (default: 1)",
+            metavar="N",
+        )
+        _add_index_backend_argument(p)
+
     # Build subcommand
     build_parser = subparsers.add_parser(
         "build",
@@ -158,15 +233,8 @@ def _create_parser() -> argparse.ArgumentParser:
     build_parser.add_argument(FLAG_INPUT_SHORT, FLAG_INPUT, required=True, help="Library root containing creator folders")
     build_parser.add_argument(FLAG_OUTPUT_SHORT, FLAG_OUTPUT, required=True, help="Folder for the generated static site")
     _add_config_arguments(build_parser)
-    build_parser.add_argument(FLAG_OPEN, action="store_true", help="Open index.html after a successful build")
-    build_parser.add_argument(FLAG_FORCE, action="store_true", help="Skip confirmation before replacing existing output")
-    build_parser.add_argument(
-        FLAG_CLEAR_THUMBNAIL_CACHE,
-        action="store_true",
-        help="Remove cached thumbnails before building",
-    )
-    build_parser.add_argument(FLAG_THEMES_DIR, help="Folder containing custom theme CSS files", metavar="DIR")
-    build_parser.add_argument("--strict", action="store_true", help="Fail immediately on invalid metadata instead of skipping entries")
+    _add_rendering_arguments(build_parser)
+    _add_indexing_arguments(build_parser)
     build_parser.set_defaults(_command_parser=build_parser)
 
     # Print-config
@@ -197,8 +265,145 @@ def _create_parser() -> argparse.ArgumentParser:
     delete_mode.add_argument(FLAG_FORCE, action="store_true", help="Skip deletion confirmation")
     delete_metadata_parser.set_defaults(_command_parser=delete_metadata_parser)
 
+    # Index
+    index_parser = subparsers.add_parser(
+        "index",
+        help="Reconcile metadata and write a library index artifact for a separate render step",
+        description=(
+            "Reconcile library metadata and index the library into a single artifact file. "
+            "Run this where the media lives, then render the artifact with 'cr4te render'."
+        ),
+        epilog="Example: cr4te index -i path/to/library --out index.bin --domain music",
+    )
+    index_parser.add_argument(FLAG_INPUT_SHORT, FLAG_INPUT, required=True, help="Library root containing creator folders")
+    index_parser.add_argument(FLAG_OUT, required=True, help="Artifact file to write", metavar="FILE")
+    index_parser.add_argument(
+        FLAG_CACHE_DIR,
+        help="Folder for scan, media probe, and metadata caches (default: FILE.cache next to the artifact)",
+        metavar="DIR",
+    )
+    _add_config_arguments(index_parser)
+    index_parser.add_argument("--strict", action="store_true", help="Fail immediately on invalid metadata instead of skipping entries")
+    _add_indexing_arguments(index_parser)
+    index_parser.set_defaults(_command_parser=index_parser)
+
+    # Render
+    render_parser = subparsers.add_parser(
+        "render",
+        help="Build the static site from a library index artifact",
+        description=(
+            "Generate the static HTML site from an artifact written by 'cr4te index' without walking the library again. "
+            "Media files are still read from the library to link them and generate thumbnails."
+        ),
+        epilog="Example: cr4te render --index index.bin -o path/to/site --domain music",
+    )
+    render_parser.add_argument(FLAG_INDEX, required=True, help="Artifact written by cr4te index", metavar="FILE")
+    render_parser.add_argument(FLAG_OUTPUT_SHORT, FLAG_OUTPUT, required=True, help="Folder for the generated static site")
+    render_parser.add_argument(
+        FLAG_INPUT_SHORT,
+        FLAG_INPUT,
+        help="Library root on this machine, if it is mounted somewhere other than where it was indexed",
+    )
+    _add_config_arguments(render_parser)
+    _add_rendering_arguments(render_parser)
+    _add_index_backend_argument(render_parser)
+    render_parser.set_defaults(_command_parser=render_parser)
+
+    # Query
+    query_parser = subparsers.add_parser(
+        "query",
+        help="Look up projects, creators, or collaborations in a built site",
+        description=(
+            "Answer tag, facet, and collaboration questions from the lookup written by the last build, "
+            "without reading the library again. Results are printed one per line; projects as CREATOR<TAB>PROJECT."
+        ),
+        epilog="Example: cr4te query -o path/to/site --tag Genre=Jazz --facet languages=English",
+    )
+    query_parser.add_argument(FLAG_OUTPUT_SHORT, FLAG_OUTPUT, required=True, help="Folder of a site generated by cr4te build")
+    query_parser.add_argument(
+        FLAG_TAG,
+        action="append",
+        default=[],
+        help="Require the tag TAG in CATEGORY; repeat to require several tags",
+        metavar="CATEGORY=TAG",
+    )
+    query_parser.add_argument(
+        FLAG_FACET,
+        action="append",
+        default=[],
+        help=f"Require VALUE in the project metadata FIELD ({', '.join(field.value for field in ProjectField)}); repeat to require several",
+        metavar="FIELD=VALUE",
+    )
+    query_mode = query_parser.add_mutually_exclusive_group()
+    query_mode.add_argument("--creators", action="store_true", help="List creators carrying the given tags instead of projects")
+    query_mode.add_argument("--member", help="List the collaborations that name NAME as a member", metavar="NAME")
+    query_parser.set_defaults(_command_parser=query_parser)
+
     return parser
     
+def _index_memory_budget_from_args(args) -> int:
+    index_memory_mb = getattr(args, "index_memory_mb", None)
+    if index_memory_mb is None:
+        index_memory_mb = DEFAULT_CREATOR_MEMORY_BUDGET_BYTES // (1024 * 1024)
+    if index_memory_mb < 0:
+        raise CommandUsageError(f"{FLAG_INDEX_MEMORY_MB} must not be negative: {index_memory_mb}")
+    return index_memory_mb * 1024 * 1024
+
+
+def _jobs_from_args(args) -> int:
+    jobs = getattr(args, "jobs", None)
+    if jobs is None:
+        jobs = 1
+    if jobs < 1:
+        raise CommandUsageError(f"{FLAG_JOBS} must be at least 1: {jobs}")
+    return jobs
+
+
+def _thumbnail_workers_from_args(args) -> int:
+    thumbnail_workers = getattr(args, "thumbnail_workers", None)
+    if thumbnail_workers is None:
+        thumbnail_workers = 1
+    if thumbnail_workers < 1:
+        raise CommandUsageError(f"{FLAG_THUMBNAIL_WORKERS} must be at least 1: {thumbnail_workers}")
+    return thumbnail_workers
+
+
+def _io_concurrency_from_args(args, jobs: int) -> int:
+    io_concurrency = getattr(args, "io_concurrency", None)
+    if io_concurrency is None:
+        io_concurrency = 1
+    if io_concurrency < 1:
+        raise CommandUsageError(f"{FLAG_IO_CONCURRENCY} must be at least 1: {io_concurrency}")
+    if io_concurrency > 1 and jobs > 1:
+        raise CommandUsageError(f"{FLAG_IO_CONCURRENCY} cannot be combined with {FLAG_JOBS}")
+    return io_concurrency
+
+
+def _index_backend_from_args(args) -> IndexBackend:
+    return IndexBackend(getattr(args, "index_backend", None) or IndexBackend.MEMORY)
+
+
+def _thumbnail_store_from_args(args) -> ThumbnailStore:
+    return ThumbnailStore(getattr(args, "thumbnail_store", None) or ThumbnailStore.PATH)
+
+
+def _confirm_output_replacement(args, output_dir: Path) -> bool:
+    if not output_dir.exists():
+        return True
+    msg = (
+        f"Output folder '{output_dir}' exists. "
+        f"Replace it and {'clear' if args.clear_thumbnail_cache else 'preserve'} the thumbnail cache?"
+    )
+    return _confirm_action(msg, force=args.force)
+
+
+def _finish_site_build(args, index_html_path: Path) -> int:
+    if args.open:
+        logging.info("Opening index.html...")
+        webbrowser.open(_file_uri(index_html_path))
+    return ExitCode.SUCCESS
+
+
 def _build_cmd_handler(args) -> int:
     config = _load_config(args.config)
     config = _apply_cli_overrides_from_args(config, args)
@@ -210,15 +415,14 @@ def _build_cmd_handler(args) -> int:
     _validate_build_paths(input_dir, output_dir)
 
     custom_themes_dir = _resolve_optional_directory(getattr(args, "themes_dir", None), "Custom themes path")
+    creator_memory_budget_bytes = _index_memory_budget_from_args(args)
+    jobs = _jobs_from_args(args)
+    io_concurrency = _io_concurrency_from_args(args, jobs)
+    thumbnail_workers = _thumbnail_workers_from_args(args)
 
-    if output_dir.exists():
-        msg = (
-            f"Output folder '{output_dir}' exists. "
-            f"Replace it and {'clear' if args.clear_thumbnail_cache else 'preserve'} the thumbnail cache?"
-        )
-        if not _confirm_action(msg, force=args.force):
-            logging.info("Aborting.")
-            return ExitCode.SUCCESS
+    if not _confirm_output_replacement(args, output_dir):
+        logging.info("Aborting.")
+        return ExitCode.SUCCESS
 
     result = run_build(
         BuildRequest(
@@ -228,17 +432,96 @@ def _build_cmd_handler(args) -> int:
             custom_themes_dir=custom_themes_dir,
             clear_thumbnail_cache=args.clear_thumbnail_cache,
             strict=args.strict,
+            creator_memory_budget_bytes=creator_memory_budget_bytes,
+            jobs=jobs,
+            io_concurrency=io_concurrency,
+            thumbnail_workers=thumbnail_workers,
+            thumbnail_store=_thumbnail_store_from_args(args),
+            index_backend=_index_backend_from_args(args),
         )
     )
     log_build_summary(result.summary, logging.getLogger(__name__))
+    return _finish_site_build(args, result.index_html_path)
 
-    if args.open:
-        logging.info("Opening index.html...")
-        webbrowser.open(_file_uri(result.index_html_path))
 
+def _index_cmd_handler(args) -> int:
+    config = _load_config(args.config)
+    config = _apply_cli_overrides_from_args(config, args)
+
+    input_dir = Path(args.input).resolve()
+    _validate_input_dir(input_dir)
+
+    artifact_path = Path(args.out).resolve()
+    if artifact_path.is_dir():
+        raise CommandUsageError(f"{FLAG_OUT} must be a file path, not a directory: {artifact_path}")
+    cache_dir = Path(args.cache_dir).resolve() if args.cache_dir else artifact_path.with_name(f"{artifact_path.name}.cache")
+    jobs = _jobs_from_args(args)
+    io_concurrency = _io_concurrency_from_args(args, jobs)
+    for path in (artifact_path, cache_dir):
+        if path.is_relative_to(input_dir):
+            raise CommandUsageError(f"Index output must not be inside the input path: {path} is inside {input_dir}")
+
+    result = run_index(
+        IndexRequest(
+            input_dir=input_dir,
+            artifact_path=artifact_path,
+            cache_dir=cache_dir,
+            config=config,
+            strict=args.strict,
+            creator_memory_budget_bytes=_index_memory_budget_from_args(args),
+            jobs=jobs,
+            io_concurrency=io_concurrency,
+            index_backend=_index_backend_from_args(args),
+        )
+    )
+    log_build_summary(result.summary, logging.getLogger(__name__))
+    logging.info(f"Library index written to {result.artifact_path}")
     return ExitCode.SUCCESS
 
 
+def _render_cmd_handler(args) -> int:
+    config = _load_config(args.config)
+    config = _apply_cli_overrides_from_args(config, args)
+
+    artifact_path = Path(args.index).resolve()
+    output_dir = Path(args.output).resolve()
+    input_dir = Path(args.input).resolve() if args.input else None
+    if input_dir is not None:
+        _validate_input_dir(input_dir)
+    try:
+        with open_library_artifact(artifact_path, input_dir) as artifact:
+            input_dir = artifact.input_dir
+    except LibraryArtifactError as exc:
+        raise CommandUsageError(str(exc)) from exc
+    _validate_build_paths(input_dir, output_dir)
+    custom_themes_dir = _resolve_optional_directory(getattr(args, "themes_dir", None), "Custom themes path")
+    thumbnail_workers = _thumbnail_workers_from_args(args)
+
+    if not _confirm_output_replacement(args, output_dir):
+        logging.info("Aborting.")
+        return ExitCode.SUCCESS
+
+    try:
+        result = run_render(
+            RenderRequest(
+                artifact_path=artifact_path,
+                output_dir=output_dir,
+                config=config,
+                input_dir=input_dir,
+                custom_themes_dir=custom_themes_dir,
+                clear_thumbnail_cache=args.clear_thumbnail_cache,
+                strict=args.strict,
+                thumbnail_workers=thumbnail_workers,
+                thumbnail_store=_thumbnail_store_from_args(args),
+                index_backend=_index_backend_from_args(args),
+            )
+        )
+    except LibraryArtifactError as exc:
+        raise CommandUsageError(str(exc)) from exc
+    log_build_summary(result.summary, logging.getLogger(__name__))
+    return _finish_site_build(args, result.index_html_path)
+
+
 def _print_config_cmd_handler(args) -> int:
     config = _load_config(args.config)
     config = _apply_cli_overrides_from_args(config, args)
@@ -258,6 +541,51 @@ def _delete_metadata_cmd_handler(args) -> int:
     return ExitCode.SUCCESS
 
 
+def _split_query_pair(value: str, flag: str) -> tuple[str, str]:
+    name, separator, item = value.partition("=")
+    if not separator or not name.strip() or not item.strip():
+        raise CommandUsageError(f"{flag} expects NAME=VALUE: {value!r}")
+    return name, item
+
+
+def _project_field_from_arg(value: str) -> ProjectField:
+    try:
+        return ProjectField(value.strip())
+    except ValueError:
+        choices = ", ".join(field.value for field in ProjectField)
+        raise CommandUsageError(f"{FLAG_FACET} field must be one of {choices}: {value!r}") from None
+
+
+def _query_cmd_handler(args) -> int:
+    tags = [_split_query_pair(value, FLAG_TAG) for value in args.tag]
+    facets = [
+        (_project_field_from_arg(name), value)
+        for name, value in (_split_query_pair(value, FLAG_FACET) for value in args.facet)
+    ]
+    if args.member is not None and (tags or facets):
+        raise CommandUsageError(f"--member cannot be combined with {FLAG_TAG} or {FLAG_FACET}")
+    if args.creators and facets:
+        raise CommandUsageError(f"--creators accepts only {FLAG_TAG}")
+    if args.member is None and not tags and not facets:
+        raise CommandUsageError(f"Pass at least one {FLAG_TAG}, {FLAG_FACET}, or --member")
+
+    lookup_path = Path(args.output).resolve() / OUTPUT_CACHE_DIRNAME / LIBRARY_LOOKUP_DB_FILE_NAME
+    try:
+        with open_library_lookup(lookup_path) as lookup:
+            if args.member is not None:
+                results = lookup.collaborations_of(args.member)
+            elif args.creators:
+                results = lookup.find_creators(tags)
+            else:
+                results = ["\t".join(ref) for ref in lookup.find_projects(tags, facets)]
+    except LibraryLookupError as exc:
+        raise CommandUsageError(str(exc)) from exc
+
+    for result in results:
+        print(result)
+    return ExitCode.SUCCESS
+
+
 def main(argv: list[str] | None = None) -> int:
     _setup_logging()
     
@@ -266,8 +594,11 @@ def main(argv: list[str] | None = None) -> int:
     
     command_map = {
         "build": _build_cmd_handler,
+        "index": _index_cmd_handler,
+        "render": _render_cmd_handler,
         "print-config": _print_config_cmd_handler,
         "delete-metadata": _delete_metadata_cmd_handler,
+        "query": _query_cmd_handler,
     }
     
     command_func = command_map.get(args.command)
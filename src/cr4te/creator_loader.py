@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+
+from .library_index import CreatorSummary
+from .media_cache import BoundedLruCache
+from .schemas.library_schema import Creator
+
+__all__ = [
+    "DEFAULT_CREATOR_LOADER_MAX_ENTRIES",
+    "MemoizedCreatorLoader",
+]
+
+DEFAULT_CREATOR_LOADER_MAX_ENTRIES = 256
+
+
+@dataclass
+class MemoizedCreatorLoader:
+    """Build-scoped LRU front for creator loading so members and collaborations load once per eviction."""
+
+    load_creator: Callable[[CreatorSummary], Creator]
+    summaries: Mapping[str, CreatorSummary]
+    max_entries: int = DEFAULT_CREATOR_LOADER_MAX_ENTRIES
+    _cache: BoundedLruCache[str, Creator] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._cache = BoundedLruCache(self.max_entries)
+
+    def __call__(self, name: str) -> Creator | None:
+        summary = self.summaries.get(name)
+        return self.load(summary) if summary else None
+
+    def load(self, summary: CreatorSummary) -> Creator:
+        return self._cache.get_or_load(summary.name, lambda: self.load_creator(summary))
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
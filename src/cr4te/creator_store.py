@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import shutil
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .schemas.library_schema import Creator
+from .utils import path_utils
+
+__all__ = [
+    "DEFAULT_CREATOR_MEMORY_BUDGET_BYTES",
+    "CreatorStore",
+]
+
+DEFAULT_CREATOR_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+
+# Rough JSON overheads for the keys and punctuation around each part of a serialized creator.
+_CREATOR_OVERHEAD_BYTES = 160
+_PROJECT_OVERHEAD_BYTES = 96
+_MEDIA_GROUP_OVERHEAD_BYTES = 112
+_STRING_OVERHEAD_BYTES = 3
+
+
+@dataclass
+class CreatorStore:
+    """
+    Build-scoped store for creators built during indexing so rendering does not scan them again.
+
+    Creators stay in memory until their estimated serialized size exceeds the budget; later
+    creators are spilled to JSON files below ``spill_dir`` and read back on demand. The size is
+    estimated from the creator's strings, so only spilled creators are serialized.
+    """
+
+    spill_dir: Path
+    memory_budget_bytes: int = DEFAULT_CREATOR_MEMORY_BUDGET_BYTES
+    _resident: dict[str, Creator] = field(default_factory=dict, init=False)
+    _resident_sizes: dict[str, int] = field(default_factory=dict, init=False)
+    _spilled: dict[str, Path] = field(default_factory=dict, init=False)
+    _resident_bytes: int = field(default=0, init=False)
+
+    def put(self, creator: Creator) -> None:
+        self.discard(creator.name)
+        size = _estimated_size(creator)
+        if self._resident_bytes + size <= self.memory_budget_bytes:
+            self._resident[creator.name] = creator
+            self._resident_sizes[creator.name] = size
+            self._resident_bytes += size
+            return
+
+        spill_path = self.spill_dir / path_utils.build_unique_path(Path(f"{creator.name}.json"), depth=1)
+        spill_path.parent.mkdir(parents=True, exist_ok=True)
+        spill_path.write_text(creator.model_dump_json(exclude_unset=True), encoding="utf-8")
+        self._spilled[creator.name] = spill_path
+
+    def get(self, name: str) -> Creator | None:
+        creator = self._resident.get(name)
+        if creator is not None:
+            return creator
+
+        spill_path = self._spilled.get(name)
+        if spill_path is None:
+            return None
+        return Creator.model_validate_json(spill_path.read_text(encoding="utf-8"))
+
+    def discard(self, name: str) -> None:
+        self._resident.pop(name, None)
+        self._resident_bytes -= self._resident_sizes.pop(name, 0)
+        spill_path = self._spilled.pop(name, None)
+        if spill_path is not None:
+            spill_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        self._resident.clear()
+        self._resident_sizes.clear()
+        self._spilled.clear()
+        self._resident_bytes = 0
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    @property
+    def resident_count(self) -> int:
+        return len(self._resident)
+
+    @property
+    def spilled_count(self) -> int:
+        return len(self._spilled)
+
+
+def _estimated_size(creator: Creator) -> int:
+    """Approximate the serialized size of a creator, which its media paths dominate."""
+    size = _CREATOR_OVERHEAD_BYTES + _strings_size(
+        (creator.name, creator.display_name, creator.portrait),
+        creator.aliases,
+        creator.members,
+        creator.nationalities,
+        creator.collaborations,
+        *creator.tags.values(),
+    )
+    media_groups = list(creator.media_groups)
+    for project in creator.projects:
+        size += _PROJECT_OVERHEAD_BYTES + _strings_size(
+            (project.title, project.display_title, project.cover),
+            *project.tags.values(),
+            *project.facets.values(),
+        )
+        media_groups.extend(project.media_groups)
+    for group in media_groups:
+        size += _MEDIA_GROUP_OVERHEAD_BYTES + _strings_size(
+            (group.rel_dir_path,),
+            group.tracks,
+            group.images,
+            group.documents,
+            group.texts,
+            (video.file for video in group.videos),
+            (video.poster for video in group.videos),
+        )
+    return size
+
+
+def _strings_size(*groups: Iterable[str]) -> int:
+    return sum(len(value) + _STRING_OVERHEAD_BYTES for strings in groups for value in strings)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class IndexBackend(str, Enum):
+    MEMORY = "memory"
+    SQLITE = "sqlite"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+class ScanEntryKind(str, Enum):
+    DIRECTORY = "directory"
+    PROJECT = "project"
+    MEDIA = "media"
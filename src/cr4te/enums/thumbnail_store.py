@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ThumbnailStore(str, Enum):
+    PATH = "path"
+    CONTENT = "content"
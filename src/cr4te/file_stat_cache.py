@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+import stat
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .build_metrics import AssetStatistics
+from .media_cache import BoundedLruCache
+
+__all__ = [
+    "DEFAULT_FILE_STAT_CACHE_MAX_ENTRIES",
+    "FileStatCache",
+]
+
+DEFAULT_FILE_STAT_CACHE_MAX_ENTRIES = 65536
+
+
+@dataclass
+class FileStatCache:
+    """
+    Build-scoped memo of ``stat`` and ``resolve`` results for rendering.
+
+    Callers that create or replace a path must ``invalidate`` it. Issued system calls and
+    avoided repeats are counted in the shared asset statistics.
+    """
+
+    statistics: AssetStatistics = field(default_factory=AssetStatistics)
+    max_entries: int = DEFAULT_FILE_STAT_CACHE_MAX_ENTRIES
+    _stats: BoundedLruCache[str, os.stat_result | None] = field(init=False)
+    _resolved: BoundedLruCache[str, Path] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._stats = BoundedLruCache(self.max_entries)
+        self._resolved = BoundedLruCache(self.max_entries)
+
+    def stat(self, path: Path) -> os.stat_result | None:
+        """Return the followed ``stat`` result, or None when the path cannot be stat'ed."""
+        hits = self._stats.hits
+        result = self._stats.get_or_load(os.fspath(path), lambda: self._stat_uncached(path))
+        self.statistics.filesystem_cache_hits += self._stats.hits - hits
+        return result
+
+    def is_file(self, path: Path) -> bool:
+        result = self.stat(path)
+        return result is not None and stat.S_ISREG(result.st_mode)
+
+    def exists(self, path: Path) -> bool:
+        return self.stat(path) is not None
+
+    def resolve(self, path: Path) -> Path:
+        hits = self._resolved.hits
+        result = self._resolved.get_or_load(os.fspath(path), lambda: self._resolve_uncached(path))
+        self.statistics.filesystem_cache_hits += self._resolved.hits - hits
+        return result
+
+    def invalidate(self, path: Path) -> None:
+        key = os.fspath(path)
+        self._stats.discard(key)
+        self._resolved.discard(key)
+
+    def _stat_uncached(self, path: Path) -> os.stat_result | None:
+        self.statistics.filesystem_stat_calls += 1
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return None
+
+    def _resolve_uncached(self, path: Path) -> Path:
+        self.statistics.path_resolve_calls += 1
+        return path.resolve()
@@ -1,14 +1,20 @@
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator
 
 from .build_issues import BuildIssue, BuildIssuePolicy
-from .build_metrics import AssetStatistics
+from .build_metrics import AssetStatistics, RenderStatistics
+from .enums.portrait_visibility import PortraitVisibility
+from .enums.thumb_type import ThumbType
+from .enums.thumbnail_store import ThumbnailStore
+from .creator_loader import MemoizedCreatorLoader
 from .html_context import HtmlBuildContext
-from .enums.visible_fields import CreatorField
 from .library_index import CreatorSummary, LibraryIndex
+from .library_index_store import SqliteLibraryIndex
+from .media_cache import MediaInfoCache
 from .output_preparation import copy_static_assets, prepare_output_dirs
+from .overview_collector import OverviewCollector
 from .overview_contexts import (
     build_creator_overview_entry_from_index,
     build_project_overview_entry_from_index,
@@ -20,11 +26,10 @@ from .page_contexts import (
     compute_creator_stats,
     sort_project,
 )
-from .render_assets import prepare_default_thumbnails
-from .render_models import CreatorOverviewEntry, ProjectOverviewEntry, TagCollection
+from .render_assets import prefetch_thumbnails, prepare_default_thumbnails
 from .schemas.config_schema import SiteLabels, SiteRendering
-from .schemas.library_schema import Creator as CreatorModel
-from .tag_contexts import collect_project_metadata_tags_from_summary, collect_tags_from_creator_summary, merge_tag_maps
+from .schemas.library_schema import Creator as CreatorModel, MediaGroup
+from .tag_contexts import collect_library_tags
 from .template_renderer import (
     render_creator_overview_page,
     render_creator_page,
@@ -44,69 +49,131 @@ class HtmlBuildResult:
     index_html_path: Path
     issues: tuple[BuildIssue, ...] = ()
     asset_statistics: AssetStatistics = field(default_factory=AssetStatistics)
+    render_statistics: RenderStatistics = field(default_factory=RenderStatistics)
 
 
 def build_html_pages_streaming(
-    index: LibraryIndex,
+    index: LibraryIndex | SqliteLibraryIndex,
     theme_registry: ThemeRegistry,
     output_dir: Path,
     site_labels: SiteLabels,
     site_rendering: SiteRendering,
     load_creator: Callable[[CreatorSummary], CreatorModel],
     strict: bool = False,
+    media_cache: MediaInfoCache | None = None,
+    overview: OverviewCollector | None = None,
+    thumbnail_workers: int = 1,
+    thumbnail_store: ThumbnailStore = ThumbnailStore.PATH,
 ) -> HtmlBuildResult:
+    """
+    Render every creator and project page, then the overview and tag pages.
+
+    Creators are loaded one at a time in display-name order. Overview entries are handed to
+    ``overview`` as each creator finishes; pass a collector backed by the index database to keep
+    them out of memory for very large libraries. The tags page is read from the index lookup.
+    With several thumbnail workers, images are resized in worker processes and the next creator's
+    thumbnails are started while the current creator's pages are built. With the content thumbnail
+    store, thumbnails are named after a fingerprint of the source image instead of its path, and
+    thumbnails no page asked for are removed once every page has been rendered.
+    """
     ctx = HtmlBuildContext(
         index.input_dir,
         output_dir,
         site_labels,
         site_rendering,
         themes=theme_registry.themes,
+        media_cache=media_cache or MediaInfoCache(),
         issue_policy=BuildIssuePolicy(strict=strict),
+        thumbnail_workers=thumbnail_workers,
+        thumbnail_store=thumbnail_store,
     )
 
     prepare_output_dirs(ctx)
     copy_static_assets(ctx)
     prepare_default_thumbnails(ctx)
 
-    summary_by_name = index.creator_by_name
-
-    def get_creator(name: str) -> Optional[CreatorModel]:
-        summary = summary_by_name.get(name)
-        return load_creator(summary) if summary else None
-
-    creator_entries: list[CreatorOverviewEntry] = []
-    project_entries: list[ProjectOverviewEntry] = []
-    all_tags = TagCollection()
-
-    for summary in sorted(index.creators, key=lambda c: c.display_name.lower()):
-        creator = load_creator(summary)
-        logger.info(f"Building creator page: {creator.name}")
-        creator_stats = compute_creator_stats(creator)
-        creator_context = build_creator_page_context(ctx, creator, get_creator, creator_stats)
-        render_creator_page(ctx, creator, creator_context)
-
-        for project in sorted(creator.projects, key=sort_project):
-            logger.info(f"Building project page: {creator.name} - {project.title}")
-            project_context = build_project_page_context(ctx, creator, project, get_creator)
-            render_project_page(ctx, creator, project, project_context)
-
-        creator_entries.append(build_creator_overview_entry_from_index(ctx, summary))
-        for project in sorted(summary.projects, key=sort_project_summary):
-            project_entries.append(build_project_overview_entry_from_index(ctx, summary, project))
-
-        project_metadata_tags = collect_project_metadata_tags_from_summary(ctx, summary)
-        all_tags = merge_tag_maps(
-            all_tags,
-            collect_tags_from_creator_summary(summary),
-            project_metadata_tags,
-            {ctx.meta_filter_label(CreatorField.NATIONALITIES): list(summary.nationalities)},
-        )
-
-    creator_entries.sort(key=lambda e: e.name.lower())
-    project_entries.sort(key=lambda e: (e.title.lower(), e.creator_name.lower()))
+    get_creator = MemoizedCreatorLoader(load_creator, index.creator_by_name)
+
+    overview = overview or OverviewCollector()
+
+    try:
+        summaries = index.creators_by_display_name()
+        upcoming = next(summaries, None)
+        if upcoming is not None:
+            _prefetch_creator_thumbnails(ctx, get_creator, upcoming)
+        while upcoming is not None:
+            summary, upcoming = upcoming, next(summaries, None)
+            creator = get_creator.load(summary)
+            if upcoming is not None:
+                # The next creator's images are resized while this creator's pages are built.
+                _prefetch_creator_thumbnails(ctx, get_creator, upcoming)
+            logger.info(f"Building creator page: {creator.name}")
+            creator_stats = compute_creator_stats(creator)
+            creator_context = build_creator_page_context(ctx, creator, get_creator, creator_stats)
+            render_creator_page(ctx, creator, creator_context)
+
+            for project in sorted(creator.projects, key=sort_project):
+                logger.info(f"Building project page: {creator.name} - {project.title}")
+                project_context = build_project_page_context(ctx, creator, project, get_creator)
+                render_project_page(ctx, creator, project, project_context)
+
+            overview.add_creator_entry(build_creator_overview_entry_from_index(ctx, summary))
+            for project in sorted(summary.projects, key=sort_project_summary):
+                overview.add_project_entry(build_project_overview_entry_from_index(ctx, summary, project))
+            ctx.thumbnails.release(summary.name)
+
+        render_creator_overview_page(ctx, overview.creator_entries())
+        render_project_overview_page(ctx, overview.project_entries())
+        render_tags_page(ctx, collect_library_tags(ctx, index.lookup))
+        # Every page has asked for its thumbnails, so what the manifest has not handed out is stale.
+        ctx.asset_statistics.stale_thumbnails_removed = ctx.thumbnail_manifest.prune_unreferenced()
+    finally:
+        ctx.thumbnails.close()
+        ctx.thumbnail_manifest.close()
+
+    probe_store = ctx.media_cache.probe_store
+    return HtmlBuildResult(
+        ctx.index_html_path,
+        ctx.issues,
+        ctx.asset_statistics,
+        RenderStatistics(
+            creator_cache_hits=get_creator.hits,
+            creator_cache_misses=get_creator.misses,
+            media_probe_hits=probe_store.hits if probe_store else 0,
+            media_probe_misses=probe_store.misses if probe_store else 0,
+        ),
+    )
 
-    render_creator_overview_page(ctx, creator_entries)
-    render_project_overview_page(ctx, project_entries)
-    render_tags_page(ctx, all_tags)
 
-    return HtmlBuildResult(ctx.index_html_path, ctx.issues, ctx.asset_statistics)
+def _prefetch_creator_thumbnails(
+    ctx: HtmlBuildContext,
+    get_creator: MemoizedCreatorLoader,
+    summary: CreatorSummary,
+) -> None:
+    if not ctx.thumbnails.parallel:
+        return
+    prefetch_thumbnails(ctx, _creator_thumbnail_requests(ctx, get_creator.load(summary)), summary.name)
+
+
+def _creator_thumbnail_requests(ctx: HtmlBuildContext, creator: CreatorModel) -> Iterator[tuple[str, ThumbType]]:
+    """The source thumbnails a creator's pages and overview entries ask for, in the order they ask."""
+    portrait_visibility = ctx.site_rendering.portraits.visibility
+    if portrait_visibility != PortraitVisibility.DISABLED:
+        yield creator.portrait, ThumbType.PORTRAIT
+    projects = sorted(creator.projects, key=sort_project)
+    for project in projects:
+        yield project.cover, ThumbType.CREATOR_PAGE_PROJECT
+    yield from _gallery_thumbnail_requests(creator.media_groups)
+    for project in projects:
+        yield project.cover, ThumbType.COVER
+        yield from _gallery_thumbnail_requests(project.media_groups)
+    if portrait_visibility == PortraitVisibility.ALL:
+        yield creator.portrait, ThumbType.CREATOR_OVERVIEW
+    for project in projects:
+        yield project.cover, ThumbType.PROJECT_OVERVIEW
+
+
+def _gallery_thumbnail_requests(media_groups: Iterable[MediaGroup]) -> Iterator[tuple[str, ThumbType]]:
+    for group in media_groups:
+        for rel_image_path in group.images:
+            yield rel_image_path, ThumbType.GALLERY
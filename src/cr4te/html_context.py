@@ -4,8 +4,10 @@ from typing import List
 
 from .build_issues import BuildIssue, BuildIssuePolicy
 from .build_metrics import AssetStatistics
+from .file_stat_cache import FileStatCache
 from .enums.media_type import MediaType
 from .enums.thumb_type import ThumbType
+from .enums.thumbnail_store import ThumbnailStore
 from .enums.visible_fields import CollaborationField, CreatorField, ProjectField
 from .schemas.config_schema import ProjectVisibleMetadataRendering, SiteLabels, SiteRendering
 from .taxonomy import get_project_facet
@@ -21,6 +23,7 @@ from .constants import (
     OUTPUT_HTML_DIRNAME,
     OUTPUT_SYMLINKS_DIRNAME,
     OUTPUT_THUMBNAILS_DIRNAME,
+    THUMBNAIL_MANIFEST_DB_FILE_NAME,
     INDEX_HTML_FILE_NAME,
     PROJECTS_HTML_FILE_NAME,
     TAGS_HTML_FILE_NAME,
@@ -37,6 +40,8 @@ from .constants import (
     PORTRAIT_THUMB_HEIGHT,
     COVER_THUMB_HEIGHT,
 )
+from .thumbnail_engine import ThumbnailEngine
+from .thumbnail_manifest import ThumbnailManifest
 from .themes import ThemeDefinition, discover_builtin_themes, get_default_theme
 from .utils.format_utils import format_named
 
@@ -51,6 +56,21 @@ class HtmlBuildContext:
     media_cache: MediaInfoCache = field(default_factory=MediaInfoCache)
     issue_policy: BuildIssuePolicy = field(default_factory=lambda: BuildIssuePolicy(strict=False))
     asset_statistics: AssetStatistics = field(default_factory=AssetStatistics)
+    thumbnail_workers: int = 1
+    thumbnail_store: ThumbnailStore = ThumbnailStore.PATH
+    file_stats: FileStatCache = field(init=False)
+    thumbnails: ThumbnailEngine = field(init=False)
+    thumbnail_manifest: ThumbnailManifest = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.file_stats = FileStatCache(self.asset_statistics)
+        self.thumbnails = ThumbnailEngine(self.asset_statistics, self.thumbnail_workers)
+        self.thumbnail_manifest = ThumbnailManifest(
+            self.thumbs_dir / THUMBNAIL_MANIFEST_DB_FILE_NAME,
+            track_references=self.thumbnail_store == ThumbnailStore.CONTENT,
+        )
+        if self.media_cache.file_stats is None:
+            self.media_cache.file_stats = self.file_stats
 
     @property
     def issues(self) -> tuple[BuildIssue, ...]:
@@ -147,6 +167,10 @@ class HtmlBuildContext:
     def media_type_order(self) -> List[MediaType]:
         return self.site_rendering.media.type_order
 
+    @property
+    def text_max_bytes(self) -> int:
+        return self.site_rendering.media.text_max_bytes
+
     def _project_visible_metadata_config(self, field: ProjectField) -> ProjectVisibleMetadataRendering:
         return self.site_rendering.project_metadata.rendering_for(field)
 
@@ -240,3 +264,15 @@ class HtmlBuildContext:
             ThumbType.GALLERY: self.site_rendering.galleries.media_groups.image_max_height,
         }[thumb_type]
 
+    def get_srcset_heights(self, thumb_type: ThumbType) -> tuple[int, ...]:
+        """Heights of the smaller thumbnails offered next to the generated one in ``srcset``, ascending."""
+        heights = {
+            ThumbType.CREATOR_OVERVIEW: self.site_rendering.galleries.creator_cards.srcset_heights,
+            ThumbType.PROJECT_OVERVIEW: self.site_rendering.galleries.project_cards.srcset_heights,
+            ThumbType.CREATOR_PAGE_PROJECT: self.site_rendering.galleries.project_cards.creator_page_srcset_heights,
+            ThumbType.PORTRAIT: [],
+            ThumbType.COVER: [],
+            ThumbType.GALLERY: self.site_rendering.galleries.media_groups.srcset_heights,
+        }[thumb_type]
+        generated_height = self.get_generated_thumb_height(thumb_type)
+        return tuple(height for height in heights if height < generated_height)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .build_issues import BuildIssue, IssueCode, IssueScope, IssueSeverity
+from .build_metrics import IndexStatistics
+from .library_index import CreatorSummary, LibraryIndex, summarize_creator
+from .library_index_store import SqliteLibraryIndex
+from .schemas.library_schema import Creator
+
+__all__ = [
+    "LIBRARY_ARTIFACT_VERSION",
+    "LibraryArtifact",
+    "LibraryArtifactError",
+    "open_library_artifact",
+    "write_library_artifact",
+]
+
+LIBRARY_ARTIFACT_VERSION = 2
+
+_SCHEMA = (
+    "CREATE TABLE manifest (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE creators (position INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, model BLOB NOT NULL)",
+)
+
+
+class LibraryArtifactError(RuntimeError):
+    pass
+
+
+def write_library_artifact(
+    index: LibraryIndex | SqliteLibraryIndex,
+    load_creator: Callable[[CreatorSummary], Creator],
+    artifact_path: Path,
+) -> None:
+    """
+    Write ``index`` and each creator model to a standalone artifact, replacing any previous file atomically.
+
+    Creators are stored as zlib-compressed model JSON in library folder order, so the artifact can be
+    rendered on another machine without re-walking the library and without unpickling anything.
+    Issue paths are stored relative to the library root and rebased when the artifact is opened.
+    """
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = artifact_path.with_name(f".{artifact_path.name}.{os.getpid()}.tmp")
+    temp_path.unlink(missing_ok=True)
+    manifest = {
+        "input_dir": str(index.input_dir),
+        "issues": json.dumps([_issue_record(issue, index.input_dir) for issue in index.issues]),
+        "statistics": json.dumps(asdict(index.statistics)),
+    }
+    try:
+        with closing(sqlite3.connect(temp_path)) as connection:
+            connection.execute("PRAGMA journal_mode=OFF")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(f"PRAGMA user_version = {LIBRARY_ARTIFACT_VERSION}")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.executemany("INSERT INTO manifest (key, value) VALUES (?, ?)", manifest.items())
+            connection.executemany(
+                "INSERT INTO creators (name, model) VALUES (?, ?)",
+                (
+                    (summary.name, zlib.compress(load_creator(summary).model_dump_json(exclude_unset=True).encode("utf-8")))
+                    for summary in index.creators
+                ),
+            )
+            connection.commit()
+        os.replace(temp_path, artifact_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+@dataclass
+class LibraryArtifact:
+    """
+    An index artifact opened read-only, rebased onto the library folder visible on this machine.
+
+    ``load_index`` rebuilds the creator summaries from the stored models; ``load_creator`` reads
+    one model back on demand, so rendering keeps a single creator in memory at a time.
+    """
+
+    path: Path
+    input_dir: Path
+    connection: sqlite3.Connection
+
+    def load_index(self, index_store: SqliteLibraryIndex | None = None) -> LibraryIndex | SqliteLibraryIndex:
+        manifest = dict(self.connection.execute("SELECT key, value FROM manifest"))
+        try:
+            issues = tuple(_issue_from_record(record, self.input_dir) for record in json.loads(manifest["issues"]))
+            statistics = IndexStatistics(**json.loads(manifest["statistics"]))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise LibraryArtifactError(f"Library index artifact {self.path} has an unreadable manifest: {exc}") from exc
+
+        summaries = (
+            summarize_creator(self.input_dir / name, self._decode(name, model))
+            for name, model in self.connection.execute("SELECT name, model FROM creators ORDER BY position")
+        )
+        if index_store is None:
+            return LibraryIndex(input_dir=self.input_dir, creators=tuple(summaries), issues=issues, statistics=statistics)
+
+        for summary in summaries:
+            index_store.add(summary)
+        return index_store.finish(self.input_dir, issues, statistics, index_store.metadata_result)
+
+    def load_creator(self, summary: CreatorSummary) -> Creator:
+        row = self.connection.execute("SELECT model FROM creators WHERE name = ?", (summary.name,)).fetchone()
+        if row is None:
+            raise LibraryArtifactError(f"Creator {summary.name!r} is missing from library index artifact {self.path}")
+        return self._decode(summary.name, row[0])
+
+    def _decode(self, name: str, model: bytes) -> Creator:
+        try:
+            return Creator.model_validate_json(zlib.decompress(model))
+        except (zlib.error, ValueError) as exc:
+            raise LibraryArtifactError(f"Creator {name!r} in library index artifact {self.path} is unreadable: {exc}") from exc
+
+
+@contextmanager
+def open_library_artifact(artifact_path: Path, input_dir: Path | None = None) -> Iterator[LibraryArtifact]:
+    """
+    Open an artifact written by ``write_library_artifact`` read-only.
+
+    ``input_dir`` locates the library on this machine; it defaults to the folder that was indexed.
+    """
+    if not artifact_path.is_file():
+        raise LibraryArtifactError(f"Library index artifact not found: {artifact_path}")
+    try:
+        connection = sqlite3.connect(f"{artifact_path.resolve().as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error as exc:
+        raise LibraryArtifactError(f"Unable to open library index artifact {artifact_path}: {exc}") from exc
+    with closing(connection):
+        try:
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            row = connection.execute("SELECT value FROM manifest WHERE key = 'input_dir'").fetchone()
+        except sqlite3.DatabaseError as exc:
+            raise LibraryArtifactError(f"Unable to read library index artifact {artifact_path}: {exc}") from exc
+        if version != LIBRARY_ARTIFACT_VERSION or row is None:
+            raise LibraryArtifactError(
+                f"Library index artifact {artifact_path} has version {version}, "
+                f"expected {LIBRARY_ARTIFACT_VERSION}; run cr4te index again"
+            )
+
+        library_dir = (input_dir or Path(row[0])).resolve()
+        if not library_dir.is_dir():
+            raise LibraryArtifactError(
+                f"Library folder {library_dir} does not exist on this machine; pass its location with --input"
+            )
+        yield LibraryArtifact(artifact_path, library_dir, connection)
+
+
+def _issue_record(issue: BuildIssue, input_dir: Path) -> dict[str, Any]:
+    path = issue.path.relative_to(input_dir) if issue.path.is_relative_to(input_dir) else issue.path
+    return {
+        "path": path.as_posix(),
+        "message": issue.message,
+        "scope": issue.scope.value,
+        "code": issue.code.value,
+        "severity": issue.severity.value,
+    }
+
+
+def _issue_from_record(record: dict[str, Any], input_dir: Path) -> BuildIssue:
+    return BuildIssue(
+        path=input_dir / record["path"],
+        message=record["message"],
+        scope=IssueScope(record["scope"]),
+        code=IssueCode(record["code"]),
+        severity=IssueSeverity(record["severity"]),
+    )
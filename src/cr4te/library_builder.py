@@ -1,33 +1,50 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from dataclasses import replace
+import multiprocessing
+import multiprocessing.util
+from collections import defaultdict, deque
+from collections.abc import Callable, Container, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
 
 from pydantic import ValidationError
 
-from .build_issues import BuildIssueError, BuildIssuePolicy, IssueScope
-from .constants import README_FILE_NAME
+from .build_issues import BuildIssue, BuildIssueError, BuildIssuePolicy, IssueScope
+from .build_metrics import IndexStatistics
 from .creator_classification import infer_creator_type
 from .enums.creator_type import CreatorType
+from .creator_store import CreatorStore
+from .enums.scan_entry_kind import ScanEntryKind
+from .enums.visible_fields import ProjectField
+from .library_ignore import IgnoreRules, load_ignore_rules
 from .library_index import CreatorSummary, LibraryIndex, summarize_creator
+from .library_index_store import SqliteLibraryIndex
 from .library_issues import invalid_collaboration_reference_issue, issue_from_exception
+from .library_lookup import normalize_lookup_value
+from .media_cache import MediaInfoCache
+from .media_probe_store import MediaProbeStore
+from .metadata_manager import CreatorMetadataReconciliation, reconcile_creator_metadata
+from .metadata_results import MetadataWriteResult
+from .metadata_state import CreatorMetadataState, MetadataStateStore
+from .metadata_writer import MetadataWriter
 from .library_metadata import (
     MetadataLoadError,
     load_json_model,
     metadata_path,
-    normalize_metadata_date,
 )
 from .library_scan import (
     CreatorScan,
     iter_creator_dirs,
-    iter_media_files,
-    iter_project_dirs,
+    iter_creator_entries,
+    load_creator_ignore_rules,
     rel_to_input,
 )
+from .scan_cache import ScanCache
 from .schemas.config_schema import MediaRules
-from .schemas.library_schema import Creator, Project
+from .schemas.library_schema import COLLABORATION_CREATOR_FIELDS, PERSON_CREATOR_FIELDS, Creator, Project
 from .schemas.metadata_file_schema import CreatorMetadata, ProjectMetadata
 from .utils import text_utils
 
@@ -40,7 +57,6 @@ logger = logging.getLogger(__name__)
 
 
 def _build_project(
-    creator_dir: Path,
     project_dir: Path,
     project_metadata: ProjectMetadata,
     scan: CreatorScan,
@@ -50,12 +66,11 @@ def _build_project(
     selected_cover = scan.selected_cover(project_name)
     cover = rel_to_input(selected_cover, input_dir) if selected_cover else ""
 
-    return Project(
+    return Project.model_construct(
         title=project_name,
         display_title=project_metadata.display_title.strip() or project_name,
-        release_date=normalize_metadata_date(project_metadata.release_date, "release_date", f"{creator_dir.name} - {project_name}"),
+        release_date=project_metadata.release_date,
         cover=cover,
-        info=text_utils.read_text(project_dir / README_FILE_NAME),
         tags=project_metadata.tags,
         facets=project_metadata.facets,
         media_groups=scan.project_media_groups(project_name),
@@ -68,24 +83,111 @@ def _infer_creator_type(creator_name: str, metadata: CreatorMetadata, media_rule
     return infer_creator_type(creator_name, media_rules.collaboration_separators)
 
 
+@dataclass(frozen=True)
+class _ScannedCreator:
+    scan: CreatorScan
+    project_dirs: dict[str, Path]
+    directory_mtimes: dict[Path, int]
+    ignore_fingerprint: str
+    from_cache: bool = False
+
+
+def _scan_creator(
+    creator_dir: Path,
+    input_dir: Path,
+    media_rules: MediaRules,
+    scan_cache: ScanCache | None = None,
+    media_cache: MediaInfoCache | None = None,
+    root_ignore_rules: IgnoreRules | None = None,
+) -> _ScannedCreator:
+    ignore_rules = load_creator_ignore_rules(creator_dir, root_ignore_rules)
+    if scan_cache is not None:
+        cached = scan_cache.load(creator_dir, input_dir, ignore_rules.fingerprint)
+        if cached is not None:
+            return _ScannedCreator(
+                cached.scan,
+                cached.project_dirs,
+                cached.directory_mtimes,
+                ignore_rules.fingerprint,
+                from_cache=True,
+            )
+
+    scan = CreatorScan(creator_dir, input_dir, media_rules, media_cache or MediaInfoCache())
+    project_dirs: dict[str, Path] = {}
+    directory_mtimes: dict[Path, int] = {}
+    for entry in iter_creator_entries(creator_dir, media_rules, ignore_rules):
+        match entry.kind:
+            case ScanEntryKind.DIRECTORY:
+                if scan_cache is not None:
+                    directory_mtimes[entry.path] = entry.path.stat().st_mtime_ns
+            case ScanEntryKind.PROJECT:
+                project_dirs[entry.path.name] = entry.path
+            case _:
+                scan.add_media(entry.path)
+
+    return _ScannedCreator(scan, project_dirs, directory_mtimes, ignore_rules.fingerprint)
+
+
+def _store_scanned_creator(
+    scan_cache: ScanCache,
+    creator_dir: Path,
+    scanned: _ScannedCreator,
+    written_paths: Iterable[Path] = (),
+) -> None:
+    # Metadata files written after the walk change their folder mtimes; record the new values
+    # so the next build can still reuse this scan.
+    written_dirs = {path.parent for path in written_paths} & scanned.directory_mtimes.keys()
+    if scanned.from_cache and not written_dirs:
+        return
+
+    directory_mtimes = dict(scanned.directory_mtimes)
+    try:
+        for dir_path in written_dirs:
+            directory_mtimes[dir_path] = dir_path.stat().st_mtime_ns
+    except OSError:
+        # A folder that vanished after its write costs a rescan on the next build.
+        return
+    scan_cache.store(
+        creator_dir,
+        scanned.scan,
+        scanned.project_dirs,
+        directory_mtimes,
+        scanned.ignore_fingerprint,
+    )
+
+
 def _build_creator(
     creator_dir: Path,
     input_dir: Path,
     media_rules: MediaRules,
     policy: BuildIssuePolicy,
+    scanned: _ScannedCreator | None = None,
+    reconciliation: CreatorMetadataReconciliation | None = None,
 ) -> Creator:
-    metadata = load_json_model(metadata_path(creator_dir), CreatorMetadata)
-    scan = CreatorScan(creator_dir, input_dir, media_rules)
-    for media_path in iter_media_files(creator_dir, media_rules):
-        scan.add_media(media_path)
+    """
+    Assemble a creator from its validated metadata and its scan.
+
+    Metadata is validated where ``cr4te.json`` is loaded, and the date order of the section for the
+    creator's type once that type is known; the project and creator models are then constructed
+    without validating those values a second time.
+    """
+    if reconciliation is None:
+        metadata = load_json_model(metadata_path(creator_dir), CreatorMetadata)
+        load_project_metadata = _load_project_metadata_file
+    else:
+        metadata = reconciliation.creator_metadata()
+        load_project_metadata = reconciliation.project_metadata
+    scanned = scanned or _scan_creator(creator_dir, input_dir, media_rules)
+    scan = scanned.scan
+    project_dirs = scanned.project_dirs
 
     creator_name = creator_dir.name
     display_name = metadata.display_name.strip() or creator_name
     creator_type = _infer_creator_type(creator_name, metadata, media_rules)
+    metadata.validate_date_order(creator_type)
     selected_portrait = scan.selected_portrait()
     portrait = rel_to_input(selected_portrait, input_dir) if selected_portrait else ""
 
-    project_dirs = {project_dir.name: project_dir for project_dir in iter_project_dirs(creator_dir, media_rules)}
     project_names = sorted(set(project_dirs) | scan.discovered_project_names())
     projects = []
     for project_name in project_names:
@@ -94,9 +196,8 @@ def _build_creator(
 
         project_dir = project_dirs[project_name]
         try:
-            project_metadata = load_json_model(metadata_path(project_dir), ProjectMetadata)
+            project_metadata = load_project_metadata(project_dir)
             projects.append(_build_project(
-                creator_dir,
                 project_dir,
                 project_metadata,
                 scan,
@@ -110,52 +211,47 @@ def _build_creator(
     else:
         type_metadata = metadata.person
 
-    active_since = normalize_metadata_date(type_metadata.active_since, "active_since", creator_name)
-    info = text_utils.read_text(creator_dir / README_FILE_NAME)
-    media_groups = scan.creator_media_groups()
-
+    values = {
+        "name": creator_name,
+        "display_name": display_name,
+        "portrait": portrait,
+        "type": creator_type,
+        "aliases": metadata.aliases,
+        "collaborations": metadata.collaborations,
+        "tags": metadata.tags,
+        "active_since": type_metadata.active_since,
+        "nationalities": type_metadata.nationalities,
+        "media_groups": scan.creator_media_groups(),
+        "projects": projects,
+    }
     if creator_type == CreatorType.COLLABORATION:
         members = metadata.collaboration.members
         if not members:
             members = [name.strip() for name in text_utils.multi_split(creator_name, media_rules.collaboration_separators)]
-        return Creator(
-            name=creator_name,
-            display_name=display_name,
-            portrait=portrait,
-            type=creator_type,
-            aliases=metadata.aliases,
-            collaborations=metadata.collaborations,
-            tags=metadata.tags,
-            active_since=active_since,
-            nationalities=type_metadata.nationalities,
-            info=info,
-            media_groups=media_groups,
-            projects=projects,
-            founding_date=normalize_metadata_date(metadata.collaboration.founding.date, "founding_date", creator_name),
+        values.update(
+            founding_date=metadata.collaboration.founding.date,
             founding_location=metadata.collaboration.founding.place,
-            dissolution_date=normalize_metadata_date(metadata.collaboration.dissolution_date, "dissolution_date", creator_name),
+            dissolution_date=metadata.collaboration.dissolution_date,
             members=members,
         )
+        unset_values: dict[str, object] = dict.fromkeys(PERSON_CREATOR_FIELDS, "")
+    else:
+        values.update(
+            date_of_birth=metadata.person.birth.date,
+            place_of_birth=metadata.person.birth.place,
+            date_of_death=metadata.person.death.date,
+            place_of_death=metadata.person.death.place,
+            civil_name=metadata.person.civil_name,
+        )
+        unset_values = {**dict.fromkeys(COLLABORATION_CREATOR_FIELDS, ""), "members": []}
 
-    return Creator(
-        name=creator_name,
-        display_name=display_name,
-        portrait=portrait,
-        type=creator_type,
-        aliases=metadata.aliases,
-        collaborations=metadata.collaborations,
-        tags=metadata.tags,
-        active_since=active_since,
-        nationalities=type_metadata.nationalities,
-        info=info,
-        media_groups=media_groups,
-        projects=projects,
-        date_of_birth=normalize_metadata_date(metadata.person.birth.date, "date_of_birth", creator_name),
-        place_of_birth=metadata.person.birth.place,
-        date_of_death=normalize_metadata_date(metadata.person.death.date, "date_of_death", creator_name),
-        place_of_death=metadata.person.death.place,
-        civil_name=metadata.person.civil_name,
-    )
+    # Passing every field keeps pydantic from resolving default factories per creator; only the
+    # type's own fields count as set, so serialized creators stay valid for their type.
+    return Creator.model_construct(set(values), **values, **unset_values)
+
+
+def _load_project_metadata_file(project_dir: Path) -> ProjectMetadata:
+    return load_json_model(metadata_path(project_dir), ProjectMetadata)
 
 
 def _link_creator_summaries(summaries: list[CreatorSummary], policy: BuildIssuePolicy, input_dir: Path) -> tuple[CreatorSummary, ...]:
@@ -166,56 +262,386 @@ def _link_creator_summaries(summaries: list[CreatorSummary], policy: BuildIssueP
         if summary.type != CreatorType.COLLABORATION:
             continue
         for member in summary.members:
-            reverse_links[member].append(summary.name)
+            reverse_links[normalize_lookup_value(member)].append(summary.name)
+
+    return tuple(
+        _link_creator_summary(
+            summary,
+            creator_names,
+            reverse_links.get(normalize_lookup_value(summary.name), []),
+            policy,
+            input_dir,
+        )
+        for summary in summaries
+    )
+
+
+def _link_creator_summary(
+    summary: CreatorSummary,
+    creator_names: Container[str],
+    reverse_links: Sequence[str],
+    policy: BuildIssuePolicy,
+    input_dir: Path,
+) -> CreatorSummary:
+    if summary.type == CreatorType.COLLABORATION:
+        return summary
+
+    manual = [name for name in summary.collaborations if name in creator_names]
+    invalid = sorted(set(summary.collaborations) - set(manual))
+    if invalid:
+        policy.handle(invalid_collaboration_reference_issue(input_dir / summary.name, invalid))
+
+    collaborations = tuple(sorted(set(manual + list(reverse_links))))
+    return replace(summary, collaborations=collaborations)
+
+
+@dataclass(frozen=True)
+class _PendingCreatorWrites:
+    """Bookkeeping that has to wait until a creator's queued metadata writes have landed."""
+
+    creator_dir: Path
+    reconciliation: CreatorMetadataReconciliation
+    scanned: _ScannedCreator
+    scan_cache: ScanCache | None = None
+    state_store: MetadataStateStore | None = None
+    state: CreatorMetadataState | None = None
+
+    def complete(self) -> None:
+        self.reconciliation.complete_writes()
+        if self.state_store is not None and self.state is not None:
+            self.state_store.store(self.state)
+        if self.scan_cache is not None:
+            written_paths = (*self.reconciliation.result.created, *self.reconciliation.result.updated)
+            _store_scanned_creator(self.scan_cache, self.creator_dir, self.scanned, written_paths)
+
+
+@dataclass(frozen=True)
+class _CreatorIndexResult:
+    creator: Creator | None
+    summary: CreatorSummary | None
+    issues: tuple[BuildIssue, ...]
+    scan_cache_hits: int = 0
+    scan_cache_misses: int = 0
+    media_probe_hits: int = 0
+    media_probe_misses: int = 0
+    metadata_result: MetadataWriteResult | None = None
+    pending_writes: _PendingCreatorWrites | None = None
+
+
+def _complete_creator_writes(result: _CreatorIndexResult) -> _CreatorIndexResult:
+    if result.pending_writes is None:
+        return result
+    result.pending_writes.complete()
+    return replace(result, pending_writes=None)
+
+
+def _index_creator(
+    creator_dir: Path,
+    input_dir: Path,
+    media_rules: MediaRules,
+    strict: bool,
+    scan_cache_dir: Path | None,
+    probe_store: MediaProbeStore | None = None,
+    project_facet_fields: tuple[ProjectField, ...] | None = None,
+    metadata_state_dir: Path | None = None,
+    writer: MetadataWriter | None = None,
+    root_ignore_rules: IgnoreRules | None = None,
+) -> _CreatorIndexResult:
+    """
+    Build and summarize one creator; runs in worker processes or I/O threads when indexing concurrently.
+
+    With project facet fields, the creator's metadata files are reconciled from the same folder
+    listing and their parsed content is used directly instead of being read again. A metadata state
+    folder lets files unchanged since the previous build skip reconciliation.
+    Changed files are queued on ``writer``; the result then carries pending writes, and the caller
+    completes them with ``_complete_creator_writes``. Without a writer they complete before returning.
+    """
+    policy = BuildIssuePolicy(strict=strict)
+    scan_cache = ScanCache(scan_cache_dir, media_rules) if scan_cache_dir is not None else None
+    creator = None
+    summary = None
+    reconciliation = None
+    pending_writes = None
+    try:
+        logger.info(f"Indexing: {creator_dir.name}")
+        scanned = _scan_creator(
+            creator_dir,
+            input_dir,
+            media_rules,
+            scan_cache,
+            MediaInfoCache(probe_store=probe_store),
+            root_ignore_rules,
+        )
+        if project_facet_fields is not None:
+            state_store = (
+                MetadataStateStore(metadata_state_dir, media_rules, project_facet_fields)
+                if metadata_state_dir is not None
+                else None
+            )
+            state = state_store.load(creator_dir) if state_store is not None else None
+            reconciliation = reconcile_creator_metadata(
+                creator_dir,
+                scanned.project_dirs.values(),
+                media_rules,
+                project_facet_fields,
+                state=state,
+                writer=writer,
+            )
+            pending_writes = _PendingCreatorWrites(creator_dir, reconciliation, scanned, scan_cache, state_store, state)
+            if writer is None:
+                pending_writes.complete()
+                pending_writes = None
+        elif scan_cache is not None:
+            _store_scanned_creator(scan_cache, creator_dir, scanned)
+        creator = _build_creator(creator_dir, input_dir, media_rules, policy, scanned, reconciliation)
+        summary = summarize_creator(creator_dir, creator)
+    except BuildIssueError:
+        raise
+    except (MetadataLoadError, ValidationError, ValueError, OSError) as exc:
+        creator = None
+        policy.handle(issue_from_exception(creator_dir, IssueScope.CREATOR, exc), exc)
+
+    return _CreatorIndexResult(
+        creator=creator,
+        summary=summary,
+        issues=tuple(policy.issues),
+        scan_cache_hits=scan_cache.hits if scan_cache else 0,
+        scan_cache_misses=scan_cache.misses if scan_cache else 0,
+        metadata_result=reconciliation.result if reconciliation else None,
+        pending_writes=pending_writes,
+    )
 
-    linked: list[CreatorSummary] = []
-    for summary in summaries:
-        if summary.type == CreatorType.COLLABORATION:
-            linked.append(summary)
-            continue
 
-        manual = [name for name in summary.collaborations if name in creator_names]
-        invalid = sorted(set(summary.collaborations) - creator_names)
-        if invalid:
-            policy.handle(invalid_collaboration_reference_issue(input_dir / summary.name, invalid))
+_worker_writer: MetadataWriter | None = None
+_worker_probe_store: MediaProbeStore | None = None
+
+
+def _init_index_worker(media_probe_path: Path | None) -> None:
+    # One writer and one probe store per worker process serve every creator that process indexes.
+    # The parent has already prepared the probe schema, so workers never migrate it concurrently.
+    global _worker_writer, _worker_probe_store
+    _worker_writer = MetadataWriter()
+    multiprocessing.util.Finalize(None, _worker_writer.close, exitpriority=10)
+    if media_probe_path is not None:
+        _worker_probe_store = MediaProbeStore(media_probe_path, prepare_schema=False)
+        multiprocessing.util.Finalize(None, _worker_probe_store.close, exitpriority=10)
+
+
+def _index_creator_in_worker(creator_dir: Path, **kwargs: object) -> _CreatorIndexResult:
+    # Futures cannot leave the worker, so its writes complete before the result is sent back;
+    # the other workers keep writing meanwhile.
+    probe_store = _worker_probe_store
+    probe_hits = probe_store.hits if probe_store else 0
+    probe_misses = probe_store.misses if probe_store else 0
+    result = _index_creator(creator_dir, writer=_worker_writer, probe_store=probe_store, **kwargs)
+    return replace(
+        _complete_creator_writes(result),
+        media_probe_hits=probe_store.hits - probe_hits if probe_store else 0,
+        media_probe_misses=probe_store.misses - probe_misses if probe_store else 0,
+    )
 
-        collaborations = tuple(sorted(set(manual + reverse_links.get(summary.name, []))))
-        linked.append(replace(summary, collaborations=collaborations))
 
-    return tuple(linked)
+def _iter_index_results(
+    creator_dirs: Iterable[Path],
+    index_creator: Callable[..., _CreatorIndexResult],
+    jobs: int,
+    io_concurrency: int = 1,
+    writer: MetadataWriter | None = None,
+    probe_store: MediaProbeStore | None = None,
+) -> Iterator[_CreatorIndexResult]:
+    if jobs > 1:
+        # The writer's threads are already running here, and forking them could leave a worker
+        # holding a lock no thread of its own will release, so workers start fresh interpreters.
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_index_worker,
+            initargs=(probe_store.db_path if probe_store is not None else None,),
+        )
+        worker_index_creator = partial(_index_creator_in_worker, **index_creator.keywords)
+        yield from _iter_ordered_results(executor, creator_dirs, worker_index_creator, jobs * 4)
+        return
+
+    index_creator = partial(index_creator, writer=writer, probe_store=probe_store)
+    if io_concurrency > 1:
+        # Threads spend most of their time waiting on listings, stats and header reads, so upcoming
+        # creators are indexed while the current one is merged; on a slow mount the waits overlap.
+        # They share this process's writer and probe store, so the thread count stays at the I/O
+        # concurrency plus the writer's workers; model construction still holds the GIL, and
+        # CPU-bound libraries are better served by --jobs.
+        executor = ThreadPoolExecutor(max_workers=io_concurrency, thread_name_prefix="cr4te-io")
+        results = _iter_ordered_results(executor, creator_dirs, index_creator, io_concurrency * 2)
+    else:
+        results = map(index_creator, creator_dirs)
+    yield from _iter_completed_results(results, writer.max_workers if writer is not None else 0)
+
+
+def _iter_completed_results(
+    results: Iterable[_CreatorIndexResult],
+    max_pending: int,
+) -> Iterator[_CreatorIndexResult]:
+    # Writes of the last few creators stay queued on the shared writer while the next creators are
+    # indexed, so writes overlap across creators; completing them in order keeps results ordered.
+    pending: deque[_CreatorIndexResult] = deque()
+    for result in results:
+        pending.append(result)
+        if len(pending) > max_pending:
+            yield _complete_creator_writes(pending.popleft())
+    while pending:
+        yield _complete_creator_writes(pending.popleft())
+
+
+def _iter_ordered_results(
+    executor: Executor,
+    creator_dirs: Iterable[Path],
+    index_creator: Callable[[Path], _CreatorIndexResult],
+    max_in_flight: int,
+) -> Iterator[_CreatorIndexResult]:
+    # Results are consumed in submission order, so merged summaries and issues stay deterministic.
+    # The in-flight window bounds how many finished creators wait behind a slow one.
+    with executor:
+        pending: deque[Future[_CreatorIndexResult]] = deque()
+        try:
+            for creator_dir in creator_dirs:
+                pending.append(executor.submit(index_creator, creator_dir))
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
 
 
 def build_library_index(
     input_dir: Path,
     media_rules: MediaRules,
     strict: bool = False,
-) -> LibraryIndex:
+    scan_cache_dir: Path | None = None,
+    creator_store: CreatorStore | None = None,
+    jobs: int = 1,
+    media_probe_path: Path | None = None,
+    project_facet_fields: Iterable[ProjectField] | None = None,
+    metadata_state_dir: Path | None = None,
+    index_store: SqliteLibraryIndex | None = None,
+    io_concurrency: int = 1,
+) -> LibraryIndex | SqliteLibraryIndex:
+    """
+    Index every creator below the input folder.
+
+    Passing project facet fields fuses metadata reconciliation into the pass: each creator's
+    metadata files are reconciled and read once, and the write results are returned on the index.
+    With a metadata state folder, files unchanged since the previous build are not reconciled again.
+    With an index store, summaries are written to it as creators finish instead of being kept in
+    memory, and the filled store is returned.
+    An I/O concurrency above one indexes upcoming creators on that many threads of this process, so
+    the round trips of a network mount overlap; it applies when ``jobs`` is one.
+    Reconciled files are written through one bounded writer for the whole pass, or one per worker
+    process, and every write has completed when this returns. Media probes likewise go through one
+    store per process.
+    """
     input_dir = input_dir.resolve()
+    # The root .cr4teignore applies to every creator; it is read once here instead of per creator.
+    root_ignore_rules = load_ignore_rules(input_dir)
+    index_creator = partial(
+        _index_creator,
+        input_dir=input_dir,
+        media_rules=media_rules,
+        strict=strict,
+        scan_cache_dir=scan_cache_dir,
+        project_facet_fields=tuple(project_facet_fields) if project_facet_fields is not None else None,
+        metadata_state_dir=metadata_state_dir,
+        root_ignore_rules=root_ignore_rules,
+    )
 
     summaries: list[CreatorSummary] = []
     policy = BuildIssuePolicy(strict=strict)
-    for creator_dir in iter_creator_dirs(input_dir, media_rules):
-        try:
-            logger.info(f"Indexing: {creator_dir.name}")
-            creator = _build_creator(creator_dir, input_dir, media_rules, policy)
-            summaries.append(summarize_creator(creator_dir, creator))
-        except BuildIssueError:
-            raise
-        except (MetadataLoadError, ValidationError, ValueError, OSError) as exc:
-            policy.handle(issue_from_exception(creator_dir, IssueScope.CREATOR, exc), exc)
+    scan_cache_hits = 0
+    scan_cache_misses = 0
+    media_probe_hits = 0
+    media_probe_misses = 0
+    metadata_result = MetadataWriteResult()
+    # Opening the store here prepares its schema once, before any worker process connects.
+    probe_store = MediaProbeStore(media_probe_path) if media_probe_path is not None else None
+    seen_creator_dirs: list[Path] = []
+
+    def creator_dirs() -> Iterator[Path]:
+        for creator_dir in iter_creator_dirs(input_dir, media_rules, root_ignore_rules):
+            seen_creator_dirs.append(creator_dir)
+            yield creator_dir
+
+    try:
+        with MetadataWriter() as writer:
+            results = _iter_index_results(
+                creator_dirs(),
+                index_creator,
+                jobs,
+                io_concurrency,
+                writer,
+                probe_store,
+            )
+            for result in results:
+                for issue in result.issues:
+                    policy.handle(issue)
+                scan_cache_hits += result.scan_cache_hits
+                scan_cache_misses += result.scan_cache_misses
+                media_probe_hits += result.media_probe_hits
+                media_probe_misses += result.media_probe_misses
+                if result.metadata_result is not None:
+                    metadata_result.extend(result.metadata_result)
+                if result.summary is None:
+                    continue
+                if index_store is not None:
+                    index_store.add(result.summary)
+                else:
+                    summaries.append(result.summary)
+                if creator_store is not None and result.creator is not None:
+                    creator_store.put(result.creator)
+    finally:
+        if probe_store is not None:
+            media_probe_hits += probe_store.hits
+            media_probe_misses += probe_store.misses
+            probe_store.close()
+
+    if scan_cache_dir is not None:
+        # Records of removed or renamed creators would otherwise stay in the cache forever.
+        ScanCache(scan_cache_dir, media_rules).prune(seen_creator_dirs)
+
+    statistics = IndexStatistics(
+        scan_cache_hits=scan_cache_hits,
+        scan_cache_misses=scan_cache_misses,
+        media_probe_hits=media_probe_hits,
+        media_probe_misses=media_probe_misses,
+    )
+    if index_store is not None:
+        index_store.link_collaborations(
+            lambda summary, creator_names, reverse_links: _link_creator_summary(
+                summary,
+                creator_names,
+                reverse_links,
+                policy,
+                input_dir,
+            )
+        )
+        return index_store.finish(input_dir, tuple(policy.issues), statistics, metadata_result)
 
     return LibraryIndex(
         input_dir=input_dir,
         creators=_link_creator_summaries(summaries, policy, input_dir),
         issues=tuple(policy.issues),
+        statistics=statistics,
+        metadata_result=metadata_result,
     )
 
 
 def load_indexed_creator(
-    index: LibraryIndex,
+    index: LibraryIndex | SqliteLibraryIndex,
     summary: CreatorSummary,
     media_rules: MediaRules,
+    creator_store: CreatorStore | None = None,
 ) -> Creator:
-    policy = BuildIssuePolicy(strict=False)
-    creator = _build_creator(summary.path, index.input_dir, media_rules, policy)
+    creator = creator_store.get(summary.name) if creator_store is not None else None
+    if creator is None:
+        policy = BuildIssuePolicy(strict=False)
+        creator = _build_creator(summary.path, index.input_dir, media_rules, policy)
     return creator.model_copy(update={"collaborations": list(summary.collaborations)})
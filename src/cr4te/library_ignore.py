@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .constants import IGNORE_FILE_NAME
+
+__all__ = [
+    "IgnorePattern",
+    "IgnoreRules",
+    "load_ignore_rules",
+    "parse_ignore_patterns",
+]
+
+
+@dataclass(frozen=True)
+class IgnorePattern:
+    base: str
+    regex: re.Pattern[str]
+    negated: bool = False
+    directory_only: bool = False
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.directory_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(f"{self.base}/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1:]
+        return self.regex.match(rel_path) is not None
+
+
+@dataclass(frozen=True)
+class IgnoreRules:
+    """
+    Compiled ``.cr4teignore`` patterns, evaluated against library-relative POSIX paths.
+
+    The last matching pattern wins, as in ``.gitignore``. Callers check entries while descending,
+    so a path is only evaluated after its parent folders were kept.
+    """
+
+    patterns: tuple[IgnorePattern, ...] = ()
+    fingerprint: str = ""
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        for pattern in reversed(self.patterns):
+            if pattern.matches(rel_path, is_dir):
+                return not pattern.negated
+        return False
+
+
+def load_ignore_rules(dir_path: Path, rel_dir: str = "", inherited: IgnoreRules | None = None) -> IgnoreRules:
+    """Append the patterns of ``dir_path/.cr4teignore`` to the inherited rules."""
+    inherited = inherited or IgnoreRules()
+    try:
+        text = (dir_path / IGNORE_FILE_NAME).read_text(encoding="utf-8", errors="replace")
+    except (FileNotFoundError, NotADirectoryError):
+        return inherited
+
+    fingerprint = hashlib.sha1(f"{inherited.fingerprint}\0{rel_dir}\0{text}".encode()).hexdigest()
+    return IgnoreRules(
+        patterns=inherited.patterns + parse_ignore_patterns(text.splitlines(), rel_dir),
+        fingerprint=fingerprint,
+    )
+
+
+def parse_ignore_patterns(lines: Iterable[str], base: str = "") -> tuple[IgnorePattern, ...]:
+    patterns: list[IgnorePattern] = []
+    for line in lines:
+        pattern = line.rstrip()
+        if not pattern or pattern.startswith("#"):
+            continue
+
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+        directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if not pattern:
+            continue
+
+        anchored = "/" in pattern
+        body = _translate_glob(pattern.lstrip("/"))
+        prefix = "" if anchored else "(?:.*/)?"
+        patterns.append(IgnorePattern(
+            base=base,
+            regex=re.compile(rf"{prefix}{body}\Z"),
+            negated=negated,
+            directory_only=directory_only,
+        ))
+    return tuple(patterns)
+
+
+def _translate_glob(pattern: str) -> str:
+    parts: list[str] = []
+    index = 0
+    length = len(pattern)
+    while index < length:
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", index + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                content = pattern[index + 1:end].replace("\\", "\\\\")
+                if content.startswith("!"):
+                    content = f"^{content[1:]}"
+                parts.append(f"[{content}]")
+                index = end + 1
+                continue
+        elif char == "\\" and index + 1 < length:
+            parts.append(re.escape(pattern[index + 1]))
+            index += 2
+            continue
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
@@ -1,34 +1,44 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
+from typing import TypeVar
 
 from .build_issues import BuildIssue
+from .build_metrics import IndexStatistics
 from .enums.creator_type import CreatorType
 from .enums.visible_fields import ProjectField
+from .library_lookup import LibraryLookup, build_library_lookup
 from .media_counts import MediaCounts, count_media_groups
+from .metadata_results import MetadataWriteResult
 from .schemas.library_schema import Creator, Project
 
 __all__ = [
     "CreatorSummary",
     "LibraryIndex",
     "ProjectSummary",
+    "creator_display_sort_key",
     "summarize_creator",
 ]
 
+KeyT = TypeVar("KeyT")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ProjectSummary:
     title: str
     display_title: str
     release_date: str
     cover: str
-    tags: dict[str, list[str]]
-    facets: dict[ProjectField, list[str]]
+    tags: dict[str, tuple[str, ...]]
+    facets: dict[ProjectField, tuple[str, ...]]
     media_counts: MediaCounts
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreatorSummary:
     path: Path
     name: str
@@ -37,10 +47,9 @@ class CreatorSummary:
     portrait: str
     aliases: tuple[str, ...]
     collaborations: tuple[str, ...]
-    tags: dict[str, list[str]]
+    tags: dict[str, tuple[str, ...]]
     active_since: str
     nationalities: tuple[str, ...]
-    info: str
     date_of_birth: str = ""
     place_of_birth: str = ""
     date_of_death: str = ""
@@ -63,17 +72,42 @@ class LibraryIndex:
     input_dir: Path
     creators: tuple[CreatorSummary, ...]
     issues: tuple[BuildIssue, ...] = ()
+    statistics: IndexStatistics = field(default_factory=IndexStatistics)
+    metadata_result: MetadataWriteResult = field(default_factory=MetadataWriteResult)
 
-    @property
+    @cached_property
     def creator_by_name(self) -> dict[str, CreatorSummary]:
         return {creator.name: creator for creator in self.creators}
 
+    @cached_property
+    def lookup(self) -> LibraryLookup:
+        return build_library_lookup(self.creators)
+
+    @property
+    def creator_count(self) -> int:
+        return len(self.creators)
+
     @property
     def project_count(self) -> int:
         return sum(creator.project_count for creator in self.creators)
 
+    def creators_by_display_name(self) -> Iterator[CreatorSummary]:
+        return iter(sorted(self.creators, key=creator_display_sort_key))
+
+
+def creator_display_sort_key(creator: CreatorSummary) -> str:
+    return creator.display_name.lower()
+
 
 def summarize_creator(creator_dir: Path, creator: Creator) -> CreatorSummary:
+    """
+    Reduce a loaded creator to the summary kept in the library index.
+
+    Tag categories, tag and facet values, dates, and nationalities repeat across thousands of
+    projects, so they are interned and stored as tuples, and display names equal to the folder
+    name reuse it; empty tag categories and facets are dropped. Summaries of large libraries then
+    share one string object per distinct value.
+    """
     project_summaries = tuple(_summarize_project(project) for project in creator.projects)
     media_counts = count_media_groups(creator.media_groups)
     for project in project_summaries:
@@ -82,24 +116,23 @@ def summarize_creator(creator_dir: Path, creator: Creator) -> CreatorSummary:
     return CreatorSummary(
         path=creator_dir,
         name=creator.name,
-        display_name=creator.display_name,
+        display_name=creator.name if creator.display_name == creator.name else creator.display_name,
         type=creator.type,
         portrait=creator.portrait,
-        aliases=tuple(creator.aliases),
-        collaborations=tuple(creator.collaborations),
-        tags=creator.tags,
-        active_since=creator.active_since,
-        nationalities=tuple(creator.nationalities),
-        info=creator.info,
+        aliases=_intern_values(creator.aliases),
+        collaborations=_intern_values(creator.collaborations),
+        tags=_intern_tags(creator.tags),
+        active_since=sys.intern(creator.active_since),
+        nationalities=_intern_values(creator.nationalities),
         date_of_birth=creator.date_of_birth,
-        place_of_birth=creator.place_of_birth,
+        place_of_birth=sys.intern(creator.place_of_birth),
         date_of_death=creator.date_of_death,
-        place_of_death=creator.place_of_death,
+        place_of_death=sys.intern(creator.place_of_death),
         civil_name=creator.civil_name,
         founding_date=creator.founding_date,
-        founding_location=creator.founding_location,
+        founding_location=sys.intern(creator.founding_location),
         dissolution_date=creator.dissolution_date,
-        members=tuple(creator.members),
+        members=_intern_values(creator.members),
         media_counts=media_counts,
         projects=project_summaries,
     )
@@ -108,10 +141,29 @@ def summarize_creator(creator_dir: Path, creator: Creator) -> CreatorSummary:
 def _summarize_project(project: Project) -> ProjectSummary:
     return ProjectSummary(
         title=project.title,
-        display_title=project.display_title,
-        release_date=project.release_date,
+        display_title=project.title if project.display_title == project.title else project.display_title,
+        release_date=sys.intern(project.release_date),
         cover=project.cover,
-        tags=project.tags,
-        facets=project.facets,
+        tags=_intern_tags(project.tags),
+        facets=_intern_facets(project.facets),
         media_counts=count_media_groups(project.media_groups),
     )
+
+
+def _intern_values(values: Iterable[str]) -> tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+
+def _intern_tags(tags: Mapping[str, Iterable[str]]) -> dict[str, tuple[str, ...]]:
+    return {sys.intern(category): values for category, values in _non_empty_values(tags)}
+
+
+def _intern_facets(facets: Mapping[ProjectField, Iterable[str]]) -> dict[ProjectField, tuple[str, ...]]:
+    return dict(_non_empty_values(facets))
+
+
+def _non_empty_values(values_by_key: Mapping[KeyT, Iterable[str]]) -> Iterator[tuple[KeyT, tuple[str, ...]]]:
+    for key, values in values_by_key.items():
+        interned = _intern_values(values)
+        if interned:
+            yield key, interned
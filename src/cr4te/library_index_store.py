@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+from collections.abc import Callable, Container, Iterable, Iterator, Mapping, Sequence
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar, overload
+
+from .build_issues import BuildIssue
+from .build_metrics import IndexStatistics
+from .enums.visible_fields import ProjectField
+from .library_index import CreatorSummary, creator_display_sort_key
+from .library_lookup import ProjectRef, lookup_entries, normalize_lookup_value
+from .metadata_results import MetadataWriteResult
+from .overview_collector import creator_entry_sort_key, project_entry_sort_key
+from .render_models import CreatorOverviewEntry, ProjectOverviewEntry
+
+__all__ = [
+    "LIBRARY_LOOKUP_VERSION",
+    "LibraryLookupError",
+    "SqliteLibraryIndex",
+    "SqliteLibraryLookup",
+    "SqliteOverviewCollector",
+    "open_library_lookup",
+    "write_library_lookup",
+]
+
+RowT = TypeVar("RowT")
+_PAGE_SIZE = 256
+LIBRARY_LOOKUP_VERSION = 2
+
+_LOOKUP_SCHEMA = (
+    "CREATE TABLE creator_tags (category TEXT NOT NULL, tag TEXT NOT NULL, creator TEXT NOT NULL)",
+    "CREATE INDEX creator_tags_by_tag ON creator_tags (category, tag, creator)",
+    "CREATE TABLE creator_nationalities (nationality TEXT NOT NULL, creator TEXT NOT NULL)",
+    "CREATE INDEX creator_nationalities_by_nationality ON creator_nationalities (nationality)",
+    "CREATE TABLE collaboration_members (member TEXT NOT NULL, collaboration TEXT NOT NULL)",
+    "CREATE INDEX collaboration_members_by_member ON collaboration_members (member)",
+    "CREATE TABLE project_tags (category TEXT NOT NULL, tag TEXT NOT NULL, creator TEXT NOT NULL, project TEXT NOT NULL)",
+    "CREATE INDEX project_tags_by_tag ON project_tags (category, tag, creator, project)",
+    "CREATE TABLE project_facets (field TEXT NOT NULL, value TEXT NOT NULL, creator TEXT NOT NULL, project TEXT NOT NULL)",
+    "CREATE INDEX project_facets_by_value ON project_facets (field, value, creator, project)",
+)
+_LOOKUP_TABLES = ("creator_tags", "creator_nationalities", "collaboration_members", "project_tags", "project_facets")
+
+_INDEX_SCHEMA = (
+    "CREATE TABLE creators ("
+    "position INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, sort_key TEXT NOT NULL, summary BLOB NOT NULL)",
+    "CREATE INDEX creators_by_sort_key ON creators (sort_key, position)",
+    "CREATE TABLE overview_creators (position INTEGER PRIMARY KEY, sort_key TEXT NOT NULL, entry BLOB NOT NULL)",
+    "CREATE INDEX overview_creators_by_sort_key ON overview_creators (sort_key, position)",
+    "CREATE TABLE overview_projects ("
+    "position INTEGER PRIMARY KEY, title_key TEXT NOT NULL, creator_key TEXT NOT NULL, entry BLOB NOT NULL)",
+    "CREATE INDEX overview_projects_by_sort_key ON overview_projects (title_key, creator_key, position)",
+    *_LOOKUP_SCHEMA,
+)
+
+
+class _PickledRows(Sequence[RowT]):
+    """
+    Sized, re-iterable view of pickled rows, read one page at a time in SQL order.
+
+    The row count is kept by the writer and passed in, so ``len`` never queries. Positional reads
+    fetch and keep the page around the requested row, and slices are read with a single query.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, table: str, column: str, order_by: tuple[str, ...], count: int):
+        self._connection = connection
+        self._table = table
+        self._column = column
+        self._order_by = (*order_by, "position")
+        self._count = count
+        self._page_start = 0
+        self._page: list[RowT] = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> RowT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RowT]: ...
+
+    def __getitem__(self, index: int | slice) -> RowT | list[RowT]:
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._count))
+            if not positions:
+                return []
+            first = min(positions[0], positions[-1])
+            rows = self._read(first, abs(positions[-1] - positions[0]) + 1)
+            return [rows[position - first] for position in positions]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        if not self._page_start <= index < self._page_start + len(self._page):
+            self._page_start = index - index % _PAGE_SIZE
+            self._page = self._read(self._page_start, _PAGE_SIZE)
+        return self._page[index - self._page_start]
+
+    def __iter__(self) -> Iterator[RowT]:
+        order_columns = ", ".join(self._order_by)
+        first_page = f"SELECT {order_columns}, {self._column} FROM {self._table} ORDER BY {order_columns} LIMIT ?"
+        next_page = (
+            f"SELECT {order_columns}, {self._column} FROM {self._table} "
+            f"WHERE ({order_columns}) > ({', '.join('?' * len(self._order_by))}) ORDER BY {order_columns} LIMIT ?"
+        )
+        # Keyset pages keep no cursor open between rows, so callers may write to the database while iterating.
+        rows = self._connection.execute(first_page, (_PAGE_SIZE,)).fetchall()
+        while rows:
+            for row in rows:
+                yield pickle.loads(row[-1])
+            last_key = rows[-1][:-1]
+            rows = self._connection.execute(next_page, (*last_key, _PAGE_SIZE)).fetchall() if len(rows) == _PAGE_SIZE else []
+
+    def _read(self, offset: int, limit: int) -> list[RowT]:
+        rows = self._connection.execute(
+            f"SELECT {self._column} FROM {self._table} ORDER BY {', '.join(self._order_by)} LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+        return [pickle.loads(value) for (value,) in rows]
+
+
+class _CreatorsByName(Mapping[str, CreatorSummary]):
+    def __init__(self, index: SqliteLibraryIndex):
+        self._index = index
+
+    def __getitem__(self, name: str) -> CreatorSummary:
+        row = self._index._connection.execute("SELECT summary FROM creators WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return pickle.loads(row[0])
+
+    def __contains__(self, name: object) -> bool:
+        return self._index._connection.execute("SELECT 1 FROM creators WHERE name = ?", (name,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (summary.name for summary in self._index.creators)
+
+    def __len__(self) -> int:
+        return self._index.creator_count
+
+
+@dataclass
+class SqliteLibraryIndex:
+    """
+    ``LibraryIndex`` backend that keeps creator summaries in a build-scoped SQLite database.
+
+    Summaries are written as creators finish indexing and read back a page at a time in SQL
+    order, so neither indexing nor rendering holds the whole library in memory. Counts, issues,
+    and statistics stay on the object and remain readable after ``close``.
+    """
+
+    db_path: Path
+    input_dir: Path = field(default_factory=Path)
+    issues: tuple[BuildIssue, ...] = ()
+    statistics: IndexStatistics = field(default_factory=IndexStatistics)
+    metadata_result: MetadataWriteResult = field(default_factory=MetadataWriteResult)
+    creator_count: int = 0
+    project_count: int = 0
+    _connection: sqlite3.Connection = field(init=False, repr=False)
+    _lookup: SqliteLibraryLookup = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_database_files()
+        self._connection = sqlite3.connect(self.db_path)
+        # The database is rebuilt by every build, so durability is traded for write speed.
+        self._connection.execute("PRAGMA journal_mode=OFF")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        for statement in _INDEX_SCHEMA:
+            self._connection.execute(statement)
+        self._lookup = SqliteLibraryLookup(self._connection)
+
+    @property
+    def creators(self) -> Sequence[CreatorSummary]:
+        """Creator summaries in library folder order."""
+        return _PickledRows(self._connection, "creators", "summary", (), self.creator_count)
+
+    @property
+    def creator_by_name(self) -> Mapping[str, CreatorSummary]:
+        return _CreatorsByName(self)
+
+    @property
+    def lookup(self) -> SqliteLibraryLookup:
+        return self._lookup
+
+    def creators_by_display_name(self) -> Iterator[CreatorSummary]:
+        return iter(_PickledRows(self._connection, "creators", "summary", ("sort_key",), self.creator_count))
+
+    def add(self, summary: CreatorSummary) -> None:
+        self._connection.execute(
+            "INSERT INTO creators (name, sort_key, summary) VALUES (?, ?, ?)",
+            (summary.name, creator_display_sort_key(summary), _pickle(summary)),
+        )
+        self._lookup.add(summary)
+        self.creator_count += 1
+        self.project_count += summary.project_count
+
+    def link_collaborations(
+        self,
+        link: Callable[[CreatorSummary, Container[str], Sequence[str]], CreatorSummary],
+    ) -> None:
+        """Rewrite each summary with ``link(summary, creator_names, collaborations_listing_it_as_member)``."""
+        creator_names = self.creator_by_name
+        for summary in self.creators:
+            linked = link(summary, creator_names, self._lookup.collaborations_of(summary.name))
+            if linked != summary:
+                self._connection.execute(
+                    "UPDATE creators SET summary = ? WHERE name = ?",
+                    (_pickle(linked), summary.name),
+                )
+        self._connection.commit()
+
+    def finish(
+        self,
+        input_dir: Path,
+        issues: tuple[BuildIssue, ...],
+        statistics: IndexStatistics,
+        metadata_result: MetadataWriteResult,
+    ) -> SqliteLibraryIndex:
+        self.input_dir = input_dir
+        self.issues = issues
+        self.statistics = statistics
+        self.metadata_result = metadata_result
+        self._connection.commit()
+        return self
+
+    def overview_collector(self) -> SqliteOverviewCollector:
+        return SqliteOverviewCollector(self._connection)
+
+    def write_lookup(self, db_path: Path) -> None:
+        """Copy the lookup tables built during indexing to a standalone lookup file."""
+        self._connection.commit()
+
+        def copy_tables(temp_path: Path) -> None:
+            self._connection.execute("ATTACH DATABASE ? AS lookup", (os.fspath(temp_path),))
+            try:
+                for table in _LOOKUP_TABLES:
+                    self._connection.execute(f"INSERT INTO lookup.{table} SELECT * FROM main.{table}")
+                self._connection.commit()
+            finally:
+                self._connection.execute("DETACH DATABASE lookup")
+
+        _write_lookup_file(db_path, copy_tables)
+
+    def close(self) -> None:
+        self._connection.close()
+        self._remove_database_files()
+
+    def _remove_database_files(self) -> None:
+        for suffix in ("", "-journal", "-wal", "-shm"):
+            Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+
+
+@dataclass
+class SqliteOverviewCollector:
+    """
+    Overview entries and tags spooled into the index database while creator pages render.
+
+    Entries are read back lazily in SQL order, so the overview pages stream from disk.
+    """
+
+    connection: sqlite3.Connection
+    creator_entry_count: int = 0
+    project_entry_count: int = 0
+
+    def add_creator_entry(self, entry: CreatorOverviewEntry) -> None:
+        self.connection.execute(
+            "INSERT INTO overview_creators (sort_key, entry) VALUES (?, ?)",
+            (creator_entry_sort_key(entry), _pickle(entry)),
+        )
+        self.creator_entry_count += 1
+
+    def add_project_entry(self, entry: ProjectOverviewEntry) -> None:
+        self.connection.execute(
+            "INSERT INTO overview_projects (title_key, creator_key, entry) VALUES (?, ?, ?)",
+            (*project_entry_sort_key(entry), _pickle(entry)),
+        )
+        self.project_entry_count += 1
+
+    def creator_entries(self) -> Sequence[CreatorOverviewEntry]:
+        return _PickledRows(self.connection, "overview_creators", "entry", ("sort_key",), self.creator_entry_count)
+
+    def project_entries(self) -> Sequence[ProjectOverviewEntry]:
+        return _PickledRows(
+            self.connection,
+            "overview_projects",
+            "entry",
+            ("title_key", "creator_key"),
+            self.project_entry_count,
+        )
+
+
+class LibraryLookupError(RuntimeError):
+    pass
+
+
+@dataclass
+class SqliteLibraryLookup:
+    """
+    ``LibraryLookup`` backend answering the same queries from indexed SQLite tables.
+
+    It shares the index database during a build and is also written to a standalone file,
+    which ``cr4te query`` opens read-only.
+    """
+
+    connection: sqlite3.Connection
+
+    def add(self, summary: CreatorSummary) -> None:
+        entries = lookup_entries(summary)
+        self.connection.executemany(
+            "INSERT INTO creator_tags (category, tag, creator) VALUES (?, ?, ?)",
+            ((category, tag, summary.name) for category, tag in entries.creator_tags),
+        )
+        self.connection.executemany(
+            "INSERT INTO creator_nationalities (nationality, creator) VALUES (?, ?)",
+            ((nationality, summary.name) for nationality in entries.nationalities),
+        )
+        self.connection.executemany(
+            "INSERT INTO collaboration_members (member, collaboration) VALUES (?, ?)",
+            ((member, summary.name) for member in entries.members),
+        )
+        self.connection.executemany(
+            "INSERT INTO project_tags (category, tag, creator, project) VALUES (?, ?, ?, ?)",
+            ((category, tag, *ref) for category, tag, ref in entries.project_tags),
+        )
+        self.connection.executemany(
+            "INSERT INTO project_facets (field, value, creator, project) VALUES (?, ?, ?, ?)",
+            ((facet_field.value, value, *ref) for facet_field, value, ref in entries.project_facets),
+        )
+
+    def creators_tagged(self, category: str, tag: str) -> list[str]:
+        return self.find_creators(((category, tag),))
+
+    def projects_tagged(self, category: str, tag: str) -> list[ProjectRef]:
+        return self.find_projects(tags=((category, tag),))
+
+    def projects_with_facet(self, facet_field: ProjectField, value: str) -> list[ProjectRef]:
+        return self.find_projects(facets=((facet_field, value),))
+
+    def collaborations_of(self, member: str) -> list[str]:
+        return self._column(
+            "SELECT collaboration FROM collaboration_members WHERE member = ? ORDER BY collaboration",
+            (normalize_lookup_value(member),),
+        )
+
+    def find_creators(self, tags: Iterable[tuple[str, str]]) -> list[str]:
+        """Return the creators carrying every given tag."""
+        selects: list[str] = []
+        parameters: list[str] = []
+        for category, tag in tags:
+            selects.append("SELECT creator FROM creator_tags WHERE category = ? AND tag = ?")
+            parameters.extend((normalize_lookup_value(category), normalize_lookup_value(tag)))
+        if not selects:
+            return []
+        return self._column(f"{' INTERSECT '.join(selects)} ORDER BY 1", tuple(parameters))
+
+    def find_projects(
+        self,
+        tags: Iterable[tuple[str, str]] = (),
+        facets: Iterable[tuple[ProjectField, str]] = (),
+    ) -> list[ProjectRef]:
+        """Return the projects carrying every given tag and facet value."""
+        selects: list[str] = []
+        parameters: list[str] = []
+        for category, tag in tags:
+            selects.append("SELECT creator, project FROM project_tags WHERE category = ? AND tag = ?")
+            parameters.extend((normalize_lookup_value(category), normalize_lookup_value(tag)))
+        for facet_field, value in facets:
+            selects.append("SELECT creator, project FROM project_facets WHERE field = ? AND value = ?")
+            parameters.extend((facet_field.value, normalize_lookup_value(value)))
+        if not selects:
+            return []
+        query = f"{' INTERSECT '.join(selects)} ORDER BY 1, 2"
+        return [ProjectRef(*row) for row in self.connection.execute(query, parameters)]
+
+    def tag_map(self) -> dict[str, set[str]]:
+        """Return every creator and project tag, grouped by category."""
+        grouped: dict[str, set[str]] = {}
+        for category, tag in self.connection.execute(
+            "SELECT category, tag FROM creator_tags UNION SELECT category, tag FROM project_tags"
+        ):
+            grouped.setdefault(category, set()).add(tag)
+        return grouped
+
+    def facet_values(self, facet_field: ProjectField) -> set[str]:
+        return set(self._column("SELECT DISTINCT value FROM project_facets WHERE field = ?", (facet_field.value,)))
+
+    def nationalities(self) -> set[str]:
+        return set(self._column("SELECT DISTINCT nationality FROM creator_nationalities", ()))
+
+    def _column(self, query: str, parameters: tuple[str, ...]) -> list[str]:
+        return [value for (value,) in self.connection.execute(query, parameters)]
+
+
+def write_library_lookup(creators: Iterable[CreatorSummary], db_path: Path) -> None:
+    """Write a standalone lookup file for ``creators``, replacing any previous file atomically."""
+
+    def add_creators(temp_path: Path) -> None:
+        with closing(sqlite3.connect(temp_path)) as connection:
+            lookup = SqliteLibraryLookup(connection)
+            for summary in creators:
+                lookup.add(summary)
+            connection.commit()
+
+    _write_lookup_file(db_path, add_creators)
+
+
+def _write_lookup_file(db_path: Path, fill: Callable[[Path], None]) -> None:
+    # The schema is created first and filled by ``fill`` before the file is renamed into place.
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = db_path.with_name(f".{db_path.name}.{os.getpid()}.tmp")
+    temp_path.unlink(missing_ok=True)
+    try:
+        with closing(sqlite3.connect(temp_path)) as connection:
+            connection.execute("PRAGMA journal_mode=OFF")
+            connection.execute(f"PRAGMA user_version = {LIBRARY_LOOKUP_VERSION}")
+            for statement in _LOOKUP_SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+        fill(temp_path)
+        os.replace(temp_path, db_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def open_library_lookup(db_path: Path) -> Iterator[SqliteLibraryLookup]:
+    """Open a lookup file written by ``write_library_lookup`` read-only."""
+    if not db_path.is_file():
+        raise LibraryLookupError(f"Library lookup not found: {db_path}")
+    try:
+        connection = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error as exc:
+        raise LibraryLookupError(f"Unable to open library lookup {db_path}: {exc}") from exc
+    with closing(connection):
+        try:
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+        except sqlite3.DatabaseError as exc:
+            raise LibraryLookupError(f"Unable to read library lookup {db_path}: {exc}") from exc
+        if version != LIBRARY_LOOKUP_VERSION:
+            raise LibraryLookupError(
+                f"Library lookup {db_path} has version {version}, expected {LIBRARY_LOOKUP_VERSION}; rebuild the site"
+            )
+        yield SqliteLibraryLookup(connection)
+
+
+def _pickle(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+from .enums.creator_type import CreatorType
+from .enums.visible_fields import ProjectField
+
+if TYPE_CHECKING:
+    from .library_index import CreatorSummary
+
+__all__ = [
+    "LibraryLookup",
+    "LookupEntries",
+    "ProjectRef",
+    "build_library_lookup",
+    "lookup_entries",
+    "normalize_lookup_value",
+]
+
+EntryT = TypeVar("EntryT")
+
+
+class ProjectRef(NamedTuple):
+    creator: str
+    title: str
+
+
+def normalize_lookup_value(value: str) -> str:
+    """Strip a tag, category, facet value, or member name the same way the tags page does."""
+    return value.strip()
+
+
+@dataclass(frozen=True)
+class LookupEntries:
+    """Everything one creator contributes to the lookup indexes."""
+
+    creator_tags: tuple[tuple[str, str], ...]
+    nationalities: tuple[str, ...]
+    members: tuple[str, ...]
+    project_tags: tuple[tuple[str, str, ProjectRef], ...]
+    project_facets: tuple[tuple[ProjectField, str, ProjectRef], ...]
+
+
+def lookup_entries(summary: CreatorSummary) -> LookupEntries:
+    project_tags = []
+    project_facets = []
+    for project in summary.projects:
+        ref = ProjectRef(summary.name, project.title)
+        project_tags.extend((category, tag, ref) for category, tag in _tag_keys(project.tags))
+        project_facets.extend(
+            (facet_field, value, ref)
+            for facet_field, values in project.facets.items()
+            if isinstance(facet_field, ProjectField)
+            for value in _values(values)
+        )
+    return LookupEntries(
+        creator_tags=tuple(_tag_keys(summary.tags)),
+        nationalities=tuple(_values(summary.nationalities)),
+        members=tuple(_values(summary.members)) if summary.type == CreatorType.COLLABORATION else (),
+        project_tags=tuple(project_tags),
+        project_facets=tuple(project_facets),
+    )
+
+
+@dataclass
+class LibraryLookup:
+    """
+    Inverted indexes over creator summaries, built in a single pass.
+
+    Maps tags to the creators and projects carrying them, facet values and nationalities to
+    their projects and creators, and members to the collaborations listing them. Keys are
+    stripped and blank values skipped, matching what the tags page shows. Query results are
+    sorted by creator name, then project title.
+    """
+
+    creators_by_tag: dict[tuple[str, str], list[str]] = field(default_factory=lambda: defaultdict(list))
+    projects_by_tag: dict[tuple[str, str], list[ProjectRef]] = field(default_factory=lambda: defaultdict(list))
+    projects_by_facet: dict[tuple[ProjectField, str], list[ProjectRef]] = field(default_factory=lambda: defaultdict(list))
+    creators_by_nationality: dict[str, list[str]] = field(default_factory=lambda: defaultdict(list))
+    collaborations_by_member: dict[str, list[str]] = field(default_factory=lambda: defaultdict(list))
+
+    def add(self, summary: CreatorSummary) -> None:
+        entries = lookup_entries(summary)
+        for key in entries.creator_tags:
+            self.creators_by_tag[key].append(summary.name)
+        for nationality in entries.nationalities:
+            self.creators_by_nationality[nationality].append(summary.name)
+        for member in entries.members:
+            self.collaborations_by_member[member].append(summary.name)
+        for category, tag, ref in entries.project_tags:
+            self.projects_by_tag[category, tag].append(ref)
+        for facet_field, value, ref in entries.project_facets:
+            self.projects_by_facet[facet_field, value].append(ref)
+
+    def creators_tagged(self, category: str, tag: str) -> list[str]:
+        return sorted(self.creators_by_tag.get(_tag_key(category, tag), ()))
+
+    def projects_tagged(self, category: str, tag: str) -> list[ProjectRef]:
+        return sorted(self.projects_by_tag.get(_tag_key(category, tag), ()))
+
+    def projects_with_facet(self, facet_field: ProjectField, value: str) -> list[ProjectRef]:
+        return sorted(self.projects_by_facet.get((facet_field, normalize_lookup_value(value)), ()))
+
+    def collaborations_of(self, member: str) -> list[str]:
+        return sorted(self.collaborations_by_member.get(normalize_lookup_value(member), ()))
+
+    def find_creators(self, tags: Iterable[tuple[str, str]]) -> list[str]:
+        """Return the creators carrying every given tag."""
+        return _intersect([self.creators_by_tag.get(_tag_key(category, tag), ()) for category, tag in tags])
+
+    def find_projects(
+        self,
+        tags: Iterable[tuple[str, str]] = (),
+        facets: Iterable[tuple[ProjectField, str]] = (),
+    ) -> list[ProjectRef]:
+        """Return the projects carrying every given tag and facet value."""
+        return _intersect([
+            *(self.projects_by_tag.get(_tag_key(category, tag), ()) for category, tag in tags),
+            *(self.projects_by_facet.get((facet_field, normalize_lookup_value(value)), ()) for facet_field, value in facets),
+        ])
+
+    def tag_map(self) -> dict[str, set[str]]:
+        """Return every creator and project tag, grouped by category."""
+        grouped: dict[str, set[str]] = defaultdict(set)
+        for category, tag in (*self.creators_by_tag, *self.projects_by_tag):
+            grouped[category].add(tag)
+        return dict(grouped)
+
+    def facet_values(self, facet_field: ProjectField) -> set[str]:
+        return {value for key_field, value in self.projects_by_facet if key_field is facet_field}
+
+    def nationalities(self) -> set[str]:
+        return set(self.creators_by_nationality)
+
+
+def build_library_lookup(creators: Iterable[CreatorSummary]) -> LibraryLookup:
+    lookup = LibraryLookup()
+    for summary in creators:
+        lookup.add(summary)
+    return lookup
+
+
+def _intersect(candidates: list[Sequence[EntryT]]) -> list[EntryT]:
+    if not candidates:
+        return []
+    # Probe the shortest posting list against the others so a rare tag keeps the query cheap.
+    smallest, *others = sorted(candidates, key=len)
+    other_sets = [set(entries) for entries in others]
+    return sorted({entry for entry in smallest if all(entry in entries for entries in other_sets)})
+
+
+def _tag_key(category: str, tag: str) -> tuple[str, str]:
+    return normalize_lookup_value(category), normalize_lookup_value(tag)
+
+
+def _tag_keys(tags: Mapping[str, Iterable[str]]) -> Iterable[tuple[str, str]]:
+    return dict.fromkeys(
+        (category, tag)
+        for raw_category, values in tags.items()
+        if (category := normalize_lookup_value(raw_category))
+        for tag in _values(values)
+    )
+
+
+def _values(values: Iterable[str]) -> Iterable[str]:
+    # A value listed twice on one entry, before or after stripping, still indexes the entry once.
+    return dict.fromkeys(value for value in map(normalize_lookup_value, values) if value)
@@ -20,6 +20,7 @@ __all__ = [
     "load_json_model",
     "metadata_path",
     "normalize_metadata_date",
+    "parse_json_model",
 ]
 
 ModelT = TypeVar("ModelT")
@@ -59,16 +60,23 @@ def load_json_model(path: Path, model_type: type[ModelT]) -> ModelT:
     try:
         with open(path, "r", encoding="utf-8") as file:
             raw_data = json.load(file)
-        if not isinstance(raw_data, dict):
-            raise MetadataShapeError(f"Metadata file must contain a JSON object: {path}")
-        return model_type(**raw_data)
     except JSONDecodeError as exc:
         raise MetadataJsonError(f"Invalid JSON in metadata file {path}: {exc.msg}") from exc
+    except OSError as exc:
+        raise MetadataIOError(f"Unable to read metadata file {path}: {exc}") from exc
+
+    return parse_json_model(raw_data, model_type, path)
+
+
+def parse_json_model(raw_data: object, model_type: type[ModelT], path: Path) -> ModelT:
+    """Validate already-parsed metadata file content, reporting errors against its file path."""
+    if not isinstance(raw_data, dict):
+        raise MetadataShapeError(f"Metadata file must contain a JSON object: {path}")
+    try:
+        return model_type(**raw_data)
     except ValidationError as exc:
         errors = [f"{' > '.join(map(str, err['loc']))}: {err['msg']}" for err in exc.errors()]
         raise MetadataValidationError(f"Invalid metadata file {path}:\n" + "\n".join(errors)) from exc
-    except OSError as exc:
-        raise MetadataIOError(f"Unable to read metadata file {path}: {exc}") from exc
 
 
 def metadata_path(folder: Path) -> Path:
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Collection, Iterable, Mapping
+from typing import Any, Collection, Iterable, Iterator, Mapping
 
 from .constants import README_FILE_NAME
 from .enums.image_sample_strategy import ImageSampleStrategy
 from .enums.orientation import Orientation
 from .enums.portrait_discovery import PortraitDiscovery
+from .enums.scan_entry_kind import ScanEntryKind
+from .library_ignore import IgnoreRules, load_ignore_rules
+from .media_cache import ImageDimensions, MediaInfoCache
 from .media_extensions import AUDIO_EXTS, DOC_EXTS, IMAGE_EXTS, MEDIA_EXTS, TEXT_EXTS, VIDEO_EXTS
 from .schemas.config_schema import MediaRules
 from .schemas.library_schema import MediaGroup, Video
@@ -15,9 +19,11 @@ from .utils import image_utils
 
 __all__ = [
     "CreatorScan",
+    "ScanEntry",
     "iter_creator_dirs",
-    "iter_media_files",
+    "iter_creator_entries",
     "iter_project_dirs",
+    "load_creator_ignore_rules",
     "rel_to_input",
 ]
 
@@ -26,38 +32,99 @@ def rel_to_input(path: Path, input_dir: Path) -> str:
     return path.relative_to(input_dir).as_posix()
 
 
-def iter_creator_dirs(input_dir: Path, media_rules: MediaRules) -> Iterable[Path]:
-    for creator_dir in sorted(input_dir.iterdir()):
-        if not creator_dir.is_dir() or _is_excluded_path(creator_dir, (media_rules.global_exclude_prefix,)):
-            continue
-        yield creator_dir
-
+@dataclass(frozen=True)
+class ScanEntry:
+    kind: ScanEntryKind
+    path: Path
 
-def iter_project_dirs(creator_dir: Path, media_rules: MediaRules) -> Iterable[Path]:
-    for child in sorted(creator_dir.iterdir()):
-        if not child.is_dir():
-            continue
-        if child.name == media_rules.metadata_folder_name:
-            continue
-        if _is_excluded_path(child, (media_rules.global_exclude_prefix,)):
-            continue
-        yield child
 
+def load_creator_ignore_rules(creator_dir: Path, root_rules: IgnoreRules | None = None) -> IgnoreRules:
+    """Combine the library root ``.cr4teignore`` with the creator's own file."""
+    if root_rules is None:
+        root_rules = load_ignore_rules(creator_dir.parent)
+    return load_ignore_rules(creator_dir, creator_dir.name, root_rules)
 
-def iter_media_files(creator_dir: Path, media_rules: MediaRules) -> Iterable[Path]:
-    def within_depth(path: Path) -> bool:
-        if media_rules.max_search_depth is None:
-            return True
-        return len(path.relative_to(creator_dir).parts) <= media_rules.max_search_depth + 1
 
-    for media_path in creator_dir.rglob("*"):
-        if not media_path.is_file():
-            continue
-        if _is_excluded_path(media_path, (media_rules.global_exclude_prefix,)):
+def iter_creator_dirs(
+    input_dir: Path,
+    media_rules: MediaRules,
+    ignore_rules: IgnoreRules | None = None,
+) -> Iterable[Path]:
+    if ignore_rules is None:
+        ignore_rules = load_ignore_rules(input_dir)
+    for entry in _sorted_entries(input_dir):
+        if _is_excluded_name(entry.name, media_rules.global_exclude_prefix) or not entry.is_dir():
             continue
-        if not within_depth(media_path):
+        if ignore_rules.is_ignored(entry.name, is_dir=True):
             continue
-        yield media_path
+        yield Path(entry.path)
+
+
+def iter_project_dirs(
+    creator_dir: Path,
+    media_rules: MediaRules,
+    ignore_rules: IgnoreRules | None = None,
+) -> Iterable[Path]:
+    if ignore_rules is None:
+        ignore_rules = load_creator_ignore_rules(creator_dir)
+    for entry in _sorted_entries(creator_dir):
+        if _is_project_entry(entry, media_rules) and not ignore_rules.is_ignored(
+            f"{creator_dir.name}/{entry.name}",
+            is_dir=True,
+        ):
+            yield Path(entry.path)
+
+
+def iter_creator_entries(
+    creator_dir: Path,
+    media_rules: MediaRules,
+    ignore_rules: IgnoreRules | None = None,
+) -> Iterator[ScanEntry]:
+    """
+    List a creator folder tree in a single pass, yielding project folders and media files.
+
+    Each listed folder is yielded as a directory entry before it is read. Directory entry type
+    information from ``os.scandir`` is reused instead of issuing extra stat calls, and symbolic
+    links to directories are not descended into. ``.cr4teignore`` patterns are checked as entries
+    are listed, so ignored folders are never read.
+    """
+    if ignore_rules is None:
+        ignore_rules = load_creator_ignore_rules(creator_dir)
+    pending: list[tuple[Path, str, int]] = [(creator_dir, creator_dir.name, 0)]
+    while pending:
+        dir_path, rel_dir, depth = pending.pop()
+        yield ScanEntry(ScanEntryKind.DIRECTORY, dir_path)
+        subdirs: list[tuple[Path, str]] = []
+        for entry in _sorted_entries(dir_path):
+            if _is_excluded_name(entry.name, media_rules.global_exclude_prefix):
+                continue
+            rel_path = f"{rel_dir}/{entry.name}"
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if ignore_rules.is_ignored(rel_path, is_dir):
+                continue
+            if is_dir:
+                if depth == 0 and entry.name != media_rules.metadata_folder_name:
+                    yield ScanEntry(ScanEntryKind.PROJECT, Path(entry.path))
+                if media_rules.max_search_depth is None or depth < media_rules.max_search_depth:
+                    subdirs.append((Path(entry.path), rel_path))
+            elif entry.is_file():
+                yield ScanEntry(ScanEntryKind.MEDIA, Path(entry.path))
+            elif depth == 0 and _is_project_entry(entry, media_rules):
+                yield ScanEntry(ScanEntryKind.PROJECT, Path(entry.path))
+        pending.extend((subdir, rel_subdir, depth + 1) for subdir, rel_subdir in reversed(subdirs))
+
+
+def _sorted_entries(dir_path: Path) -> list[os.DirEntry[str]]:
+    with os.scandir(dir_path) as entries:
+        return sorted(entries, key=lambda entry: entry.name)
+
+
+def _is_project_entry(entry: os.DirEntry[str], media_rules: MediaRules) -> bool:
+    return (
+        entry.name != media_rules.metadata_folder_name
+        and not _is_excluded_name(entry.name, media_rules.global_exclude_prefix)
+        and entry.is_dir()
+    )
 
 
 def _media_groups_from_buckets(
@@ -87,8 +154,16 @@ def _media_groups_from_buckets(
     ]
 
 
-def _is_excluded_path(path: Path, exclude_prefixes: tuple[str, ...]) -> bool:
-    return any(part.startswith(exclude_prefixes) or part.startswith(".") for part in path.parts)
+def _is_excluded_name(name: str, exclude_prefix: str) -> bool:
+    return name.startswith((exclude_prefix, "."))
+
+
+def _buckets_as_json(buckets: Mapping[Path, _MediaBucket]) -> dict[str, dict[str, Any]]:
+    return {rel_folder.as_posix(): bucket.as_json() for rel_folder, bucket in buckets.items()}
+
+
+def _buckets_from_json(data: Mapping[str, Mapping[str, Any]], input_dir: Path) -> dict[Path, _MediaBucket]:
+    return {Path(rel_folder): _MediaBucket.from_json(rel_folder, input_dir, bucket) for rel_folder, bucket in data.items()}
 
 
 def _sample_images(rel_image_paths: list[str], max_images: int, strategy: ImageSampleStrategy) -> list[str]:
@@ -132,7 +207,7 @@ def _select_named_candidate(candidates: list[Path], preferred_dir: Path) -> Path
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class _MediaBucket:
     rel_dir_path: Path
     is_root: bool
@@ -162,6 +237,29 @@ class _MediaBucket:
         elif suffix in TEXT_EXTS and media_path.name.lower() != README_FILE_NAME.lower():
             self.texts.append(rel_path)
 
+    def as_json(self) -> dict[str, Any]:
+        return {
+            "is_root": self.is_root,
+            "videos": list(self.videos),
+            "tracks": list(self.tracks),
+            "images": list(self.images),
+            "documents": list(self.documents),
+            "texts": list(self.texts),
+        }
+
+    @classmethod
+    def from_json(cls, rel_dir_path: str, input_dir: Path, data: Mapping[str, Any]) -> _MediaBucket:
+        return cls(
+            rel_dir_path=Path(rel_dir_path),
+            is_root=bool(data["is_root"]),
+            input_dir=input_dir,
+            videos=list(data["videos"]),
+            tracks=list(data["tracks"]),
+            images=list(data["images"]),
+            documents=list(data["documents"]),
+            texts=list(data["texts"]),
+        )
+
     def to_media_group(
         self,
         image_sample_max: int,
@@ -189,6 +287,7 @@ class CreatorScan:
     creator_dir: Path
     input_dir: Path
     media_rules: MediaRules
+    media_cache: MediaInfoCache = field(default_factory=MediaInfoCache)
     _creator_buckets: dict[Path, _MediaBucket] = field(default_factory=dict, init=False)
     _project_buckets: dict[str, dict[Path, _MediaBucket]] = field(default_factory=dict, init=False)
     _image_paths: list[Path] = field(default_factory=list, init=False)
@@ -198,7 +297,6 @@ class CreatorScan:
     _selected_covers: dict[str, Path | None] = field(default_factory=dict, init=False)
     _video_posters: dict[str, str] = field(default_factory=dict, init=False)
     _gallery_excluded_images: set[str] = field(default_factory=set, init=False)
-    _image_orientations: dict[Path, Orientation] = field(default_factory=dict, init=False)
 
     def add_media(self, media_path: Path) -> None:
         if media_path.suffix.lower() not in MEDIA_EXTS:
@@ -221,6 +319,62 @@ class CreatorScan:
             self._video_paths.append(media_path)
         self._special_images_resolved = False
 
+    def as_json(self) -> dict[str, Any]:
+        """Serialize the buckets and resolved special images so an unchanged creator can skip its scan."""
+        self._resolve_special_images()
+        return {
+            "creator_buckets": _buckets_as_json(self._creator_buckets),
+            "project_buckets": {
+                project_name: _buckets_as_json(buckets)
+                for project_name, buckets in self._project_buckets.items()
+            },
+            "selected_portrait": self._rel_or_none(self._selected_portrait),
+            "selected_covers": {
+                project_name: self._rel_or_none(cover)
+                for project_name, cover in self._selected_covers.items()
+            },
+            "video_posters": dict(self._video_posters),
+            "gallery_excluded_images": sorted(self._gallery_excluded_images),
+        }
+
+    @classmethod
+    def from_json(
+        cls,
+        creator_dir: Path,
+        input_dir: Path,
+        media_rules: MediaRules,
+        data: Mapping[str, Any],
+    ) -> CreatorScan:
+        scan = cls(creator_dir, input_dir, media_rules)
+        scan._creator_buckets = _buckets_from_json(data["creator_buckets"], input_dir)
+        scan._project_buckets = {
+            project_name: _buckets_from_json(buckets, input_dir)
+            for project_name, buckets in data["project_buckets"].items()
+        }
+        for bucket in scan._iter_buckets():
+            scan._image_paths.extend(input_dir / image for image in bucket.images)
+            scan._video_paths.extend(input_dir / video for video in bucket.videos)
+        scan._selected_portrait = scan._path_or_none(data["selected_portrait"])
+        scan._selected_covers = {
+            project_name: scan._path_or_none(cover)
+            for project_name, cover in data["selected_covers"].items()
+        }
+        scan._video_posters = dict(data["video_posters"])
+        scan._gallery_excluded_images = set(data["gallery_excluded_images"])
+        scan._special_images_resolved = True
+        return scan
+
+    def _iter_buckets(self) -> Iterator[_MediaBucket]:
+        yield from self._creator_buckets.values()
+        for buckets in self._project_buckets.values():
+            yield from buckets.values()
+
+    def _rel_or_none(self, path: Path | None) -> str | None:
+        return rel_to_input(path, self.input_dir) if path is not None else None
+
+    def _path_or_none(self, rel_path: str | None) -> Path | None:
+        return self.input_dir / rel_path if rel_path is not None else None
+
     def _project_name(self, parts: tuple[str, ...]) -> str | None:
         if len(parts) <= 2:
             return None
@@ -346,8 +500,10 @@ class CreatorScan:
         return project_images
 
     def _orientation(self, image_path: Path) -> Orientation:
-        orientation = self._image_orientations.get(image_path)
-        if orientation is None:
-            orientation = image_utils.infer_image_orientation(image_path)
-            self._image_orientations[image_path] = orientation
-        return orientation
+        def load_dimensions() -> ImageDimensions:
+            try:
+                return image_utils.read_image_dimensions(image_path)
+            except Exception:
+                return ImageDimensions()
+
+        return self.media_cache.image_dimensions(image_path, load_dimensions).orientation
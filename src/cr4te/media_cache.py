@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import os
 from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from .enums.orientation import Orientation
 
+if TYPE_CHECKING:
+    from .file_stat_cache import FileStatCache
+    from .media_probe_store import MediaProbeStore
+
 __all__ = [
     "DEFAULT_MEDIA_CACHE_MAX_ENTRIES",
+    "BoundedLruCache",
     "ImageDimensions",
     "MediaInfoCache",
 ]
@@ -33,26 +39,38 @@ class ImageDimensions:
 
 
 @dataclass
-class _BoundedLruCache(Generic[K, V]):
+class BoundedLruCache(Generic[K, V]):
     max_entries: int = DEFAULT_MEDIA_CACHE_MAX_ENTRIES
+    hits: int = 0
+    misses: int = 0
     _items: OrderedDict[K, V] = field(default_factory=OrderedDict)
 
     def get_or_load(self, key: K, loader: Callable[[], V]) -> V:
         if self.max_entries <= 0:
+            self.misses += 1
             return loader()
 
         if key in self._items:
+            self.hits += 1
             self._items.move_to_end(key)
             return self._items[key]
 
+        self.misses += 1
         value = loader()
+        self.put(key, value)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        if self.max_entries <= 0:
+            return
         self._items[key] = value
         self._items.move_to_end(key)
 
         while len(self._items) > self.max_entries:
             self._items.popitem(last=False)
 
-        return value
+    def discard(self, key: K) -> None:
+        self._items.pop(key, None)
 
     def __len__(self) -> int:
         return len(self._items)
@@ -60,19 +78,71 @@ class _BoundedLruCache(Generic[K, V]):
 
 @dataclass
 class MediaInfoCache:
+    """
+    Per-build memo of media facts, optionally backed by a persistent probe store.
+
+    Only measurable results are persisted: empty dimensions and non-positive durations are what
+    loaders return after reporting a failure, and those must be reported again on the next build.
+    When a file stat cache is attached, path resolution and probe freshness checks go through it.
+    """
+
     max_entries: int = DEFAULT_MEDIA_CACHE_MAX_ENTRIES
-    _image_dimensions: _BoundedLruCache[str, ImageDimensions] = field(init=False)
-    _audio_durations: _BoundedLruCache[str, float] = field(init=False)
+    probe_store: MediaProbeStore | None = None
+    file_stats: FileStatCache | None = None
+    _image_dimensions: BoundedLruCache[str, ImageDimensions] = field(init=False)
+    _audio_durations: BoundedLruCache[str, float] = field(init=False)
 
     def __post_init__(self) -> None:
-        self._image_dimensions = _BoundedLruCache(self.max_entries)
-        self._audio_durations = _BoundedLruCache(self.max_entries)
+        self._image_dimensions = BoundedLruCache(self.max_entries)
+        self._audio_durations = BoundedLruCache(self.max_entries)
 
     def image_dimensions(self, path: Path, loader: Callable[[], ImageDimensions]) -> ImageDimensions:
-        return self._image_dimensions.get_or_load(_path_key(path), loader)
+        resolved_path = self._resolve(path)
+        return self._image_dimensions.get_or_load(
+            str(resolved_path),
+            lambda: self._probe_image_dimensions(resolved_path, loader),
+        )
+
+    def record_image_dimensions(self, path: Path, dimensions: ImageDimensions) -> None:
+        """Remember dimensions known from elsewhere, such as the thumbnail manifest, without probing the file."""
+        self._image_dimensions.put(str(self._resolve(path)), dimensions)
 
     def audio_duration_seconds(self, path: Path, loader: Callable[[], float]) -> float:
-        return self._audio_durations.get_or_load(_path_key(path), loader)
+        resolved_path = self._resolve(path)
+        return self._audio_durations.get_or_load(
+            str(resolved_path),
+            lambda: self._probe_audio_duration(resolved_path, loader),
+        )
+
+    def _probe_image_dimensions(self, resolved_path: Path, loader: Callable[[], ImageDimensions]) -> ImageDimensions:
+        if self.probe_store is None:
+            return loader()
+        file_stat = self._stat(resolved_path)
+        dimensions = self.probe_store.image_dimensions(resolved_path, file_stat)
+        if dimensions is None:
+            dimensions = loader()
+            if dimensions.width > 0 and dimensions.height > 0:
+                self.probe_store.store_image_dimensions(resolved_path, dimensions, file_stat)
+        return dimensions
+
+    def _probe_audio_duration(self, resolved_path: Path, loader: Callable[[], float]) -> float:
+        if self.probe_store is None:
+            return loader()
+        file_stat = self._stat(resolved_path)
+        seconds = self.probe_store.audio_duration_seconds(resolved_path, file_stat)
+        if seconds is None:
+            seconds = loader()
+            if seconds > 0:
+                self.probe_store.store_audio_duration_seconds(resolved_path, seconds, file_stat)
+        return seconds
+
+    def _resolve(self, path: Path) -> Path:
+        if self.file_stats is None:
+            return path.resolve(strict=False)
+        return self.file_stats.resolve(path)
+
+    def _stat(self, path: Path) -> os.stat_result | None:
+        return self.file_stats.stat(path) if self.file_stats is not None else None
 
     @property
     def image_dimension_count(self) -> int:
@@ -81,7 +151,3 @@ class MediaInfoCache:
     @property
     def audio_duration_count(self) -> int:
         return len(self._audio_durations)
-
-
-def _path_key(path: Path) -> str:
-    return str(path.resolve(strict=False))
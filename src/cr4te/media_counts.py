@@ -8,7 +8,7 @@ from .schemas.library_schema import MediaGroup
 __all__ = ["MediaCounts", "count_media_groups"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MediaCounts:
     video: int = 0
     audio: int = 0
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .media_cache import ImageDimensions
+
+__all__ = [
+    "MEDIA_PROBE_STORE_VERSION",
+    "MediaProbeStore",
+]
+
+MEDIA_PROBE_STORE_VERSION = 1
+_COMMIT_INTERVAL = 256
+_BUSY_TIMEOUT_SECONDS = 30.0
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS image_dimensions ("
+    "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+    "width INTEGER NOT NULL, height INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS audio_durations ("
+    "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+    "seconds REAL NOT NULL)",
+)
+
+
+@dataclass
+class MediaProbeStore:
+    """
+    SQLite-backed media facts that survive between builds.
+
+    Rows are keyed by the path as given, so callers pass resolved paths, and are only trusted while
+    the file keeps its recorded size and ``st_mtime_ns``. A warm rebuild answers from one ``stat``
+    instead of opening the file; callers that already hold that ``stat`` result may pass it along.
+    One store serves every thread of a process, and several indexing processes may share one
+    database file. Worker processes pass ``prepare_schema=False`` once the parent has opened the
+    store, so a version migration never runs in two processes at once.
+    """
+
+    db_path: Path
+    prepare_schema: bool = True
+    hits: int = 0
+    misses: int = 0
+    _connection: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _pending_writes: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+            if self.prepare_schema:
+                self._prepare_schema(self._connection)
+            else:
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+        except (OSError, sqlite3.Error):
+            # The store is only an optimization; without it every probe opens the media file.
+            self.close()
+
+    def image_dimensions(self, path: Path, file_stat: os.stat_result | None = None) -> ImageDimensions | None:
+        row = self._lookup("SELECT size, mtime_ns, width, height FROM image_dimensions WHERE path = ?", path, file_stat)
+        return ImageDimensions(width=row[0], height=row[1]) if row is not None else None
+
+    def store_image_dimensions(
+        self,
+        path: Path,
+        dimensions: ImageDimensions,
+        file_stat: os.stat_result | None = None,
+    ) -> None:
+        self._store(
+            "INSERT OR REPLACE INTO image_dimensions (path, size, mtime_ns, width, height) VALUES (?, ?, ?, ?, ?)",
+            path,
+            file_stat,
+            (dimensions.width, dimensions.height),
+        )
+
+    def audio_duration_seconds(self, path: Path, file_stat: os.stat_result | None = None) -> float | None:
+        row = self._lookup("SELECT size, mtime_ns, seconds FROM audio_durations WHERE path = ?", path, file_stat)
+        return float(row[0]) if row is not None else None
+
+    def store_audio_duration_seconds(
+        self,
+        path: Path,
+        seconds: float,
+        file_stat: os.stat_result | None = None,
+    ) -> None:
+        self._store(
+            "INSERT OR REPLACE INTO audio_durations (path, size, mtime_ns, seconds) VALUES (?, ?, ?, ?)",
+            path,
+            file_stat,
+            (seconds,),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.commit()
+        except sqlite3.Error:
+            pass
+        finally:
+            connection.close()
+
+    def _lookup(self, query: str, path: Path, file_stat: os.stat_result | None) -> tuple | None:
+        try:
+            file_stat = file_stat or os.stat(path)
+        except OSError:
+            file_stat = None
+        with self._lock:
+            row = None
+            if self._connection is not None and file_stat is not None:
+                try:
+                    row = self._connection.execute(query, (os.fspath(path),)).fetchone()
+                except sqlite3.Error:
+                    row = None
+            if row is None or (row[0], row[1]) != (file_stat.st_size, file_stat.st_mtime_ns):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[2:]
+
+    def _store(self, statement: str, path: Path, file_stat: os.stat_result | None, values: tuple) -> None:
+        if self._connection is None:
+            return
+        try:
+            file_stat = file_stat or os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._connection.execute(statement, (os.fspath(path), file_stat.st_size, file_stat.st_mtime_ns, *values))
+                self._pending_writes += 1
+                if self._pending_writes >= _COMMIT_INTERVAL:
+                    self._connection.commit()
+                    self._pending_writes = 0
+            except sqlite3.Error:
+                return
+
+    @staticmethod
+    def _prepare_schema(connection: sqlite3.Connection) -> None:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+        if version != MEDIA_PROBE_STORE_VERSION:
+            connection.execute("DROP TABLE IF EXISTS image_dimensions")
+            connection.execute("DROP TABLE IF EXISTS audio_durations")
+            connection.execute(f"PRAGMA user_version = {MEDIA_PROBE_STORE_VERSION}")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        connection.commit()
@@ -3,7 +3,9 @@ from __future__ import annotations
 import copy
 import json
 import logging
+import os
 from collections.abc import Iterable, Sequence
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from json import JSONDecodeError
 from pathlib import Path
@@ -11,100 +13,217 @@ from typing import Any
 
 from .constants import CR4TE_JSON_FILE_NAME
 from .creator_classification import infer_creator_type
-from .build_issues import BuildIssue, IssueScope
+from .build_issues import IssueScope
 from .enums.creator_type import CreatorType
 from .enums.visible_fields import ProjectField
 from .library_issues import issue_from_exception
-from .library_metadata import MetadataIOError, MetadataJsonError, MetadataLoadError, MetadataShapeError
-from .library_scan import iter_creator_dirs, iter_project_dirs
+from .library_metadata import (
+    MetadataIOError,
+    MetadataJsonError,
+    MetadataLoadError,
+    MetadataShapeError,
+    load_json_model,
+    parse_json_model,
+)
+from .metadata_results import MetadataWriteResult
+from .metadata_state import CreatorMetadataState
+from .metadata_writer import MetadataWriter
 from .metadata_templates import (
     CollaborationMetadataTemplate,
     CreatorMetadataTemplate,
     ProjectMetadataTemplate,
 )
 from .schemas.config_schema import MediaRules
+from .schemas.metadata_file_schema import CreatorMetadata, ProjectMetadata
 from .utils import text_utils
 
 __all__ = [
+    "CreatorMetadataReconciliation",
     "MetadataWriteResult",
     "delete_metadata_files",
-    "reconcile_metadata_files",
+    "reconcile_creator_metadata",
 ]
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class MetadataWriteResult:
-    created: list[Path] = field(default_factory=list)
-    updated: list[Path] = field(default_factory=list)
-    unchanged: list[Path] = field(default_factory=list)
-    skipped: list[Path] = field(default_factory=list)
-    issues: list[BuildIssue] = field(default_factory=list)
-
-    def summary_line(self) -> str:
-        return (
-            "Metadata summary: "
-            f"created={len(self.created)}, "
-            f"updated={len(self.updated)}, "
-            f"unchanged={len(self.unchanged)}, "
-            f"skipped={len(self.skipped)}"
-        )
+@dataclass(frozen=True)
+class _PendingMetadataWrite:
+    future: Future[os.stat_result]
+    path: Path
+    owner_path: Path
+    scope: IssueScope
+    content: bytes
 
 
-def reconcile_metadata_files(
-    input_dir: Path,
+@dataclass
+class CreatorMetadataReconciliation:
+    """
+    One creator's reconciled metadata, handed to indexing so each file is read once per build.
+
+    Data that could not be reconciled keeps the parsed file content, so indexing reports the same
+    validation errors it would report when reading the file itself. Files skipped as unchanged since
+    the last build were never parsed here and are read from disk instead.
+
+    Writes queued on a shared writer are only reflected exactly in ``result`` and the
+    reconciliation state after ``complete_writes``.
+    """
+
+    creator_dir: Path
+    creator_data: dict[str, Any] | None = None
+    creator_error: MetadataLoadError | None = None
+    project_data: dict[str, dict[str, Any]] = field(default_factory=dict)
+    project_errors: dict[str, MetadataLoadError] = field(default_factory=dict)
+    result: MetadataWriteResult = field(default_factory=MetadataWriteResult)
+    state: CreatorMetadataState | None = None
+    _pending_writes: list[_PendingMetadataWrite] = field(default_factory=list, repr=False)
+
+    def queue_write(
+        self,
+        future: Future[os.stat_result],
+        path: Path,
+        owner_path: Path,
+        scope: IssueScope,
+        content: bytes,
+    ) -> None:
+        self._pending_writes.append(_PendingMetadataWrite(future, path, owner_path, scope, content))
+
+    def complete_writes(self) -> None:
+        """Wait for this creator's queued writes, reporting failed files as skipped instead of written."""
+        pending_writes, self._pending_writes = self._pending_writes, []
+        for pending in pending_writes:
+            try:
+                file_stat = pending.future.result()
+            except OSError as exc:
+                for written_paths in (self.result.created, self.result.updated):
+                    if pending.path in written_paths:
+                        written_paths.remove(pending.path)
+                self.result.skipped.append(pending.path)
+                self.result.issues.append(issue_from_exception(
+                    pending.owner_path,
+                    pending.scope,
+                    MetadataIOError(f"Unable to write metadata file {pending.path}: {exc}"),
+                ))
+                continue
+            if self.state is not None:
+                self.state.record(pending.path, pending.content, file_stat)
+
+    def creator_metadata(self) -> CreatorMetadata:
+        if self.creator_error is not None:
+            raise self.creator_error
+        metadata_path = self.creator_dir / CR4TE_JSON_FILE_NAME
+        if self.creator_data is None:
+            return load_json_model(metadata_path, CreatorMetadata)
+        return parse_json_model(self.creator_data, CreatorMetadata, metadata_path)
+
+    def project_metadata(self, project_dir: Path) -> ProjectMetadata:
+        error = self.project_errors.get(project_dir.name)
+        if error is not None:
+            raise error
+        metadata_path = project_dir / CR4TE_JSON_FILE_NAME
+        if project_dir.name not in self.project_data:
+            return load_json_model(metadata_path, ProjectMetadata)
+        return parse_json_model(self.project_data[project_dir.name], ProjectMetadata, metadata_path)
+
+
+def reconcile_creator_metadata(
+    creator_dir: Path,
+    project_dirs: Iterable[Path],
     media_rules: MediaRules,
-    project_facet_fields: Iterable[ProjectField] = (),
+    project_facet_fields: Sequence[ProjectField] = (),
     dry_run: bool = False,
-) -> MetadataWriteResult:
-    input_dir = input_dir.resolve()
-    project_facet_fields = tuple(project_facet_fields)
-    result = MetadataWriteResult()
-
-    for creator_dir in iter_creator_dirs(input_dir, media_rules):
-        metadata_path = creator_dir / CR4TE_JSON_FILE_NAME
-        existing, invalid = _load_reconciliation_json(
-            metadata_path,
-            creator_dir,
-            IssueScope.CREATOR,
-            result,
-        )
-        nested_projects = existing.get("projects", {}) if isinstance(existing, dict) else {}
-        if not isinstance(nested_projects, dict):
-            nested_projects = {}
-        if not invalid:
-            try:
-                creator_type = _selected_creator_type(existing or {}, creator_dir.name, media_rules)
-                template = _creator_metadata_template(creator_dir, media_rules, creator_type)
-                reconciled = _reconcile_creator_metadata(existing or {}, template, creator_type)
-            except ValueError as exc:
-                result.skipped.append(metadata_path)
-                result.issues.append(issue_from_exception(creator_dir, IssueScope.CREATOR, exc))
-            else:
-                _record_metadata_write(metadata_path, existing, reconciled, result, dry_run)
-
-        for project_dir in iter_project_dirs(creator_dir, media_rules):
-            project_metadata_path = project_dir / CR4TE_JSON_FILE_NAME
-            existing_project, invalid = _load_reconciliation_json(
-                project_metadata_path,
-                project_dir,
-                IssueScope.PROJECT,
-                result,
+    state: CreatorMetadataState | None = None,
+    writer: MetadataWriter | None = None,
+) -> CreatorMetadataReconciliation:
+    """
+    Reconcile one creator's metadata files, keeping the parsed data for indexing.
+
+    With a reconciliation state, files that still match their recorded fingerprint are counted as
+    unchanged without being parsed, and every file confirmed or written here is recorded again.
+    Without a writer, changed files are written in parallel and complete before this returns;
+    with a shared writer, the caller must call ``complete_writes`` on the result.
+    """
+    if writer is None:
+        with MetadataWriter() as own_writer:
+            reconciliation = reconcile_creator_metadata(
+                creator_dir,
+                project_dirs,
+                media_rules,
+                project_facet_fields,
+                dry_run,
+                state,
+                own_writer,
             )
-            if invalid:
-                continue
+            reconciliation.complete_writes()
+        return reconciliation
+
+    reconciliation = CreatorMetadataReconciliation(creator_dir, state=None if dry_run else state)
+    result = reconciliation.result
+    metadata_path = creator_dir / CR4TE_JSON_FILE_NAME
+    loaded = _load_reconciliation_file(metadata_path, creator_dir, IssueScope.CREATOR, result, state)
+    existing = loaded.data
+    reconciliation.creator_error = loaded.error
+    if loaded.unchanged:
+        # Recorded creator files were written by reconciliation, which drops nested project seeds.
+        existing = None
+        result.unchanged.append(metadata_path)
+    else:
+        reconciliation.creator_data = existing or {}
+    nested_projects = existing.get("projects", {}) if isinstance(existing, dict) else {}
+    if not isinstance(nested_projects, dict):
+        nested_projects = {}
+    if loaded.error is None and not loaded.unchanged:
+        try:
+            creator_type = _selected_creator_type(existing or {}, creator_dir.name, media_rules)
+            template = _creator_metadata_template(creator_dir, media_rules, creator_type)
+            reconciled = _reconcile_creator_metadata(existing or {}, template, creator_type)
+        except ValueError as exc:
+            result.skipped.append(metadata_path)
+            result.issues.append(issue_from_exception(creator_dir, IssueScope.CREATOR, exc))
+        else:
+            _record_metadata_write(
+                reconciliation,
+                writer,
+                metadata_path,
+                creator_dir,
+                IssueScope.CREATOR,
+                loaded,
+                reconciled,
+                dry_run,
+            )
+            reconciliation.creator_data = reconciled
 
-            seeded_project = existing_project
-            if seeded_project is None:
-                nested_project = nested_projects.get(project_dir.name)
-                seeded_project = nested_project if isinstance(nested_project, dict) else {}
+    for project_dir in project_dirs:
+        project_metadata_path = project_dir / CR4TE_JSON_FILE_NAME
+        loaded = _load_reconciliation_file(project_metadata_path, project_dir, IssueScope.PROJECT, result, state)
+        if loaded.error is not None:
+            reconciliation.project_errors[project_dir.name] = loaded.error
+            continue
+        if loaded.unchanged:
+            result.unchanged.append(project_metadata_path)
+            continue
 
-            project_template = _project_metadata_template(project_dir, project_facet_fields)
-            reconciled_project = _reconcile_project_metadata(seeded_project, project_template, project_facet_fields)
-            _record_metadata_write(project_metadata_path, existing_project, reconciled_project, result, dry_run)
+        existing_project = loaded.data
+        seeded_project = existing_project
+        if seeded_project is None:
+            nested_project = nested_projects.get(project_dir.name)
+            seeded_project = nested_project if isinstance(nested_project, dict) else {}
+
+        project_template = _project_metadata_template(project_dir, project_facet_fields)
+        reconciled_project = _reconcile_project_metadata(seeded_project, project_template, project_facet_fields)
+        _record_metadata_write(
+            reconciliation,
+            writer,
+            project_metadata_path,
+            project_dir,
+            IssueScope.PROJECT,
+            loaded,
+            reconciled_project,
+            dry_run,
+        )
+        reconciliation.project_data[project_dir.name] = reconciled_project
 
-    return result
+    return reconciliation
 
 
 def _creator_metadata_template(
@@ -145,27 +264,31 @@ def _selected_creator_type(existing: dict[str, Any], creator_name: str, media_ru
 
 
 def _record_metadata_write(
+    reconciliation: CreatorMetadataReconciliation,
+    writer: MetadataWriter,
     metadata_path: Path,
-    existing: dict[str, Any] | None,
+    owner_path: Path,
+    scope: IssueScope,
+    loaded: _LoadedMetadataFile,
     reconciled: dict[str, Any],
-    result: MetadataWriteResult,
     dry_run: bool,
 ) -> None:
-    if not metadata_path.exists():
-        logger.info(f"{'[DRY-RUN] ' if dry_run else ''}Creating metadata: {metadata_path}")
-        if not dry_run:
-            _write_json(metadata_path, reconciled)
-        result.created.append(metadata_path)
+    result = reconciliation.result
+    existing = loaded.data
+    if existing is not None and reconciled == existing:
+        result.unchanged.append(metadata_path)
+        if reconciliation.state is not None:
+            reconciliation.state.record(metadata_path, loaded.raw, loaded.stat)
         return
 
-    if reconciled == existing:
-        result.unchanged.append(metadata_path)
+    action = "Creating" if existing is None else "Updating"
+    logger.info(f"{'[DRY-RUN] ' if dry_run else ''}{action} metadata: {metadata_path}")
+    (result.created if existing is None else result.updated).append(metadata_path)
+    if dry_run:
         return
 
-    logger.info(f"{'[DRY-RUN] ' if dry_run else ''}Updating metadata: {metadata_path}")
-    if not dry_run:
-        _write_json(metadata_path, reconciled)
-    result.updated.append(metadata_path)
+    content = _render_json(reconciled)
+    reconciliation.queue_write(writer.write(metadata_path, content), metadata_path, owner_path, scope, content)
 
 
 def _reconcile_creator_metadata(
@@ -248,31 +371,69 @@ def _has_user_values(value: Any, default: Any) -> bool:
     return value != default
 
 
-def _load_reconciliation_json(
+@dataclass(frozen=True)
+class _LoadedMetadataFile:
+    data: dict[str, Any] | None = None
+    raw: bytes | None = None
+    stat: os.stat_result | None = None
+    error: MetadataLoadError | None = None
+    unchanged: bool = False
+
+
+def _load_reconciliation_file(
     metadata_path: Path,
     owner_path: Path,
     scope: IssueScope,
     result: MetadataWriteResult,
-) -> tuple[dict[str, Any] | None, bool]:
+    state: CreatorMetadataState | None = None,
+) -> _LoadedMetadataFile:
     try:
-        return _load_optional_json(metadata_path), False
+        file_stat = os.stat(metadata_path)
+    except FileNotFoundError:
+        return _LoadedMetadataFile()
+    except OSError as exc:
+        return _reconciliation_load_error(
+            MetadataIOError(f"Unable to read metadata file {metadata_path}: {exc}"),
+            metadata_path,
+            owner_path,
+            scope,
+            result,
+        )
+
+    if state is not None and state.matches_stat(metadata_path, file_stat):
+        return _LoadedMetadataFile(unchanged=True)
+
+    try:
+        raw = metadata_path.read_bytes()
+        if state is not None and state.matches_content(metadata_path, raw, file_stat):
+            return _LoadedMetadataFile(raw=raw, unchanged=True)
+        return _LoadedMetadataFile(data=_parse_json_object(raw, metadata_path), raw=raw, stat=file_stat)
+    except OSError as exc:
+        load_error = MetadataIOError(f"Unable to read metadata file {metadata_path}: {exc}")
     except MetadataLoadError as exc:
-        result.skipped.append(metadata_path)
-        result.issues.append(issue_from_exception(owner_path, scope, exc))
-        return None, True
+        load_error = exc
+    return _reconciliation_load_error(load_error, metadata_path, owner_path, scope, result)
+
 
+def _reconciliation_load_error(
+    load_error: MetadataLoadError,
+    metadata_path: Path,
+    owner_path: Path,
+    scope: IssueScope,
+    result: MetadataWriteResult,
+) -> _LoadedMetadataFile:
+    result.skipped.append(metadata_path)
+    result.issues.append(issue_from_exception(owner_path, scope, load_error))
+    return _LoadedMetadataFile(error=load_error)
 
-def _load_optional_json(path: Path) -> dict[str, Any] | None:
-    if not path.exists():
-        return None
 
+def _parse_json_object(raw: bytes, path: Path) -> dict[str, Any]:
     try:
-        with open(path, "r", encoding="utf-8") as file:
-            data = json.load(file)
+        data = json.loads(raw.decode("utf-8"))
+    except UnicodeDecodeError as exc:
+        raise MetadataIOError(f"Unable to read metadata file {path}: {exc}") from exc
     except JSONDecodeError as exc:
         raise MetadataJsonError(f"Invalid JSON in metadata file {path}: {exc.msg}") from exc
-    except OSError as exc:
-        raise MetadataIOError(f"Unable to read metadata file {path}: {exc}") from exc
 
     if not isinstance(data, dict):
         raise MetadataShapeError(f"Metadata file must contain a JSON object: {path}")
@@ -280,10 +441,8 @@ def _load_optional_json(path: Path) -> dict[str, Any] | None:
     return data
 
 
-def _write_json(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    rendered = json.dumps(data, indent=2, ensure_ascii=False)
-    path.write_text(rendered + "\n", encoding="utf-8")
+def _render_json(data: dict[str, Any]) -> bytes:
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def delete_metadata_files(input_dir: Path, dry_run: bool = False) -> None:
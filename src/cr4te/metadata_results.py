@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .build_issues import BuildIssue
+
+__all__ = [
+    "MetadataWriteResult",
+]
+
+
+@dataclass
+class MetadataWriteResult:
+    created: list[Path] = field(default_factory=list)
+    updated: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    skipped: list[Path] = field(default_factory=list)
+    issues: list[BuildIssue] = field(default_factory=list)
+
+    def summary_line(self) -> str:
+        return (
+            "Metadata summary: "
+            f"created={len(self.created)}, "
+            f"updated={len(self.updated)}, "
+            f"unchanged={len(self.unchanged)}, "
+            f"skipped={len(self.skipped)}"
+        )
+
+    def extend(self, other: MetadataWriteResult) -> None:
+        self.created.extend(other.created)
+        self.updated.extend(other.updated)
+        self.unchanged.extend(other.unchanged)
+        self.skipped.extend(other.skipped)
+        self.issues.extend(other.issues)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .enums.visible_fields import ProjectField
+from .schemas.config_schema import MediaRules
+from .utils import path_utils
+
+__all__ = [
+    "METADATA_STATE_VERSION",
+    "CreatorMetadataState",
+    "MetadataFileState",
+    "MetadataStateStore",
+]
+
+METADATA_STATE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class MetadataFileState:
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+@dataclass
+class CreatorMetadataState:
+    """
+    Fingerprints of one creator's reconciled metadata files, keyed by path relative to the creator folder.
+
+    ``recorded`` holds what the previous build left behind; ``current`` collects what this build
+    confirmed or wrote, so files that disappeared are dropped when the state is stored again.
+    """
+
+    creator_dir: Path
+    recorded: dict[str, MetadataFileState] = field(default_factory=dict)
+    current: dict[str, MetadataFileState] = field(default_factory=dict)
+
+    def matches_stat(self, path: Path, file_stat: os.stat_result) -> bool:
+        """Return whether the file keeps its recorded size and mtime, carrying the entry forward if so."""
+        key = self._key(path)
+        entry = self.recorded.get(key)
+        if entry is None or (entry.size, entry.mtime_ns) != (file_stat.st_size, file_stat.st_mtime_ns):
+            return False
+        self.current[key] = entry
+        return True
+
+    def matches_content(self, path: Path, raw: bytes, file_stat: os.stat_result) -> bool:
+        """Return whether touched-but-identical content was already reconciled, refreshing its mtime if so."""
+        key = self._key(path)
+        entry = self.recorded.get(key)
+        if entry is None or entry.sha256 != _content_hash(raw):
+            return False
+        self.current[key] = MetadataFileState(file_stat.st_size, file_stat.st_mtime_ns, entry.sha256)
+        return True
+
+    def record(self, path: Path, raw: bytes, file_stat: os.stat_result) -> None:
+        self.current[self._key(path)] = MetadataFileState(file_stat.st_size, file_stat.st_mtime_ns, _content_hash(raw))
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.creator_dir).as_posix()
+
+
+@dataclass
+class MetadataStateStore:
+    """
+    Disk-backed per-creator reconciliation state.
+
+    A metadata file is reconciled against templates shaped by the configured project facet
+    fields, the collaboration separators, and its own content (which fixes the creator type).
+    Records carry a fingerprint of those inputs, so a configuration change re-reconciles every
+    file while an unchanged file costs one ``stat`` instead of a parse and template merge.
+    """
+
+    cache_dir: Path
+    media_rules: MediaRules
+    project_facet_fields: Iterable[ProjectField] = ()
+    _inputs_fingerprint: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        inputs = {
+            "collaboration_separators": list(self.media_rules.collaboration_separators),
+            "project_facet_fields": [facet_field.value for facet_field in self.project_facet_fields],
+        }
+        self._inputs_fingerprint = hashlib.sha1(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def load(self, creator_dir: Path) -> CreatorMetadataState:
+        state = CreatorMetadataState(creator_dir)
+        record = self._read_record(creator_dir)
+        if (
+            record is None
+            or record.get("version") != METADATA_STATE_VERSION
+            or record.get("creator_dir") != str(creator_dir)
+            or record.get("inputs") != self._inputs_fingerprint
+        ):
+            return state
+
+        try:
+            state.recorded = {
+                rel_path: MetadataFileState(entry["size"], entry["mtime_ns"], entry["sha256"])
+                for rel_path, entry in record["files"].items()
+            }
+        except (KeyError, TypeError, AttributeError):
+            state.recorded = {}
+        return state
+
+    def store(self, state: CreatorMetadataState) -> None:
+        if state.current == state.recorded:
+            return
+
+        record = {
+            "version": METADATA_STATE_VERSION,
+            "creator_dir": str(state.creator_dir),
+            "inputs": self._inputs_fingerprint,
+            "files": {
+                rel_path: {"size": entry.size, "mtime_ns": entry.mtime_ns, "sha256": entry.sha256}
+                for rel_path, entry in state.current.items()
+            },
+        }
+        record_path = self._record_path(state.creator_dir)
+        try:
+            record_path.parent.mkdir(parents=True, exist_ok=True)
+            record_path.write_text(json.dumps(record, sort_keys=True), encoding="utf-8")
+        except OSError:
+            # The state is only an optimization; an unwritable record costs a full reconciliation next build.
+            return
+
+    def _read_record(self, creator_dir: Path) -> dict[str, Any] | None:
+        try:
+            data = json.loads(self._record_path(creator_dir).read_text(encoding="utf-8"))
+        except (OSError, UnicodeError, json.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _record_path(self, creator_dir: Path) -> Path:
+        return self.cache_dir / path_utils.build_unique_path(Path(f"{creator_dir.as_posix()}.json"), depth=1)
+
+
+def _content_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
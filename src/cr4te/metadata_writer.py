@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+__all__ = [
+    "DEFAULT_METADATA_WRITE_WORKERS",
+    "MetadataWriter",
+    "write_file_atomically",
+]
+
+DEFAULT_METADATA_WRITE_WORKERS = 8
+_PENDING_WRITES_PER_WORKER = 4
+
+
+@dataclass
+class MetadataWriter:
+    """
+    Bounded thread pool for metadata file writes.
+
+    Every file is written to a temporary sibling and renamed into place, so readers and crashed
+    builds never observe half-written JSON. At most a few writes per worker are queued at once;
+    ``write`` blocks until a slot frees up, which keeps memory flat on very large libraries.
+    """
+
+    max_workers: int = DEFAULT_METADATA_WRITE_WORKERS
+    _executor: ThreadPoolExecutor = field(init=False, repr=False)
+    _slots: threading.BoundedSemaphore = field(init=False, repr=False)
+    _pending: set[Future[os.stat_result]] = field(default_factory=set, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cr4te-metadata")
+        self._slots = threading.BoundedSemaphore(self.max_workers * _PENDING_WRITES_PER_WORKER)
+
+    def write(self, path: Path, content: bytes) -> Future[os.stat_result]:
+        """Queue an atomic write; the future resolves to the written file's ``stat`` result."""
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(write_file_atomically, path, content)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._release)
+        return future
+
+    def drain(self) -> None:
+        """Wait until every queued write has finished; failures stay on their futures."""
+        with self._lock:
+            pending = tuple(self._pending)
+        for future in pending:
+            future.exception()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> MetadataWriter:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def _release(self, future: Future[os.stat_result]) -> None:
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+
+def write_file_atomically(path: Path, content: bytes) -> os.stat_result:
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temp_path, "xb") as file:
+            file.write(content)
+            # Without this, a crash soon after the rename can leave an empty file in place of the old one.
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+    return os.stat(path)
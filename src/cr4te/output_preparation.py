@@ -3,7 +3,13 @@ from __future__ import annotations
 import shutil
 from pathlib import Path
 
-from .constants import CR4TE_CSS_DIR, CR4TE_FAVICON_PATH, CR4TE_JS_DIR, OUTPUT_THUMBNAILS_DIRNAME
+from .constants import (
+    CR4TE_CSS_DIR,
+    CR4TE_FAVICON_PATH,
+    CR4TE_JS_DIR,
+    OUTPUT_CACHE_DIRNAME,
+    OUTPUT_THUMBNAILS_DIRNAME,
+)
 from .html_context import HtmlBuildContext
 
 __all__ = [
@@ -33,6 +39,8 @@ def copy_static_assets(ctx: HtmlBuildContext) -> None:
 
 def clear_output_folder(output_dir: Path, clear_thumbnail_cache: bool) -> None:
     for item in output_dir.iterdir():
+        if item.name == OUTPUT_CACHE_DIRNAME:
+            continue
         if clear_thumbnail_cache or item.name != OUTPUT_THUMBNAILS_DIRNAME:
             if item.is_dir():
                 shutil.rmtree(item)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from .render_models import CreatorOverviewEntry, ProjectOverviewEntry
+
+__all__ = [
+    "OverviewCollector",
+    "creator_entry_sort_key",
+    "project_entry_sort_key",
+]
+
+
+def creator_entry_sort_key(entry: CreatorOverviewEntry) -> str:
+    return entry.name.lower()
+
+
+def project_entry_sort_key(entry: ProjectOverviewEntry) -> tuple[str, str]:
+    return entry.title.lower(), entry.creator_name.lower()
+
+
+@dataclass
+class OverviewCollector:
+    """
+    Overview entries gathered while creator pages render, kept in memory.
+
+    Entries come back sorted for the overview pages; ties keep the order they were added in.
+    """
+
+    _creator_entries: list[CreatorOverviewEntry] = field(default_factory=list, init=False)
+    _project_entries: list[ProjectOverviewEntry] = field(default_factory=list, init=False)
+
+    def add_creator_entry(self, entry: CreatorOverviewEntry) -> None:
+        self._creator_entries.append(entry)
+
+    def add_project_entry(self, entry: ProjectOverviewEntry) -> None:
+        self._project_entries.append(entry)
+
+    def creator_entries(self) -> Sequence[CreatorOverviewEntry]:
+        return sorted(self._creator_entries, key=creator_entry_sort_key)
+
+    def project_entries(self) -> Sequence[ProjectOverviewEntry]:
+        return sorted(self._project_entries, key=project_entry_sort_key)
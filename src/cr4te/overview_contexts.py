@@ -10,7 +10,7 @@ from .html_paths import build_rel_creator_html_path, build_rel_project_html_path
 from .library_index import CreatorSummary, ProjectSummary
 from .render_assets import build_thumbnail_context
 from .render_metadata import build_filter_search_terms
-from .render_models import CreatorOverviewEntry, ProjectOverviewEntry
+from .render_models import CreatorOverviewEntry, ProjectOverviewEntry, ThumbnailContext
 from .tag_contexts import build_tag_search_terms, project_summary_values
 from .utils.sorting_utils import dated_title_sort_key
 from .utils import date_utils
@@ -28,26 +28,23 @@ def sort_project_summary(project: ProjectSummary) -> tuple:
 
 def build_creator_overview_entry_from_index(ctx: HtmlBuildContext, creator: CreatorSummary) -> CreatorOverviewEntry:
     if ctx.site_rendering.portraits.visibility != PortraitVisibility.ALL:
-        rel_thumbnail_path = ""
-        image_wrapper_width = 0
-        image_wrapper_height = 0
+        thumb = ThumbnailContext(rel_thumbnail_path="", image_wrapper_width=0, image_wrapper_height=0)
     else:
         thumb = build_thumbnail_context(ctx, creator.portrait, ThumbType.CREATOR_OVERVIEW)
-        rel_thumbnail_path = thumb.rel_thumbnail_path
-        image_wrapper_width = thumb.image_wrapper_width
-        image_wrapper_height = thumb.image_wrapper_height
 
     return CreatorOverviewEntry(
         name=creator.display_name,
         rel_html_path=(Path(ctx.html_dir.name) / build_rel_creator_html_path(creator)).as_posix(),
         search_text=_build_creator_summary_search_text(ctx, creator),
-        rel_thumbnail_path=rel_thumbnail_path,
-        image_wrapper_width=image_wrapper_width,
-        image_wrapper_height=image_wrapper_height,
+        rel_thumbnail_path=thumb.rel_thumbnail_path,
+        image_wrapper_width=thumb.image_wrapper_width,
+        image_wrapper_height=thumb.image_wrapper_height,
         project_count=creator.project_count,
         media_counts=creator.media_counts,
         project_count_summary=_build_project_count_summary(ctx, creator),
         media_count_summary=_build_media_count_summary(ctx, creator),
+        srcset=thumb.srcset,
+        sizes=thumb.sizes,
     )
 
 
@@ -66,6 +63,8 @@ def build_project_overview_entry_from_index(
         creator_name=creator.display_name,
         search_text=_build_project_summary_search_text(ctx, project, creator),
         media_counts=project.media_counts,
+        srcset=thumb.srcset,
+        sizes=thumb.sizes,
     )
 
 
@@ -73,7 +72,7 @@ def _build_creator_summary_search_text(ctx: HtmlBuildContext, creator: CreatorSu
     search_terms = [creator.display_name]
     search_terms.extend(alias.strip() for alias in creator.aliases if alias and alias.strip())
     search_terms.extend(build_tag_search_terms(creator.tags))
-    search_terms.extend(build_filter_search_terms(ctx.meta_filter_label(CreatorField.NATIONALITIES), list(creator.nationalities)))
+    search_terms.extend(build_filter_search_terms(ctx.meta_filter_label(CreatorField.NATIONALITIES), creator.nationalities))
 
     for project in creator.projects:
         search_terms.append(project.display_title)
@@ -15,7 +15,7 @@ from .html_paths import build_rel_creator_html_path, build_rel_project_html_path
 from .library_issues import invalid_collaboration_reference_issue
 from .media_counts import count_media_groups
 from .render_assets import build_thumbnail_context, get_image_orientation
-from .render_media import build_media_group_contexts
+from .render_media import build_media_group_contexts, build_readme_html
 from .render_metadata import (
     build_collaboration_meta_entries,
     build_creator_meta_entries,
@@ -41,7 +41,7 @@ from .tag_contexts import (
     merge_tag_maps,
 )
 from .utils.sorting_utils import dated_title_sort_key
-from .utils import date_utils, text_utils
+from .utils import date_utils
 
 __all__ = [
     "CreatorLoader",
@@ -93,7 +93,7 @@ def build_project_page_context(
         meta_entries=build_project_meta_entries(ctx, project),
         rel_thumbnail_path=thumbnail.rel_thumbnail_path,
         thumbnail_orientation=get_image_orientation(ctx, thumb_path),
-        info_html=text_utils.markdown_to_html(project.info),
+        info_html=build_readme_html(ctx, Path(creator.name, project.title)),
         tags=merge_tag_maps(project.tags),
         media_groups=build_media_group_contexts(ctx, project.media_groups),
     )
@@ -130,7 +130,7 @@ def build_creator_page_context(
         name=creator.display_name,
         rel_portrait_path=rel_portrait_path,
         portrait_orientation=portrait_orientation,
-        info_html=text_utils.markdown_to_html(creator.info),
+        info_html=build_readme_html(ctx, Path(creator.name)),
         tags=merge_tag_maps(
             collect_tags_from_creator(creator),
             collect_project_metadata_tags(ctx, creator),
@@ -266,6 +266,8 @@ def _build_project_cards(ctx: HtmlBuildContext, creator: CreatorModel) -> list[P
                 image_wrapper_width=thumb.image_wrapper_width,
                 image_wrapper_height=thumb.image_wrapper_height,
                 media_counts=count_media_groups(project.media_groups),
+                srcset=thumb.srcset,
+                sizes=thumb.sizes,
             )
         )
     return project_cards
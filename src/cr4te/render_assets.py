@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import json
+import math
 import os
+import stat
+from collections.abc import Hashable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -17,8 +19,10 @@ from .html_context import HtmlBuildContext
 from .enums.orientation import Orientation
 from .enums.portrait_visibility import PortraitVisibility
 from .enums.thumb_type import ThumbType
+from .enums.thumbnail_store import ThumbnailStore
 from .media_cache import ImageDimensions
-from .render_models import ThumbnailContext
+from .render_models import ThumbnailContext, ThumbnailVariant
+from .thumbnail_engine import ThumbnailJob, ThumbnailTarget
 from .utils import image_utils, path_utils
 
 __all__ = [
@@ -27,6 +31,7 @@ __all__ = [
     "DefaultThumbnailSpec",
     "get_image_dimensions",
     "get_image_orientation",
+    "prefetch_thumbnails",
     "prepare_default_thumbnails",
     "resolve_thumbnail_or_default",
     "stage_media_file",
@@ -76,18 +81,19 @@ def build_default_thumbnail_specs(ctx: HtmlBuildContext) -> tuple[DefaultThumbna
 
 
 def stage_media_file(ctx: HtmlBuildContext, rel_source_path: Path) -> Path | None:
-    source_path = (ctx.input_dir / rel_source_path).resolve()
+    source_path = ctx.file_stats.resolve(ctx.input_dir / rel_source_path)
     target_path = ctx.symlinks_dir / path_utils.build_unique_path(rel_source_path)
 
-    if not source_path.is_file():
+    if not ctx.file_stats.is_file(source_path):
         ctx.report_issue(missing_media_issue(source_path))
         return None
 
-    if target_path.exists():
+    if ctx.file_stats.exists(target_path):
         ctx.asset_statistics.media_links_reused += 1
         return target_path
 
     target_path.parent.mkdir(parents=True, exist_ok=True)
+    ctx.file_stats.invalidate(target_path)
     try:
         os.symlink(source_path, target_path)
         ctx.asset_statistics.symbolic_links_created += 1
@@ -109,30 +115,64 @@ def stage_media_file(ctx: HtmlBuildContext, rel_source_path: Path) -> Path | Non
 
 
 def resolve_thumbnail_or_default(ctx: HtmlBuildContext, rel_image_path: Optional[str], thumb_type: ThumbType) -> Path:
+    return _resolve_thumbnail_variants(ctx, rel_image_path, thumb_type)[0]
+
+
+def _resolve_thumbnail_variants(ctx: HtmlBuildContext, rel_image_path: Optional[str], thumb_type: ThumbType) -> tuple[Path, ...]:
+    """The thumbnail followed by its smaller ``srcset`` variants, or the default thumbnail alone."""
     if rel_image_path:
         return _get_or_create_thumbnail(ctx, Path(rel_image_path), thumb_type)
     ctx.asset_statistics.default_thumbnail_uses += 1
-    return ctx.get_default_thumb_path(thumb_type)
+    return (ctx.get_default_thumb_path(thumb_type),)
 
 
 def build_thumbnail_context(ctx: HtmlBuildContext, rel_image_path: Optional[str], thumb_type: ThumbType) -> ThumbnailContext:
-    thumb_path = resolve_thumbnail_or_default(ctx, rel_image_path, thumb_type)
-    rel_thumbnail_path = path_utils.relative_path_from(thumb_path, ctx.output_dir).as_posix()
+    thumb_path, *variant_paths = _resolve_thumbnail_variants(ctx, rel_image_path, thumb_type)
+    rel_thumbnail_path = path_utils.relative_path_from(thumb_path, ctx.output_dir, ctx.file_stats.resolve).as_posix()
     source_path = ctx.input_dir / rel_image_path if rel_image_path else thumb_path
     dimensions = get_image_dimensions(ctx, thumb_path, issue_path=source_path)
     if not dimensions.width or not dimensions.height:
         thumb_path = ctx.get_default_thumb_path(thumb_type)
         ctx.asset_statistics.default_thumbnail_uses += 1
-        rel_thumbnail_path = path_utils.relative_path_from(thumb_path, ctx.output_dir).as_posix()
+        rel_thumbnail_path = path_utils.relative_path_from(thumb_path, ctx.output_dir, ctx.file_stats.resolve).as_posix()
         dimensions = get_image_dimensions(ctx, thumb_path)
+        variant_paths = []
 
+    srcset = _thumbnail_srcset(ctx, variant_paths, ThumbnailVariant(rel_thumbnail_path, dimensions.width))
     return ThumbnailContext(
         rel_thumbnail_path=rel_thumbnail_path,
         image_wrapper_width=dimensions.width,
         image_wrapper_height=dimensions.height,
+        srcset=srcset,
+        sizes=_thumbnail_sizes(ctx, thumb_type, dimensions) if srcset else "",
     )
 
 
+def _thumbnail_srcset(
+    ctx: HtmlBuildContext,
+    variant_paths: Iterable[Path],
+    thumbnail: ThumbnailVariant,
+) -> tuple[ThumbnailVariant, ...]:
+    variants = []
+    for variant_path in variant_paths:
+        dimensions = get_image_dimensions(ctx, variant_path)
+        if dimensions.width and dimensions.width < thumbnail.width:
+            rel_variant_path = path_utils.relative_path_from(variant_path, ctx.output_dir, ctx.file_stats.resolve).as_posix()
+            variants.append(ThumbnailVariant(rel_variant_path, dimensions.width))
+    return (*variants, thumbnail) if variants else ()
+
+
+def _thumbnail_sizes(ctx: HtmlBuildContext, thumb_type: ThumbType, dimensions: ImageDimensions) -> str:
+    """
+    The ``sizes`` hint for a lazily loaded thumbnail.
+
+    Browsers that support ``auto`` use the laid-out width; the fallback is the widest the image is
+    shown at, which is its width at the configured maximum display height, or the viewport width.
+    """
+    max_width = math.ceil(ctx.get_display_image_max_height(thumb_type) * dimensions.width / dimensions.height)
+    return f"auto, (max-width: {max_width}px) 100vw, {max_width}px"
+
+
 def get_image_dimensions(ctx: HtmlBuildContext, path: Path, issue_path: Path | None = None) -> ImageDimensions:
     def load_dimensions() -> ImageDimensions:
         try:
@@ -148,90 +188,208 @@ def get_image_orientation(ctx: HtmlBuildContext, path: Path) -> Orientation:
     return get_image_dimensions(ctx, path).orientation
 
 
-def _freshness_sidecar_path(thumb_path: Path) -> Path:
-    return thumb_path.with_suffix(f"{thumb_path.suffix}.json")
+@dataclass(frozen=True)
+class _ThumbnailSource:
+    """A library image as the thumbnail cache knows it: by path and stat, or by content fingerprint."""
+
+    rel_path: Path
+    stat: os.stat_result
+    fingerprint: str | None = None
+
+    def identity(self) -> dict[str, int | str]:
+        if self.fingerprint is not None:
+            return {"source_fingerprint": self.fingerprint}
+        return {
+            "source_path": self.rel_path.as_posix(),
+            "source_size": self.stat.st_size,
+            "source_mtime_ns": self.stat.st_mtime_ns,
+        }
 
 
 def _thumbnail_freshness_metadata(
-    source_path: Path,
-    rel_image_path: Path,
+    source: _ThumbnailSource,
     thumb_path: Path,
     thumb_type: ThumbType,
     generated_height: int,
 ) -> dict[str, int | str]:
-    source_stat = source_path.stat()
     return {
         "version": THUMBNAIL_FRESHNESS_VERSION,
-        "source_path": rel_image_path.as_posix(),
-        "source_size": source_stat.st_size,
-        "source_mtime_ns": source_stat.st_mtime_ns,
+        **source.identity(),
         "thumb_type": thumb_type.value,
         "generated_height": generated_height,
         "thumbnail_suffix": thumb_path.suffix.lower(),
     }
 
 
-def _read_freshness_sidecar(sidecar_path: Path) -> dict[str, object] | None:
-    try:
-        data = json.loads(sidecar_path.read_text(encoding="utf-8"))
-    except (OSError, UnicodeError, json.JSONDecodeError):
+def _source_thumbnail_path(ctx: HtmlBuildContext, source: _ThumbnailSource, thumb_type: ThumbType, height: int) -> Path:
+    if source.fingerprint is not None:
+        # Copies of one image share a name, so each size is generated once for all of them.
+        thumb_path = ctx.thumbs_dir / path_utils.build_unique_path(Path(source.fingerprint + source.rel_path.suffix.lower()))
+    else:
+        thumb_path = ctx.thumbs_dir / path_utils.build_unique_path(source.rel_path)
+    if height != ctx.get_generated_thumb_height(thumb_type):
+        return path_utils.tag_path(thumb_path, f"{thumb_type.value}-{height}")
+    return path_utils.tag_path(thumb_path, thumb_type.value)
+
+
+def _thumb_types_sharing_source(ctx: HtmlBuildContext, thumb_type: ThumbType) -> tuple[ThumbType, ...]:
+    """Thumb types the build renders from the same image as ``thumb_type``, which comes first."""
+    match thumb_type:
+        case ThumbType.COVER | ThumbType.CREATOR_PAGE_PROJECT | ThumbType.PROJECT_OVERVIEW:
+            group = (ThumbType.COVER, ThumbType.CREATOR_PAGE_PROJECT, ThumbType.PROJECT_OVERVIEW)
+        case ThumbType.PORTRAIT | ThumbType.CREATOR_OVERVIEW:
+            portrait_visibility = ctx.site_rendering.portraits.visibility
+            group = (ThumbType.PORTRAIT,) if portrait_visibility != PortraitVisibility.DISABLED else ()
+            if portrait_visibility == PortraitVisibility.ALL:
+                group += (ThumbType.CREATOR_OVERVIEW,)
+        case _:
+            group = ()
+    return (thumb_type, *(sibling for sibling in group if sibling != thumb_type))
+
+
+def _source_file_stat(ctx: HtmlBuildContext, source_path: Path) -> os.stat_result | None:
+    source_stat = ctx.file_stats.stat(source_path)
+    return source_stat if source_stat is not None and stat.S_ISREG(source_stat.st_mode) else None
+
+
+def _unfingerprinted_sources(ctx: HtmlBuildContext, rel_image_paths: Iterable[str]) -> Iterator[Path]:
+    for rel_image_path in rel_image_paths:
+        source_path = ctx.input_dir / rel_image_path
+        source_stat = _source_file_stat(ctx, source_path)
+        if source_stat is not None and ctx.thumbnail_manifest.source_fingerprint(Path(rel_image_path), source_stat) is None:
+            yield source_path
+
+
+def _thumbnail_source(ctx: HtmlBuildContext, rel_image_path: Path) -> _ThumbnailSource | None:
+    """
+    Identify a library image for the thumbnail cache, or return ``None`` when it is not a file.
+
+    With the content store the image is read once to fingerprint it, by a hash that prefetch started
+    when there is one; the fingerprint is kept in the thumbnail manifest while the file keeps its size
+    and modification time. Raises ``OSError`` when the image cannot be read.
+    """
+    source_path = ctx.input_dir / rel_image_path
+    source_stat = _source_file_stat(ctx, source_path)
+    if source_stat is None:
         return None
-    return data if isinstance(data, dict) else None
+    if ctx.thumbnail_store != ThumbnailStore.CONTENT:
+        return _ThumbnailSource(rel_image_path, source_stat)
 
+    fingerprint = ctx.thumbnail_manifest.source_fingerprint(rel_image_path, source_stat)
+    if fingerprint is None:
+        fingerprint = ctx.thumbnails.fingerprint(source_path)
+        ctx.thumbnail_manifest.store_source_fingerprint(rel_image_path, source_stat, fingerprint)
+        ctx.asset_statistics.source_fingerprints_computed += 1
+    return _ThumbnailSource(rel_image_path, source_stat, fingerprint)
 
-def _write_freshness_sidecar(sidecar_path: Path, metadata: dict[str, int | str]) -> None:
-    sidecar_path.write_text(json.dumps(metadata, sort_keys=True), encoding="utf-8")
 
+def _thumbnail_target(ctx: HtmlBuildContext, source: _ThumbnailSource, thumb_type: ThumbType, generated_height: int) -> ThumbnailTarget:
+    thumb_path = _source_thumbnail_path(ctx, source, thumb_type, generated_height)
+    freshness = _thumbnail_freshness_metadata(source, thumb_path, thumb_type, generated_height)
+    return ThumbnailTarget(thumb_path=thumb_path, generated_height=generated_height, freshness=tuple(freshness.items()))
 
-def _regenerate_thumbnail(ctx: HtmlBuildContext, source_path: Path, thumb_path: Path, thumb_type: ThumbType) -> None:
-    thumb = image_utils.generate_thumbnail(source_path, ctx.get_generated_thumb_height(thumb_type))
-    thumb_path.parent.mkdir(parents=True, exist_ok=True)
 
-    thumb_ext = thumb_path.suffix.lower()
-    match thumb_ext:
-        case ".jpg" | ".jpeg":
-            image_format = "JPEG"
-        case ".png":
-            image_format = "PNG"
-        case _:
-            raise ValueError(f"Unsupported thumbnail extension: {thumb_ext}")
+def _thumbnail_targets(ctx: HtmlBuildContext, source: _ThumbnailSource, thumb_type: ThumbType) -> tuple[ThumbnailTarget, ...]:
+    """The thumbnail for ``thumb_type`` followed by its smaller ``srcset`` variants."""
+    heights = (ctx.get_generated_thumb_height(thumb_type), *ctx.get_srcset_heights(thumb_type))
+    return tuple(_thumbnail_target(ctx, source, thumb_type, height) for height in heights)
 
-    thumb.save(thumb_path, format=image_format)
-    ctx.asset_statistics.source_thumbnails_generated += 1
 
+def _fresh_thumbnail_dimensions(ctx: HtmlBuildContext, target: ThumbnailTarget) -> ImageDimensions | None:
+    return ctx.thumbnail_manifest.dimensions(target.thumb_path, dict(target.freshness))
 
-def _get_or_create_thumbnail(ctx: HtmlBuildContext, rel_image_path: Path, thumb_type: ThumbType) -> Path:
-    thumb_path = ctx.thumbs_dir / path_utils.build_unique_path(rel_image_path)
-    thumb_path = path_utils.tag_path(thumb_path, thumb_type.value)
-    source_path = ctx.input_dir / rel_image_path
-    sidecar_path = _freshness_sidecar_path(thumb_path)
 
-    if not source_path.is_file():
+def _thumbnail_job(
+    ctx: HtmlBuildContext,
+    source: _ThumbnailSource,
+    thumb_type: ThumbType,
+    requested: Sequence[ThumbnailTarget],
+) -> ThumbnailJob:
+    """A job for the requested stale sizes and every other stale size the build renders from their source."""
+    siblings = (
+        target
+        for sibling_type in _thumb_types_sharing_source(ctx, thumb_type)[1:]
+        for target in _thumbnail_targets(ctx, source, sibling_type)
+    )
+    return ThumbnailJob(
+        source_path=ctx.input_dir / source.rel_path,
+        targets=(*requested, *(sibling for sibling in siblings if _fresh_thumbnail_dimensions(ctx, sibling) is None)),
+    )
+
+
+def prefetch_thumbnails(
+    ctx: HtmlBuildContext,
+    requests: Iterable[tuple[Optional[str], ThumbType]],
+    tag: Hashable,
+) -> None:
+    """
+    Start the thumbnails that pages are about to request, so images are resized while contexts build.
+
+    Fresh thumbnails and missing or unreadable sources are skipped here; the latter are reported
+    when the page asks for them. With the content store, every source without a recorded fingerprint
+    is hashed on the engine's threads first, so jobs are not planned one hash at a time.
+    """
+    if not ctx.thumbnails.parallel:
+        return
+    requests = [(rel_image_path, thumb_type) for rel_image_path, thumb_type in requests if rel_image_path]
+    if ctx.thumbnail_store == ThumbnailStore.CONTENT:
+        ctx.thumbnails.prefetch_fingerprints(_unfingerprinted_sources(ctx, (path for path, _ in requests)), tag)
+
+    def stale_jobs() -> Iterator[ThumbnailJob]:
+        for rel_image_path, thumb_type in requests:
+            try:
+                source = _thumbnail_source(ctx, Path(rel_image_path))
+            except OSError:
+                continue
+            if source is None:
+                continue
+            stale = [target for target in _thumbnail_targets(ctx, source, thumb_type) if _fresh_thumbnail_dimensions(ctx, target) is None]
+            if stale:
+                yield _thumbnail_job(ctx, source, thumb_type, stale)
+
+    ctx.thumbnails.prefetch(stale_jobs(), tag)
+
+
+def _get_or_create_thumbnail(ctx: HtmlBuildContext, rel_image_path: Path, thumb_type: ThumbType) -> tuple[Path, ...]:
+    source_path = ctx.input_dir / rel_image_path
+    try:
+        source = _thumbnail_source(ctx, rel_image_path)
+    except OSError as exc:
+        ctx.report_issue(thumbnail_failure_issue(source_path, exc), exc)
+        ctx.asset_statistics.default_thumbnail_uses += 1
+        return (ctx.get_default_thumb_path(thumb_type),)
+    if source is None:
         ctx.report_issue(missing_media_issue(source_path))
         ctx.asset_statistics.default_thumbnail_uses += 1
-        return ctx.get_default_thumb_path(thumb_type)
+        return (ctx.get_default_thumb_path(thumb_type),)
+
+    ctx.asset_statistics.source_freshness_checks += 1
+    requested = _thumbnail_targets(ctx, source, thumb_type)
+    stale = []
+    for target in requested:
+        dimensions = _fresh_thumbnail_dimensions(ctx, target)
+        if dimensions is None:
+            stale.append(target)
+        else:
+            ctx.media_cache.record_image_dimensions(target.thumb_path, dimensions)
+    requested_paths = tuple(target.thumb_path for target in requested)
+    if not stale:
+        ctx.asset_statistics.source_thumbnails_reused += 1
+        return requested_paths
 
     try:
-        ctx.asset_statistics.source_freshness_checks += 1
-        generated_height = ctx.get_generated_thumb_height(thumb_type)
-        current_freshness = _thumbnail_freshness_metadata(
-            source_path,
-            rel_image_path,
-            thumb_path,
-            thumb_type,
-            generated_height,
-        )
-        stored_freshness = _read_freshness_sidecar(sidecar_path)
-
-        if thumb_path.exists() and current_freshness == stored_freshness:
-            ctx.asset_statistics.source_thumbnails_reused += 1
-            return thumb_path
-
-        _regenerate_thumbnail(ctx, source_path, thumb_path, thumb_type)
-        _write_freshness_sidecar(sidecar_path, current_freshness)
+        job_result = ctx.thumbnails.take(_thumbnail_job(ctx, source, thumb_type, stale)).result()
     except Exception as exc:
+        for target in stale:
+            ctx.file_stats.invalidate(target.thumb_path)
         ctx.report_issue(thumbnail_failure_issue(source_path, exc), exc)
         ctx.asset_statistics.default_thumbnail_uses += 1
-        return ctx.get_default_thumb_path(thumb_type)
+        return (ctx.get_default_thumb_path(thumb_type),)
 
-    return thumb_path
+    # Sizes generated for other pages from the same decode are recorded now, so their requests find them fresh.
+    for result in job_result.results:
+        ctx.thumbnail_manifest.store(result.target.thumb_path, dict(result.target.freshness), result.dimensions)
+        ctx.file_stats.invalidate(result.target.thumb_path)
+        ctx.media_cache.record_image_dimensions(result.target.thumb_path, result.dimensions)
+    ctx.asset_statistics.source_thumbnails_generated += 1
+    return requested_paths
@@ -3,7 +3,13 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Iterable
 
-from .asset_issues import media_inspection_failure_issue, media_read_failure_issue, missing_media_issue
+from .asset_issues import (
+    media_inspection_failure_issue,
+    media_read_failure_issue,
+    missing_media_issue,
+    text_truncated_issue,
+)
+from .constants import README_FILE_NAME
 from .html_context import HtmlBuildContext
 from .enums.media_type import MediaType
 from .enums.thumb_type import ThumbType
@@ -22,6 +28,7 @@ from .utils import audio_utils, image_utils, path_utils, text_utils
 
 __all__ = [
     "build_media_group_contexts",
+    "build_readme_html",
     "sort_media_sections_by_type",
 ]
 
@@ -86,7 +93,9 @@ def _get_section_titles(media_group: MediaGroup, audio_section_title: str, image
 
 def _staged_rel_path(ctx: HtmlBuildContext, rel_path: str) -> str | None:
     staged_path = stage_media_file(ctx, Path(rel_path))
-    return path_utils.relative_path_from(staged_path, ctx.output_dir).as_posix() if staged_path else None
+    if not staged_path:
+        return None
+    return path_utils.relative_path_from(staged_path, ctx.output_dir, ctx.file_stats.resolve).as_posix()
 
 
 def _audio_duration_seconds(ctx: HtmlBuildContext, rel_path: str) -> float:
@@ -107,17 +116,18 @@ def _build_image_contexts(ctx: HtmlBuildContext, rel_image_paths: list[str]) ->
 
     for rel_path in rel_image_paths:
         source_path = ctx.input_dir / Path(rel_path)
-        if not source_path.is_file():
+        if not ctx.file_stats.is_file(source_path):
             ctx.report_issue(missing_media_issue(source_path))
             continue
         thumbnail = build_thumbnail_context(ctx, rel_path, ThumbType.GALLERY)
         default_thumbnail_path = path_utils.relative_path_from(
             ctx.get_default_thumb_path(ThumbType.GALLERY),
             ctx.output_dir,
+            ctx.file_stats.resolve,
         ).as_posix()
         if thumbnail.rel_thumbnail_path == default_thumbnail_path:
             try:
-                image_utils.read_image_dimensions(source_path)
+                ctx.media_cache.image_dimensions(source_path, lambda: image_utils.read_image_dimensions(source_path))
             except Exception as exc:
                 ctx.report_issue(media_read_failure_issue(source_path, exc), exc)
                 continue
@@ -131,6 +141,8 @@ def _build_image_contexts(ctx: HtmlBuildContext, rel_image_paths: list[str]) ->
                 image_wrapper_height=thumbnail.image_wrapper_height,
                 rel_path=staged_rel_path,
                 caption=Path(rel_path).stem,
+                srcset=thumbnail.srcset,
+                sizes=thumbnail.sizes,
             )
         )
 
@@ -184,22 +196,39 @@ def _build_document_contexts(ctx: HtmlBuildContext, rel_document_paths: list[str
     return contexts
 
 
+def build_readme_html(ctx: HtmlBuildContext, rel_dir_path: Path) -> str:
+    """Render the README of a creator or project folder, read only now that its page is rendering."""
+    readme_path = ctx.input_dir / rel_dir_path / README_FILE_NAME
+    if not ctx.file_stats.is_file(readme_path):
+        return ""
+    return _markdown_file_html(ctx, readme_path) or ""
+
+
 def _build_text_contexts(ctx: HtmlBuildContext, rel_text_paths: list[str]) -> list[TextContext]:
     contexts: list[TextContext] = []
     for rel_path in rel_text_paths:
         text_path = ctx.input_dir / Path(rel_path)
-        if not text_path.is_file():
+        if not ctx.file_stats.is_file(text_path):
             ctx.report_issue(missing_media_issue(text_path))
             continue
-        try:
-            content = text_utils.read_text(text_path)
-        except (OSError, UnicodeError) as exc:
-            ctx.report_issue(media_read_failure_issue(text_path, exc), exc)
+        content = _markdown_file_html(ctx, text_path)
+        if content is None:
             continue
         contexts.append(
             TextContext(
-                content=text_utils.markdown_to_html(content),
+                content=content,
                 title=Path(rel_path).stem.title(),
             )
         )
     return contexts
+
+
+def _markdown_file_html(ctx: HtmlBuildContext, text_path: Path) -> str | None:
+    try:
+        html, truncated = text_utils.markdown_file_to_html(text_path, ctx.text_max_bytes)
+    except (OSError, UnicodeError) as exc:
+        ctx.report_issue(media_read_failure_issue(text_path, exc), exc)
+        return None
+    if truncated:
+        ctx.report_issue(text_truncated_issue(text_path, ctx.text_max_bytes))
+    return html
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 from urllib.parse import quote
 
 from .constants import PROJECTS_HTML_FILE_NAME
@@ -147,7 +147,7 @@ def project_metadata_values(project: ProjectModel, field: ProjectField) -> list[
     return list(project.facets.get(field, []))
 
 
-def build_filter_search_terms(label: str, values: list[str]) -> list[str]:
+def build_filter_search_terms(label: str, values: Iterable[str]) -> list[str]:
     return [
         f"{label}:{value.strip()}"
         for value in values
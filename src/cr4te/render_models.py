@@ -28,6 +28,7 @@ __all__ = [
     "TagGroup",
     "TextContext",
     "ThumbnailContext",
+    "ThumbnailVariant",
     "TrackContext",
     "VideoContext",
 ]
@@ -82,11 +83,19 @@ class PageShellContext:
     navigation_items: tuple[NavigationItem, ...]
 
 
+@dataclass(frozen=True)
+class ThumbnailVariant:
+    rel_thumbnail_path: str
+    width: int
+
+
 @dataclass(frozen=True)
 class ThumbnailContext:
     rel_thumbnail_path: str
     image_wrapper_width: int
     image_wrapper_height: int
+    srcset: tuple[ThumbnailVariant, ...] = ()
+    sizes: str = ""
 
 
 @dataclass(frozen=True)
@@ -96,6 +105,8 @@ class GalleryImageContext:
     image_wrapper_height: int
     rel_path: str
     caption: str
+    srcset: tuple[ThumbnailVariant, ...] = ()
+    sizes: str = ""
 
 
 @dataclass(frozen=True)
@@ -174,6 +185,8 @@ class ProjectCardContext:
     image_wrapper_width: int
     image_wrapper_height: int
     media_counts: MediaCounts
+    srcset: tuple[ThumbnailVariant, ...] = ()
+    sizes: str = ""
 
 
 @dataclass(frozen=True)
@@ -241,6 +254,8 @@ class CreatorOverviewEntry:
     media_counts: MediaCounts
     project_count_summary: str
     media_count_summary: str
+    srcset: tuple[ThumbnailVariant, ...] = ()
+    sizes: str = ""
 
 
 @dataclass(frozen=True)
@@ -253,3 +268,5 @@ class ProjectOverviewEntry:
     creator_name: str
     search_text: str
     media_counts: MediaCounts
+    srcset: tuple[ThumbnailVariant, ...] = ()
+    sizes: str = ""
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .library_scan import CreatorScan
+from .schemas.config_schema import MediaRules
+from .utils import path_utils
+
+__all__ = [
+    "SCAN_CACHE_VERSION",
+    "CachedCreatorScan",
+    "ScanCache",
+]
+
+SCAN_CACHE_VERSION = 3
+
+
+@dataclass(frozen=True)
+class CachedCreatorScan:
+    scan: CreatorScan
+    project_dirs: dict[str, Path]
+    directory_mtimes: dict[Path, int]
+
+
+@dataclass
+class ScanCache:
+    """
+    Disk-backed per-creator scan records keyed by folder path and directory ``st_mtime_ns`` values.
+
+    Adding, removing, or renaming an entry changes its parent folder mtime, so a creator whose
+    listed folders all keep their recorded mtimes can be restored without walking its tree.
+    Records also remember the ``.cr4teignore`` fingerprint and the size and ``st_mtime_ns`` of the
+    selected portrait and cover files, because editing a file in place does not touch any folder
+    mtime. Records of creators that a build no longer finds are removed by ``prune``.
+    """
+
+    cache_dir: Path
+    media_rules: MediaRules
+    hits: int = 0
+    misses: int = 0
+    _rules_fingerprint: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._rules_fingerprint = hashlib.sha1(self.media_rules.model_dump_json().encode("utf-8")).hexdigest()
+
+    def load(self, creator_dir: Path, input_dir: Path, ignore_fingerprint: str = "") -> CachedCreatorScan | None:
+        record = self._read_record(creator_dir)
+        cached = None
+        if record is not None and record.get("ignore_rules") == ignore_fingerprint:
+            cached = self._restore(record, creator_dir, input_dir)
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cached
+
+    def store(
+        self,
+        creator_dir: Path,
+        scan: CreatorScan,
+        project_dirs: Mapping[str, Path],
+        directory_mtimes: Mapping[Path, int],
+        ignore_fingerprint: str = "",
+    ) -> None:
+        try:
+            selected_files = _selected_file_stats(creator_dir, scan)
+        except OSError:
+            # A selected image that vanished after the walk costs a rescan on the next build.
+            return
+        record = {
+            "version": SCAN_CACHE_VERSION,
+            "creator_dir": str(creator_dir),
+            "media_rules": self._rules_fingerprint,
+            "ignore_rules": ignore_fingerprint,
+            "directories": {
+                path.relative_to(creator_dir).as_posix(): mtime_ns
+                for path, mtime_ns in directory_mtimes.items()
+            },
+            "project_dirs": sorted(project_dirs),
+            "selected_files": selected_files,
+            "scan": scan.as_json(),
+        }
+        record_path = self._record_path(creator_dir)
+        try:
+            record_path.parent.mkdir(parents=True, exist_ok=True)
+            record_path.write_text(json.dumps(record, sort_keys=True), encoding="utf-8")
+        except OSError:
+            # The cache is only an optimization; an unwritable record costs a rescan on the next build.
+            return
+
+    def prune(self, creator_dirs: Iterable[Path]) -> None:
+        """Delete the records of creators outside ``creator_dirs``, such as removed or renamed folders."""
+        keep = {self._record_path(creator_dir) for creator_dir in creator_dirs}
+        for record_path in self.cache_dir.glob("*/*.json"):
+            if record_path in keep:
+                continue
+            try:
+                record_path.unlink(missing_ok=True)
+            except OSError:
+                continue
+
+    def _restore(self, record: dict[str, Any], creator_dir: Path, input_dir: Path) -> CachedCreatorScan | None:
+        if (
+            record.get("version") != SCAN_CACHE_VERSION
+            or record.get("creator_dir") != str(creator_dir)
+            or record.get("media_rules") != self._rules_fingerprint
+        ):
+            return None
+
+        try:
+            directories = record["directories"]
+            if not _directories_unchanged(creator_dir, directories):
+                return None
+            if not _files_unchanged(creator_dir, record["selected_files"]):
+                return None
+            scan = CreatorScan.from_json(creator_dir, input_dir, self.media_rules, record["scan"])
+            project_dirs = {name: creator_dir / name for name in record["project_dirs"]}
+            directory_mtimes = {creator_dir / rel_dir: mtime_ns for rel_dir, mtime_ns in directories.items()}
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+        return CachedCreatorScan(scan, project_dirs, directory_mtimes)
+
+    def _read_record(self, creator_dir: Path) -> dict[str, Any] | None:
+        try:
+            data = json.loads(self._record_path(creator_dir).read_text(encoding="utf-8"))
+        except (OSError, UnicodeError, json.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _record_path(self, creator_dir: Path) -> Path:
+        return self.cache_dir / path_utils.build_unique_path(Path(f"{creator_dir.as_posix()}.json"), depth=1)
+
+
+def _directories_unchanged(creator_dir: Path, directories: Mapping[str, int]) -> bool:
+    for rel_dir, mtime_ns in directories.items():
+        try:
+            if os.stat(creator_dir / rel_dir).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _selected_file_stats(creator_dir: Path, scan: CreatorScan) -> dict[str, list[int]]:
+    selected = [scan.selected_portrait(), *(scan.selected_cover(name) for name in scan.discovered_project_names())]
+    file_stats = {}
+    for path in selected:
+        if path is not None:
+            path_stat = os.stat(path)
+            file_stats[path.relative_to(creator_dir).as_posix()] = [path_stat.st_size, path_stat.st_mtime_ns]
+    return file_stats
+
+
+def _files_unchanged(creator_dir: Path, file_stats: Mapping[str, list[int]]) -> bool:
+    for rel_path, (size, mtime_ns) in file_stats.items():
+        try:
+            path_stat = os.stat(creator_dir / rel_path)
+        except OSError:
+            return False
+        if (path_stat.st_size, path_stat.st_mtime_ns) != (size, mtime_ns):
+            return False
+    return True
@@ -239,17 +239,39 @@ class GalleryLayoutRendering(StrictConfigModel):
         return f"{width}/{height}"
 
 
+def _normalize_srcset_heights(heights: List[int]) -> List[int]:
+    return sorted(set(heights))
+
+
 class OverviewCardGalleryRendering(GalleryLayoutRendering):
     page_rows: conint(gt=0)
     image_max_height: conint(gt=0)
+    srcset_heights: List[conint(gt=0)]
+
+    @field_validator("srcset_heights")
+    @classmethod
+    def normalize_srcset_heights(cls, value: List[int]) -> List[int]:
+        return _normalize_srcset_heights(value)
 
 
 class ProjectCardGalleryRendering(OverviewCardGalleryRendering):
     creator_page_image_max_height: conint(gt=0)
+    creator_page_srcset_heights: List[conint(gt=0)]
+
+    @field_validator("creator_page_srcset_heights")
+    @classmethod
+    def normalize_creator_page_srcset_heights(cls, value: List[int]) -> List[int]:
+        return _normalize_srcset_heights(value)
 
 
 class MediaGroupGalleryRendering(StrictConfigModel):
     image_max_height: conint(gt=0)
+    srcset_heights: List[conint(gt=0)]
+
+    @field_validator("srcset_heights")
+    @classmethod
+    def normalize_srcset_heights(cls, value: List[int]) -> List[int]:
+        return _normalize_srcset_heights(value)
 
 
 class GalleryRendering(StrictConfigModel):
@@ -260,6 +282,7 @@ class GalleryRendering(StrictConfigModel):
 
 class MediaRendering(StrictConfigModel):
     type_order: List[MediaType]
+    text_max_bytes: conint(gt=0)
 
 
 class CreatorPageRendering(StrictConfigModel):
@@ -3,12 +3,7 @@ from typing import Dict, List
 
 from ..enums.creator_type import CreatorType
 from ..enums.visible_fields import ProjectField
-from ..utils.date_utils import normalize_optional_iso_date
-
-
-def _validate_date_order(start: str, end: str, field_names: str):
-    if start and end and start > end:
-        raise ValueError(f"{field_names} are in invalid chronological order")
+from ..utils.date_utils import normalize_optional_iso_date, validate_date_order
 
 
 class BaseDatedModel(BaseModel):
@@ -49,7 +44,6 @@ class Project(BaseModel):
     display_title: str
     release_date: str
     cover: str
-    info: str
     tags: Dict[str, List[str]] = Field(default_factory=dict)
     facets: Dict[ProjectField, List[str]] = Field(default_factory=dict)
     media_groups: List[MediaGroup]
@@ -94,7 +88,6 @@ class Creator(BaseDatedModel):
     nationalities: List[str] = Field(default_factory=list)
     aliases: List[str] = Field(default_factory=list)
     portrait: str
-    info: str
     tags: Dict[str, List[str]] = Field(default_factory=dict)
     projects: List[Project] = Field(default_factory=list)
     media_groups: List[MediaGroup] = Field(default_factory=list)
@@ -105,14 +98,14 @@ class Creator(BaseDatedModel):
         if self.type == CreatorType.PERSON:
             if self.model_fields_set & COLLABORATION_CREATOR_FIELDS:
                 raise ValueError("person creator must not have collaboration fields")
-            _validate_date_order(self.date_of_birth, self.date_of_death, "date_of_birth/date_of_death")
+            validate_date_order(self.date_of_birth, self.date_of_death, "date_of_birth/date_of_death")
 
         elif self.type == CreatorType.COLLABORATION:
             if self.model_fields_set & PERSON_CREATOR_FIELDS:
                 raise ValueError("collaboration must not have person fields")
             if "members" not in self.model_fields_set:
                 raise ValueError("collaboration creator must have members")
-            _validate_date_order(self.founding_date, self.dissolution_date, "founding_date/dissolution_date")
+            validate_date_order(self.founding_date, self.dissolution_date, "founding_date/dissolution_date")
 
         return self
 
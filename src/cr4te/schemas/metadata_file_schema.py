@@ -6,7 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..enums.creator_type import CreatorType
 from ..enums.visible_fields import ProjectField
-from ..utils.date_utils import normalize_optional_iso_date
+from ..utils.date_utils import normalize_optional_iso_date, validate_date_order
 
 TagMap = Dict[str, List[str]]
 FacetMap = Dict[ProjectField, List[str]]
@@ -65,6 +65,22 @@ class CreatorMetadata(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
+    def validate_date_order(self, creator_type: CreatorType) -> None:
+        """
+        Check the date order of the section ``creator_type`` uses.
+
+        The type may be inferred from the folder name, so this runs once it is known; a leftover
+        section of the other type is never read and is not checked.
+        """
+        if creator_type == CreatorType.COLLABORATION:
+            validate_date_order(
+                self.collaboration.founding.date,
+                self.collaboration.dissolution_date,
+                "founding_date/dissolution_date",
+            )
+        else:
+            validate_date_order(self.person.birth.date, self.person.death.date, "date_of_birth/date_of_death")
+
 
 class ProjectMetadata(BaseModel):
     display_title: str = ""
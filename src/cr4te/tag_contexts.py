@@ -3,8 +3,10 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping
 
 from .html_context import HtmlBuildContext
-from .enums.visible_fields import ProjectField
-from .library_index import CreatorSummary, ProjectSummary
+from .enums.visible_fields import CreatorField, ProjectField
+from .library_index import ProjectSummary
+from .library_index_store import SqliteLibraryLookup
+from .library_lookup import LibraryLookup
 from .render_metadata import project_metadata_values
 from .render_models import TagCollection, TagGroup
 from .schemas.library_schema import Creator as CreatorModel
@@ -13,10 +15,9 @@ __all__ = [
     "RawTagMap",
     "TagSource",
     "build_tag_search_terms",
+    "collect_library_tags",
     "collect_project_metadata_tags",
-    "collect_project_metadata_tags_from_summary",
     "collect_tags_from_creator",
-    "collect_tags_from_creator_summary",
     "merge_tag_maps",
     "project_summary_values",
 ]
@@ -66,20 +67,11 @@ def collect_project_metadata_tags(ctx: HtmlBuildContext, creator: CreatorModel)
     )
 
 
-def collect_tags_from_creator_summary(creator: CreatorSummary) -> TagCollection:
+def collect_library_tags(ctx: HtmlBuildContext, lookup: LibraryLookup | SqliteLibraryLookup) -> TagCollection:
     return merge_tag_maps(
-        creator.tags,
-        *(project.tags for project in creator.projects),
-    )
-
-
-def collect_project_metadata_tags_from_summary(ctx: HtmlBuildContext, creator: CreatorSummary) -> TagCollection:
-    return merge_tag_maps(
-        *(
-            {ctx.meta_filter_label(field): project_summary_values(project, field)}
-            for project in creator.projects
-            for field in ctx.project_tag_fields
-        )
+        lookup.tag_map(),
+        *({ctx.meta_filter_label(field): lookup.facet_values(field)} for field in ctx.project_tag_fields),
+        {ctx.meta_filter_label(CreatorField.NATIONALITIES): lookup.nationalities()},
     )
 
 
@@ -91,11 +83,11 @@ def build_tag_search_terms(tag_map: TagSource) -> list[str]:
     ]
 
 
-def project_summary_values(project: ProjectSummary, field: ProjectField) -> list[str]:
+def project_summary_values(project: ProjectSummary, field: ProjectField) -> tuple[str, ...]:
     for facet_field, values in project.facets.items():
         if isinstance(facet_field, ProjectField) and facet_field is field:
             return values
-    return []
+    return ()
 
 
 def _iter_tag_items(tag_map: TagSource) -> Iterable[tuple[str, Iterable[str]]]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
@@ -86,11 +87,11 @@ def _page_shell_context(
     )
 
 
-def render_project_overview_page(ctx: HtmlBuildContext, project_entries: list[ProjectOverviewEntry]) -> None:
+def render_project_overview_page(ctx: HtmlBuildContext, project_entries: Sequence[ProjectOverviewEntry]) -> None:
     logger.info("Generating project overview page...")
 
     template = env.get_template("project_overview.html.j2")
-    rendered = template.render(
+    stream = template.stream(
         projects=project_entries,
         site_labels=ctx.site_labels,
         site_rendering=ctx.site_rendering,
@@ -106,7 +107,7 @@ def render_project_overview_page(ctx: HtmlBuildContext, project_entries: list[Pr
     )
 
     with open(ctx.projects_html_path, "w", encoding="utf-8") as file:
-        file.write(rendered)
+        stream.dump(file)
 
 
 def render_tags_page(ctx: HtmlBuildContext, tags: TagSource) -> None:
@@ -212,11 +213,11 @@ def render_creator_page(
         file.write(rendered)
 
 
-def render_creator_overview_page(ctx: HtmlBuildContext, creator_entries: list[CreatorOverviewEntry]) -> None:
+def render_creator_overview_page(ctx: HtmlBuildContext, creator_entries: Sequence[CreatorOverviewEntry]) -> None:
     logger.info("Generating overview page...")
 
     template = env.get_template("creator_overview.html.j2")
-    rendered = template.render(
+    stream = template.stream(
         site_labels=ctx.site_labels,
         site_rendering=ctx.site_rendering,
         creator_entries=creator_entries,
@@ -232,4 +233,4 @@ def render_creator_overview_page(ctx: HtmlBuildContext, creator_entries: list[Cr
     )
 
     with open(ctx.index_html_path, "w", encoding="utf-8") as file:
-        file.write(rendered)
+        stream.dump(file)
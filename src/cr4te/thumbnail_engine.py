@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections import deque
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+
+from .build_metrics import AssetStatistics
+from .media_cache import ImageDimensions
+from .utils import image_utils, path_utils
+
+__all__ = [
+    "ThumbnailEngine",
+    "ThumbnailJob",
+    "ThumbnailJobResult",
+    "ThumbnailResult",
+    "ThumbnailTarget",
+    "run_thumbnail_job",
+]
+
+# Sizes of the jobs handed out since the last release are remembered up to this many paths.
+_MAX_CLAIMED = 1024
+
+
+@dataclass(frozen=True)
+class ThumbnailTarget:
+    thumb_path: Path
+    generated_height: int
+    freshness: tuple[tuple[str, int | str], ...]
+
+
+@dataclass(frozen=True)
+class ThumbnailJob:
+    """Thumbnails to cut from one source image; the first target is the one requested."""
+
+    source_path: Path
+    targets: tuple[ThumbnailTarget, ...]
+
+
+@dataclass(frozen=True)
+class ThumbnailResult:
+    target: ThumbnailTarget
+    dimensions: ImageDimensions
+
+
+@dataclass(frozen=True)
+class ThumbnailJobResult:
+    results: tuple[ThumbnailResult, ...]
+    seconds: float
+
+
+def run_thumbnail_job(job: ThumbnailJob) -> ThumbnailJobResult:
+    """
+    Generate every target of ``job`` from one decode, largest first.
+
+    Runs in worker processes, so it only writes the thumbnails of its own job; the caller records
+    them in the thumbnail manifest.
+    """
+    started = perf_counter()
+    targets = sorted(job.targets, key=lambda target: target.generated_height, reverse=True)
+    thumbs = image_utils.generate_thumbnails(job.source_path, [target.generated_height for target in targets])
+    dimensions: dict[Path, ImageDimensions] = {}
+    for target, thumb in zip(targets, thumbs):
+        _save_thumbnail(thumb, target.thumb_path)
+        dimensions[target.thumb_path] = ImageDimensions(width=thumb.width, height=thumb.height)
+
+    return ThumbnailJobResult(
+        results=tuple(ThumbnailResult(target, dimensions[target.thumb_path]) for target in job.targets),
+        seconds=perf_counter() - started,
+    )
+
+
+def _save_thumbnail(thumb, thumb_path: Path) -> None:
+    thumb_path.parent.mkdir(parents=True, exist_ok=True)
+
+    thumb_ext = thumb_path.suffix.lower()
+    match thumb_ext:
+        case ".jpg" | ".jpeg":
+            image_format = "JPEG"
+        case ".png":
+            image_format = "PNG"
+        case _:
+            raise ValueError(f"Unsupported thumbnail extension: {thumb_ext}")
+
+    thumb.save(thumb_path, format=image_format)
+
+
+class ThumbnailEngine:
+    """
+    Runs thumbnail jobs and hands back futures for their results.
+
+    With one worker every job runs inline when it is taken. With more, jobs run in a process pool:
+    ``prefetch`` queues jobs that pages are about to request, at most ``workers * 4`` of them running, and
+    ``take`` returns the prefetched future for any size of a prefetched job or starts the job.
+    Errors surface from the future on the rendering thread, so issues are reported in page order
+    whatever order workers finish in. ``prefetch_fingerprints`` likewise hashes source images on
+    ``workers`` threads ahead of the jobs that are named after them. Worker time is added to ``statistics`` as jobs complete;
+    ``close`` records the elapsed time.
+    """
+
+    def __init__(self, statistics: AssetStatistics, workers: int = 1):
+        self.statistics = statistics
+        self.workers = max(1, workers)
+        self._max_prefetched = self.workers * 4
+        self._executor: ProcessPoolExecutor | None = None
+        self._hash_executor: ThreadPoolExecutor | None = None
+        self._fingerprints: dict[Path, tuple[Future[str], Hashable]] = {}
+        self._prefetched: dict[Path, tuple[Future[ThumbnailJobResult], Hashable]] = {}
+        self._prefetches_running: set[Future[ThumbnailJobResult]] = set()
+        self._claimed: set[Path] = set()
+        self._plans: deque[tuple[Iterator[ThumbnailJob], Hashable]] = deque()
+        self._lock = threading.Lock()
+        self._started = perf_counter()
+
+    @property
+    def parallel(self) -> bool:
+        return self.workers > 1
+
+    def prefetch(self, jobs: Iterable[ThumbnailJob], tag: Hashable) -> None:
+        """Queue ``jobs`` behind earlier prefetches; ``release(tag)`` drops whatever was not taken."""
+        if not self.parallel:
+            return
+        self._plans.append((iter(jobs), tag))
+        self._top_up()
+
+    def prefetch_fingerprints(self, source_paths: Iterable[Path], tag: Hashable) -> None:
+        """Start hashing ``source_paths``; ``release(tag)`` drops the hashes that were not taken."""
+        if not self.parallel:
+            return
+        for source_path in source_paths:
+            if source_path in self._fingerprints:
+                continue
+            if self._hash_executor is None:
+                self._hash_executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cr4te-hash")
+            self._fingerprints[source_path] = (self._hash_executor.submit(path_utils.content_fingerprint, source_path), tag)
+
+    def fingerprint(self, source_path: Path) -> str:
+        """The content fingerprint of ``source_path``, from a prefetched hash or computed now."""
+        prefetched = self._fingerprints.pop(source_path, None)
+        if prefetched is None:
+            return path_utils.content_fingerprint(source_path)
+        return prefetched[0].result()
+
+    def take(self, job: ThumbnailJob) -> Future[ThumbnailJobResult]:
+        prefetched = self._prefetched.pop(job.targets[0].thumb_path, None)
+        future = prefetched[0] if prefetched is not None else self._start(job)
+        if len(self._claimed) < _MAX_CLAIMED:
+            self._claimed.update(target.thumb_path for target in job.targets)
+        self._top_up()
+        return future
+
+    def release(self, tag: Hashable) -> None:
+        """Drop jobs prefetched under ``tag`` that were not taken."""
+        self._plans = deque(plan for plan in self._plans if plan[1] != tag)
+        self._prefetched = {path: prefetched for path, prefetched in self._prefetched.items() if prefetched[1] != tag}
+        self._fingerprints = {path: prefetched for path, prefetched in self._fingerprints.items() if prefetched[1] != tag}
+        self._claimed.clear()
+        self._top_up()
+
+    def close(self) -> None:
+        self._plans.clear()
+        self._prefetched.clear()
+        self._claimed.clear()
+        self._fingerprints.clear()
+        if self._hash_executor is not None:
+            self._hash_executor.shutdown(wait=True, cancel_futures=True)
+            self._hash_executor = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self.statistics.thumbnail_workers = self.workers
+        self.statistics.thumbnail_seconds = perf_counter() - self._started
+
+    def __enter__(self) -> ThumbnailEngine:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def _top_up(self) -> None:
+        while self._plans and len(self._prefetches_running) < self._max_prefetched:
+            plan, tag = self._plans[0]
+            job = next(plan, None)
+            if job is None:
+                self._plans.popleft()
+            elif not any(target.thumb_path in self._prefetched or target.thumb_path in self._claimed for target in job.targets):
+                # A job sharing a size with earlier work waits to be taken, so it sees that work in the manifest.
+                future = self._start(job)
+                if not future.done():
+                    self._prefetches_running.add(future)
+                    future.add_done_callback(self._prefetches_running.discard)
+                for target in job.targets:
+                    self._prefetched.setdefault(target.thumb_path, (future, tag))
+
+    def _start(self, job: ThumbnailJob) -> Future[ThumbnailJobResult]:
+        if self.parallel:
+            if self._executor is None:
+                # The hashing threads may already be running, so workers are spawned, not forked.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            future = self._executor.submit(run_thumbnail_job, job)
+        else:
+            future = Future()
+            try:
+                future.set_result(run_thumbnail_job(job))
+            except Exception as exc:
+                future.set_exception(exc)
+        future.add_done_callback(self._record)
+        return future
+
+    def _record(self, future: Future[ThumbnailJobResult]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            self.statistics.thumbnail_busy_seconds += future.result().seconds
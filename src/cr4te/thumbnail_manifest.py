@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .media_cache import ImageDimensions
+
+__all__ = [
+    "THUMBNAIL_MANIFEST_VERSION",
+    "ThumbnailManifest",
+]
+
+THUMBNAIL_MANIFEST_VERSION = 1
+_COMMIT_INTERVAL = 256
+_BUSY_TIMEOUT_SECONDS = 30.0
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS thumbnails ("
+    "path TEXT PRIMARY KEY, freshness TEXT NOT NULL, width INTEGER NOT NULL, height INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS source_fingerprints ("
+    "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, fingerprint TEXT NOT NULL)",
+)
+
+# Rows used by the current build; temporary tables live only as long as the connection.
+_REFERENCE_SCHEMA = (
+    "CREATE TEMP TABLE referenced_thumbnails (path TEXT PRIMARY KEY)",
+    "CREATE TEMP TABLE referenced_sources (path TEXT PRIMARY KEY)",
+)
+
+
+@dataclass
+class ThumbnailManifest:
+    """
+    Freshness metadata and dimensions of the generated thumbnails, in one SQLite file.
+
+    Rows are keyed by the thumbnail path relative to the folder holding the database, which is the
+    thumbnails folder, so clearing the thumbnail cache clears the manifest with it. A thumbnail is
+    only trusted while the freshness metadata it was written with matches the current one exactly;
+    a warm rebuild answers from one source ``stat`` and one indexed lookup without opening the
+    thumbnail. In content-addressed mode it also records the content fingerprint of each source by
+    library-relative path, trusted while the source keeps its size and ``st_mtime_ns``, so only new
+    or changed files are hashed. Storing a row removes the ``<thumbnail>.json`` freshness sidecar
+    that older builds wrote next to the thumbnail. The database is opened on first use. A database
+    that cannot be read is replaced, since without it every thumbnail would be regenerated on every
+    build.
+
+    With ``track_references``, every row that is looked up successfully or stored is remembered, and
+    ``prune_unreferenced`` removes the other rows and their thumbnail files once a build has asked
+    for everything it renders. Fingerprint-named thumbnails are never overwritten when their source
+    changes, so without this the sets of edited images would stay in the thumbnails folder.
+    """
+
+    db_path: Path
+    track_references: bool = False
+    _connection: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _unavailable: bool = field(default=False, init=False, repr=False)
+    _pending_writes: int = field(default=0, init=False, repr=False)
+
+    def dimensions(self, thumb_path: Path, freshness: Mapping[str, int | str]) -> ImageDimensions | None:
+        connection = self._connect()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute(
+                "SELECT freshness, width, height FROM thumbnails WHERE path = ?",
+                (self._key(thumb_path),),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[0] != _serialize(freshness):
+            return None
+        self._reference("referenced_thumbnails", self._key(thumb_path))
+        return ImageDimensions(width=row[1], height=row[2])
+
+    def store(self, thumb_path: Path, freshness: Mapping[str, int | str], dimensions: ImageDimensions) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO thumbnails (path, freshness, width, height) VALUES (?, ?, ?, ?)",
+            (self._key(thumb_path), _serialize(freshness), dimensions.width, dimensions.height),
+        )
+        self._reference("referenced_thumbnails", self._key(thumb_path))
+        # Thumbnails written before the manifest existed carried a JSON sidecar; the row replaces it.
+        try:
+            _legacy_sidecar_path(thumb_path).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def discard(self, thumb_path: Path) -> None:
+        self._write("DELETE FROM thumbnails WHERE path = ?", (self._key(thumb_path),))
+
+    def source_fingerprint(self, rel_source_path: Path, source_stat: os.stat_result) -> str | None:
+        """The content fingerprint recorded for a library file, while it keeps its size and ``st_mtime_ns``."""
+        connection = self._connect()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute(
+                "SELECT size, mtime_ns, fingerprint FROM source_fingerprints WHERE path = ?",
+                (rel_source_path.as_posix(),),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or (row[0], row[1]) != (source_stat.st_size, source_stat.st_mtime_ns):
+            return None
+        self._reference("referenced_sources", rel_source_path.as_posix())
+        return row[2]
+
+    def store_source_fingerprint(self, rel_source_path: Path, source_stat: os.stat_result, fingerprint: str) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO source_fingerprints (path, size, mtime_ns, fingerprint) VALUES (?, ?, ?, ?)",
+            (rel_source_path.as_posix(), source_stat.st_size, source_stat.st_mtime_ns, fingerprint),
+        )
+        self._reference("referenced_sources", rel_source_path.as_posix())
+
+    def prune_unreferenced(self) -> int:
+        """Delete rows and thumbnail files not referenced since opening; returns the files removed."""
+        connection = self._connect() if self.track_references else None
+        if connection is None:
+            return 0
+        try:
+            unreferenced = [
+                key
+                for (key,) in connection.execute(
+                    "SELECT path FROM thumbnails WHERE path NOT IN (SELECT path FROM temp.referenced_thumbnails)"
+                )
+            ]
+            removed = 0
+            for key in unreferenced:
+                try:
+                    (self.db_path.parent / key).unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    # A thumbnail that cannot be removed keeps its row, so a later build can retry.
+                    continue
+                else:
+                    removed += 1
+                connection.execute("DELETE FROM thumbnails WHERE path = ?", (key,))
+            connection.execute(
+                "DELETE FROM source_fingerprints WHERE path NOT IN (SELECT path FROM temp.referenced_sources)"
+            )
+            connection.commit()
+        except sqlite3.Error:
+            return 0
+        self._pending_writes = 0
+        return removed
+
+    def close(self) -> None:
+        connection, self._connection = self._connection, None
+        self._pending_writes = 0
+        if connection is None:
+            return
+        try:
+            connection.commit()
+        except sqlite3.Error:
+            pass
+        finally:
+            connection.close()
+
+    def _key(self, thumb_path: Path) -> str:
+        return Path(os.path.relpath(thumb_path, self.db_path.parent)).as_posix()
+
+    def _reference(self, table: str, key: str) -> None:
+        if not self.track_references or self._connection is None:
+            return
+        try:
+            self._connection.execute(f"INSERT OR IGNORE INTO temp.{table} (path) VALUES (?)", (key,))
+        except sqlite3.Error:
+            return
+
+    def _write(self, statement: str, parameters: tuple) -> None:
+        connection = self._connect()
+        if connection is None:
+            return
+        try:
+            connection.execute(statement, parameters)
+            self._pending_writes += 1
+            if self._pending_writes >= _COMMIT_INTERVAL:
+                connection.commit()
+                self._pending_writes = 0
+        except sqlite3.Error:
+            return
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._connection is not None or self._unavailable:
+            return self._connection
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                self._connection = self._open()
+            except sqlite3.DatabaseError:
+                self._remove_database()
+                self._connection = self._open()
+        except (OSError, sqlite3.Error):
+            # Without a manifest every thumbnail is regenerated, which is slow but correct.
+            self.close()
+            self._unavailable = True
+        return self._connection
+
+    def _open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT_SECONDS)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != THUMBNAIL_MANIFEST_VERSION:
+                connection.execute("DROP TABLE IF EXISTS thumbnails")
+                connection.execute("DROP TABLE IF EXISTS source_fingerprints")
+                connection.execute(f"PRAGMA user_version = {THUMBNAIL_MANIFEST_VERSION}")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            if self.track_references:
+                for statement in _REFERENCE_SCHEMA:
+                    connection.execute(statement)
+            connection.commit()
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def _remove_database(self) -> None:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+
+
+def _legacy_sidecar_path(thumb_path: Path) -> Path:
+    return thumb_path.with_suffix(f"{thumb_path.suffix}.json")
+
+
+def _serialize(freshness: Mapping[str, int | str]) -> str:
+    return json.dumps(dict(freshness), sort_keys=True, separators=(",", ":"))
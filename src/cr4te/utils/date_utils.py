@@ -11,6 +11,7 @@ __all__ = [
     "format_nice_date",
     "normalize_optional_iso_date",
     "parse_date",
+    "validate_date_order",
 ]
 
 
@@ -50,6 +51,11 @@ def normalize_optional_iso_date(date_str: Optional[str]) -> str:
     raise ValueError(f"{normalized} must be in yyyy, yyyy-mm, yyyy-mm-dd format or empty")
 
 
+def validate_date_order(start: str, end: str, field_names: str) -> None:
+    if start and end and start > end:
+        raise ValueError(f"{field_names} are in invalid chronological order")
+
+
 def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     """Parse date string in YYYY, YYYY-MM, or YYYY-MM-DD format."""
     try:
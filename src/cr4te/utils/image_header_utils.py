@@ -0,0 +1,163 @@
+import struct
+from pathlib import Path
+from typing import BinaryIO
+
+from ..media_cache import ImageDimensions
+
+__all__ = ["read_header_dimensions"]
+
+
+_HEADER_PROBE_BYTES = 32
+_EXIF_ORIENTATION_TAG = 0x0112
+# EXIF orientations 5-8 rotate the stored pixels by 90 or 270 degrees.
+_TRANSPOSED_EXIF_ORIENTATIONS = frozenset({5, 6, 7, 8})
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_STANDALONE_MARKERS = frozenset({0x01, *range(0xD0, 0xD9)})
+_JPEG_SOS_MARKER = 0xDA
+_JPEG_APP1_MARKER = 0xE1
+_WEBP_VP8X_EXIF_FLAG = 0x08
+
+
+def read_header_dimensions(image_path: Path) -> ImageDimensions | None:
+    """
+    Read displayed image dimensions from the file header without decoding pixels.
+
+    Returns None for unrecognized or malformed headers so callers can fall back to Pillow.
+    """
+    with open(image_path, "rb") as stream:
+        head = stream.read(_HEADER_PROBE_BYTES)
+        if head.startswith(b"\xff\xd8"):
+            stream.seek(2)
+            return _read_jpeg_dimensions(stream)
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return _read_png_dimensions(head)
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            return _read_gif_dimensions(head)
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _read_webp_dimensions(head)
+        if head.startswith(b"BM"):
+            return _read_bmp_dimensions(head)
+    return None
+
+
+def _dimensions(width: int, height: int) -> ImageDimensions | None:
+    if width <= 0 or height <= 0:
+        return None
+    return ImageDimensions(width=width, height=height)
+
+
+def _read_png_dimensions(head: bytes) -> ImageDimensions | None:
+    if len(head) < 24 or head[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", head[16:24])
+    return _dimensions(width, height)
+
+
+def _read_gif_dimensions(head: bytes) -> ImageDimensions | None:
+    if len(head) < 10:
+        return None
+    width, height = struct.unpack("<HH", head[6:10])
+    return _dimensions(width, height)
+
+
+def _read_bmp_dimensions(head: bytes) -> ImageDimensions | None:
+    if len(head) < 26:
+        return None
+    (dib_header_size,) = struct.unpack("<I", head[14:18])
+    if dib_header_size == 12:
+        width, height = struct.unpack("<HH", head[18:22])
+    else:
+        width, height = struct.unpack("<ii", head[18:26])
+    # Negative heights mark top-down bitmaps.
+    return _dimensions(width, abs(height))
+
+
+def _read_webp_dimensions(head: bytes) -> ImageDimensions | None:
+    if len(head) < 30:
+        return None
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        if head[23:26] != b"\x9d\x01\x2a":
+            return None
+        width, height = struct.unpack("<HH", head[26:30])
+        return _dimensions(width & 0x3FFF, height & 0x3FFF)
+    if chunk == b"VP8L":
+        if head[20] != 0x2F:
+            return None
+        (bits,) = struct.unpack("<I", head[21:25])
+        return _dimensions((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b"VP8X":
+        if head[20] & _WEBP_VP8X_EXIF_FLAG:
+            # EXIF orientation lives in a trailing chunk; let Pillow handle it.
+            return None
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return _dimensions(width, height)
+    return None
+
+
+def _read_jpeg_dimensions(stream: BinaryIO) -> ImageDimensions | None:
+    orientation = 1
+    while True:
+        byte = stream.read(1)
+        if byte != b"\xff":
+            return None
+        marker = stream.read(1)
+        while marker == b"\xff":
+            marker = stream.read(1)
+        if not marker:
+            return None
+        marker_code = marker[0]
+        if marker_code in _JPEG_STANDALONE_MARKERS:
+            continue
+
+        length_bytes = stream.read(2)
+        if len(length_bytes) != 2:
+            return None
+        (segment_length,) = struct.unpack(">H", length_bytes)
+        if segment_length < 2:
+            return None
+        payload_length = segment_length - 2
+
+        if marker_code in _JPEG_SOF_MARKERS:
+            frame = stream.read(5)
+            if len(frame) != 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            if orientation in _TRANSPOSED_EXIF_ORIENTATIONS:
+                width, height = height, width
+            return _dimensions(width, height)
+        if marker_code == _JPEG_SOS_MARKER:
+            return None
+        if marker_code == _JPEG_APP1_MARKER:
+            payload = stream.read(payload_length)
+            if payload.startswith(b"Exif\x00\x00"):
+                orientation = _read_exif_orientation(payload[6:])
+            continue
+        stream.seek(payload_length, 1)
+
+
+def _read_exif_orientation(tiff: bytes) -> int:
+    byte_order = tiff[:2]
+    if byte_order == b"II":
+        prefix = "<"
+    elif byte_order == b"MM":
+        prefix = ">"
+    else:
+        return 1
+
+    try:
+        (ifd_offset,) = struct.unpack_from(prefix + "I", tiff, 4)
+        (entry_count,) = struct.unpack_from(prefix + "H", tiff, ifd_offset)
+        for index in range(entry_count):
+            entry_offset = ifd_offset + 2 + index * 12
+            tag, value_type = struct.unpack_from(prefix + "HH", tiff, entry_offset)
+            if tag != _EXIF_ORIENTATION_TAG:
+                continue
+            if value_type != 3:
+                return 1
+            (orientation,) = struct.unpack_from(prefix + "H", tiff, entry_offset + 8)
+            return orientation
+    except struct.error:
+        return 1
+    return 1
@@ -1,15 +1,17 @@
 import platform
 import re
+from collections.abc import Sequence
 from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageOps
 
 from ..enums.orientation import Orientation
 from ..media_cache import ImageDimensions
+from .image_header_utils import read_header_dimensions
 
 __all__ = [
     "create_centered_text_image",
-    "generate_thumbnail",
+    "generate_thumbnails",
     "infer_image_orientation",
     "read_image_dimensions",
     "parse_aspect_ratio",
@@ -41,9 +43,25 @@ def parse_aspect_ratio(aspect_ratio: str) -> tuple[int, int]:
     return width, height
 
 
+_EXIF_ORIENTATION_TAG = 0x0112
+_TRANSPOSED_EXIF_ORIENTATIONS = frozenset({5, 6, 7, 8})
+
+
 def read_image_dimensions(image_path: Path) -> ImageDimensions:
+    """
+    Return displayed dimensions, honoring EXIF rotation.
+
+    Common formats are read from their headers; Pillow is only opened for anything else.
+    """
+    dimensions = read_header_dimensions(image_path)
+    if dimensions is not None:
+        return dimensions
+
     with Image.open(image_path) as img:
-        return ImageDimensions(width=img.width, height=img.height)
+        width, height = img.width, img.height
+        if img.getexif().get(_EXIF_ORIENTATION_TAG) in _TRANSPOSED_EXIF_ORIENTATIONS:
+            width, height = height, width
+        return ImageDimensions(width=width, height=height)
 
 
 def infer_image_orientation(image_path: Path) -> Orientation:
@@ -53,11 +71,36 @@ def infer_image_orientation(image_path: Path) -> Orientation:
         return Orientation.LANDSCAPE
 
 
-def generate_thumbnail(source_path: Path, target_height: int) -> Image:
+# Sources are scaled down by whole factors only while they stay this many times the thumbnail size.
+THUMBNAIL_REDUCING_GAP = 2.0
+
+
+def generate_thumbnails(source_path: Path, target_heights: Sequence[int]) -> list[Image.Image]:
+    """
+    Resize one decode of the source to each of ``target_heights``, keeping the aspect ratio.
+
+    Every height is resampled from the same decode, so smaller sizes do not compound the loss of
+    larger ones, and returned in the order given. JPEG sources are decoded at 1/2, 1/4 or 1/8
+    scale when that still leaves twice the largest thumbnail size, and other sources are first
+    reduced by a whole factor, so the Lanczos passes only resample small images. EXIF rotation is
+    applied to the decode, so thumbnails match the dimensions reported by ``read_image_dimensions``.
+    """
     with Image.open(source_path) as img:
-        aspect_ratio = img.width / img.height
-        target_width = int(target_height * aspect_ratio)
-        return img.resize((target_width, target_height), Image.LANCZOS)
+        exif_orientation = img.getexif().get(_EXIF_ORIENTATION_TAG)
+        transposed = exif_orientation in _TRANSPOSED_EXIF_ORIENTATIONS
+        source_width, source_height = (img.height, img.width) if transposed else (img.width, img.height)
+        aspect_ratio = source_width / source_height
+        sizes = {height: (int(height * aspect_ratio), height) for height in target_heights}
+        largest_width, largest_height = sizes[max(sizes)]
+        if transposed:
+            largest_width, largest_height = largest_height, largest_width
+        img.draft(None, (int(largest_width * THUMBNAIL_REDUCING_GAP), int(largest_height * THUMBNAIL_REDUCING_GAP)))
+        oriented = ImageOps.exif_transpose(img) if exif_orientation not in (None, 1) else img
+
+        return [
+            oriented.resize(sizes[height], Image.LANCZOS, reducing_gap=THUMBNAIL_REDUCING_GAP)
+            for height in target_heights
+        ]
 
 
 def create_centered_text_image(width: int, height: int, text: str, output_path: Path) -> None:
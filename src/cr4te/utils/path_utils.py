@@ -1,13 +1,16 @@
 import hashlib
 import os
 from pathlib import Path
+from typing import Callable
 
-__all__ = ["relative_path_from", "build_unique_path", "tag_path"]
+__all__ = ["relative_path_from", "build_unique_path", "content_fingerprint", "tag_path"]
 
+FINGERPRINT_CHUNK_BYTES = 1024 * 1024
 
-def relative_path_from(file_path: Path, base_path: Path) -> Path:
-    file_path = file_path.resolve()
-    base_path = base_path.resolve()
+
+def relative_path_from(file_path: Path, base_path: Path, resolve: Callable[[Path], Path] = Path.resolve) -> Path:
+    file_path = resolve(file_path)
+    base_path = resolve(base_path)
 
     return Path(os.path.relpath(file_path, base_path))
 
@@ -37,5 +40,14 @@ def build_unique_path(input_path: Path, depth: int = 4) -> Path:
     return Path(*chunks)
 
 
+def content_fingerprint(file_path: Path) -> str:
+    """Return a BLAKE2b digest of the file contents, so copies of one file share a fingerprint."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as file:
+        while chunk := file.read(FINGERPRINT_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def tag_path(input_path: Path, tag: str) -> Path:
     return input_path.with_name(f"{input_path.stem}_{tag}{input_path.suffix}")
@@ -1,20 +1,96 @@
 import re
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 import markdown
 
-__all__ = ["markdown_to_html", "read_text", "slugify", "multi_split"]
+__all__ = ["MARKDOWN_CHUNK_BYTES", "markdown_file_to_html", "slugify", "multi_split"]
 
+MARKDOWN_EXTENSIONS = ["nl2br", "tables"]
+MARKDOWN_CHUNK_BYTES = 256 * 1024
+# Lines that may continue the block above a blank line: indented text and further list items.
+_CONTINUATION_LINE = re.compile(r"\s|[-*+]\s|\d+\.\s")
+# Start of a reference definition such as ``[id]: https://example.com "Title"``.
+_REFERENCE_DEFINITION = re.compile(r" {0,3}\[[^\[\]]*\]:")
 
-def markdown_to_html(text: str) -> str:
-    return markdown.markdown(text, extensions=["nl2br", "tables"])
+
+def markdown_file_to_html(text_path: Path, max_bytes: int) -> Tuple[str, bool]:
+    """
+    Converts up to ``max_bytes`` of a UTF-8 markdown file, returning the HTML and whether the file was cut short.
+
+    The file is read line by line and cut at the last whole line within the limit; a first line
+    longer than the limit is cut at the last whole character instead. Files larger than
+    ``MARKDOWN_CHUNK_BYTES`` are converted a chunk at a time, split only where a blank line is
+    followed by a line that starts a new block, so memory follows the chunk size rather than the
+    file size. Reference definitions of the whole file are collected first in that case, so
+    reference-style links resolve across chunks.
+    """
+    converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    references: Dict[str, Tuple[str, str]] = {}
+    html_parts: List[str] = []
+    chunk: List[str] = []
+    chunk_bytes = 0
+    remaining = max_bytes
+    after_blank_line = False
+    truncated = False
+    with text_path.open("rb") as text_file:
+        while line := text_file.readline(remaining + 1):
+            if len(line) > remaining:
+                truncated = True
+                if remaining == max_bytes:
+                    chunk.append(_utf8_prefix(line, max_bytes))
+                break
+            remaining -= len(line)
+            text = line.decode("utf-8")
+            is_blank = not text.strip()
+            if after_blank_line and not is_blank and chunk_bytes >= MARKDOWN_CHUNK_BYTES and not _CONTINUATION_LINE.match(text):
+                if not html_parts:
+                    references = _collect_references(converter, text_path, max_bytes)
+                html_parts.append(_convert_chunk(converter, chunk, references, first=not html_parts))
+                chunk, chunk_bytes = [], 0
+            after_blank_line = is_blank
+            chunk.append(text)
+            chunk_bytes += len(line)
+    html_parts.append(_convert_chunk(converter, chunk, references, first=not html_parts))
+    return "\n".join(part for part in html_parts if part), truncated
+
+
+def _utf8_prefix(data: bytes, max_bytes: int) -> str:
+    # Continuation bytes look like 0b10xxxxxx; stepping back over them avoids splitting a character.
+    end = max_bytes
+    while end > 0 and data[end] & 0xC0 == 0x80:
+        end -= 1
+    return data[:end].decode("utf-8")
+
+
+def _collect_references(converter: markdown.Markdown, text_path: Path, max_bytes: int) -> Dict[str, Tuple[str, str]]:
+    # Only definition lines and the indented lines right after them are kept; markdown parses them.
+    definitions: List[str] = []
+    remaining = max_bytes
+    in_definition = False
+    with text_path.open("rb") as text_file:
+        while line := text_file.readline(remaining + 1):
+            if len(line) > remaining:
+                break
+            remaining -= len(line)
+            text = line.decode("utf-8")
+            if _REFERENCE_DEFINITION.match(text):
+                definitions.append(text)
+                in_definition = True
+            elif in_definition and text[:1].isspace() and text.strip():
+                definitions[-1] += text
+            else:
+                in_definition = False
+    if not definitions:
+        return {}
+    converter.reset().convert("\n".join(definitions))
+    return dict(converter.references)
 
 
-def read_text(text_path: Path) -> str:
-    if text_path.exists() and text_path.is_file():
-        return text_path.read_text(encoding="utf-8").strip()
-    return ""
+def _convert_chunk(converter: markdown.Markdown, lines: List[str], references: Dict[str, Tuple[str, str]], first: bool) -> str:
+    text = "".join(lines).rstrip()
+    converter.reset().references.update(references)
+    return converter.convert(text.lstrip() if first else text)
 
 
 def slugify(text: str) -> str:
@@ -8,6 +8,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
 from cr4te.build_issues import BuildIssue, IssueCode, IssueScope
+from cr4te.build_metrics import BuildTimings
 from cr4te.build_runner import BuildPhase, BuildPhaseError, BuildRequest, run_build
 from cr4te.config_manager import apply_cli_overrides, load_config
 from cr4te.enums.domain import Domain
@@ -37,12 +38,11 @@ class BuildRunnerTests(unittest.TestCase):
                 message="invalid metadata",
             )
             metadata_result = MetadataWriteResult(issues=[issue])
-            index = LibraryIndex(input_dir=root, creators=(), issues=(issue,))
+            index = LibraryIndex(input_dir=root, creators=(), issues=(issue,), metadata_result=metadata_result)
             html_result = HtmlBuildResult(output_dir / "index.html")
 
             with (
                 patch("cr4te.build_runner.discover_themes", return_value=ThemeRegistry(discover_builtin_themes())),
-                patch("cr4te.build_runner.reconcile_metadata_files", return_value=metadata_result),
                 patch("cr4te.build_runner.build_library_index", return_value=index),
                 patch("cr4te.build_runner.build_html_pages_streaming", return_value=html_result),
                 patch("cr4te.build_runner.perf_counter", side_effect=range(10)),
@@ -50,7 +50,16 @@ class BuildRunnerTests(unittest.TestCase):
                 result = run_build(self.request_for(root, output_dir))
 
             self.assertEqual(result.summary.issues, (issue,))
-            self.assertEqual(result.summary.timings.total_seconds, 5)
+            self.assertEqual(
+                result.summary.timings,
+                BuildTimings(
+                    theme_discovery_seconds=1,
+                    output_preparation_seconds=1,
+                    library_indexing_seconds=1,
+                    html_rendering_seconds=1,
+                ),
+            )
+            self.assertEqual(result.summary.timings.total_seconds, 4)
             self.assertIs(result.metadata_result, metadata_result)
 
     def test_runner_adds_phase_context_to_expected_operational_failures(self):
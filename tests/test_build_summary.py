@@ -8,7 +8,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
 from cr4te.build_issues import BuildIssue, IssueCode, IssueScope, IssueSeverity
-from cr4te.build_metrics import AssetStatistics, BuildTimings
+from cr4te.build_metrics import AssetStatistics, BuildTimings, IndexStatistics, RenderStatistics
 from cr4te.build_summary import BuildSummary, log_build_summary
 from cr4te.enums.creator_type import CreatorType
 from cr4te.library_index import CreatorSummary, LibraryIndex, ProjectSummary
@@ -39,7 +39,6 @@ class BuildSummaryTests(unittest.TestCase):
                         tags={},
                         active_since="",
                         nationalities=(),
-                        info="",
                         projects=(
                             ProjectSummary(
                                 title="One",
@@ -72,7 +71,6 @@ class BuildSummaryTests(unittest.TestCase):
                         tags={},
                         active_since="",
                         nationalities=(),
-                        info="",
                     ),
                 ),
                 issues=(issue,),
@@ -116,13 +114,18 @@ class BuildSummaryTests(unittest.TestCase):
                 "INFO:cr4te.tests.build_summary:Build summary: creators=1, projects=2, errors=0, warnings=0",
                 (
                     "INFO:cr4te.tests.build_summary:Build timings: themes=0.000s, output=0.000s, "
-                    "metadata=0.000s, indexing=0.000s, rendering=0.000s, total=0.000s"
+                    "indexing=0.000s, rendering=0.000s, total=0.000s"
                 ),
+                "INFO:cr4te.tests.build_summary:Scan cache: reused=0, rescanned=0",
+                "INFO:cr4te.tests.build_summary:Creator cache: hits=0, misses=0",
+                "INFO:cr4te.tests.build_summary:Media probes: reused=0, measured=0",
                 "INFO:cr4te.tests.build_summary:Asset links: symbolic=0, hard=0, reused=0",
                 (
                     "INFO:cr4te.tests.build_summary:Source thumbnails: "
-                    "generated=0, reused=0, default_uses=0, freshness_checks=0"
+                    "generated=0, reused=0, default_uses=0, freshness_checks=0, fingerprints=0, removed=0"
                 ),
+                "INFO:cr4te.tests.build_summary:Thumbnail engine: workers=1, images_per_second=0.0, utilization=0%",
+                "INFO:cr4te.tests.build_summary:Filesystem calls: stat=0, resolve=0, cached=0",
             ],
         )
 
@@ -147,7 +150,6 @@ class BuildSummaryTests(unittest.TestCase):
                     tags={},
                     active_since="",
                     nationalities=(),
-                    info="",
                     projects=(
                         ProjectSummary(
                             title="Landscapes",
@@ -177,10 +179,21 @@ class BuildSummaryTests(unittest.TestCase):
             timings=BuildTimings(
                 theme_discovery_seconds=0.1,
                 output_preparation_seconds=0.2,
-                metadata_reconciliation_seconds=0.3,
                 library_indexing_seconds=0.4,
                 html_rendering_seconds=0.5,
             ),
+            index_statistics=IndexStatistics(
+                scan_cache_hits=8,
+                scan_cache_misses=9,
+                media_probe_hits=12,
+                media_probe_misses=13,
+            ),
+            render_statistics=RenderStatistics(
+                creator_cache_hits=10,
+                creator_cache_misses=11,
+                media_probe_hits=14,
+                media_probe_misses=15,
+            ),
             asset_statistics=AssetStatistics(
                 symbolic_links_created=1,
                 hard_links_created=2,
@@ -189,21 +202,43 @@ class BuildSummaryTests(unittest.TestCase):
                 source_thumbnails_reused=5,
                 default_thumbnail_uses=6,
                 source_freshness_checks=7,
+                source_fingerprints_computed=8,
+                stale_thumbnails_removed=9,
+                filesystem_stat_calls=16,
+                path_resolve_calls=17,
+                filesystem_cache_hits=18,
+                thumbnail_workers=4,
+                thumbnail_seconds=2.0,
+                thumbnail_busy_seconds=6.0,
             ),
         )
 
         self.assertEqual(
             summary.timing_line(),
-            "Build timings: themes=0.100s, output=0.200s, metadata=0.300s, indexing=0.400s, rendering=0.500s, total=1.500s",
+            "Build timings: themes=0.100s, output=0.200s, indexing=0.400s, rendering=0.500s, total=1.200s",
         )
         self.assertEqual(
             summary.asset_statistic_lines(),
             (
                 "Asset links: symbolic=1, hard=2, reused=3",
-                "Source thumbnails: generated=4, reused=5, default_uses=6, freshness_checks=7",
+                "Source thumbnails: generated=4, reused=5, default_uses=6, freshness_checks=7, fingerprints=8, removed=9",
+                "Thumbnail engine: workers=4, images_per_second=2.0, utilization=75%",
+                "Filesystem calls: stat=16, resolve=17, cached=18",
+            ),
+        )
+        self.assertEqual(summary.index_statistic_line(), "Scan cache: reused=8, rescanned=9")
+        self.assertEqual(summary.render_statistic_line(), "Creator cache: hits=10, misses=11")
+        self.assertEqual(summary.media_probe_statistic_line(), "Media probes: reused=26, measured=28")
+        self.assertEqual(
+            summary.lines()[1:],
+            (
+                summary.timing_line(),
+                summary.index_statistic_line(),
+                summary.render_statistic_line(),
+                summary.media_probe_statistic_line(),
+                *summary.asset_statistic_lines(),
             ),
         )
-        self.assertEqual(summary.lines()[1:], (summary.timing_line(), *summary.asset_statistic_lines()))
 
     def test_summary_combines_explicit_non_library_issues(self):
         index = LibraryIndex(input_dir=Path("Artists"), creators=())
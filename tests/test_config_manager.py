@@ -253,6 +253,20 @@ class ConfigManagerTests(unittest.TestCase):
             ):
                 GalleryLayoutRendering(building_strategy="aspect", aspect_ratio=value)
 
+    def test_gallery_srcset_heights_are_sorted_without_duplicates_and_must_be_positive(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "config.json"
+            write_json(config_path, {"site_rendering": {"galleries": {"media_groups": {"srcset_heights": [300, 120, 300]}}}})
+
+            config = load_config(config_path)
+
+            self.assertEqual(config.site_rendering.galleries.media_groups.srcset_heights, [120, 300])
+            self.assertEqual(config.site_rendering.galleries.project_cards.creator_page_srcset_heights, [150, 300])
+
+            write_json(config_path, {"site_rendering": {"galleries": {"creator_cards": {"srcset_heights": [0]}}}})
+            with self.assertRaises(ValueError):
+                load_config(config_path)
+
     def test_metadata_date_and_place_format_is_configurable_as_a_label(self):
         with tempfile.TemporaryDirectory() as tmp:
             config_path = Path(tmp) / "config.json"
@@ -0,0 +1,68 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.creator_loader import MemoizedCreatorLoader
+from cr4te.enums.creator_type import CreatorType
+from cr4te.library_index import CreatorSummary
+from cr4te.schemas.library_schema import Creator
+
+
+def make_summary(name: str) -> CreatorSummary:
+    return CreatorSummary(
+        path=Path(name),
+        name=name,
+        display_name=name,
+        type=CreatorType.PERSON,
+        portrait="",
+        aliases=(),
+        collaborations=(),
+        tags={},
+        active_since="",
+        nationalities=(),
+    )
+
+
+class MemoizedCreatorLoaderTests(unittest.TestCase):
+    def make_loader(self, max_entries: int):
+        loaded = []
+
+        def load_creator(summary: CreatorSummary) -> Creator:
+            loaded.append(summary.name)
+            return Creator(
+                name=summary.name,
+                display_name=summary.display_name,
+                type=summary.type,
+                active_since="",
+                portrait="",
+            )
+
+        summaries = {name: make_summary(name) for name in ("Ada", "Bob")}
+        return MemoizedCreatorLoader(load_creator, summaries, max_entries), loaded
+
+    def test_repeated_lookups_load_each_creator_once_and_count_hits(self):
+        loader, loaded = self.make_loader(max_entries=8)
+
+        self.assertEqual(loader("Ada").name, "Ada")
+        self.assertIs(loader("Ada"), loader.load(make_summary("Ada")))
+        self.assertIsNone(loader("Unknown"))
+
+        self.assertEqual(loaded, ["Ada"])
+        self.assertEqual((loader.hits, loader.misses), (2, 1))
+
+    def test_loader_is_bounded(self):
+        loader, loaded = self.make_loader(max_entries=1)
+
+        loader("Ada")
+        loader("Bob")
+        loader("Ada")
+
+        self.assertEqual(loaded, ["Ada", "Bob", "Ada"])
+        self.assertEqual((loader.hits, loader.misses), (0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
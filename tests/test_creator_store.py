@@ -0,0 +1,104 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from PIL import Image
+
+from cr4te.config_manager import apply_cli_overrides, load_config
+from cr4te.creator_store import CreatorStore
+from cr4te.enums.creator_type import CreatorType
+from cr4te.enums.domain import Domain
+from cr4te.library_builder import build_library_index, load_indexed_creator
+from cr4te.schemas.library_schema import Creator, MediaGroup
+
+
+def make_creator(name: str, aliases: tuple[str, ...] = (), images: int = 0) -> Creator:
+    return Creator(
+        name=name,
+        display_name=name,
+        type=CreatorType.PERSON,
+        active_since="",
+        portrait="",
+        aliases=list(aliases),
+        media_groups=[
+            MediaGroup(
+                is_root=True,
+                videos=[],
+                tracks=[],
+                images=[f"{name}/image-{index:04}.jpg" for index in range(images)],
+                documents=[],
+                texts=[],
+                rel_dir_path=name,
+            )
+        ],
+    )
+
+
+class CreatorStoreTests(unittest.TestCase):
+    def test_creators_within_budget_stay_resident(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = CreatorStore(Path(tmp) / "spill")
+            creator = make_creator("Ada")
+
+            store.put(creator)
+
+            self.assertIs(store.get("Ada"), creator)
+            self.assertIsNone(store.get("Bob"))
+            self.assertEqual((store.resident_count, store.spilled_count), (1, 0))
+            self.assertFalse((Path(tmp) / "spill").exists())
+
+    def test_resident_creators_are_sized_without_serializing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = CreatorStore(Path(tmp) / "spill")
+
+            with patch.object(Creator, "model_dump_json") as model_dump_json:
+                store.put(make_creator("Ada", images=100))
+
+            model_dump_json.assert_not_called()
+            self.assertEqual(store.resident_count, 1)
+
+    def test_creators_beyond_budget_are_spilled_and_read_back(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            spill_dir = Path(tmp) / "spill"
+            bob = make_creator("Bob", aliases=("Robert", "Bobby"), images=100)
+            store = CreatorStore(spill_dir, memory_budget_bytes=len(bob.model_dump_json(exclude_unset=True)) // 2)
+
+            store.put(make_creator("Ada"))
+            store.put(bob)
+
+            self.assertEqual((store.resident_count, store.spilled_count), (1, 1))
+            self.assertEqual(store.get("Bob"), bob)
+
+            store.close()
+
+            self.assertFalse(spill_dir.exists())
+            self.assertIsNone(store.get("Bob"))
+
+    def test_indexed_creators_are_not_scanned_again_for_rendering(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            project_dir = root / "Noomi" / "Landscapes"
+            project_dir.mkdir(parents=True)
+            Image.new("RGB", (120, 90)).save(project_dir / "photo.jpg")
+            media_rules = apply_cli_overrides(load_config(), domain=Domain.ART).media_rules
+
+            for budget in (1024 * 1024, 0):
+                with self.subTest(budget=budget):
+                    store = CreatorStore(Path(tmp) / f"spill-{budget}", memory_budget_bytes=budget)
+                    index = build_library_index(root, media_rules, creator_store=store)
+
+                    with patch("cr4te.library_builder._build_creator") as build_creator:
+                        creator = load_indexed_creator(index, index.creators[0], media_rules, store)
+
+                    build_creator.assert_not_called()
+                    self.assertEqual(creator.projects[0].cover, "Noomi/Landscapes/photo.jpg")
+                    store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
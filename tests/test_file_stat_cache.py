@@ -0,0 +1,53 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.build_metrics import AssetStatistics
+from cr4te.file_stat_cache import FileStatCache
+
+
+class FileStatCacheTests(unittest.TestCase):
+    def test_repeated_checks_issue_one_stat_and_one_resolve(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            media_path = Path(tmp) / "image.jpg"
+            media_path.write_bytes(b"pixels")
+            statistics = AssetStatistics()
+            cache = FileStatCache(statistics)
+
+            with patch("cr4te.file_stat_cache.os.stat", wraps=os.stat) as stat:
+                self.assertTrue(cache.is_file(media_path))
+                self.assertTrue(cache.exists(media_path))
+                self.assertEqual(cache.stat(media_path).st_size, 6)
+                self.assertFalse(cache.is_file(Path(tmp)))
+
+            self.assertEqual(cache.resolve(media_path), media_path.resolve())
+            self.assertEqual(cache.resolve(media_path), media_path.resolve())
+
+            self.assertEqual(stat.call_count, 2)
+            self.assertEqual(statistics.filesystem_stat_calls, 2)
+            self.assertEqual(statistics.path_resolve_calls, 1)
+            self.assertEqual(statistics.filesystem_cache_hits, 3)
+
+    def test_missing_paths_are_cached_until_invalidated(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target_path = Path(tmp) / "target.jpg"
+            cache = FileStatCache()
+
+            self.assertFalse(cache.exists(target_path))
+            target_path.write_bytes(b"created")
+            self.assertFalse(cache.exists(target_path))
+
+            cache.invalidate(target_path)
+
+            self.assertTrue(cache.exists(target_path))
+            self.assertEqual(cache.statistics.filesystem_stat_calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
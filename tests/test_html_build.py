@@ -23,6 +23,7 @@ from cr4te.enums.creator_type import CreatorType
 from cr4te.enums.domain import Domain
 from cr4te.enums.portrait_discovery import PortraitDiscovery
 from cr4te.enums.portrait_visibility import PortraitVisibility
+from cr4te.enums.thumbnail_store import ThumbnailStore
 from cr4te.html_builder import build_html_pages_streaming
 from cr4te.library_builder import build_library_index, load_indexed_creator
 from cr4te.library_index import CreatorSummary, LibraryIndex, ProjectSummary
@@ -127,6 +128,86 @@ class HtmlBuildTests(unittest.TestCase):
 
                     self.assertEqual(cached_thumbnail.exists(), not clear_thumbnail_cache)
 
+    def test_query_command_answers_from_the_lookup_of_the_last_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            output_dir = Path(tmp) / "site"
+            project_dir = root / "Noomi" / "Landscapes"
+            write_image(project_dir / "cover.jpg")
+            write_json(project_dir / "cr4te.json", {"tags": {"Mood": ["Calm"]}, "facets": {"mediums": ["Paper"]}})
+
+            with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as missing:
+                main(["query", "-o", str(output_dir), "--tag", "Mood=Calm"])
+            self.assertEqual(missing.exception.code, 2)
+
+            main(["build", "-i", str(root), "-o", str(output_dir), "--domain", Domain.ART.value, "--force"])
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                exit_code = main(["query", "-o", str(output_dir), "--tag", "Mood=Calm", "--facet", "mediums=Paper"])
+
+            self.assertEqual(exit_code, ExitCode.SUCCESS)
+            self.assertEqual(stdout.getvalue(), "Noomi\tLandscapes\n")
+            for argv in (
+                ["query", "-o", str(output_dir)],
+                ["query", "-o", str(output_dir), "--tag", "Mood"],
+                ["query", "-o", str(output_dir), "--facet", "colours=Red"],
+                ["query", "-o", str(output_dir), "--creators", "--facet", "mediums=Paper"],
+            ):
+                with self.subTest(argv=argv), redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as caught:
+                    main(argv)
+                self.assertEqual(caught.exception.code, 2)
+
+    def test_index_artifact_renders_the_same_site_as_a_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            project_dir = root / "Noomi" / "Landscapes"
+            write_image(project_dir / "cover.jpg")
+            write_json(project_dir / "cr4te.json", {"tags": {"Mood": ["Calm"]}})
+            artifact_path = Path(tmp) / "index.bin"
+            domain = ["--domain", Domain.ART.value]
+
+            main(["build", "-i", str(root), "-o", str(Path(tmp) / "built"), *domain, "--force"])
+            self.assertEqual(main(["index", "-i", str(root), "--out", str(artifact_path), *domain]), ExitCode.SUCCESS)
+            self.assertTrue((Path(tmp) / "index.bin.cache").is_dir())
+            with patch("cr4te.build_runner.build_library_index", side_effect=AssertionError("library walked")):
+                exit_code = main(["render", "--index", str(artifact_path), "-o", str(Path(tmp) / "rendered"), *domain, "--force"])
+
+            self.assertEqual(exit_code, ExitCode.SUCCESS)
+            built_pages = sorted((Path(tmp) / "built" / "html").rglob("*.html"))
+            rendered_pages = sorted((Path(tmp) / "rendered" / "html").rglob("*.html"))
+            self.assertEqual(
+                [page.relative_to(Path(tmp) / "built").as_posix() for page in built_pages],
+                [page.relative_to(Path(tmp) / "rendered").as_posix() for page in rendered_pages],
+            )
+            for built, rendered in zip(built_pages, rendered_pages):
+                self.assertEqual(built.read_text(encoding="utf-8"), rendered.read_text(encoding="utf-8"))
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                main(["query", "-o", str(Path(tmp) / "rendered"), "--tag", "Mood=Calm"])
+            self.assertEqual(stdout.getvalue(), "Noomi\tLandscapes\n")
+
+            for argv in (
+                ["render", "--index", str(Path(tmp) / "missing.bin"), "-o", str(Path(tmp) / "site"), "--force"],
+                ["index", "-i", str(root), "--out", str(root / "index.bin")],
+            ):
+                with self.subTest(argv=argv), redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as caught:
+                    main(argv)
+                self.assertEqual(caught.exception.code, 2)
+
+    def test_render_rejects_output_paths_overlapping_the_indexed_library(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            write_image(root / "Ada" / "Landscapes" / "cover.jpg")
+            artifact_path = Path(tmp) / "index.bin"
+            self.assertEqual(main(["index", "-i", str(root), "--out", str(artifact_path)]), ExitCode.SUCCESS)
+
+            for output_dir in (root, root / "site", Path(tmp)):
+                with self.subTest(output_dir=output_dir), redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as caught:
+                    main(["render", "--index", str(artifact_path), "-o", str(output_dir), "--force"])
+                self.assertEqual(caught.exception.code, 2)
+                self.assertTrue((root / "Ada" / "Landscapes" / "cover.jpg").is_file())
+            self.assertFalse((root / "site").exists())
+
     def test_cli_accepts_portrait_overrides_and_rejects_removed_portrait_options(self):
         parser = _create_parser()
         args = parser.parse_args([
@@ -225,6 +306,40 @@ class HtmlBuildTests(unittest.TestCase):
             self.assertLess(creator_overview.index("A Display"), creator_overview.index("Z Display"))
             self.assertLess(project_overview.index("A Project"), project_overview.index("Z Project"))
 
+    def test_sqlite_index_backend_renders_the_same_site_as_memory_backend(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            write_image(root / "Ada" / "Sketches" / "cover.jpg")
+            write_image(root / "Bob" / "portrait.jpg", (80, 160))
+            (root / "Ada & Bob" / "Duets").mkdir(parents=True)
+            write_json(root / "Bob" / "cr4te.json", {"display_name": "Bobby", "tags": {"Style": ["ink"]}})
+
+            pages = {}
+            for backend in ("memory", "sqlite"):
+                output_dir = Path(tmp) / backend
+                _build_cmd_handler(SimpleNamespace(
+                    config=None,
+                    input=str(root),
+                    output=str(output_dir),
+                    domain=Domain.ART.value,
+                    image_sample_strategy=None,
+                    portrait_discovery=None,
+                    portrait_visibility=None,
+                    open=False,
+                    force=True,
+                    clear_thumbnail_cache=False,
+                    strict=True,
+                    index_backend=backend,
+                ))
+                pages[backend] = {
+                    path.relative_to(output_dir).as_posix(): path.read_text(encoding="utf-8")
+                    for path in output_dir.rglob("*.html")
+                }
+                self.assertFalse((output_dir / "cache" / "library_index.sqlite3").exists())
+
+            self.assertEqual(pages["sqlite"], pages["memory"])
+            self.assertIn("ink", pages["sqlite"]["tags.html"])
+
     def test_build_command_aborts_when_media_cannot_be_linked(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "Artists"
@@ -541,7 +656,6 @@ class HtmlBuildTests(unittest.TestCase):
                     tags={},
                     active_since="",
                     nationalities=(),
-                    info="",
                     projects=(project_summary,),
                 ),
             ),
@@ -552,7 +666,6 @@ class HtmlBuildTests(unittest.TestCase):
             type=CreatorType.PERSON,
             active_since="",
             portrait="",
-            info="",
             media_groups=[],
             projects=[
                 Project(
@@ -560,7 +673,6 @@ class HtmlBuildTests(unittest.TestCase):
                     display_title="Displayed Landscapes",
                     release_date="",
                     cover="",
-                    info="",
                     tags={},
                     facets={},
                     media_groups=[],
@@ -645,6 +757,115 @@ class HtmlBuildTests(unittest.TestCase):
             html_pages = list((output_dir / "html").rglob("*.html"))
             self.assertEqual(len(html_pages), 2)
 
+    def test_thumbnail_workers_render_the_same_site_and_issues_as_inline_thumbnails(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for name in ("Ada", "Bob", "Cy"):
+                write_image(root / name / "portrait.jpg", (80, 160))
+                write_image(root / name / "Sketches" / "cover.jpg")
+                write_image(root / name / "Sketches" / "study.png", (60, 90))
+            (root / "Bob" / "Sketches" / "broken.jpg").write_bytes(b"not an image")
+
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+            index = build_library_index(root, config.media_rules)
+            results = {}
+            sites = {}
+            for workers in (1, 3):
+                output_dir = Path(tmp) / f"site-{workers}"
+                results[workers] = build_html_pages_streaming(
+                    index,
+                    discover_themes(None),
+                    output_dir,
+                    config.site_labels,
+                    config.site_rendering,
+                    lambda summary: load_indexed_creator(index, summary, config.media_rules),
+                    thumbnail_workers=workers,
+                )
+                sites[workers] = {
+                    path.relative_to(output_dir).as_posix(): path.read_bytes()
+                    for path in output_dir.rglob("*")
+                    if path.is_file() and "cache" not in path.parts
+                }
+
+            self.assertEqual(sites[3], sites[1])
+            self.assertEqual(results[3].issues, results[1].issues)
+            self.assertEqual(results[3].issues[0].code, IssueCode.THUMBNAIL_FAILURE)
+            stats = results[3].asset_statistics
+            self.assertEqual(stats.source_thumbnails_generated, results[1].asset_statistics.source_thumbnails_generated)
+            self.assertEqual(stats.thumbnail_workers, 3)
+            self.assertGreater(stats.thumbnails_per_second, 0)
+            self.assertGreater(stats.thumbnail_worker_utilization, 0)
+
+    def test_content_store_removes_the_thumbnails_of_edited_images(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            output_dir = Path(tmp) / "site"
+            write_image(root / "Ada" / "portrait.jpg", (80, 160))
+            write_image(root / "Ada" / "Sketches" / "cover.jpg")
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+
+            def render():
+                index = build_library_index(root, config.media_rules)
+                return build_html_pages_streaming(
+                    index,
+                    discover_themes(None),
+                    output_dir,
+                    config.site_labels,
+                    config.site_rendering,
+                    lambda summary: load_indexed_creator(index, summary, config.media_rules),
+                    thumbnail_workers=2,
+                    thumbnail_store=ThumbnailStore.CONTENT,
+                )
+
+            def thumbnails():
+                return set((output_dir / "thumbnails").rglob("*.jpg"))
+
+            first = render()
+            first_thumbnails = thumbnails()
+            write_image(root / "Ada" / "Sketches" / "cover.jpg", (160, 90))
+            second = render()
+
+            self.assertEqual(first.asset_statistics.stale_thumbnails_removed, 0)
+            self.assertGreater(second.asset_statistics.stale_thumbnails_removed, 0)
+            self.assertEqual(len(thumbnails()), len(first_thumbnails))
+            self.assertEqual(
+                len(first_thumbnails - thumbnails()),
+                second.asset_statistics.stale_thumbnails_removed,
+            )
+
+    def test_streaming_html_build_loads_each_referenced_creator_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            output_dir = Path(tmp) / "site"
+            for name in ("Ada", "Bob", "Ada & Bob"):
+                (root / name).mkdir(parents=True)
+            (root / "Ada & Bob" / "Duet").mkdir()
+            write_json(
+                root / "Ada & Bob" / "cr4te.json",
+                {"type": "collaboration", "collaboration": {"members": ["Ada", "Bob"]}},
+            )
+
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+            index = build_library_index(root, config.media_rules)
+            loaded = []
+
+            def load_creator(summary):
+                loaded.append(summary.name)
+                return load_indexed_creator(index, summary, config.media_rules)
+
+            result = build_html_pages_streaming(
+                index,
+                discover_themes(None),
+                output_dir,
+                config.site_labels,
+                config.site_rendering,
+                load_creator,
+            )
+
+            self.assertEqual(sorted(loaded), ["Ada", "Ada & Bob", "Bob"])
+            self.assertEqual(result.render_statistics.creator_cache_misses, 3)
+            self.assertGreater(result.render_statistics.creator_cache_hits, 0)
+
     def test_streaming_html_build_copies_and_renders_custom_theme(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "Artists"
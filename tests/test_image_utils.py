@@ -2,15 +2,17 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
 from cr4te.enums.orientation import Orientation
 from cr4te.media_cache import ImageDimensions
-from cr4te.utils.image_utils import infer_image_orientation, parse_aspect_ratio, read_image_dimensions
+from cr4te.utils.image_header_utils import read_header_dimensions
+from cr4te.utils.image_utils import generate_thumbnails, infer_image_orientation, parse_aspect_ratio, read_image_dimensions
 
 
 class ImageUtilsTests(unittest.TestCase):
@@ -70,6 +72,82 @@ class ImageUtilsTests(unittest.TestCase):
 
             self.assertEqual(infer_image_orientation(missing_path), Orientation.LANDSCAPE)
 
+    def test_header_dimensions_cover_common_formats_without_opening_pillow(self):
+        formats = {
+            "image.jpg": {"format": "JPEG"},
+            "image.png": {"format": "PNG"},
+            "image.gif": {"format": "GIF"},
+            "image.bmp": {"format": "BMP"},
+            "lossy.webp": {"format": "WEBP", "quality": 80},
+            "lossless.webp": {"format": "WEBP", "lossless": True},
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, save_options in formats.items():
+                image_path = Path(tmp) / name
+                Image.new("RGB", (123, 77), color=(10, 20, 30)).save(image_path, **save_options)
+
+                with self.subTest(name=name), patch("cr4te.utils.image_utils.Image.open") as image_open:
+                    self.assertEqual(read_header_dimensions(image_path), ImageDimensions(width=123, height=77))
+                    self.assertEqual(read_image_dimensions(image_path), ImageDimensions(width=123, height=77))
+                    image_open.assert_not_called()
+
+    def test_exif_rotation_swaps_reported_jpeg_dimensions(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for orientation, expected in ((1, (200, 100)), (3, (200, 100)), (6, (100, 200)), (8, (100, 200))):
+                image_path = Path(tmp) / f"rotated-{orientation}.jpg"
+                exif = Image.Exif()
+                exif[0x0112] = orientation
+                Image.new("RGB", (200, 100)).save(image_path, exif=exif.tobytes())
+
+                with self.subTest(orientation=orientation):
+                    self.assertEqual(read_image_dimensions(image_path), ImageDimensions(*expected))
+
+            rotated_path = Path(tmp) / "rotated-6.jpg"
+            self.assertEqual(infer_image_orientation(rotated_path), Orientation.PORTRAIT)
+
+    def test_exif_rotated_thumbnails_match_reported_orientation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = Path(tmp) / "rotated-6.jpg"
+            exif = Image.Exif()
+            exif[0x0112] = 6
+            Image.new("RGB", (300, 200)).save(image_path, exif=exif.tobytes())
+
+            (thumb,) = generate_thumbnails(image_path, [150])
+
+            self.assertEqual(read_image_dimensions(image_path), ImageDimensions(width=200, height=300))
+            self.assertEqual(thumb.size, (100, 150))
+            self.assertNotIn(0x0112, thumb.getexif())
+
+    def test_every_thumbnail_size_is_resampled_from_the_decode(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = Path(tmp) / "source.jpg"
+            Image.new("RGB", (1200, 800), color=(10, 20, 30)).save(image_path)
+            resize = Image.Image.resize
+
+            with patch.object(Image.Image, "resize", autospec=True, side_effect=resize) as resize_calls:
+                thumbs = generate_thumbnails(image_path, [150, 450, 300])
+
+            self.assertEqual([thumb.height for thumb in thumbs], [150, 450, 300])
+            self.assertEqual(len({id(call.args[0]) for call in resize_calls.call_args_list}), 1)
+
+    def test_unrecognized_headers_fall_back_to_pillow(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = Path(tmp) / "image.tiff"
+            Image.new("RGB", (40, 60)).save(image_path, format="TIFF")
+
+            self.assertIsNone(read_header_dimensions(image_path))
+            self.assertEqual(read_image_dimensions(image_path), ImageDimensions(width=40, height=60))
+
+    def test_truncated_header_falls_back_to_pillow_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = Path(tmp) / "broken.jpg"
+            image_path.write_bytes(b"\xff\xd8\xff\xe0\x00")
+
+            self.assertIsNone(read_header_dimensions(image_path))
+            with self.assertRaises(UnidentifiedImageError):
+                read_image_dimensions(image_path)
+            self.assertEqual(infer_image_orientation(image_path), Orientation.LANDSCAPE)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,105 @@
+import json
+import sqlite3
+import sys
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.config_manager import apply_cli_overrides, load_config
+from cr4te.enums.domain import Domain
+from cr4te.library_artifact import LibraryArtifactError, open_library_artifact, write_library_artifact
+from cr4te.library_builder import build_library_index, load_indexed_creator
+from cr4te.library_index_store import SqliteLibraryIndex
+
+
+def write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+class LibraryArtifactTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name) / "Artists"
+        self.artifact_path = Path(self.tmp.name) / "index.bin"
+        self.media_rules = apply_cli_overrides(load_config(), domain=Domain.ART).media_rules
+        write_json(self.root / "Ada" / "cr4te.json", {"tags": {"Style": ["Ink"]}, "collaborations": ["Nobody"]})
+        write_json(self.root / "Ada" / "Sketches" / "cr4te.json", {"facets": {"mediums": ["Paper"]}})
+        write_json(self.root / "Bob" / "Walls" / "cr4te.json", {"release_date": "2020-02"})
+        write_json(self.root / "Ada & Bob" / "cr4te.json", {"type": "collaboration"})
+        self.index = build_library_index(self.root, self.media_rules)
+        write_library_artifact(self.index, self.load_creator, self.artifact_path)
+
+    def load_creator(self, summary):
+        return load_indexed_creator(self.index, summary, self.media_rules)
+
+    def test_artifact_restores_the_index_and_creators_it_was_written_from(self):
+        self.assertTrue(self.index.issues)
+        store = SqliteLibraryIndex(Path(self.tmp.name) / "cache" / "library_index.sqlite3")
+        self.addCleanup(store.close)
+
+        for backend, index_store in (("memory", None), ("sqlite", store)):
+            with self.subTest(backend=backend), open_library_artifact(self.artifact_path) as artifact:
+                loaded = artifact.load_index(index_store)
+
+                self.assertEqual(loaded.input_dir, self.index.input_dir)
+                self.assertEqual(list(loaded.creators), list(self.index.creators))
+                self.assertEqual(loaded.issues, self.index.issues)
+                self.assertEqual(loaded.statistics, self.index.statistics)
+                self.assertEqual(loaded.lookup.collaborations_of("Ada"), ["Ada & Bob"])
+                for summary in self.index.creators:
+                    self.assertEqual(artifact.load_creator(summary), self.load_creator(summary))
+
+    def test_artifact_is_rebased_onto_a_library_mounted_elsewhere(self):
+        mounted = self.root.rename(Path(self.tmp.name) / "mnt")
+
+        with self.assertRaisesRegex(LibraryArtifactError, "--input"):
+            with open_library_artifact(self.artifact_path):
+                pass
+        with open_library_artifact(self.artifact_path, mounted) as artifact:
+            loaded = artifact.load_index()
+
+        self.assertEqual(loaded.input_dir, mounted.resolve())
+        self.assertEqual([summary.path for summary in loaded.creators], [mounted.resolve() / summary.name for summary in self.index.creators])
+        self.assertTrue(all(issue.path.is_relative_to(mounted.resolve()) for issue in loaded.issues))
+
+    def test_artifact_is_read_only_and_replaced_atomically(self):
+        write_library_artifact(self.index, self.load_creator, self.artifact_path)
+
+        with open_library_artifact(self.artifact_path) as artifact:
+            with self.assertRaises(sqlite3.OperationalError):
+                artifact.connection.execute("DELETE FROM creators")
+        self.assertEqual(sorted(path.name for path in self.artifact_path.parent.iterdir()), ["Artists", "index.bin"])
+
+    def test_missing_outdated_or_corrupt_artifacts_are_rejected(self):
+        with self.assertRaises(LibraryArtifactError):
+            with open_library_artifact(Path(self.tmp.name) / "missing.bin"):
+                pass
+
+        not_an_artifact = Path(self.tmp.name) / "other.bin"
+        not_an_artifact.write_bytes(b"not a database")
+        with self.assertRaises(LibraryArtifactError):
+            with open_library_artifact(not_an_artifact):
+                pass
+
+        with closing(sqlite3.connect(self.artifact_path)) as connection:
+            connection.execute("UPDATE creators SET model = ? WHERE name = 'Bob'", (b"garbage",))
+            connection.commit()
+        with open_library_artifact(self.artifact_path) as artifact:
+            with self.assertRaisesRegex(LibraryArtifactError, "'Bob'"):
+                artifact.load_index()
+
+        with closing(sqlite3.connect(self.artifact_path)) as connection:
+            connection.execute("PRAGMA user_version = 0")
+        with self.assertRaisesRegex(LibraryArtifactError, "cr4te index"):
+            with open_library_artifact(self.artifact_path):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
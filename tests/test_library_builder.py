@@ -1,8 +1,13 @@
 import json
+import os
 import sys
 import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
@@ -15,7 +20,9 @@ from cr4te.enums.creator_type import CreatorType
 from cr4te.enums.domain import Domain
 from cr4te.enums.portrait_discovery import PortraitDiscovery
 from cr4te.enums.visible_fields import ProjectField
+from cr4te import metadata_writer
 from cr4te.library_builder import build_library_index, load_indexed_creator
+from cr4te.media_probe_store import MediaProbeStore
 
 
 def write_json(path: Path, data: dict) -> None:
@@ -85,7 +92,6 @@ class LibraryBuilderTests(unittest.TestCase):
             self.assertEqual(creator.date_of_birth, "1990-04")
             self.assertEqual(creator.place_of_birth, "Berlin")
             self.assertEqual(creator.active_since, "2020")
-            self.assertEqual(creator.info, "Creator **bio**")
             self.assertEqual(creator.portrait, "Noomi/portrait.jpg")
             self.assertEqual(creator.media_groups[0].images, ["Noomi/img_001.jpg"])
 
@@ -95,7 +101,6 @@ class LibraryBuilderTests(unittest.TestCase):
             self.assertEqual(project.display_title, "Displayed Landscapes")
             self.assertEqual(project.release_date, "2024-03-12")
             self.assertEqual(project.cover, "Noomi/Landscapes/cover.jpg")
-            self.assertEqual(project.info, "Project **notes**")
             self.assertEqual(project.facets[ProjectField.MEDIUMS], ["Photography"])
             self.assertEqual(project.facets[ProjectField.PERIODS], ["Contemporary"])
 
@@ -190,6 +195,30 @@ class LibraryBuilderTests(unittest.TestCase):
             self.assertTrue(creator.media_groups)
             self.assertTrue(creator.projects[0].media_groups)
 
+    def test_library_index_summaries_share_repeated_tag_and_facet_strings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for creator_name in ("Ada", "Noomi"):
+                project_dir = root / creator_name / "Sketches"
+                write_image(project_dir / "cover.jpg")
+                write_json(
+                    project_dir / "cr4te.json",
+                    {
+                        "tags": {"Style": ["Ink"], "Empty": []},
+                        "facets": {"mediums": ["Paper"], "periods": []},
+                    },
+                )
+
+            index = build_library_index(root, self.build_config().media_rules)
+
+            first, second = (creator.projects[0] for creator in index.creators)
+            self.assertEqual(first.tags, {"Style": ("Ink",)})
+            self.assertEqual(first.facets, {ProjectField.MEDIUMS: ("Paper",)})
+            self.assertIs(first.tags["Style"][0], second.tags["Style"][0])
+            self.assertIs(first.facets[ProjectField.MEDIUMS][0], second.facets[ProjectField.MEDIUMS][0])
+            self.assertIs(first.display_title, first.title)
+            self.assertFalse(hasattr(first, "__dict__"))
+
     def test_library_index_does_not_discover_or_carry_themes(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "Artists"
@@ -310,6 +339,58 @@ class LibraryBuilderTests(unittest.TestCase):
             self.assertEqual(index.issues[0].code, IssueCode.INVALID_METADATA)
             self.assertIn("yyyy", index.issues[0].message)
 
+    def test_creator_dates_out_of_order_are_reported_as_metadata_issue(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            bad_dir = root / "Bad Order"
+            write_json(
+                bad_dir / "cr4te.json",
+                {"person": {"birth": {"date": "1990"}, "death": {"date": "1980"}}},
+            )
+
+            index = build_library_index(root, self.build_config().media_rules)
+
+            self.assertEqual(index.creators, ())
+            self.assertEqual(len(index.issues), 1)
+            self.assertEqual(index.issues[0].code, IssueCode.INVALID_METADATA)
+            self.assertIn("chronological order", index.issues[0].message)
+
+    def test_stale_section_of_the_other_creator_type_is_not_date_checked(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            write_json(
+                root / "Ada" / "cr4te.json",
+                {
+                    "person": {"birth": {"date": "1980"}},
+                    "collaboration": {"founding": {"date": "2010"}, "dissolution_date": "2001"},
+                },
+            )
+
+            index = build_library_index(root, self.build_config().media_rules)
+
+            self.assertEqual(index.issues, ())
+            self.assertEqual([creator.name for creator in index.creators], ["Ada"])
+
+    def test_built_creators_only_mark_their_type_fields_as_set(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            (root / "Ada").mkdir(parents=True)
+            write_json(root / "Ada & Bob" / "cr4te.json", {"type": "collaboration"})
+            media_rules = self.build_config().media_rules
+            index = build_library_index(root, media_rules)
+
+            person = load_indexed_creator(index, index.creator_by_name["Ada"], media_rules)
+            collaboration = load_indexed_creator(index, index.creator_by_name["Ada & Bob"], media_rules)
+
+            self.assertNotIn("members", person.model_fields_set)
+            self.assertNotIn("date_of_birth", collaboration.model_fields_set)
+            self.assertEqual(person.members, [])
+            self.assertEqual(type(person).model_validate_json(person.model_dump_json(exclude_unset=True)), person)
+            self.assertEqual(
+                type(collaboration).model_validate_json(collaboration.model_dump_json(exclude_unset=True)),
+                collaboration,
+            )
+
     def test_extra_creator_metadata_field_is_reported_as_issue(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "Artists"
@@ -387,6 +468,190 @@ class LibraryBuilderTests(unittest.TestCase):
             self.assertIn("info", index.issues[0].message)
             self.assertIn("Extra inputs", index.issues[0].message)
 
+    def test_parallel_indexing_matches_serial_order_and_issues(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for name in ("Ada", "Bob", "Cy", "Ada & Bob"):
+                write_image(root / name / "Project" / "cover.jpg")
+            write_json(root / "Bob" / "cr4te.json", {"display_name": 42})
+            write_json(root / "Cy" / "cr4te.json", {"collaborations": ["Nobody"]})
+
+            serial = build_library_index(root, self.build_config().media_rules)
+            parallel = build_library_index(root, self.build_config().media_rules, jobs=2)
+
+            self.assertEqual(parallel.creators, serial.creators)
+            self.assertEqual(parallel.issues, serial.issues)
+            self.assertEqual([creator.name for creator in parallel.creators], ["Ada", "Ada & Bob", "Cy"])
+
+    def test_parallel_indexing_starts_workers_without_forking_live_threads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for name in ("Ada", "Bob"):
+                write_image(root / name / "Project" / "cover.jpg")
+            start_methods = []
+
+            def process_pool(*args, mp_context=None, **kwargs):
+                start_methods.append(mp_context.get_start_method() if mp_context is not None else None)
+                return ProcessPoolExecutor(*args, mp_context=mp_context, **kwargs)
+
+            with patch("cr4te.library_builder.ProcessPoolExecutor", side_effect=process_pool):
+                index = build_library_index(root, self.build_config().media_rules, jobs=2)
+
+            self.assertEqual(start_methods, ["spawn"])
+            self.assertEqual([creator.name for creator in index.creators], ["Ada", "Bob"])
+
+    def test_indexing_opens_one_probe_store_per_process(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for name in ("Ada", "Bob", "Cy"):
+                write_image(root / name / "Project" / "photo.jpg", (80, 160))
+            db_path = Path(tmp) / "probes.sqlite3"
+            media_rules = self.build_config().media_rules
+            media_rules.portrait_discovery = PortraitDiscovery.AUTO
+
+            with patch("cr4te.library_builder.MediaProbeStore", wraps=MediaProbeStore) as store_class:
+                cold = build_library_index(root, media_rules, media_probe_path=db_path)
+            warm = build_library_index(root, media_rules, jobs=2, media_probe_path=db_path)
+
+            store_class.assert_called_once_with(db_path)
+            self.assertEqual((cold.statistics.media_probe_hits, cold.statistics.media_probe_misses), (0, 3))
+            self.assertEqual((warm.statistics.media_probe_hits, warm.statistics.media_probe_misses), (3, 0))
+
+    def test_io_concurrency_overlaps_slow_listings_and_keeps_folder_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for name in ("Ada", "Bob", "Cy"):
+                write_image(root / name / "Project" / "cover.jpg")
+            write_json(root / "Bob" / "cr4te.json", {"display_name": 42})
+            serial = build_library_index(root, self.build_config().media_rules)
+
+            listing_threads = set()
+            scandir = os.scandir
+
+            def slow_scandir(path):
+                listing_threads.add(threading.current_thread().name)
+                if Path(path).name == "Ada":
+                    # The first creator finishes last, so results arrive out of folder order.
+                    time.sleep(0.2)
+                return scandir(path)
+
+            with patch("cr4te.library_scan.os.scandir", side_effect=slow_scandir):
+                concurrent = build_library_index(root, self.build_config().media_rules, io_concurrency=3)
+
+            self.assertEqual(concurrent.creators, serial.creators)
+            self.assertEqual(concurrent.issues, serial.issues)
+            self.assertTrue(any(name.startswith("cr4te-io") for name in listing_threads))
+
+    def test_indexing_overlaps_metadata_writes_of_different_creators(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for name in ("Ada", "Bob", "Cy"):
+                write_image(root / name / "Project" / "cover.jpg")
+
+            lock = threading.Lock()
+            active: list[str] = []
+            overlapping_creators: set[str] = set()
+            write_file_atomically = metadata_writer.write_file_atomically
+
+            def slow_write(path, content):
+                creator_name = path.relative_to(root.resolve()).parts[0]
+                with lock:
+                    active.append(creator_name)
+                    if len(set(active)) > 1:
+                        overlapping_creators.update(active)
+                time.sleep(0.1)
+                with lock:
+                    active.remove(creator_name)
+                return write_file_atomically(path, content)
+
+            with patch("cr4te.metadata_writer.write_file_atomically", side_effect=slow_write):
+                index = build_library_index(root, self.build_config().media_rules, project_facet_fields=())
+
+            self.assertEqual(len(index.metadata_result.created), 6)
+            self.assertEqual(overlapping_creators, {"Ada", "Bob", "Cy"})
+            self.assertTrue((root / "Cy" / "Project" / "cr4te.json").is_file())
+
+    def test_io_threads_share_the_pass_writer_and_probe_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for name in ("Ada", "Bob", "Cy", "Dee"):
+                write_image(root / name / "Project" / "photo.jpg", (80, 160))
+            media_rules = self.build_config().media_rules
+            media_rules.portrait_discovery = PortraitDiscovery.AUTO
+
+            with (
+                patch("cr4te.library_builder.MetadataWriter", wraps=metadata_writer.MetadataWriter) as writer_class,
+                patch("cr4te.metadata_manager.MetadataWriter", wraps=metadata_writer.MetadataWriter) as creator_writer_class,
+                patch("cr4te.library_builder.MediaProbeStore", wraps=MediaProbeStore) as store_class,
+            ):
+                index = build_library_index(
+                    root,
+                    media_rules,
+                    media_probe_path=Path(tmp) / "probes.sqlite3",
+                    project_facet_fields=(),
+                    io_concurrency=3,
+                )
+
+            self.assertEqual(writer_class.call_count, 1)
+            creator_writer_class.assert_not_called()
+            self.assertEqual(store_class.call_count, 1)
+            self.assertEqual(len(index.metadata_result.created), 8)
+            self.assertEqual(index.statistics.media_probe_misses, 4)
+
+    def test_root_ignore_file_is_read_once_per_pass(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for name in ("Ada", "Bob", "Cy"):
+                write_image(root / name / "Project" / "cover.jpg")
+                write_image(root / name / "_proxies" / "cover.jpg")
+            (root / ".cr4teignore").write_text("_proxies/\n", encoding="utf-8")
+            read_text = Path.read_text
+            root_reads = []
+
+            def tracked_read_text(path, *args, **kwargs):
+                if path == root.resolve() / ".cr4teignore":
+                    root_reads.append(path)
+                return read_text(path, *args, **kwargs)
+
+            with patch.object(Path, "read_text", autospec=True, side_effect=tracked_read_text):
+                index = build_library_index(root, self.build_config().media_rules)
+
+            self.assertEqual(len(root_reads), 1)
+            self.assertEqual([creator.name for creator in index.creators], ["Ada", "Bob", "Cy"])
+            self.assertEqual([project.title for project in index.creators[0].projects], ["Project"])
+
+    def test_indexing_reconciles_metadata_in_the_same_pass(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            write_image(root / "Ada" / "Project" / "cover.jpg")
+            write_json(root / "Bob" / "cr4te.json", {"display_name": "Bobby"})
+            (root / "Bob" / "Demo").mkdir()
+
+            with patch("cr4te.library_scan.os.scandir", wraps=os.scandir) as scandir:
+                index = build_library_index(root, self.build_config().media_rules, project_facet_fields=())
+
+            listed = [Path(call.args[0]).relative_to(root).as_posix() for call in scandir.call_args_list]
+            self.assertEqual(sorted(listed), sorted(set(listed)))
+            self.assertEqual(
+                sorted(path.relative_to(root).as_posix() for path in index.metadata_result.created),
+                ["Ada/Project/cr4te.json", "Ada/cr4te.json", "Bob/Demo/cr4te.json"],
+            )
+            self.assertEqual(index.metadata_result.updated, [root / "Bob" / "cr4te.json"])
+            self.assertTrue((root / "Ada" / "cr4te.json").is_file())
+            self.assertEqual([creator.display_name for creator in index.creators], ["Ada", "Bobby"])
+
+    def test_parallel_indexing_keeps_strict_fail_fast(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            (root / "Ada").mkdir(parents=True)
+            write_json(root / "Bob" / "cr4te.json", {"display_name": 42})
+
+            with self.assertRaises(BuildIssueError) as caught:
+                build_library_index(root, self.build_config().media_rules, strict=True, jobs=2)
+
+            self.assertEqual(caught.exception.issue.path, (root / "Bob").resolve())
+            self.assertEqual(caught.exception.issue.scope, IssueScope.CREATOR)
+
     def test_invalid_project_metadata_raises_in_strict_mode(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "Artists"
@@ -0,0 +1,70 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.library_ignore import IgnoreRules, load_ignore_rules, parse_ignore_patterns
+
+
+def rules(*lines: str, base: str = "") -> IgnoreRules:
+    return IgnoreRules(parse_ignore_patterns(lines, base))
+
+
+class LibraryIgnoreTests(unittest.TestCase):
+    def test_unanchored_patterns_match_names_at_any_depth(self):
+        ignore = rules("# camera dumps", "", "*.xmp", "_proxies", "backup-??")
+
+        self.assertTrue(ignore.is_ignored("Ada/photo.xmp", is_dir=False))
+        self.assertTrue(ignore.is_ignored("Ada/Project/deep/photo.xmp", is_dir=False))
+        self.assertTrue(ignore.is_ignored("Ada/Project/_proxies", is_dir=True))
+        self.assertTrue(ignore.is_ignored("Ada/backup-01", is_dir=True))
+        self.assertFalse(ignore.is_ignored("Ada/backup-001", is_dir=True))
+        self.assertFalse(ignore.is_ignored("Ada/photo.jpg", is_dir=False))
+
+    def test_anchored_directory_only_and_double_star_patterns(self):
+        ignore = rules("/Ada/raw/", "**/exports/*.tif", "Bob/**/tmp")
+
+        self.assertTrue(ignore.is_ignored("Ada/raw", is_dir=True))
+        self.assertFalse(ignore.is_ignored("Ada/raw", is_dir=False))
+        self.assertFalse(ignore.is_ignored("Bob/Ada/raw", is_dir=True))
+        self.assertTrue(ignore.is_ignored("exports/a.tif", is_dir=False))
+        self.assertTrue(ignore.is_ignored("Ada/Project/exports/a.tif", is_dir=False))
+        self.assertFalse(ignore.is_ignored("Ada/Project/exports/nested/a.tif", is_dir=False))
+        self.assertTrue(ignore.is_ignored("Bob/tmp", is_dir=True))
+        self.assertTrue(ignore.is_ignored("Bob/Project/cache/tmp", is_dir=True))
+
+    def test_last_matching_pattern_wins_and_negations_reinclude(self):
+        ignore = rules("*.jpg", "!keep-*.jpg", "keep-old.jpg", "[!a-c]*.png")
+
+        self.assertTrue(ignore.is_ignored("Ada/photo.jpg", is_dir=False))
+        self.assertFalse(ignore.is_ignored("Ada/keep-this.jpg", is_dir=False))
+        self.assertTrue(ignore.is_ignored("Ada/keep-old.jpg", is_dir=False))
+        self.assertTrue(ignore.is_ignored("Ada/zebra.png", is_dir=False))
+        self.assertFalse(ignore.is_ignored("Ada/apple.png", is_dir=False))
+
+    def test_creator_patterns_are_relative_to_their_folder_and_extend_root_rules(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "Ada").mkdir()
+            (root / ".cr4teignore").write_text("*.xmp\n", encoding="utf-8")
+            (root / "Ada" / ".cr4teignore").write_text("/raw\n!keep.xmp\n", encoding="utf-8")
+
+            root_rules = load_ignore_rules(root)
+            creator_rules = load_ignore_rules(root / "Ada", "Ada", root_rules)
+            missing_rules = load_ignore_rules(root / "Bob", "Bob", root_rules)
+
+            self.assertTrue(creator_rules.is_ignored("Ada/raw", is_dir=True))
+            self.assertFalse(creator_rules.is_ignored("Ada/Project/raw", is_dir=True))
+            self.assertFalse(creator_rules.is_ignored("Bob/raw", is_dir=True))
+            self.assertTrue(creator_rules.is_ignored("Ada/photo.xmp", is_dir=False))
+            self.assertFalse(creator_rules.is_ignored("Ada/keep.xmp", is_dir=False))
+            self.assertIs(missing_rules, root_rules)
+            self.assertNotEqual(creator_rules.fingerprint, root_rules.fingerprint)
+            self.assertEqual(load_ignore_rules(root / "missing"), IgnoreRules())
+
+
+if __name__ == "__main__":
+    unittest.main()
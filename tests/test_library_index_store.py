@@ -0,0 +1,123 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.config_manager import apply_cli_overrides, load_config
+from cr4te.enums.domain import Domain
+from cr4te.library_builder import build_library_index
+from cr4te.library_index_store import SqliteLibraryIndex
+from cr4te.media_counts import MediaCounts
+from cr4te.overview_collector import OverviewCollector
+from cr4te.render_models import CreatorOverviewEntry, ProjectOverviewEntry
+
+
+def creator_entry(name: str, rel_html_path: str) -> CreatorOverviewEntry:
+    return CreatorOverviewEntry(name, rel_html_path, name.lower(), "", 0, 0, 0, MediaCounts(), "", "")
+
+
+def project_entry(title: str, creator_name: str) -> ProjectOverviewEntry:
+    return ProjectOverviewEntry(title, f"{creator_name}/{title}.html", "", 0, 0, creator_name, title.lower(), MediaCounts())
+
+
+class LibraryIndexStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name) / "Artists"
+        self.db_path = Path(self.tmp.name) / "cache" / "library_index.sqlite3"
+        self.media_rules = apply_cli_overrides(load_config(), domain=Domain.ART).media_rules
+
+    def test_sqlite_index_matches_in_memory_index(self):
+        for name, display_name in (("Ada", "zed"), ("Bob", "Amy"), ("Cy", "amy")):
+            (self.root / name / "Project").mkdir(parents=True)
+            (self.root / name / "cr4te.json").write_text(
+                f'{{"display_name": "{display_name}", "collaborations": ["Nobody"]}}',
+                encoding="utf-8",
+            )
+        (self.root / "Ada & Bob").mkdir()
+        memory = build_library_index(self.root, self.media_rules)
+        store = SqliteLibraryIndex(self.db_path)
+        self.addCleanup(store.close)
+
+        with patch("cr4te.library_index_store._PAGE_SIZE", 2):
+            indexed = build_library_index(self.root, self.media_rules, index_store=store)
+
+            self.assertIs(indexed, store)
+            self.assertEqual(list(indexed.creators), list(memory.creators))
+            self.assertEqual(list(indexed.creators_by_display_name()), list(memory.creators_by_display_name()))
+            self.assertEqual(indexed.creators[-1], memory.creators[-1])
+            self.assertEqual(indexed.creator_by_name["Bob"].collaborations, ("Ada & Bob",))
+            self.assertNotIn("Nobody", indexed.creator_by_name)
+            self.assertEqual(indexed.issues, memory.issues)
+            self.assertEqual((indexed.creator_count, indexed.project_count), (memory.creator_count, memory.project_count))
+
+        store.close()
+        self.assertFalse(self.db_path.exists())
+        self.assertEqual(store.creator_count, 4)
+
+    def test_reverse_collaborations_match_across_backends_when_names_have_outer_whitespace(self):
+        (self.root / "Astra Vey").mkdir(parents=True)
+        (self.root / " Cy").mkdir()
+        (self.root / "Vey Cy").mkdir()
+        (self.root / "Vey Cy" / "cr4te.json").write_text(
+            '{"type": "collaboration", "collaboration": {"members": [" Astra Vey", "Cy"]}}',
+            encoding="utf-8",
+        )
+        memory = build_library_index(self.root, self.media_rules)
+        store = SqliteLibraryIndex(self.db_path)
+        self.addCleanup(store.close)
+
+        indexed = build_library_index(self.root, self.media_rules, index_store=store)
+
+        self.assertEqual(list(indexed.creators), list(memory.creators))
+        self.assertEqual(memory.creator_by_name["Astra Vey"].collaborations, ("Vey Cy",))
+        self.assertEqual(memory.creator_by_name[" Cy"].collaborations, ("Vey Cy",))
+
+    def test_sqlite_rows_answer_length_indexes_and_slices_with_few_queries(self):
+        store = SqliteLibraryIndex(self.db_path)
+        self.addCleanup(store.close)
+        collector = store.overview_collector()
+        names = [f"creator {number:02d}" for number in range(10)]
+        for name in names:
+            collector.add_creator_entry(creator_entry(name, name))
+        queries = []
+        store._connection.set_trace_callback(queries.append)
+
+        with patch("cr4te.library_index_store._PAGE_SIZE", 4):
+            entries = collector.creator_entries()
+            self.assertEqual(len(entries), 10)
+            self.assertEqual([entries[index].name for index in range(len(entries))], names)
+            self.assertEqual([entry.name for entry in entries[7:1:-2]], names[7:1:-2])
+            self.assertEqual(entries[-1].name, names[-1])
+            self.assertEqual(entries[20:], [])
+            with self.assertRaises(IndexError):
+                entries[10]
+
+        self.assertEqual(len(queries), 4)
+
+    def test_sqlite_overview_collector_matches_in_memory_order(self):
+        store = SqliteLibraryIndex(self.db_path)
+        self.addCleanup(store.close)
+        collectors = (OverviewCollector(), store.overview_collector())
+
+        for collector in collectors:
+            for entry in (creator_entry("beta", "b1"), creator_entry("Alpha", "a"), creator_entry("Beta", "b2")):
+                collector.add_creator_entry(entry)
+            for entry in (project_entry("Zoo", "Ada"), project_entry("art", "Bob"), project_entry("Art", "Ada")):
+                collector.add_project_entry(entry)
+
+        with patch("cr4te.library_index_store._PAGE_SIZE", 2):
+            memory, sqlite = collectors
+            self.assertEqual(list(sqlite.creator_entries()), list(memory.creator_entries()))
+            self.assertEqual([entry.rel_html_path for entry in sqlite.creator_entries()], ["a", "b1", "b2"])
+            self.assertEqual(list(sqlite.project_entries()), list(memory.project_entries()))
+            self.assertEqual(len(sqlite.project_entries()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
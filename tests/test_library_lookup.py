@@ -0,0 +1,141 @@
+import json
+import sqlite3
+import sys
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.config_manager import apply_cli_overrides, load_config
+from cr4te.enums.domain import Domain
+from cr4te.enums.visible_fields import ProjectField
+from cr4te.library_builder import build_library_index
+from cr4te.library_index_store import (
+    LibraryLookupError,
+    SqliteLibraryIndex,
+    open_library_lookup,
+    write_library_lookup,
+)
+from cr4te.library_lookup import ProjectRef
+
+
+def write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+class LibraryLookupTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name) / "Artists"
+        self.media_rules = apply_cli_overrides(load_config(), domain=Domain.ART).media_rules
+        write_json(
+            self.root / "Ada" / "cr4te.json",
+            {"tags": {"Style": ["Ink"]}, "person": {"nationalities": ["Norway"]}},
+        )
+        write_json(
+            self.root / "Ada" / "Sketches" / "cr4te.json",
+            {"tags": {"Style": [" Ink ", "Ink"], "Mood": ["Calm"]}, "facets": {"mediums": ["Paper"]}},
+        )
+        write_json(
+            self.root / "Ada" / "Studies" / "cr4te.json",
+            {"tags": {"Style": ["Ink"]}, "facets": {"mediums": ["Canvas"]}},
+        )
+        write_json(
+            self.root / "Bob" / "Walls" / "cr4te.json",
+            {"tags": {"Style": ["Ink"], " ": ["Hidden"]}, "facets": {"mediums": ["Paper", " "]}},
+        )
+        write_json(self.root / "Ada & Bob" / "cr4te.json", {"type": "collaboration"})
+        self.index = build_library_index(self.root, self.media_rules)
+
+    def lookups(self):
+        store = SqliteLibraryIndex(Path(self.tmp.name) / "cache" / "library_index.sqlite3")
+        self.addCleanup(store.close)
+        build_library_index(self.root, self.media_rules, index_store=store)
+        return {"memory": self.index.lookup, "sqlite": store.lookup}
+
+    def test_memory_and_sqlite_lookups_answer_the_same_queries(self):
+        for backend, lookup in self.lookups().items():
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    lookup.projects_tagged("Style", "Ink"),
+                    [ProjectRef("Ada", "Sketches"), ProjectRef("Ada", "Studies"), ProjectRef("Bob", "Walls")],
+                )
+                self.assertEqual(
+                    lookup.find_projects(tags=[("Style", "Ink")], facets=[(ProjectField.MEDIUMS, "Paper")]),
+                    [ProjectRef("Ada", "Sketches"), ProjectRef("Bob", "Walls")],
+                )
+                self.assertEqual(
+                    lookup.find_projects(tags=[("Style", "Ink"), ("Mood", "Calm")]),
+                    [ProjectRef("Ada", "Sketches")],
+                )
+                self.assertEqual(lookup.projects_with_facet(ProjectField.MEDIUMS, "Canvas"), [ProjectRef("Ada", "Studies")])
+                self.assertEqual(lookup.find_projects(), [])
+                self.assertEqual(lookup.creators_tagged("Style", "Ink"), ["Ada"])
+                self.assertEqual(lookup.find_creators([("Style", "Ink"), ("Mood", "Calm")]), [])
+                self.assertEqual(lookup.collaborations_of("Bob"), ["Ada & Bob"])
+                self.assertEqual(lookup.tag_map(), {"Style": {"Ink"}, "Mood": {"Calm"}})
+                self.assertEqual(lookup.facet_values(ProjectField.MEDIUMS), {"Paper", "Canvas"})
+                self.assertEqual(lookup.nationalities(), {"Norway"})
+
+    def test_collaboration_members_are_normalized_like_tags(self):
+        write_json(
+            self.root / "Astra & Cy" / "cr4te.json",
+            {"type": "collaboration", "collaboration": {"members": [" Astra Vey", "Cy "]}},
+        )
+        self.index = build_library_index(self.root, self.media_rules)
+        for backend, lookup in self.lookups().items():
+            with self.subTest(backend=backend):
+                self.assertEqual(lookup.collaborations_of("Astra Vey"), ["Astra & Cy"])
+                self.assertEqual(lookup.collaborations_of(" Astra Vey"), ["Astra & Cy"])
+                self.assertEqual(lookup.collaborations_of("Cy"), ["Astra & Cy"])
+
+    def test_persisted_lookup_is_read_back_and_replaced_atomically(self):
+        db_path = Path(self.tmp.name) / "cache" / "library_lookup.sqlite3"
+        write_library_lookup(self.index.creators, db_path)
+        write_library_lookup(self.index.creators, db_path)
+
+        paper = [(ProjectField.MEDIUMS, "Paper")]
+        with open_library_lookup(db_path) as lookup:
+            self.assertEqual(lookup.find_projects(facets=paper), self.index.lookup.find_projects(facets=paper))
+            with self.assertRaises(sqlite3.OperationalError):
+                lookup.connection.execute("DELETE FROM project_tags")
+        self.assertEqual([path.name for path in db_path.parent.iterdir()], [db_path.name])
+
+    def test_sqlite_index_copies_its_lookup_tables_instead_of_rebuilding_them(self):
+        store = SqliteLibraryIndex(Path(self.tmp.name) / "cache" / "library_index.sqlite3")
+        self.addCleanup(store.close)
+        build_library_index(self.root, self.media_rules, index_store=store)
+        db_path = Path(self.tmp.name) / "cache" / "library_lookup.sqlite3"
+
+        with patch("cr4te.library_index_store.lookup_entries") as entries:
+            store.write_lookup(db_path)
+        entries.assert_not_called()
+
+        with open_library_lookup(db_path) as lookup:
+            self.assertEqual(lookup.projects_tagged("Style", "Ink"), self.index.lookup.projects_tagged("Style", "Ink"))
+            self.assertEqual(lookup.collaborations_of("Bob"), ["Ada & Bob"])
+            self.assertEqual(lookup.tag_map(), self.index.lookup.tag_map())
+        self.assertFalse([path for path in db_path.parent.iterdir() if path.name.endswith(".tmp")])
+
+    def test_missing_or_outdated_lookup_is_rejected(self):
+        db_path = Path(self.tmp.name) / "library_lookup.sqlite3"
+        with self.assertRaises(LibraryLookupError):
+            with open_library_lookup(db_path):
+                pass
+
+        write_library_lookup(self.index.creators, db_path)
+        with closing(sqlite3.connect(db_path)) as connection:
+            connection.execute("PRAGMA user_version = 0")
+        with self.assertRaisesRegex(LibraryLookupError, "rebuild"):
+            with open_library_lookup(db_path):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
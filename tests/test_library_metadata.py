@@ -8,6 +8,7 @@ sys.path.insert(0, str(ROOT / "src"))
 
 from pydantic import ValidationError
 
+from cr4te.enums.creator_type import CreatorType
 from cr4te.library_metadata import (
     MetadataShapeError,
     MetadataValidationError,
@@ -53,6 +54,19 @@ class LibraryMetadataTests(unittest.TestCase):
         with self.assertRaises(ValidationError):
             ProjectMetadata(release_date="2024-99")
 
+    def test_metadata_date_order_is_checked_for_the_creator_type_section_only(self):
+        person = CreatorMetadata(person={"birth": {"date": "1990"}, "death": {"date": "1980-05"}})
+        with self.assertRaisesRegex(ValueError, "date_of_birth/date_of_death"):
+            person.validate_date_order(CreatorType.PERSON)
+        person.validate_date_order(CreatorType.COLLABORATION)
+
+        collaboration = CreatorMetadata(collaboration={"founding": {"date": "2010"}, "dissolution_date": "2001"})
+        with self.assertRaisesRegex(ValueError, "founding_date/dissolution_date"):
+            collaboration.validate_date_order(CreatorType.COLLABORATION)
+        collaboration.validate_date_order(CreatorType.PERSON)
+
+        CreatorMetadata(person={"birth": {"date": "1980"}, "death": {"date": "1990"}}).validate_date_order(CreatorType.PERSON)
+
     def test_metadata_file_schema_rejects_folder_derived_name_and_title(self):
         with self.assertRaises(ValidationError):
             CreatorMetadata(name="Ada")
@@ -69,7 +83,6 @@ class LibraryMetadataTests(unittest.TestCase):
             "title": "Album",
             "display_title": "Album",
             "cover": "",
-            "info": "",
             "media_groups": [],
         }
 
@@ -1,3 +1,4 @@
+import os
 import sys
 import tempfile
 import unittest
@@ -10,9 +11,16 @@ sys.path.insert(0, str(ROOT / "src"))
 from PIL import Image
 
 from cr4te.config_manager import load_config
-from cr4te.enums.orientation import Orientation
 from cr4te.enums.portrait_discovery import PortraitDiscovery
-from cr4te.library_scan import CreatorScan, iter_media_files, rel_to_input
+from cr4te.enums.scan_entry_kind import ScanEntryKind
+from cr4te.media_cache import ImageDimensions, MediaInfoCache
+from cr4te.media_probe_store import MediaProbeStore
+from cr4te.library_builder import build_library_index, load_indexed_creator
+from cr4te.library_scan import CreatorScan, iter_creator_entries, rel_to_input
+
+
+def media_files(creator_dir: Path, media_rules) -> list[Path]:
+    return [entry.path for entry in iter_creator_entries(creator_dir, media_rules) if entry.kind == ScanEntryKind.MEDIA]
 
 
 def write_image(path: Path, size: tuple[int, int] = (120, 90)) -> None:
@@ -30,7 +38,7 @@ class LibraryScanTests(unittest.TestCase):
         config = load_config()
         config.media_rules.portrait_discovery = discovery
         scan = CreatorScan(creator_dir, input_dir, config.media_rules)
-        for media_path in iter_media_files(creator_dir, config.media_rules):
+        for media_path in media_files(creator_dir, config.media_rules):
             scan.add_media(media_path)
         return scan
 
@@ -115,7 +123,7 @@ class LibraryScanTests(unittest.TestCase):
             config = load_config()
             config.media_rules.metadata_folder_name = "details"
             scan = CreatorScan(creator_dir, input_dir, config.media_rules)
-            for media_path in iter_media_files(creator_dir, config.media_rules):
+            for media_path in media_files(creator_dir, config.media_rules):
                 scan.add_media(media_path)
 
             groups = scan.project_media_groups("Project")
@@ -171,7 +179,7 @@ class LibraryScanTests(unittest.TestCase):
 
             config = load_config()
             scan = CreatorScan(creator_dir, input_dir, config.media_rules)
-            for media_path in reversed(list(iter_media_files(creator_dir, config.media_rules))):
+            for media_path in reversed(media_files(creator_dir, config.media_rules)):
                 scan.add_media(media_path)
 
             self.assertEqual(rel_to_input(scan.selected_portrait(), input_dir), "Ada/a/portrait.png")
@@ -258,7 +266,7 @@ class LibraryScanTests(unittest.TestCase):
             config = load_config()
             config.media_rules.image_gallery_sample_max = 1
             scan = CreatorScan(creator_dir, input_dir, config.media_rules)
-            for media_path in iter_media_files(creator_dir, config.media_rules):
+            for media_path in media_files(creator_dir, config.media_rules):
                 scan.add_media(media_path)
 
             self.assertEqual(rel_to_input(scan.selected_cover("Project"), input_dir), "Ada/Project/a-landscape.jpg")
@@ -315,7 +323,7 @@ class LibraryScanTests(unittest.TestCase):
             config.media_rules.portrait_basename = "clip"
             config.media_rules.cover_basename = "clip"
             named_scan = CreatorScan(creator_dir, input_dir, config.media_rules)
-            for media_path in iter_media_files(creator_dir, config.media_rules):
+            for media_path in media_files(creator_dir, config.media_rules):
                 named_scan.add_media(media_path)
 
             self.assertEqual(named_scan.selected_portrait(), poster_path)
@@ -335,7 +343,7 @@ class LibraryScanTests(unittest.TestCase):
             (project_dir / "clip.mp4").write_bytes(b"video")
 
             config = load_config()
-            media_paths = list(iter_media_files(creator_dir, config.media_rules))
+            media_paths = list(media_files(creator_dir, config.media_rules))
             scans = []
             for paths in (media_paths, reversed(media_paths)):
                 scan = CreatorScan(creator_dir, input_dir, config.media_rules)
@@ -362,14 +370,147 @@ class LibraryScanTests(unittest.TestCase):
             write_image(image_path, (80, 160))
 
             with patch(
-                "cr4te.library_scan.image_utils.infer_image_orientation",
-                return_value=Orientation.PORTRAIT,
-            ) as infer_orientation:
+                "cr4te.library_scan.image_utils.read_image_dimensions",
+                return_value=ImageDimensions(width=80, height=160),
+            ) as read_dimensions:
                 scan = self.scan(creator_dir, input_dir, PortraitDiscovery.AUTO)
                 scan.selected_portrait()
                 scan.selected_cover("Project")
 
-            infer_orientation.assert_called_once_with(image_path)
+            read_dimensions.assert_called_once_with(image_path)
+
+    def test_fallback_orientation_reuses_persisted_probes_on_warm_scans(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_dir = Path(tmp) / "Artists"
+            creator_dir = input_dir / "Ada"
+            image_path = creator_dir / "Project" / "photo.jpg"
+            write_image(image_path, (80, 160))
+            db_path = Path(tmp) / "cache" / "probes.sqlite3"
+            config = load_config()
+            config.media_rules.portrait_discovery = PortraitDiscovery.AUTO
+
+            for expected_reads in (1, 0):
+                store = MediaProbeStore(db_path)
+                scan = CreatorScan(creator_dir, input_dir, config.media_rules, MediaInfoCache(probe_store=store))
+                for media_path in media_files(creator_dir, config.media_rules):
+                    scan.add_media(media_path)
+                with (
+                    self.subTest(expected_reads=expected_reads),
+                    patch(
+                        "cr4te.library_scan.image_utils.read_image_dimensions",
+                        return_value=ImageDimensions(width=80, height=160),
+                    ) as read_dimensions,
+                ):
+                    self.assertEqual(scan.selected_portrait(), image_path)
+                    self.assertEqual(read_dimensions.call_count, expected_reads)
+                store.close()
+
+    def test_creator_entries_are_typed_and_listed_in_one_pass(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_dir = Path(tmp) / "Artists"
+            creator_dir = input_dir / "Ada"
+            for path in (
+                creator_dir / "root.md",
+                creator_dir / "meta" / "notes.md",
+                creator_dir / "Project" / "scene.md",
+            ):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("Notes", encoding="utf-8")
+
+            entries = [
+                (entry.kind, rel_to_input(entry.path, input_dir))
+                for entry in iter_creator_entries(creator_dir, load_config().media_rules)
+            ]
+
+            self.assertEqual(
+                entries,
+                [
+                    (ScanEntryKind.DIRECTORY, "Ada"),
+                    (ScanEntryKind.PROJECT, "Ada/Project"),
+                    (ScanEntryKind.MEDIA, "Ada/root.md"),
+                    (ScanEntryKind.DIRECTORY, "Ada/Project"),
+                    (ScanEntryKind.MEDIA, "Ada/Project/scene.md"),
+                    (ScanEntryKind.DIRECTORY, "Ada/meta"),
+                    (ScanEntryKind.MEDIA, "Ada/meta/notes.md"),
+                ],
+            )
+
+    def test_excluded_hidden_and_too_deep_folders_are_never_listed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_dir = Path(tmp) / "Artists"
+            creator_dir = input_dir / "Ada"
+            for path in (
+                creator_dir / "root.md",
+                creator_dir / "_raw" / "dump.md",
+                creator_dir / ".cache" / "sidecar.md",
+                creator_dir / "a" / "b" / "kept.md",
+                creator_dir / "a" / "b" / "c" / "too-deep.md",
+            ):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("Notes", encoding="utf-8")
+
+            config = load_config()
+            config.media_rules.max_search_depth = 2
+            real_scandir = os.scandir
+            listed: list[str] = []
+
+            def tracking_scandir(path):
+                listed.append(rel_to_input(Path(path), input_dir))
+                return real_scandir(path)
+
+            with patch("cr4te.library_scan.os.scandir", side_effect=tracking_scandir):
+                media = [rel_to_input(path, input_dir) for path in media_files(creator_dir, config.media_rules)]
+
+            self.assertEqual(media, ["Ada/root.md", "Ada/a/b/kept.md"])
+            self.assertEqual(listed, ["Ada", "Ada/a", "Ada/a/b"])
+
+    def test_cr4teignore_folders_are_pruned_before_they_are_listed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_dir = Path(tmp) / "Artists"
+            for path in (
+                input_dir / "Ada" / "photo.jpg",
+                input_dir / "Ada" / "photo.xmp",
+                input_dir / "Ada" / "raw" / "dump.jpg",
+                input_dir / "Ada" / "Project" / "proxies" / "clip.mp4",
+                input_dir / "Ada" / "Project" / "cover.jpg",
+                input_dir / "Archive" / "old.jpg",
+            ):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(b"data")
+            (input_dir / ".cr4teignore").write_text("Archive/\n*.xmp\nproxies/\n", encoding="utf-8")
+            (input_dir / "Ada" / ".cr4teignore").write_text("/raw/\n", encoding="utf-8")
+
+            config = load_config()
+            real_scandir = os.scandir
+            listed: list[str] = []
+
+            def tracking_scandir(path):
+                listed.append(Path(path).relative_to(input_dir).as_posix())
+                return real_scandir(path)
+
+            with patch("cr4te.library_scan.os.scandir", side_effect=tracking_scandir):
+                index = build_library_index(input_dir, config.media_rules)
+
+            self.assertEqual([summary.name for summary in index.creators], ["Ada"])
+            creator = load_indexed_creator(index, index.creators[0], config.media_rules)
+            self.assertEqual([group.rel_dir_path for group in creator.media_groups], ["Ada"])
+            self.assertEqual(creator.media_groups[0].images, ["Ada/photo.jpg"])
+            self.assertEqual([project.title for project in creator.projects], ["Project"])
+            self.assertEqual(creator.projects[0].cover, "Ada/Project/cover.jpg")
+            self.assertEqual([group.rel_dir_path for group in creator.projects[0].media_groups], ["Ada/Project"])
+            self.assertEqual(listed, [".", "Ada", "Ada/Project"])
+
+    def test_exclusions_ignore_ancestors_above_the_library_root(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_dir = Path(tmp) / ".hidden" / "_Artists"
+            write_image(input_dir / "Ada" / "gallery.jpg")
+
+            config = load_config()
+            index = build_library_index(input_dir, config.media_rules)
+
+            self.assertEqual([summary.name for summary in index.creators], ["Ada"])
+            creator = load_indexed_creator(index, index.creators[0], config.media_rules)
+            self.assertEqual(creator.media_groups[0].images, ["Ada/gallery.jpg"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.media_cache import ImageDimensions, MediaInfoCache
+from cr4te.media_probe_store import MediaProbeStore
+
+
+class MediaProbeStoreTests(unittest.TestCase):
+    def test_probes_are_reused_across_store_instances_until_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            media_path = Path(tmp) / "image.jpg"
+            media_path.write_bytes(b"pixels")
+            db_path = Path(tmp) / "cache" / "probes.sqlite3"
+
+            store = MediaProbeStore(db_path)
+            self.assertIsNone(store.image_dimensions(media_path))
+            store.store_image_dimensions(media_path, ImageDimensions(width=30, height=40))
+            store.store_audio_duration_seconds(media_path, 12.5)
+            store.close()
+
+            reopened = MediaProbeStore(db_path)
+            self.assertEqual(reopened.image_dimensions(media_path), ImageDimensions(width=30, height=40))
+            self.assertEqual(reopened.audio_duration_seconds(media_path), 12.5)
+
+            stat = media_path.stat()
+            os.utime(media_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertIsNone(reopened.image_dimensions(media_path))
+            media_path.write_bytes(b"more pixels")
+            self.assertIsNone(reopened.audio_duration_seconds(media_path))
+            reopened.close()
+
+            self.assertEqual((reopened.hits, reopened.misses), (2, 2))
+
+    def test_store_resets_tables_written_by_another_version(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            media_path = Path(tmp) / "image.jpg"
+            media_path.write_bytes(b"pixels")
+            db_path = Path(tmp) / "probes.sqlite3"
+
+            store = MediaProbeStore(db_path)
+            store.store_image_dimensions(media_path, ImageDimensions(width=30, height=40))
+            store.close()
+            with sqlite3.connect(db_path) as connection:
+                connection.execute("PRAGMA user_version = 999")
+
+            reopened = MediaProbeStore(db_path)
+            self.assertIsNone(reopened.image_dimensions(media_path))
+            reopened.close()
+
+    def test_worker_connections_leave_the_schema_to_the_store_that_prepared_it(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            media_path = Path(tmp) / "image.jpg"
+            media_path.write_bytes(b"pixels")
+            db_path = Path(tmp) / "probes.sqlite3"
+
+            store = MediaProbeStore(db_path)
+            store.store_image_dimensions(media_path, ImageDimensions(width=30, height=40))
+            store.close()
+            with sqlite3.connect(db_path) as connection:
+                connection.execute("PRAGMA user_version = 999")
+
+            worker = MediaProbeStore(db_path, prepare_schema=False)
+            self.assertEqual(worker.image_dimensions(media_path), ImageDimensions(width=30, height=40))
+            worker.close()
+
+    def test_unusable_database_degrades_to_probing_every_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            media_path = Path(tmp) / "image.jpg"
+            media_path.write_bytes(b"pixels")
+            db_path = Path(tmp) / "probes.sqlite3"
+            db_path.write_bytes(b"not a database" * 100)
+
+            store = MediaProbeStore(db_path)
+            store.store_image_dimensions(media_path, ImageDimensions(width=30, height=40))
+
+            self.assertIsNone(store.image_dimensions(media_path))
+            store.close()
+
+    def test_media_info_cache_persists_only_measured_values(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            good_path = Path(tmp) / "good.jpg"
+            broken_path = Path(tmp) / "broken.jpg"
+            good_path.write_bytes(b"pixels")
+            broken_path.write_bytes(b"pixels")
+            db_path = Path(tmp) / "probes.sqlite3"
+            calls = []
+
+            def loader(path: Path, dimensions: ImageDimensions):
+                def _load():
+                    calls.append(path.name)
+                    return dimensions
+
+                return _load
+
+            store = MediaProbeStore(db_path)
+            cache = MediaInfoCache(probe_store=store)
+            cache.image_dimensions(good_path, loader(good_path, ImageDimensions(width=10, height=20)))
+            cache.image_dimensions(broken_path, loader(broken_path, ImageDimensions()))
+            cache.audio_duration_seconds(broken_path, lambda: 0)
+            store.close()
+
+            warm_store = MediaProbeStore(db_path)
+            warm_cache = MediaInfoCache(probe_store=warm_store)
+            self.assertEqual(
+                warm_cache.image_dimensions(good_path, loader(good_path, ImageDimensions(width=1, height=1))),
+                ImageDimensions(width=10, height=20),
+            )
+            warm_cache.image_dimensions(broken_path, loader(broken_path, ImageDimensions()))
+            self.assertIsNone(warm_store.audio_duration_seconds(broken_path))
+            warm_store.close()
+
+            self.assertEqual(calls, ["good.jpg", "broken.jpg", "broken.jpg"])
+
+
+if __name__ == "__main__":
+    unittest.main()
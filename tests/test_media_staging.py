@@ -1,8 +1,10 @@
 import json
 import os
+import sqlite3
 import sys
 import tempfile
 import unittest
+from contextlib import closing
 from pathlib import Path
 from unittest.mock import patch
 
@@ -13,25 +15,39 @@ sys.path.insert(0, str(ROOT / "src"))
 
 from cr4te.build_issues import BuildIssueError, BuildIssuePolicy, IssueCode
 from cr4te.config_manager import apply_cli_overrides, load_config
+from cr4te.constants import THUMBNAIL_MANIFEST_DB_FILE_NAME
 from cr4te.html_context import HtmlBuildContext
 from cr4te.enums.domain import Domain
 from cr4te.enums.portrait_visibility import PortraitVisibility
 from cr4te.enums.thumb_type import ThumbType
+from cr4te.enums.thumbnail_store import ThumbnailStore
+from cr4te.media_cache import ImageDimensions
 from cr4te.output_preparation import copy_static_assets, prepare_output_dirs
 from cr4te.render_assets import (
     build_default_thumbnail_specs,
+    build_thumbnail_context,
     prepare_default_thumbnails,
     resolve_thumbnail_or_default,
     stage_media_file,
 )
+from cr4te.utils import image_utils, path_utils
 
 
-def freshness_sidecar_path(thumb_path: Path) -> Path:
-    return thumb_path.with_suffix(f"{thumb_path.suffix}.json")
+def manifest_rows(ctx: HtmlBuildContext, statement: str, thumb_path: Path) -> list[tuple]:
+    # Closing the manifest commits its pending rows; it reopens on the next lookup.
+    ctx.thumbnail_manifest.close()
+    with closing(sqlite3.connect(ctx.thumbs_dir / THUMBNAIL_MANIFEST_DB_FILE_NAME)) as connection, connection:
+        return connection.execute(statement, (thumb_path.relative_to(ctx.thumbs_dir).as_posix(),)).fetchall()
 
 
-def read_freshness_metadata(thumb_path: Path) -> dict[str, object]:
-    return json.loads(freshness_sidecar_path(thumb_path).read_text(encoding="utf-8"))
+def read_freshness_metadata(ctx: HtmlBuildContext, thumb_path: Path) -> dict[str, object]:
+    (row,) = manifest_rows(ctx, "SELECT freshness FROM thumbnails WHERE path = ?", thumb_path)
+    return json.loads(row[0])
+
+
+def gallery_thumbnail_heights(ctx: HtmlBuildContext) -> list[int]:
+    """The gallery thumbnail and its srcset variants, in the largest-first order they are generated in."""
+    return sorted((ctx.get_generated_thumb_height(ThumbType.GALLERY), *ctx.get_srcset_heights(ThumbType.GALLERY)), reverse=True)
 
 
 class MediaStagingTests(unittest.TestCase):
@@ -169,7 +185,7 @@ class MediaStagingTests(unittest.TestCase):
 
             source_stat = image_path.stat()
             self.assertEqual(
-                read_freshness_metadata(thumb_path),
+                read_freshness_metadata(ctx, thumb_path),
                 {
                     "version": 1,
                     "source_path": "Noomi/image.png",
@@ -197,16 +213,90 @@ class MediaStagingTests(unittest.TestCase):
 
             thumb_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
 
-            with patch("cr4te.render_assets.image_utils.generate_thumbnail") as generate_thumbnail:
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails") as generate_thumbnails:
                 reused_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
 
-            generate_thumbnail.assert_not_called()
+            generate_thumbnails.assert_not_called()
             self.assertEqual(reused_path, thumb_path)
             self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 1)
             self.assertEqual(ctx.asset_statistics.source_thumbnails_reused, 1)
             self.assertEqual(ctx.asset_statistics.source_freshness_checks, 2)
 
-    def test_thumbnail_is_regenerated_when_freshness_sidecar_is_missing(self):
+    def test_cover_sizes_are_generated_from_one_decode_and_reused_from_the_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "input"
+            output_dir = Path(tmp) / "site"
+            image_path = root / "Noomi" / "Project" / "cover.png"
+            image_path.parent.mkdir(parents=True)
+            Image.new("RGB", (1200, 900), color=(120, 80, 160)).save(image_path)
+
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+            ctx = HtmlBuildContext(root, output_dir, config.site_labels, config.site_rendering)
+            prepare_output_dirs(ctx)
+
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails", wraps=image_utils.generate_thumbnails) as generate_thumbnails:
+                card_path = resolve_thumbnail_or_default(ctx, "Noomi/Project/cover.png", ThumbType.CREATOR_PAGE_PROJECT)
+                cover_path = resolve_thumbnail_or_default(ctx, "Noomi/Project/cover.png", ThumbType.COVER)
+                overview_path = resolve_thumbnail_or_default(ctx, "Noomi/Project/cover.png", ThumbType.PROJECT_OVERVIEW)
+
+            cover_types = (ThumbType.COVER, ThumbType.CREATOR_PAGE_PROJECT, ThumbType.PROJECT_OVERVIEW)
+            generate_thumbnails.assert_called_once_with(
+                image_path,
+                sorted(
+                    (
+                        height
+                        for thumb_type in cover_types
+                        for height in (ctx.get_generated_thumb_height(thumb_type), *ctx.get_srcset_heights(thumb_type))
+                    ),
+                    reverse=True,
+                ),
+            )
+            self.assertEqual(len({card_path, cover_path, overview_path}), 3)
+            with Image.open(overview_path) as overview:
+                self.assertEqual(overview.height, ctx.get_generated_thumb_height(ThumbType.PROJECT_OVERVIEW))
+            self.assertEqual(read_freshness_metadata(ctx, overview_path)["thumb_type"], ThumbType.PROJECT_OVERVIEW.value)
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 1)
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_reused, 2)
+
+    def test_srcset_variants_are_cut_from_the_same_decode_and_listed_smallest_first(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "input"
+            output_dir = Path(tmp) / "site"
+            image_path = root / "Noomi" / "image.png"
+            image_path.parent.mkdir(parents=True)
+            Image.new("RGB", (1200, 900), color=(120, 80, 160)).save(image_path)
+
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+            ctx = HtmlBuildContext(root, output_dir, config.site_labels, config.site_rendering)
+            prepare_output_dirs(ctx)
+
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails", wraps=image_utils.generate_thumbnails) as generate_thumbnails:
+                thumbnail = build_thumbnail_context(ctx, "Noomi/image.png", ThumbType.GALLERY)
+                reused = build_thumbnail_context(ctx, "Noomi/image.png", ThumbType.GALLERY)
+
+            generate_thumbnails.assert_called_once_with(image_path, [450, 300, 150])
+            self.assertEqual(reused, thumbnail)
+            self.assertEqual([variant.width for variant in thumbnail.srcset], [200, 400, 600])
+            self.assertEqual(thumbnail.srcset[-1].rel_thumbnail_path, thumbnail.rel_thumbnail_path)
+            for variant in thumbnail.srcset:
+                self.assertTrue((output_dir / variant.rel_thumbnail_path).is_file())
+            self.assertEqual(thumbnail.sizes, "auto, (max-width: 400px) 100vw, 400px")
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 1)
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_reused, 1)
+
+    def test_default_thumbnails_have_no_srcset(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+            ctx = HtmlBuildContext(Path(tmp) / "input", Path(tmp) / "site", config.site_labels, config.site_rendering)
+            prepare_output_dirs(ctx)
+            prepare_default_thumbnails(ctx)
+
+            thumbnail = build_thumbnail_context(ctx, None, ThumbType.GALLERY)
+
+            self.assertEqual(thumbnail.srcset, ())
+            self.assertEqual(thumbnail.sizes, "")
+
+    def test_thumbnail_is_regenerated_when_manifest_row_is_missing(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "input"
             output_dir = Path(tmp) / "site"
@@ -219,22 +309,22 @@ class MediaStagingTests(unittest.TestCase):
             prepare_output_dirs(ctx)
 
             thumb_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
-            freshness_sidecar_path(thumb_path).unlink()
+            manifest_rows(ctx, "DELETE FROM thumbnails WHERE path = ?", thumb_path)
 
             replacement_thumb = Image.new("RGB", (32, 32), color=(20, 120, 80))
             with patch(
-                "cr4te.render_assets.image_utils.generate_thumbnail",
-                return_value=replacement_thumb,
-            ) as generate_thumbnail:
+                "cr4te.render_assets.image_utils.generate_thumbnails",
+                return_value=[replacement_thumb],
+            ) as generate_thumbnails:
                 regenerated_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
 
             self.assertEqual(regenerated_path, thumb_path)
-            generate_thumbnail.assert_called_once_with(image_path, ctx.get_generated_thumb_height(ThumbType.GALLERY))
+            generate_thumbnails.assert_called_once_with(image_path, [ctx.get_generated_thumb_height(ThumbType.GALLERY)])
             self.assertEqual(ctx.asset_statistics.source_freshness_checks, 2)
             self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 2)
-            self.assertEqual(read_freshness_metadata(thumb_path)["source_path"], "Noomi/image.png")
+            self.assertEqual(read_freshness_metadata(ctx, thumb_path)["source_path"], "Noomi/image.png")
 
-    def test_thumbnail_is_regenerated_when_freshness_sidecar_is_unreadable(self):
+    def test_thumbnail_is_regenerated_when_manifest_is_unreadable(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "input"
             output_dir = Path(tmp) / "site"
@@ -247,15 +337,16 @@ class MediaStagingTests(unittest.TestCase):
             prepare_output_dirs(ctx)
 
             thumb_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
-            sidecar_path = freshness_sidecar_path(thumb_path)
-            sidecar_path.write_bytes(b"\xff")
+            ctx.thumbnail_manifest.close()
+            (ctx.thumbs_dir / THUMBNAIL_MANIFEST_DB_FILE_NAME).write_bytes(b"not a database" * 100)
+            ctx = HtmlBuildContext(root, output_dir, config.site_labels, config.site_rendering)
 
             replacement_thumb = Image.new("RGB", (32, 32), color=(20, 120, 80))
-            with patch("cr4te.render_assets.image_utils.generate_thumbnail", return_value=replacement_thumb) as generate_thumbnail:
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails", return_value=[replacement_thumb] * len(gallery_thumbnail_heights(ctx))) as generate_thumbnails:
                 resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
 
-            generate_thumbnail.assert_called_once_with(image_path, ctx.get_generated_thumb_height(ThumbType.GALLERY))
-            self.assertEqual(read_freshness_metadata(thumb_path)["source_path"], "Noomi/image.png")
+            generate_thumbnails.assert_called_once_with(image_path, gallery_thumbnail_heights(ctx))
+            self.assertEqual(read_freshness_metadata(ctx, thumb_path)["source_path"], "Noomi/image.png")
 
     def test_thumbnail_is_reused_when_content_changes_with_same_size_and_mtime(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -270,19 +361,19 @@ class MediaStagingTests(unittest.TestCase):
             prepare_output_dirs(ctx)
 
             thumb_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
-            original_metadata = read_freshness_metadata(thumb_path)
+            original_metadata = read_freshness_metadata(ctx, thumb_path)
             source_stat = image_path.stat()
             image_bytes = bytearray(image_path.read_bytes())
             image_bytes[-1] = (image_bytes[-1] + 1) % 256
             image_path.write_bytes(image_bytes)
             os.utime(image_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
 
-            with patch("cr4te.render_assets.image_utils.generate_thumbnail") as generate_thumbnail:
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails") as generate_thumbnails:
                 reused_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
 
-            generate_thumbnail.assert_not_called()
+            generate_thumbnails.assert_not_called()
             self.assertEqual(reused_path, thumb_path)
-            self.assertEqual(read_freshness_metadata(thumb_path), original_metadata)
+            self.assertEqual(read_freshness_metadata(ctx, thumb_path), original_metadata)
             self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 1)
             self.assertEqual(ctx.asset_statistics.source_thumbnails_reused, 1)
             self.assertEqual(ctx.asset_statistics.source_freshness_checks, 2)
@@ -301,16 +392,18 @@ class MediaStagingTests(unittest.TestCase):
 
             thumb_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
             image_path.write_bytes(image_path.read_bytes() + b"changed-size")
+            ctx.thumbnail_manifest.close()
+            ctx = HtmlBuildContext(root, output_dir, config.site_labels, config.site_rendering)
 
             replacement_thumb = Image.new("RGB", (32, 32), color=(20, 120, 80))
-            with patch("cr4te.render_assets.image_utils.generate_thumbnail", return_value=replacement_thumb) as generate_thumbnail:
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails", return_value=[replacement_thumb] * len(gallery_thumbnail_heights(ctx))) as generate_thumbnails:
                 regenerated_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
 
             self.assertEqual(regenerated_path, thumb_path)
-            generate_thumbnail.assert_called_once_with(image_path, ctx.get_generated_thumb_height(ThumbType.GALLERY))
-            self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 2)
-            self.assertEqual(ctx.asset_statistics.source_freshness_checks, 2)
-            self.assertEqual(read_freshness_metadata(thumb_path)["source_size"], image_path.stat().st_size)
+            generate_thumbnails.assert_called_once_with(image_path, gallery_thumbnail_heights(ctx))
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 1)
+            self.assertEqual(ctx.asset_statistics.source_freshness_checks, 1)
+            self.assertEqual(read_freshness_metadata(ctx, thumb_path)["source_size"], image_path.stat().st_size)
 
     def test_thumbnail_is_regenerated_when_source_mtime_changes(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -328,16 +421,18 @@ class MediaStagingTests(unittest.TestCase):
             source_stat = image_path.stat()
             newer_ns = source_stat.st_mtime_ns + 1_000_000_000
             os.utime(image_path, ns=(source_stat.st_atime_ns, newer_ns))
+            ctx.thumbnail_manifest.close()
+            ctx = HtmlBuildContext(root, output_dir, config.site_labels, config.site_rendering)
 
             replacement_thumb = Image.new("RGB", (32, 32), color=(20, 120, 80))
-            with patch("cr4te.render_assets.image_utils.generate_thumbnail", return_value=replacement_thumb) as generate_thumbnail:
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails", return_value=[replacement_thumb] * len(gallery_thumbnail_heights(ctx))) as generate_thumbnails:
                 regenerated_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
 
             self.assertEqual(regenerated_path, thumb_path)
-            generate_thumbnail.assert_called_once_with(image_path, ctx.get_generated_thumb_height(ThumbType.GALLERY))
-            self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 2)
-            self.assertEqual(ctx.asset_statistics.source_freshness_checks, 2)
-            self.assertEqual(read_freshness_metadata(thumb_path)["source_mtime_ns"], image_path.stat().st_mtime_ns)
+            generate_thumbnails.assert_called_once_with(image_path, gallery_thumbnail_heights(ctx))
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 1)
+            self.assertEqual(ctx.asset_statistics.source_freshness_checks, 1)
+            self.assertEqual(read_freshness_metadata(ctx, thumb_path)["source_mtime_ns"], image_path.stat().st_mtime_ns)
 
     def test_thumbnail_is_regenerated_when_recipe_metadata_changes(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -352,18 +447,18 @@ class MediaStagingTests(unittest.TestCase):
             prepare_output_dirs(ctx)
 
             thumb_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
-            metadata = read_freshness_metadata(thumb_path)
+            metadata = read_freshness_metadata(ctx, thumb_path)
             metadata["generated_height"] = 1
-            freshness_sidecar_path(thumb_path).write_text(json.dumps(metadata), encoding="utf-8")
+            ctx.thumbnail_manifest.store(thumb_path, metadata, ImageDimensions(width=1, height=1))
 
             replacement_thumb = Image.new("RGB", (32, 32), color=(20, 120, 80))
-            with patch("cr4te.render_assets.image_utils.generate_thumbnail", return_value=replacement_thumb) as generate_thumbnail:
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails", return_value=[replacement_thumb]) as generate_thumbnails:
                 regenerated_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
 
             self.assertEqual(regenerated_path, thumb_path)
-            generate_thumbnail.assert_called_once_with(image_path, ctx.get_generated_thumb_height(ThumbType.GALLERY))
+            generate_thumbnails.assert_called_once_with(image_path, [ctx.get_generated_thumb_height(ThumbType.GALLERY)])
             self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 2)
-            self.assertEqual(read_freshness_metadata(thumb_path)["generated_height"], ctx.get_generated_thumb_height(ThumbType.GALLERY))
+            self.assertEqual(read_freshness_metadata(ctx, thumb_path)["generated_height"], ctx.get_generated_thumb_height(ThumbType.GALLERY))
 
     def test_thumbnail_failure_uses_default_and_reports_issue(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -409,6 +504,63 @@ class MediaStagingTests(unittest.TestCase):
 
             self.assertEqual(caught.exception.issue.code, IssueCode.THUMBNAIL_FAILURE)
 
+    def test_content_store_generates_copies_of_one_image_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "input"
+            output_dir = Path(tmp) / "site"
+            for project in ("First", "Second"):
+                image_path = root / "Noomi" / project / "image.png"
+                image_path.parent.mkdir(parents=True)
+                Image.new("RGB", (120, 80), color=(120, 80, 160)).save(image_path)
+
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+            ctx = HtmlBuildContext(root, output_dir, config.site_labels, config.site_rendering, thumbnail_store=ThumbnailStore.CONTENT)
+            prepare_output_dirs(ctx)
+
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails", wraps=image_utils.generate_thumbnails) as generate_thumbnails:
+                first_path = resolve_thumbnail_or_default(ctx, "Noomi/First/image.png", ThumbType.GALLERY)
+                second_path = resolve_thumbnail_or_default(ctx, "Noomi/Second/image.png", ThumbType.GALLERY)
+
+            generate_thumbnails.assert_called_once()
+            self.assertEqual(second_path, first_path)
+            metadata = read_freshness_metadata(ctx, first_path)
+            self.assertNotIn("source_path", metadata)
+            self.assertEqual(len(metadata["source_fingerprint"]), 32)
+            self.assertEqual(ctx.asset_statistics.source_fingerprints_computed, 2)
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_generated, 1)
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_reused, 1)
+
+    def test_content_store_reuses_thumbnails_of_moved_images_after_hashing_them(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "input"
+            output_dir = Path(tmp) / "site"
+            image_path = root / "Noomi" / "image.png"
+            image_path.parent.mkdir(parents=True)
+            Image.new("RGB", (120, 80), color=(120, 80, 160)).save(image_path)
+
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+            ctx = HtmlBuildContext(root, output_dir, config.site_labels, config.site_rendering, thumbnail_store=ThumbnailStore.CONTENT)
+            prepare_output_dirs(ctx)
+            thumb_path = resolve_thumbnail_or_default(ctx, "Noomi/image.png", ThumbType.GALLERY)
+            ctx.thumbnail_manifest.close()
+
+            moved_path = root / "Noomi Archive" / "image.png"
+            moved_path.parent.mkdir()
+            image_path.rename(moved_path)
+            ctx = HtmlBuildContext(root, output_dir, config.site_labels, config.site_rendering, thumbnail_store=ThumbnailStore.CONTENT)
+
+            with patch("cr4te.render_assets.image_utils.generate_thumbnails") as generate_thumbnails, patch(
+                "cr4te.render_assets.path_utils.content_fingerprint",
+                wraps=path_utils.content_fingerprint,
+            ) as content_fingerprint:
+                moved_thumb_path = resolve_thumbnail_or_default(ctx, "Noomi Archive/image.png", ThumbType.GALLERY)
+                resolve_thumbnail_or_default(ctx, "Noomi Archive/image.png", ThumbType.GALLERY)
+
+            generate_thumbnails.assert_not_called()
+            content_fingerprint.assert_called_once_with(moved_path)
+            self.assertEqual(moved_thumb_path, thumb_path)
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_reused, 2)
+
     def test_output_preparation_copies_static_files_and_default_thumbnails(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "input"
@@ -3,6 +3,7 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from PIL import Image
 
@@ -12,7 +13,10 @@ sys.path.insert(0, str(ROOT / "src"))
 from cr4te.config_manager import apply_cli_overrides, load_config
 from cr4te.build_issues import IssueCode, IssueScope
 from cr4te.enums.domain import Domain
-from cr4te.metadata_manager import delete_metadata_files, reconcile_metadata_files
+from cr4te.library_ignore import load_ignore_rules
+from cr4te.library_scan import iter_creator_dirs, iter_project_dirs, load_creator_ignore_rules
+from cr4te.metadata_manager import MetadataWriteResult, delete_metadata_files, reconcile_creator_metadata
+from cr4te.metadata_writer import write_file_atomically
 
 
 def write_image(path: Path) -> None:
@@ -33,14 +37,21 @@ class MetadataManagerTests(unittest.TestCase):
     def art_config(self):
         return apply_cli_overrides(load_config(), domain=Domain.ART)
 
-    def reconcile_art_metadata(self, root: Path, dry_run: bool = False):
+    def reconcile_art_metadata(self, root: Path, dry_run: bool = False) -> MetadataWriteResult:
         config = self.art_config()
-        return reconcile_metadata_files(
-            root,
-            config.media_rules,
-            config.site_rendering.project_metadata.configured_fields(),
-            dry_run=dry_run,
-        )
+        result = MetadataWriteResult()
+        root_ignore_rules = load_ignore_rules(root)
+        for creator_dir in iter_creator_dirs(root, config.media_rules, root_ignore_rules):
+            creator_ignore_rules = load_creator_ignore_rules(creator_dir, root_ignore_rules)
+            reconciliation = reconcile_creator_metadata(
+                creator_dir,
+                iter_project_dirs(creator_dir, config.media_rules, creator_ignore_rules),
+                config.media_rules,
+                config.site_rendering.project_metadata.configured_fields(),
+                dry_run,
+            )
+            result.extend(reconciliation.result)
+        return result
 
     def test_reconcile_metadata_creates_creator_and_project_files(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -73,6 +84,22 @@ class MetadataManagerTests(unittest.TestCase):
             self.assertEqual(project_metadata["facets"]["materials"], [])
             self.assertNotIn("info", project_metadata)
 
+    def test_reconcile_metadata_skips_folders_listed_in_cr4teignore(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            write_image(root / "Noomi" / "Landscapes" / "cover.jpg")
+            write_image(root / "Noomi" / "Raw Dump" / "frame.jpg")
+            write_image(root / "Scratch" / "test.jpg")
+            (root / ".cr4teignore").write_text("/Scratch\n", encoding="utf-8")
+            (root / "Noomi" / ".cr4teignore").write_text("Raw Dump/\n", encoding="utf-8")
+
+            result = self.reconcile_art_metadata(root)
+
+            self.assertEqual(
+                sorted(path.relative_to(root).as_posix() for path in result.created),
+                ["Noomi/Landscapes/cr4te.json", "Noomi/cr4te.json"],
+            )
+
     def test_reconcile_metadata_preserves_display_values_and_adds_missing_project_facets(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "Artists"
@@ -260,6 +287,41 @@ class MetadataManagerTests(unittest.TestCase):
                 "Metadata summary: created=0, updated=0, unchanged=0, skipped=1",
             )
 
+    def test_reconcile_metadata_writes_many_creators_with_exact_counts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            for index in range(20):
+                (root / f"Creator {index:02}" / "Project").mkdir(parents=True)
+            write_json(root / "Creator 00" / "cr4te.json", {"display_name": "First"})
+
+            result = self.reconcile_art_metadata(root)
+
+            self.assertEqual(len(result.created), 39)
+            self.assertEqual(result.updated, [root / "Creator 00" / "cr4te.json"])
+            self.assertEqual(result.created[0], root / "Creator 00" / "Project" / "cr4te.json")
+            self.assertEqual(list(root.rglob("*.tmp")), [])
+            self.assertEqual(read_json(root / "Creator 00" / "cr4te.json")["display_name"], "First")
+
+    def test_failed_metadata_write_is_reported_as_skipped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            failing_path = root / "Noomi" / "Landscapes" / "cr4te.json"
+            failing_path.parent.mkdir(parents=True)
+
+            def write_or_fail(path, content):
+                if path == failing_path:
+                    raise PermissionError("read-only share")
+                return write_file_atomically(path, content)
+
+            with patch("cr4te.metadata_writer.write_file_atomically", side_effect=write_or_fail):
+                result = self.reconcile_art_metadata(root)
+
+            self.assertEqual(result.created, [root / "Noomi" / "cr4te.json"])
+            self.assertEqual(result.skipped, [failing_path])
+            self.assertEqual(result.issues[0].scope, IssueScope.PROJECT)
+            self.assertIn("read-only share", result.issues[0].message)
+            self.assertFalse(failing_path.exists())
+
     def test_delete_metadata_files_recurses_through_projects(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "Artists"
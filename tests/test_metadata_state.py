@@ -0,0 +1,95 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.config_manager import apply_cli_overrides, load_config
+from cr4te.enums.domain import Domain
+from cr4te.enums.visible_fields import ProjectField
+from cr4te.metadata_manager import reconcile_creator_metadata
+from cr4te.metadata_state import MetadataStateStore
+
+
+class MetadataStateTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        self.creator_dir = self.root / "Artists" / "Ada"
+        self.project_dir = self.creator_dir / "Sketches"
+        self.project_dir.mkdir(parents=True)
+        self.state_dir = self.root / "cache" / "metadata"
+        self.media_rules = apply_cli_overrides(load_config(), domain=Domain.ART).media_rules
+
+    def reconcile(self, project_facet_fields=(ProjectField.LANGUAGES,)):
+        store = MetadataStateStore(self.state_dir, self.media_rules, project_facet_fields)
+        state = store.load(self.creator_dir)
+        reconciliation = reconcile_creator_metadata(
+            self.creator_dir,
+            [self.project_dir],
+            self.media_rules,
+            project_facet_fields,
+            state=state,
+        )
+        store.store(state)
+        return reconciliation
+
+    def test_unchanged_files_are_skipped_without_being_read(self):
+        first = self.reconcile()
+
+        with patch("pathlib.Path.read_bytes", autospec=True, side_effect=Path.read_bytes) as read_bytes:
+            second = self.reconcile()
+
+        self.assertEqual(len(first.result.created), 2)
+        self.assertEqual(len(second.result.unchanged), 2)
+        self.assertEqual(read_bytes.call_count, 0)
+        self.assertEqual(second.creator_metadata().display_name, "Ada")
+        self.assertEqual(second.project_metadata(self.project_dir).display_title, "Sketches")
+
+    def test_touched_file_with_same_content_is_not_parsed_again(self):
+        self.reconcile()
+        metadata_path = self.creator_dir / "cr4te.json"
+        file_stat = metadata_path.stat()
+        os.utime(metadata_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+
+        with patch("cr4te.metadata_manager._parse_json_object") as parse:
+            reconciliation = self.reconcile()
+
+        parse.assert_not_called()
+        self.assertEqual(len(reconciliation.result.unchanged), 2)
+        with patch("pathlib.Path.read_bytes", autospec=True, side_effect=Path.read_bytes) as read_bytes:
+            self.reconcile()
+        self.assertEqual(read_bytes.call_count, 0)
+
+    def test_edited_files_and_changed_inputs_are_reconciled_again(self):
+        self.reconcile()
+        metadata_path = self.project_dir / "cr4te.json"
+        metadata_path.write_text(json.dumps({"display_title": "Edited"}), encoding="utf-8")
+
+        edited = self.reconcile()
+        reconfigured = self.reconcile(project_facet_fields=(ProjectField.LANGUAGES, ProjectField.GENRES))
+
+        self.assertEqual(edited.result.updated, [metadata_path])
+        self.assertEqual(edited.result.unchanged, [self.creator_dir / "cr4te.json"])
+        self.assertEqual(reconfigured.result.updated, [metadata_path])
+        self.assertIn("genres", json.loads(metadata_path.read_text(encoding="utf-8"))["facets"])
+
+    def test_invalid_files_are_not_recorded(self):
+        metadata_path = self.creator_dir / "cr4te.json"
+        metadata_path.write_text("{", encoding="utf-8")
+
+        self.reconcile()
+        reconciliation = self.reconcile()
+
+        self.assertEqual(reconciliation.result.skipped, [metadata_path])
+        self.assertEqual(len(reconciliation.result.issues), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
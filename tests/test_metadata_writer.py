@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.metadata_writer import MetadataWriter, write_file_atomically
+
+
+class MetadataWriterTests(unittest.TestCase):
+    def test_atomic_write_replaces_file_and_leaves_no_temp_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cr4te.json"
+            path.write_bytes(b"old")
+
+            file_stat = write_file_atomically(path, b"{}\n")
+
+            self.assertEqual(path.read_bytes(), b"{}\n")
+            self.assertEqual(file_stat.st_size, 3)
+            self.assertEqual(sorted(child.name for child in Path(tmp).iterdir()), ["cr4te.json"])
+
+    def test_atomic_write_syncs_content_before_renaming(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cr4te.json"
+            calls = []
+            fsync = os.fsync
+            replace = os.replace
+
+            def record(name, action):
+                def call(*args):
+                    calls.append(name)
+                    return action(*args)
+                return call
+
+            with patch("cr4te.metadata_writer.os.fsync", side_effect=record("fsync", fsync)), \
+                    patch("cr4te.metadata_writer.os.replace", side_effect=record("replace", replace)):
+                write_file_atomically(path, b"{}\n")
+
+            self.assertEqual(calls, ["fsync", "replace"])
+
+    def test_failed_rename_keeps_previous_content(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cr4te.json"
+            path.write_bytes(b"old")
+
+            with patch("cr4te.metadata_writer.os.replace", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    write_file_atomically(path, b"new")
+
+            self.assertEqual(path.read_bytes(), b"old")
+            self.assertEqual(sorted(child.name for child in Path(tmp).iterdir()), ["cr4te.json"])
+
+    def test_writer_drains_queued_writes_and_keeps_failures_on_futures(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / f"{index}.json" for index in range(25)]
+            missing_dir_path = Path(tmp) / "missing" / "cr4te.json"
+
+            with MetadataWriter(max_workers=2) as writer:
+                futures = [writer.write(path, path.name.encode()) for path in paths]
+                failed = writer.write(missing_dir_path, b"{}")
+                writer.drain()
+
+                self.assertTrue(all(future.done() for future in futures))
+                self.assertIsInstance(failed.exception(), FileNotFoundError)
+
+            self.assertEqual([path.read_bytes() for path in paths], [path.name.encode() for path in paths])
+
+    def test_writer_requires_a_worker(self):
+        with self.assertRaises(ValueError):
+            MetadataWriter(max_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
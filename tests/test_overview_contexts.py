@@ -50,7 +50,6 @@ class OverviewContextTests(unittest.TestCase):
                 tags={},
                 active_since="",
                 nationalities=(),
-                info="",
                 media_counts=MediaCounts(audio=1, image=2),
                 projects=(
                     ProjectSummary(
@@ -86,7 +85,6 @@ class OverviewContextTests(unittest.TestCase):
                 tags={},
                 active_since="",
                 nationalities=(),
-                info="",
             )
             empty_entry = build_creator_overview_entry_from_index(ctx, empty_creator)
             self.assertEqual(empty_entry.project_count_summary, "")
@@ -109,7 +107,6 @@ class OverviewContextTests(unittest.TestCase):
                 tags={},
                 active_since="",
                 nationalities=(),
-                info="",
             )
 
             with patch("cr4te.overview_contexts.build_thumbnail_context") as build_thumbnail:
@@ -134,7 +131,6 @@ class OverviewContextTests(unittest.TestCase):
                 tags={},
                 active_since="",
                 nationalities=(),
-                info="",
             )
 
             entry = build_creator_overview_entry_from_index(ctx, creator)
@@ -168,7 +164,6 @@ class OverviewContextTests(unittest.TestCase):
                 tags={"Role": ["Photographer"]},
                 active_since="",
                 nationalities=("German",),
-                info="",
                 projects=(project,),
             )
 
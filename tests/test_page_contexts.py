@@ -55,7 +55,6 @@ def project(**overrides) -> Project:
         "display_title": "Displayed Landscapes",
         "release_date": "2024-03-12",
         "cover": "Landscapes/cover.jpg",
-        "info": "",
         "tags": {"Mood": ["Calm"]},
         "facets": {ProjectField.MEDIUMS: ["Photography"]},
         "media_groups": [],
@@ -73,7 +72,6 @@ def person(name: str = "Noomi", **overrides) -> Creator:
         "date_of_birth": "1990-04",
         "place_of_birth": "Berlin",
         "portrait": f"{name}/portrait.jpg",
-        "info": "",
         "nationalities": ["German"],
         "aliases": ["N."],
         "tags": {"Role": ["Photographer"]},
@@ -155,7 +153,7 @@ class PageContextTests(unittest.TestCase):
             self.assertEqual(page.projects[0].title, "Displayed Landscapes")
             self.assertEqual(page.projects[0].media_counts.values(), (0, 0, 0, 0, 0))
 
-    def test_creator_page_uses_default_for_unreadable_cached_portrait_thumbnail(self):
+    def test_creator_page_takes_cached_portrait_dimensions_from_the_thumbnail_manifest(self):
         with tempfile.TemporaryDirectory() as tmp:
             input_dir = Path(tmp) / "input"
             output_dir = Path(tmp) / "site"
@@ -163,13 +161,16 @@ class PageContextTests(unittest.TestCase):
             creator = person(portrait="Noomi/portrait.jpg")
             ctx = context_for(input_dir, output_dir)
             thumb_path = resolve_thumbnail_or_default(ctx, creator.portrait, ThumbType.PORTRAIT)
-            thumb_path.write_bytes(b"not an image")
+            ctx.thumbnail_manifest.close()
+            ctx = context_for(input_dir, output_dir)
 
-            page = build_creator_page_context(ctx, creator, lambda name: None, compute_creator_stats(creator))
+            with patch("cr4te.render_assets.image_utils.read_image_dimensions") as read_image_dimensions:
+                page = build_creator_page_context(ctx, creator, lambda name: None, compute_creator_stats(creator))
 
-            self.assertEqual(page.rel_portrait_path, "assets/defaults/portrait.png")
-            self.assertEqual(len(ctx.issues), 1)
-            self.assertEqual(ctx.issues[0].code, IssueCode.MEDIA_INSPECTION_FAILURE)
+            read_image_dimensions.assert_not_called()
+            self.assertEqual(page.rel_portrait_path, thumb_path.relative_to(output_dir).as_posix())
+            self.assertEqual(ctx.issues, ())
+            self.assertEqual(ctx.asset_statistics.source_thumbnails_reused, 1)
 
     def test_collaboration_creator_page_context_uses_typed_contexts(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -186,7 +187,6 @@ class PageContextTests(unittest.TestCase):
                 active_since="2021",
                 members=["Noomi", "Missing Member"],
                 portrait="Collab/portrait.jpg",
-                info="",
                 tags={"Format": ["Duo"]},
                 projects=[],
                 media_groups=[],
@@ -229,7 +229,6 @@ class PageContextTests(unittest.TestCase):
                 active_since="2021",
                 members=["Noomi"],
                 portrait="Collab/portrait.jpg",
-                info="",
                 projects=[collab_project],
                 media_groups=[],
             )
@@ -257,7 +256,6 @@ class PageContextTests(unittest.TestCase):
                 active_since="",
                 members=["Ada", "Bob", "Missing Member"],
                 portrait="",
-                info="",
                 projects=[],
                 media_groups=[],
             )
@@ -288,7 +286,6 @@ class PageContextTests(unittest.TestCase):
                 active_since="",
                 members=["Ada"],
                 portrait="",
-                info="",
                 projects=[],
                 media_groups=[],
             )
@@ -318,7 +315,6 @@ class PageContextTests(unittest.TestCase):
                 active_since="",
                 members=["Ada", "Bob", "Charlie", "Dana"],
                 portrait="",
-                info="",
                 projects=[],
                 media_groups=[],
             )
@@ -373,7 +369,6 @@ class PageContextTests(unittest.TestCase):
                 tags={},
                 active_since="",
                 nationalities=(),
-                info="",
             )
             summary = ProjectSummary(
                 title="Landscapes",
@@ -15,7 +15,7 @@ from cr4te.html_context import HtmlBuildContext
 from cr4te.enums.domain import Domain
 from cr4te.enums.media_type import MediaType
 from cr4te.render_assets import prepare_default_thumbnails
-from cr4te.render_media import build_media_group_contexts, sort_media_sections_by_type
+from cr4te.render_media import build_media_group_contexts, build_readme_html, sort_media_sections_by_type
 from cr4te.render_models import MediaSectionContext
 from cr4te.schemas.library_schema import MediaGroup, Video
 
@@ -183,7 +183,7 @@ class RenderMediaTests(unittest.TestCase):
             output_dir = Path(tmp) / "site"
             text_path = root / "Gallery" / "notes.md"
             text_path.parent.mkdir(parents=True)
-            text_path.write_text("notes", encoding="utf-8")
+            text_path.write_bytes(b"\xffnotes")
             config = apply_cli_overrides(load_config(), domain=Domain.ART)
             ctx = HtmlBuildContext(root, output_dir, config.site_labels, config.site_rendering)
             media_group = MediaGroup(
@@ -196,14 +196,52 @@ class RenderMediaTests(unittest.TestCase):
                 rel_dir_path="Gallery",
             )
 
-            with patch("cr4te.render_media.text_utils.read_text", side_effect=UnicodeError("bad text")):
-                group = build_media_group_contexts(ctx, [media_group])[0]
+            group = build_media_group_contexts(ctx, [media_group])[0]
 
             text_section = next(section for section in group.sections if section.type == MediaType.TEXT)
             self.assertEqual(text_section.texts, [])
             self.assertEqual(len(ctx.issues), 1)
             self.assertEqual(ctx.issues[0].code, IssueCode.MEDIA_READ_FAILURE)
 
+    def test_text_media_beyond_the_size_cap_is_cut_at_a_line_and_reported(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "input"
+            text_path = root / "Gallery" / "transcript.md"
+            text_path.parent.mkdir(parents=True)
+            text_path.write_text("first line\nsecond line\n", encoding="utf-8")
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+            site_rendering = config.site_rendering.model_copy(
+                update={"media": config.site_rendering.media.model_copy(update={"text_max_bytes": 15})}
+            )
+            ctx = HtmlBuildContext(root, Path(tmp) / "site", config.site_labels, site_rendering)
+            media_group = MediaGroup(
+                is_root=False,
+                videos=[],
+                tracks=[],
+                images=[],
+                documents=[],
+                texts=["Gallery/transcript.md"],
+                rel_dir_path="Gallery",
+            )
+
+            group = build_media_group_contexts(ctx, [media_group])[0]
+
+            text_section = next(section for section in group.sections if section.type == MediaType.TEXT)
+            self.assertEqual(text_section.texts[0].content, "<p>first line</p>")
+            self.assertEqual([(issue.code, issue.severity) for issue in ctx.issues], [(IssueCode.TEXT_TRUNCATED, IssueSeverity.WARNING)])
+
+    def test_readme_is_read_when_its_page_renders(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "input"
+            (root / "Noomi" / "Landscapes").mkdir(parents=True)
+            (root / "Noomi" / "README.md").write_text("  Creator **bio**\n", encoding="utf-8")
+            config = apply_cli_overrides(load_config(), domain=Domain.ART)
+            ctx = HtmlBuildContext(root, Path(tmp) / "site", config.site_labels, config.site_rendering)
+
+            self.assertEqual(build_readme_html(ctx, Path("Noomi")), "<p>Creator <strong>bio</strong></p>")
+            self.assertEqual(build_readme_html(ctx, Path("Noomi", "Landscapes")), "")
+            self.assertEqual(ctx.issues, ())
+
     def test_unreadable_gallery_image_is_omitted_and_reported(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp) / "input"
@@ -253,7 +291,7 @@ class RenderMediaTests(unittest.TestCase):
                 rel_dir_path="Gallery",
             )
 
-            with patch("cr4te.render_assets._regenerate_thumbnail", side_effect=OSError("cannot write")):
+            with patch("cr4te.thumbnail_engine._save_thumbnail", side_effect=OSError("cannot write")):
                 group = build_media_group_contexts(ctx, [media_group])[0]
 
             image_section = next(section for section in group.sections if section.type == MediaType.IMAGE)
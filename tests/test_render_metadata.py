@@ -36,7 +36,6 @@ def project(**overrides) -> Project:
         "display_title": "Displayed Landscapes",
         "release_date": "2024-03-12",
         "cover": "",
-        "info": "",
         "tags": {},
         "facets": {},
         "media_groups": [],
@@ -54,7 +53,6 @@ def creator(**overrides) -> Creator:
         "date_of_birth": "1990-04",
         "place_of_birth": "Berlin",
         "portrait": "",
-        "info": "",
         "nationalities": ["German"],
         "aliases": ["N."],
         "projects": [],
@@ -168,7 +166,6 @@ class RenderMetadataTests(unittest.TestCase):
             founding_date="2021",
             founding_location="Paris",
             portrait="",
-            info="",
             nationalities=["French", "German"],
             aliases=["NA"],
             projects=[],
@@ -55,6 +55,10 @@ REQUIREMENT_TESTS = {
     "THUMB-002": ("tests/test_media_staging.py::MediaStagingTests.test_generated_thumbnail_stores_authoritative_source_freshness_metadata",),
     "THUMB-003": ("tests/test_media_staging.py::MediaStagingTests.test_existing_thumbnail_is_reused_when_source_freshness_matches",),
     "THUMB-004": ("tests/test_media_staging.py::MediaStagingTests.test_thumbnail_is_reused_when_content_changes_with_same_size_and_mtime",),
+    "THUMB-005": (
+        "tests/test_media_staging.py::MediaStagingTests.test_content_store_generates_copies_of_one_image_once",
+        "tests/test_media_staging.py::MediaStagingTests.test_content_store_reuses_thumbnails_of_moved_images_after_hashing_them",
+    ),
     "SITE-001": ("tests_browser/test_rendered_site.py::RenderedSiteBrowserTests.test_starting_media_pauses_only_the_previously_active_player",),
     "SITE-002": ("tests/test_js_contracts.py::JavaScriptContractTests.test_playback_coordinator_uses_captured_native_media_events_and_only_pauses",),
     "SITE-003": ("tests_browser/test_rendered_site.py::RenderedSiteBrowserTests.test_restricted_local_storage_does_not_hide_or_break_page",),
@@ -102,6 +106,11 @@ REQUIREMENT_TESTS = {
         "tests/test_template_renderer.py::TemplateRendererTests.test_creator_project_card_gallery_rows_are_configurable_independently",
         "tests_browser/test_rendered_site.py::RenderedSiteBrowserTests.test_paginated_galleries_use_configured_row_count_for_aspect_and_justified_layouts",
     ),
+    "SITE-036": (
+        "tests/test_template_renderer.py::TemplateRendererTests.test_gallery_images_offer_thumbnail_variants_through_srcset",
+        "tests/test_media_staging.py::MediaStagingTests.test_srcset_variants_are_cut_from_the_same_decode_and_listed_smallest_first",
+        "tests/test_media_staging.py::MediaStagingTests.test_default_thumbnails_have_no_srcset",
+    ),
     "THEME-001": ("tests/test_html_build.py::HtmlBuildTests.test_streaming_html_build_copies_and_renders_custom_theme",),
     "THEME-002": ("tests/test_themes.py::ThemeTests.test_custom_theme_is_discovered_from_explicit_directory",),
     "THEME-003": ("tests/test_themes.py::ThemeTests.test_invalid_custom_themes_are_reported_and_skipped",),
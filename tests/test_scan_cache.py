@@ -0,0 +1,147 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from PIL import Image
+
+from cr4te.config_manager import apply_cli_overrides, load_config
+from cr4te.enums.domain import Domain
+from cr4te.enums.portrait_discovery import PortraitDiscovery
+from cr4te.library_builder import build_library_index
+
+
+def write_image(path: Path, size: tuple[int, int] = (120, 90)) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, color=(80, 120, 160)).save(path)
+
+
+class ScanCacheTests(unittest.TestCase):
+    def media_rules(self):
+        config = apply_cli_overrides(load_config(), domain=Domain.ART)
+        config.media_rules.portrait_discovery = PortraitDiscovery.AUTO
+        return config.media_rules
+
+    def test_unchanged_creator_is_restored_without_walking_or_probing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            cache_dir = Path(tmp) / "cache"
+            write_image(root / "Ada" / "standing.jpg", (80, 160))
+            write_image(root / "Ada" / "Project" / "wide.jpg")
+            write_image(root / "Ada" / "Project" / "clip.jpg")
+            (root / "Ada" / "Project" / "clip.mp4").write_bytes(b"video")
+
+            first = build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+
+            with (
+                patch("cr4te.library_builder.iter_creator_entries") as walk,
+                patch("cr4te.library_scan.image_utils.read_image_dimensions") as read_dimensions,
+            ):
+                second = build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+
+            walk.assert_not_called()
+            read_dimensions.assert_not_called()
+            self.assertEqual(second.creators, first.creators)
+            self.assertEqual(second.creators[0].portrait, "Ada/standing.jpg")
+            self.assertEqual(second.creators[0].projects[0].cover, "Ada/Project/wide.jpg")
+            self.assertEqual((first.statistics.scan_cache_hits, first.statistics.scan_cache_misses), (0, 1))
+            self.assertEqual((second.statistics.scan_cache_hits, second.statistics.scan_cache_misses), (1, 0))
+
+    def test_changed_directory_mtime_rescans_only_that_creator(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            cache_dir = Path(tmp) / "cache"
+            write_image(root / "Ada" / "Project" / "one.jpg")
+            write_image(root / "Bob" / "gallery.jpg")
+            (root / "Ada" / "Project" / "empty").mkdir()
+
+            build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+            write_image(root / "Ada" / "Project" / "empty" / "two.jpg")
+            empty_dir = root / "Ada" / "Project" / "empty"
+            stat = empty_dir.stat()
+            os.utime(empty_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            index = build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+
+            self.assertEqual((index.statistics.scan_cache_hits, index.statistics.scan_cache_misses), (1, 1))
+            self.assertEqual(index.creator_by_name["Ada"].media_counts.image, 1)
+
+    def test_edited_ignore_file_rescans_the_creator(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            cache_dir = Path(tmp) / "cache"
+            write_image(root / "Ada" / "gallery.jpg")
+            write_image(root / "Ada" / "raw" / "dump.jpg")
+            ignore_path = root / "Ada" / ".cr4teignore"
+            ignore_path.write_text("# nothing yet\n", encoding="utf-8")
+
+            build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+            stat = (root / "Ada").stat()
+            ignore_path.write_text("raw/\n", encoding="utf-8")
+            os.utime(root / "Ada", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            index = build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+
+            self.assertEqual((index.statistics.scan_cache_hits, index.statistics.scan_cache_misses), (0, 1))
+            self.assertEqual(index.creator_by_name["Ada"].media_counts.image, 1)
+
+    def test_cover_replaced_in_place_rescans_the_creator(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            cache_dir = Path(tmp) / "cache"
+            write_image(root / "Ada" / "Project" / "first.jpg")
+            write_image(root / "Ada" / "Project" / "second.jpg")
+
+            first = build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+            self.assertEqual(first.creators[0].projects[0].cover, "Ada/Project/first.jpg")
+            project_stat = (root / "Ada" / "Project").stat()
+            write_image(root / "Ada" / "Project" / "first.jpg", (90, 120))
+            os.utime(root / "Ada" / "Project", ns=(project_stat.st_atime_ns, project_stat.st_mtime_ns))
+
+            index = build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+
+            self.assertEqual((index.statistics.scan_cache_hits, index.statistics.scan_cache_misses), (0, 1))
+            self.assertEqual(index.creators[0].projects[0].cover, "Ada/Project/second.jpg")
+
+    def test_records_of_creators_no_longer_found_are_pruned(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            cache_dir = Path(tmp) / "cache"
+            write_image(root / "Ada" / "gallery.jpg")
+            write_image(root / "Bob" / "gallery.jpg")
+
+            build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+            self.assertEqual(len(list(cache_dir.rglob("*.json"))), 2)
+            (root / "Bob").rename(root / "Cy")
+            build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+
+            records = [json.loads(path.read_text(encoding="utf-8")) for path in cache_dir.rglob("*.json")]
+            self.assertEqual(sorted(Path(record["creator_dir"]).name for record in records), ["Ada", "Cy"])
+
+    def test_changed_media_rules_or_corrupt_records_are_not_reused(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "Artists"
+            cache_dir = Path(tmp) / "cache"
+            write_image(root / "Ada" / "gallery.jpg")
+
+            build_library_index(root, self.media_rules(), scan_cache_dir=cache_dir)
+            media_rules = self.media_rules()
+            media_rules.portrait_basename = "face"
+            index = build_library_index(root, media_rules, scan_cache_dir=cache_dir)
+            self.assertEqual(index.statistics.scan_cache_misses, 1)
+
+            for record_path in cache_dir.rglob("*.json"):
+                record_path.write_text(json.dumps({"version": 1}), encoding="utf-8")
+            index = build_library_index(root, media_rules, scan_cache_dir=cache_dir)
+            self.assertEqual(index.statistics.scan_cache_misses, 1)
+            self.assertEqual(index.creators[0].media_counts.image, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -39,7 +39,6 @@ class TagContextTests(unittest.TestCase):
             display_title="Displayed Landscapes",
             release_date="",
             cover="",
-            info="",
             tags={"Mood": ["Calm"]},
             facets={},
             media_groups=[],
@@ -50,7 +49,6 @@ class TagContextTests(unittest.TestCase):
             type=CreatorType.PERSON,
             active_since="",
             portrait="",
-            info="",
             tags={"Role": ["Photographer"]},
             projects=[project],
             media_groups=[],
@@ -77,12 +75,12 @@ class TagContextTests(unittest.TestCase):
             release_date="",
             cover="",
             tags={},
-            facets={ProjectField.MEDIUMS: ["Photography"], "materials": ["Paper"]},
+            facets={ProjectField.MEDIUMS: ("Photography",), "materials": ("Paper",)},
             media_counts=MediaCounts(),
         )
 
-        self.assertEqual(project_summary_values(summary, ProjectField.MEDIUMS), ["Photography"])
-        self.assertEqual(project_summary_values(summary, ProjectField.MATERIALS), [])
+        self.assertEqual(project_summary_values(summary, ProjectField.MEDIUMS), ("Photography",))
+        self.assertEqual(project_summary_values(summary, ProjectField.MATERIALS), ())
 
 
 if __name__ == "__main__":
@@ -33,6 +33,7 @@ from cr4te.render_models import (
     ProjectOverviewEntry,
     ProjectPageContext,
     TagCollection,
+    ThumbnailVariant,
     TrackContext,
     VideoContext,
 )
@@ -79,7 +80,6 @@ def creator() -> Creator:
         type=CreatorType.PERSON,
         active_since="2020",
         portrait="",
-        info="",
         projects=[],
         media_groups=[],
     )
@@ -91,7 +91,6 @@ def project() -> Project:
         display_title="Displayed Landscapes",
         release_date="",
         cover="",
-        info="",
         tags={},
         facets={},
         media_groups=[],
@@ -394,6 +393,36 @@ class TemplateRendererTests(unittest.TestCase):
         self.assertIn('data-lightbox-title="Sunset over water" title="Sunset over water"', rendered)
         self.assertNotIn('alt="Image for "', rendered)
 
+    def test_gallery_images_offer_thumbnail_variants_through_srcset(self):
+        site_labels = load_config().site_labels
+        macro = env.get_template("partials/_media_sections.html.j2").module.render_media_groups
+        image = GalleryImageContext(
+            rel_thumbnail_path="thumbs/photo_gallery.jpg",
+            image_wrapper_width=600,
+            image_wrapper_height=450,
+            rel_path="photo.jpg",
+            caption="Sunset",
+            srcset=(
+                ThumbnailVariant("thumbs/photo_gallery-150.jpg", 200),
+                ThumbnailVariant("thumbs/photo_gallery.jpg", 600),
+            ),
+            sizes="auto, (max-width: 400px) 100vw, 400px",
+        )
+        group = MediaGroupContext(
+            audio_section_title="Audio",
+            image_section_title="Gallery",
+            sections=[MediaSectionContext(type=MediaType.IMAGE, images=[image, replace(image, srcset=(), sizes="")])],
+        )
+
+        rendered = str(macro("../", [group], 300, 24, site_labels))
+
+        self.assertIn(
+            'src="../thumbs/photo_gallery.jpg" srcset="../thumbs/photo_gallery-150.jpg 200w, ../thumbs/photo_gallery.jpg 600w" '
+            'sizes="auto, (max-width: 400px) 100vw, 400px" alt="Sunset"',
+            rendered,
+        )
+        self.assertIn('src="../thumbs/photo_gallery.jpg" alt="Sunset"', rendered)
+
     def test_video_source_does_not_claim_an_incorrect_media_type(self):
         site_labels = load_config().site_labels
         macro = env.get_template("partials/_media_sections.html.j2").module.render_media_groups
@@ -0,0 +1,155 @@
+import sys
+import threading
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from PIL import Image, UnidentifiedImageError
+
+from cr4te.build_metrics import AssetStatistics
+from cr4te.media_cache import ImageDimensions
+from cr4te.thumbnail_engine import ThumbnailEngine, ThumbnailJob, ThumbnailTarget
+from cr4te.utils import image_utils, path_utils
+
+
+def write_image(path: Path, size: tuple[int, int] = (120, 90)) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, color=(80, 120, 160)).save(path)
+
+
+class ThumbnailEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+
+    def target(self, name: str, tag: str, height: int) -> ThumbnailTarget:
+        return ThumbnailTarget(
+            thumb_path=self.root / "thumbs" / f"{name}_{tag}.png",
+            generated_height=height,
+            freshness=(("source_path", f"{name}.png"), ("generated_height", height)),
+        )
+
+    def job(self, name: str) -> ThumbnailJob:
+        return ThumbnailJob(source_path=self.root / "input" / f"{name}.png", targets=(self.target(name, "gallery", 30),))
+
+    def test_inline_engine_generates_taken_jobs_and_records_worker_time(self):
+        write_image(self.root / "input" / "a.png")
+        statistics = AssetStatistics()
+        engine = ThumbnailEngine(statistics)
+
+        (generated,) = engine.take(self.job("a")).result().results
+        engine.close()
+
+        self.assertEqual(generated.target, self.job("a").targets[0])
+        self.assertEqual(generated.dimensions, ImageDimensions(width=40, height=30))
+        self.assertTrue(generated.target.thumb_path.is_file())
+        self.assertEqual(statistics.thumbnail_workers, 1)
+        self.assertGreater(statistics.thumbnail_seconds, 0)
+        self.assertGreater(statistics.thumbnail_busy_seconds, 0)
+
+    def test_every_target_of_a_job_is_cut_from_one_decode(self):
+        write_image(self.root / "input" / "cover.png", size=(400, 300))
+        cover = self.target("cover", "cover", 60)
+        card = self.target("cover", "card", 30)
+        overview = self.target("cover", "overview", 45)
+        source_path = self.root / "input" / "cover.png"
+
+        with ThumbnailEngine(AssetStatistics()) as engine, patch(
+            "cr4te.thumbnail_engine.image_utils.generate_thumbnails",
+            side_effect=image_utils.generate_thumbnails,
+        ) as generate_thumbnails:
+            results = engine.take(ThumbnailJob(source_path, (card, cover, overview))).result().results
+
+        generate_thumbnails.assert_called_once_with(source_path, [60, 45, 30])
+        self.assertEqual([result.target for result in results], [card, cover, overview])
+        self.assertEqual(
+            [result.dimensions for result in results],
+            [ImageDimensions(width=40, height=30), ImageDimensions(width=80, height=60), ImageDimensions(width=60, height=45)],
+        )
+
+    def test_prefetched_jobs_are_handed_out_once_and_released_by_tag(self):
+        for name in ("a", "b", "c"):
+            write_image(self.root / "input" / f"{name}.png")
+        statistics = AssetStatistics()
+
+        with ThumbnailEngine(statistics, workers=2) as engine:
+            engine.prefetch([self.job("a"), self.job("b")], tag="first")
+            prefetched = engine._prefetched[self.job("a").targets[0].thumb_path][0]
+
+            self.assertIs(engine.take(self.job("a")), prefetched)
+            self.assertIsNot(engine.take(self.job("a")), prefetched)
+
+            engine.prefetch([self.job("c")], tag="second")
+            engine.release("first")
+            self.assertEqual(list(engine._prefetched), [self.job("c").targets[0].thumb_path])
+
+        self.assertEqual(statistics.thumbnail_workers, 2)
+
+    def test_worker_processes_are_spawned_rather_than_forked(self):
+        write_image(self.root / "input" / "a.png")
+        start_methods = []
+
+        def process_pool(*args, mp_context=None, **kwargs):
+            start_methods.append(mp_context.get_start_method() if mp_context is not None else None)
+            return ProcessPoolExecutor(*args, mp_context=mp_context, **kwargs)
+
+        with patch("cr4te.thumbnail_engine.ProcessPoolExecutor", side_effect=process_pool):
+            with ThumbnailEngine(AssetStatistics(), workers=2) as engine:
+                engine.take(self.job("a")).result()
+
+        self.assertEqual(start_methods, ["spawn"])
+        self.assertTrue(self.job("a").targets[0].thumb_path.is_file())
+
+    def test_prefetches_sharing_a_size_with_a_taken_job_are_left_to_the_page(self):
+        write_image(self.root / "input" / "a.png")
+
+        with ThumbnailEngine(AssetStatistics(), workers=2) as engine:
+            engine.take(self.job("a"))
+            engine.prefetch([self.job("a")], tag="next")
+            self.assertEqual(engine._prefetched, {})
+
+    def test_prefetched_fingerprints_are_hashed_on_threads_and_released_by_tag(self):
+        for name in ("a", "b", "c"):
+            write_image(self.root / "input" / f"{name}.png")
+        hashing_threads = set()
+        fingerprint = path_utils.content_fingerprint
+
+        def content_fingerprint(path):
+            hashing_threads.add(threading.current_thread().name)
+            return fingerprint(path)
+
+        with ThumbnailEngine(AssetStatistics(), workers=2) as engine, patch(
+            "cr4te.thumbnail_engine.path_utils.content_fingerprint",
+            side_effect=content_fingerprint,
+        ):
+            engine.prefetch_fingerprints([self.root / "input" / "a.png", self.root / "input" / "b.png"], tag="first")
+            engine.prefetch_fingerprints([self.root / "input" / "c.png"], tag="second")
+            self.assertEqual(engine.fingerprint(self.root / "input" / "a.png"), fingerprint(self.root / "input" / "a.png"))
+            engine.release("first")
+            self.assertEqual(list(engine._fingerprints), [self.root / "input" / "c.png"])
+
+        self.assertTrue(hashing_threads)
+        self.assertTrue(all(name.startswith("cr4te-hash") for name in hashing_threads))
+
+    def test_failures_surface_from_the_future(self):
+        (self.root / "input").mkdir()
+        (self.root / "input" / "broken.png").write_bytes(b"not an image")
+        statistics = AssetStatistics()
+
+        with ThumbnailEngine(statistics, workers=2) as engine:
+            future = engine.take(self.job("broken"))
+            with self.assertRaises(UnidentifiedImageError):
+                future.result()
+
+        self.assertEqual(statistics.thumbnail_busy_seconds, 0)
+        self.assertFalse(self.job("broken").targets[0].thumb_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cr4te.media_cache import ImageDimensions
+from cr4te.thumbnail_manifest import ThumbnailManifest
+
+FRESHNESS = {"source_path": "Noomi/image.png", "source_size": 120, "source_mtime_ns": 1, "generated_height": 450}
+
+
+class ThumbnailManifestTests(unittest.TestCase):
+    def test_rows_are_reused_across_instances_only_while_freshness_matches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            thumbs_dir = Path(tmp) / "thumbnails"
+            thumb_path = thumbs_dir / "ab" / "image_gallery.png"
+            db_path = thumbs_dir / "manifest.sqlite3"
+
+            manifest = ThumbnailManifest(db_path)
+            self.assertIsNone(manifest.dimensions(thumb_path, FRESHNESS))
+            manifest.store(thumb_path, FRESHNESS, ImageDimensions(width=600, height=450))
+            manifest.close()
+
+            reopened = ThumbnailManifest(db_path)
+            self.assertEqual(reopened.dimensions(thumb_path, dict(reversed(FRESHNESS.items()))), ImageDimensions(width=600, height=450))
+            self.assertIsNone(reopened.dimensions(thumb_path, {**FRESHNESS, "source_mtime_ns": 2}))
+            self.assertIsNone(reopened.dimensions(thumbs_dir / "ab" / "image_cover.png", FRESHNESS))
+            reopened.close()
+
+            with sqlite3.connect(db_path) as connection:
+                self.assertEqual(connection.execute("SELECT path FROM thumbnails").fetchall(), [("ab/image_gallery.png",)])
+
+    def test_storing_a_row_removes_the_legacy_freshness_sidecar(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            thumbs_dir = Path(tmp) / "thumbnails"
+            thumb_path = thumbs_dir / "ab" / "image_gallery.png"
+            sidecar_path = thumbs_dir / "ab" / "image_gallery.png.json"
+            sidecar_path.parent.mkdir(parents=True)
+            sidecar_path.write_text("{}", encoding="utf-8")
+
+            manifest = ThumbnailManifest(thumbs_dir / "manifest.sqlite3")
+            manifest.store(thumb_path, FRESHNESS, ImageDimensions(width=600, height=450))
+            manifest.close()
+
+            self.assertFalse(sidecar_path.exists())
+
+    def test_rows_not_referenced_since_opening_are_pruned_with_their_thumbnails(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            thumbs_dir = Path(tmp) / "thumbnails"
+            kept_path = thumbs_dir / "ab" / "kept_gallery.png"
+            stale_path = thumbs_dir / "cd" / "stale_gallery.png"
+            source_stat = Path(tmp).stat()
+            for thumb_path in (kept_path, stale_path):
+                thumb_path.parent.mkdir(parents=True)
+                thumb_path.write_bytes(b"thumbnail")
+
+            manifest = ThumbnailManifest(thumbs_dir / "manifest.sqlite3", track_references=True)
+            manifest.store(kept_path, FRESHNESS, ImageDimensions(width=600, height=450))
+            manifest.store(stale_path, FRESHNESS, ImageDimensions(width=600, height=450))
+            manifest.store_source_fingerprint(Path("Noomi/kept.png"), source_stat, "a" * 32)
+            manifest.store_source_fingerprint(Path("Noomi/stale.png"), source_stat, "b" * 32)
+            manifest.close()
+
+            reopened = ThumbnailManifest(thumbs_dir / "manifest.sqlite3", track_references=True)
+            self.assertIsNotNone(reopened.dimensions(kept_path, FRESHNESS))
+            self.assertIsNotNone(reopened.source_fingerprint(Path("Noomi/kept.png"), source_stat))
+            self.assertEqual(reopened.prune_unreferenced(), 1)
+            reopened.close()
+
+            self.assertTrue(kept_path.exists())
+            self.assertFalse(stale_path.exists())
+            with sqlite3.connect(thumbs_dir / "manifest.sqlite3") as connection:
+                self.assertEqual(connection.execute("SELECT path FROM thumbnails").fetchall(), [("ab/kept_gallery.png",)])
+                self.assertEqual(connection.execute("SELECT path FROM source_fingerprints").fetchall(), [("Noomi/kept.png",)])
+
+    def test_manifest_without_reference_tracking_prunes_nothing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            thumb_path = Path(tmp) / "image_gallery.png"
+            thumb_path.write_bytes(b"thumbnail")
+            manifest = ThumbnailManifest(Path(tmp) / "manifest.sqlite3")
+            manifest.store(thumb_path, FRESHNESS, ImageDimensions(width=600, height=450))
+            manifest.close()
+
+            reopened = ThumbnailManifest(Path(tmp) / "manifest.sqlite3")
+            self.assertEqual(reopened.prune_unreferenced(), 0)
+            self.assertIsNotNone(reopened.dimensions(thumb_path, FRESHNESS))
+            reopened.close()
+            self.assertTrue(thumb_path.exists())
+
+    def test_source_fingerprints_are_trusted_only_while_size_and_mtime_match(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source_path = Path(tmp) / "image.png"
+            source_path.write_bytes(b"image")
+            source_stat = source_path.stat()
+            manifest = ThumbnailManifest(Path(tmp) / "thumbnails" / "manifest.sqlite3")
+
+            self.assertIsNone(manifest.source_fingerprint(Path("Noomi/image.png"), source_stat))
+            manifest.store_source_fingerprint(Path("Noomi/image.png"), source_stat, "f" * 32)
+            self.assertEqual(manifest.source_fingerprint(Path("Noomi/image.png"), source_stat), "f" * 32)
+
+            source_path.write_bytes(b"edited image")
+            self.assertIsNone(manifest.source_fingerprint(Path("Noomi/image.png"), source_path.stat()))
+            manifest.close()
+
+    def test_manifest_is_only_created_when_used(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "thumbnails" / "manifest.sqlite3"
+
+            ThumbnailManifest(db_path).close()
+
+            self.assertFalse(db_path.parent.exists())
+
+    def test_manifest_resets_rows_written_by_another_version(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            thumb_path = Path(tmp) / "image_gallery.png"
+            db_path = Path(tmp) / "manifest.sqlite3"
+
+            manifest = ThumbnailManifest(db_path)
+            manifest.store(thumb_path, FRESHNESS, ImageDimensions(width=600, height=450))
+            manifest.close()
+            with sqlite3.connect(db_path) as connection:
+                connection.execute("PRAGMA user_version = 999")
+
+            reopened = ThumbnailManifest(db_path)
+            self.assertIsNone(reopened.dimensions(thumb_path, FRESHNESS))
+            reopened.close()
+
+    def test_unreadable_manifest_is_replaced(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            thumb_path = Path(tmp) / "image_gallery.png"
+            db_path = Path(tmp) / "manifest.sqlite3"
+            db_path.write_bytes(b"not a database" * 100)
+
+            manifest = ThumbnailManifest(db_path)
+            self.assertIsNone(manifest.dimensions(thumb_path, FRESHNESS))
+            manifest.store(thumb_path, FRESHNESS, ImageDimensions(width=600, height=450))
+            manifest.close()
+
+            reopened = ThumbnailManifest(db_path)
+            self.assertEqual(reopened.dimensions(thumb_path, FRESHNESS), ImageDimensions(width=600, height=450))
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,11 @@ import types
 import unittest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
-from PIL import Image
+import markdown
+from PIL import Image, ImageChops, ImageStat
+from PIL.JpegImagePlugin import JpegImageFile
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
@@ -16,7 +18,7 @@ from cr4te.utils import path_utils, text_utils
 from cr4te.utils.audio_utils import get_audio_duration_seconds
 from cr4te.utils.date_utils import calculate_age_from_strings, format_age, parse_date
 from cr4te.utils.format_utils import format_named, validate_named_format
-from cr4te.utils.image_utils import create_centered_text_image, generate_thumbnail
+from cr4te.utils.image_utils import create_centered_text_image, generate_thumbnails
 from cr4te.utils.json_utils import load_json
 from cr4te.utils.sorting_utils import dated_title_sort_key
 
@@ -76,25 +78,83 @@ class PathUtilsTests(unittest.TestCase):
                 with self.assertRaises(ValueError):
                     path_utils.build_unique_path(Path("project.html"), depth=depth)
 
+    def test_content_fingerprint_depends_only_on_file_contents(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            first, copy, other = (Path(tmp) / name for name in ("first.png", "copy.png", "other.png"))
+            first.write_bytes(b"image" * 1000)
+            copy.write_bytes(b"image" * 1000)
+            other.write_bytes(b"image" * 999)
+
+            self.assertEqual(path_utils.content_fingerprint(first), path_utils.content_fingerprint(copy))
+            self.assertNotEqual(path_utils.content_fingerprint(first), path_utils.content_fingerprint(other))
+
     def test_tag_path(self):
         self.assertEqual(path_utils.tag_path(Path("thumbs") / "cover.jpg", "card"), Path("thumbs") / "cover_card.jpg")
 
 
 class TextUtilsTests(unittest.TestCase):
-    def test_read_text_returns_stripped_file_contents_or_empty_string(self):
+    def test_markdown_file_to_html_supports_tables_and_line_breaks(self):
         with tempfile.TemporaryDirectory() as tmp:
             text_path = Path(tmp) / "README.md"
-            text_path.write_text("  Hello\n", encoding="utf-8")
-
-            self.assertEqual(text_utils.read_text(text_path), "Hello")
-            self.assertEqual(text_utils.read_text(Path(tmp) / "missing.md"), "")
+            text_path.write_text("  | A |\n|---|\n| B |\n\none\ntwo\n", encoding="utf-8")
 
-    def test_markdown_to_html_supports_tables_and_line_breaks(self):
-        html = text_utils.markdown_to_html("| A |\n|---|\n| B |\n\none\ntwo")
+            html, truncated = text_utils.markdown_file_to_html(text_path, max_bytes=1024)
 
+        self.assertFalse(truncated)
         self.assertIn("<table>", html)
         self.assertIn("<br", html)
 
+    def test_markdown_file_to_html_converts_large_files_in_chunks_between_blocks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            text_path = Path(tmp) / "transcript.md"
+            text_path.write_text("one\n\n- item\n\n    more item\n\n- next item\n\nlast", encoding="utf-8")
+
+            with patch.object(text_utils, "MARKDOWN_CHUNK_BYTES", 1):
+                html, truncated = text_utils.markdown_file_to_html(text_path, max_bytes=1024)
+            expected = markdown.markdown(text_path.read_text(encoding="utf-8"), extensions=["nl2br", "tables"])
+
+        self.assertFalse(truncated)
+        self.assertEqual(html.count("<ul>"), 1)
+        self.assertEqual(html.count("<p>"), 5)
+        self.assertEqual(html.replace("\n", ""), expected.replace("\n", ""))
+
+    def test_markdown_file_to_html_resolves_references_defined_in_other_chunks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            text_path = Path(tmp) / "transcript.md"
+            text_path.write_text(
+                "See [the source][src] and [notes].\n\n"
+                "[notes]: http://notes \"Notes\"\n\n"
+                "middle\n\n"
+                "Back to [src] again.\n\n"
+                "[src]:\n    http://x\n",
+                encoding="utf-8",
+            )
+
+            with patch.object(text_utils, "MARKDOWN_CHUNK_BYTES", 1):
+                html, truncated = text_utils.markdown_file_to_html(text_path, max_bytes=1024)
+            expected = markdown.markdown(text_path.read_text(encoding="utf-8"), extensions=["nl2br", "tables"])
+
+        self.assertFalse(truncated)
+        self.assertEqual(html.count('href="http://x"'), 2)
+        self.assertIn('<a href="http://notes" title="Notes">notes</a>', html)
+        self.assertEqual(html.replace("\n", ""), expected.replace("\n", ""))
+
+    def test_markdown_file_to_html_stops_at_the_last_whole_line_within_the_cap(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            text_path = Path(tmp) / "transcript.md"
+            text_path.write_text("first\nsecond\n", encoding="utf-8")
+
+            self.assertEqual(text_utils.markdown_file_to_html(text_path, max_bytes=13), ("<p>first<br />\nsecond</p>", False))
+            self.assertEqual(text_utils.markdown_file_to_html(text_path, max_bytes=12), ("<p>first</p>", True))
+
+    def test_markdown_file_to_html_cuts_a_long_first_line_at_a_character_boundary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            text_path = Path(tmp) / "README.md"
+            text_path.write_text("Café au lait\nsecond\n", encoding="utf-8")
+
+            self.assertEqual(text_utils.markdown_file_to_html(text_path, max_bytes=4), ("<p>Caf</p>", True))
+            self.assertEqual(text_utils.markdown_file_to_html(text_path, max_bytes=5), ("<p>Café</p>", True))
+
     def test_multi_split_handles_multi_character_separators(self):
         self.assertEqual(
             text_utils.multi_split("Ada and Bea & Cy", [" and ", " & "]),
@@ -153,15 +213,40 @@ class FormatUtilsTests(unittest.TestCase):
 
 
 class ImageUtilsExtraTests(unittest.TestCase):
-    def test_generate_thumbnail_preserves_aspect_ratio_for_target_height(self):
+    def test_generate_thumbnails_preserves_aspect_ratio_for_target_height(self):
         with tempfile.TemporaryDirectory() as tmp:
             image_path = Path(tmp) / "wide.jpg"
             Image.new("RGB", (200, 100), color=(120, 80, 160)).save(image_path)
 
-            thumbnail = generate_thumbnail(image_path, target_height=50)
+            (thumbnail,) = generate_thumbnails(image_path, [50])
 
             self.assertEqual(thumbnail.size, (100, 50))
 
+    def test_generate_thumbnails_cuts_every_height_from_one_decode_in_request_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = Path(tmp) / "cover.jpg"
+            Image.linear_gradient("L").resize((1600, 1200)).convert("RGB").save(image_path, quality=95)
+
+            with patch.object(JpegImageFile, "draft", autospec=True, side_effect=JpegImageFile.draft) as draft:
+                thumbnails = generate_thumbnails(image_path, [100, 300, 200])
+
+            draft.assert_called_once_with(ANY, None, (800, 600))
+            self.assertEqual([thumbnail.size for thumbnail in thumbnails], [(133, 100), (400, 300), (266, 200)])
+
+    def test_generate_thumbnails_decodes_large_jpegs_at_reduced_scale(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = Path(tmp) / "camera.jpg"
+            Image.linear_gradient("L").resize((1600, 1200)).convert("RGB").save(image_path, quality=95)
+            with Image.open(image_path) as image:
+                reference = image.resize((133, 100), Image.LANCZOS)
+
+            with patch.object(JpegImageFile, "draft", autospec=True, side_effect=JpegImageFile.draft) as draft:
+                (thumbnail,) = generate_thumbnails(image_path, [100])
+
+            draft.assert_called_once()
+            self.assertEqual(thumbnail.size, (133, 100))
+            self.assertLess(max(ImageStat.Stat(ImageChops.difference(thumbnail, reference)).mean), 2)
+
     def test_create_centered_text_image_writes_png(self):
         with tempfile.TemporaryDirectory() as tmp:
             image_path = Path(tmp) / "placeholder.png"